@@ -75,3 +75,8 @@ class ResilientFileBasedCache(FileBasedCache):
 # startup) and Django's file-based clear ignores key prefixes.
 # django-stubs omits CacheHandler's BaseConnectionHandler base.
 tagging_cache = ConnectionProxy(caches, "tagging")  # pyright: ignore[reportArgumentType], # ty: ignore[invalid-argument-type]
+
+# Per-thread connection to the "browser" page cache. Kept out of the
+# default cache for the same reason: its broad clears would drop cached
+# pages of every library, not just the ones that changed.
+browser_cache = ConnectionProxy(caches, "browser")  # pyright: ignore[reportArgumentType], # ty: ignore[invalid-argument-type]
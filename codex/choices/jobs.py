@@ -51,6 +51,7 @@ _JANITOR_NIGHTLY_STATUSES = (
     "JAS",
     "JRF",
     "JTG",
+    "JFP",
     "SIR",
     "SSU",
     "SSC",
@@ -390,6 +391,15 @@ ADMIN_JOBS: MappingProxyType[str, tuple[dict, ...]] = MappingProxyType(
                         ),
                         "statuses": ("JTG",),
                     },
+                    {
+                        "value": "backfill_fingerprints",
+                        "title": "Fingerprint Comics",
+                        "desc": (
+                            "Fingerprint comics imported before move detection"
+                            " by content. Runs nightly."
+                        ),
+                        "statuses": ("JFP",),
+                    },
                     {
                         "value": "librarian_clear_status",
                         "title": "Clear Librarian Statuses",
@@ -12,6 +12,7 @@ from codex.librarian.mp_queue import LIBRARIAN_QUEUE
 from codex.librarian.notifier.tasks import NotifierTask
 from codex.models import Bookmark, Comic
 from codex.views.auth import GroupACLMixin
+from codex.views.browser.page_cache import bump_browser_user_generation
 
 _BOOKMARK_UPDATE_FIELDS = frozenset(
     {
@@ -198,6 +199,8 @@ class BookmarkUpdateMixin(GroupACLMixin):
 
         count = update_count + create_count
         if count:
+            if user_pk := auth_filter.get("user_id"):
+                bump_browser_user_generation(user_pk)
             uid = next(iter(auth_filter.values()))
             cls._notify_library_changed(uid)
         return count
@@ -4,6 +4,7 @@ from typing import override
 
 from codex.librarian.covers.purge import CoverPurgeThread
 from codex.librarian.covers.tasks import (
+    CoverCompactPackTask,
     CoverCreateAllTask,
     CoverCreateTask,
     CoverRemoveAllTask,
@@ -25,6 +26,8 @@ class CoverThread(CoverPurgeThread):
                 self.purge_comic_covers(item.pks, custom=item.custom)
             case CoverRemoveOrphansTask():
                 self.cleanup_orphan_covers()
+            case CoverCompactPackTask():
+                self.compact_cover_pack()
             case CoverCreateAllTask():
                 self.create_all_covers()
             case CoverCreateTask():
@@ -16,28 +16,47 @@ from io import BytesIO
 from pathlib import Path
 from queue import Empty
 from time import time
+from types import MappingProxyType
 from typing import TYPE_CHECKING, override
 
 from comicbox.box import Comicbox
 from humanize import naturaldelta
 from PIL import Image
 
-from codex.librarian.covers.path import CoverPathMixin
+from codex.librarian.covers.pack import cover_pack
+from codex.librarian.covers.path import (
+    COVER_SIZE_1X,
+    COVER_SIZE_2X,
+    COVER_SIZE_LARGE,
+    COVER_SIZES,
+    CoverPathMixin,
+)
+from codex.librarian.covers.staging import pop_staged_cover
 from codex.librarian.covers.status import CreateCoversStatus
 from codex.librarian.covers.tasks import CoverCreateTask
 from codex.librarian.threads import QueuedThread
 from codex.models import Comic, CustomCover
-from codex.settings import COMICBOX_CONFIG, COVER_WORKERS
+from codex.settings import COMICBOX_CONFIG, COVER_PACK, COVER_WORKERS
 
 if TYPE_CHECKING:
-    from collections.abc import Collection
+    from collections.abc import Collection, Iterator, Sequence
 
     from codex.librarian.tasks import LibrarianTask
 
 _COVER_RATIO = 1.5372233400402415  # modal cover ratio
 THUMBNAIL_WIDTH = 165
 THUMBNAIL_HEIGHT = round(THUMBNAIL_WIDTH * _COVER_RATIO)
-_THUMBNAIL_SIZE = (THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT)
+LARGE_THUMBNAIL_WIDTH = THUMBNAIL_WIDTH * 4
+LARGE_THUMBNAIL_HEIGHT = round(LARGE_THUMBNAIL_WIDTH * _COVER_RATIO)
+# Bounding box per cover size: 1x and 2x for browser srcsets, large for
+# OPDS clients that want more than a grid thumbnail.
+THUMBNAIL_SIZES = MappingProxyType(
+    {
+        COVER_SIZE_LARGE: (LARGE_THUMBNAIL_WIDTH, LARGE_THUMBNAIL_HEIGHT),
+        COVER_SIZE_2X: (THUMBNAIL_WIDTH * 2, THUMBNAIL_HEIGHT * 2),
+        COVER_SIZE_1X: (THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT),
+    }
+)
 
 
 def _init_cover_worker() -> None:
@@ -88,56 +107,107 @@ def _save_cover_to_cache(cover_path_str: str, data: bytes) -> None:
         cover_path.touch()
 
 
+def _read_cover_source(db_path: str, *, custom: bool) -> bytes:
+    """Read the source image for a comic or custom cover."""
+    if custom:
+        with Path(db_path).open("rb") as f:
+            return f.read()
+    with Comicbox(db_path, config=COMICBOX_CONFIG) as car:
+        return car.get_cover_page(pdf_format="pixmap", skip_metadata=True) or b""
+
+
+def render_cover_sizes(
+    image_data: bytes, sizes: Sequence[str]
+) -> Iterator[tuple[str, bytes]]:
+    """
+    Yield ``(size, webp_bytes)`` for each of ``sizes``, largest first.
+
+    The source image is decoded once (JPEGs in draft mode at the
+    largest size) and each smaller size is resized from the previous one.
+    """
+    with BytesIO(image_data) as image_io, Image.open(image_io) as img:
+        img.draft(None, THUMBNAIL_SIZES[sizes[0]])
+        for size in sizes:
+            img.thumbnail(
+                THUMBNAIL_SIZES[size],
+                Image.Resampling.LANCZOS,
+                reducing_gap=3.0,
+            )
+            buf = BytesIO()
+            img.save(buf, "WEBP", method=6)
+            yield size, buf.getvalue()
+
+
 def _render_cover_thumb(args: tuple) -> tuple[int, str, str | None]:
     """
-    Render one cover thumbnail and write it to disk.
+    Render every size of one cover thumbnail and write them to disk.
 
     Picklable; runs inside a worker subprocess. Accepts a
-    pre-resolved ``(pk, db_path, cover_path_str, custom)`` tuple —
-    workers don't touch the Django ORM. Calls
+    pre-resolved ``(pk, db_path, cover_paths, custom)`` tuple, where
+    ``cover_paths`` is ``(size, cover_path_str)`` pairs from largest
+    to smallest — workers don't touch the Django ORM. Calls
     ``_save_cover_to_cache`` directly (workers own the disk write
     so the WEBP bytes never round-trip through the executor's
     pickle channel), and returns only ``(pk, cover_path_str,
-    error_msg_or_None)`` — metadata for the parent's logging +
-    status loop.
+    error_msg_or_None)`` for the 1x path — metadata for the parent's
+    logging + status loop.
 
     On failure, writes the zero-byte ``tried-and-failed`` sentinel
-    via ``_save_cover_to_cache(path, b"")`` so the cover endpoint's
-    polling loop can distinguish a missing file (not yet tried)
-    from an empty one (tried and failed).
+    via ``_save_cover_to_cache(path, b"")`` for every size so the
+    cover endpoint's polling loop can distinguish a missing file (not
+    yet tried) from an empty one (tried and failed).
     """
-    pk, db_path, cover_path_str, custom = args
+    pk, db_path, cover_paths, custom = args
+    cover_path_str = cover_paths[-1][1]
     try:
-        if custom:
-            with Path(db_path).open("rb") as f:
-                image_data = f.read()
-        else:
-            with Comicbox(db_path, config=COMICBOX_CONFIG) as car:
-                image_data = car.get_cover_page(pdf_format="pixmap", skip_metadata=True)
+        image_data = _read_cover_source(db_path, custom=custom)
         if not image_data:
-            _save_cover_to_cache(cover_path_str, b"")
+            for _size, path_str in cover_paths:
+                _save_cover_to_cache(path_str, b"")
             return pk, cover_path_str, "empty cover"
-        with BytesIO(image_data) as image_io, Image.open(image_io) as img:
-            img.thumbnail(
-                _THUMBNAIL_SIZE,
-                Image.Resampling.LANCZOS,
-                reducing_gap=3.0,
-            )
-            buf = BytesIO()
-            img.save(buf, "WEBP", method=6)
-        _save_cover_to_cache(cover_path_str, buf.getvalue())
+        path_strs = dict(cover_paths)
+        sizes = tuple(path_strs)
+        for size, data in render_cover_sizes(image_data, sizes):
+            _save_cover_to_cache(path_strs[size], data)
     except Exception as exc:
         # Disk-write attempt for the failure marker — best-effort.
         # Swallowing here is intentional: the caller is already
         # logging ``repr(exc)`` for the original failure, and a
         # marker write that fails just means the next cover request
         # will retry rather than serving the sentinel.
-        with contextlib.suppress(Exception):
-            _save_cover_to_cache(cover_path_str, b"")
+        for _size, path_str in cover_paths:
+            with contextlib.suppress(Exception):
+                _save_cover_to_cache(path_str, b"")
         return pk, cover_path_str, repr(exc)
     return pk, cover_path_str, None
 
 
+def _render_cover_pack(
+    args: tuple,
+) -> tuple[int, tuple[tuple[str, bytes], ...], str | None]:
+    """
+    Render every size of one cover thumbnail for the cover pack.
+
+    Picklable; runs inside a worker subprocess. Accepts ``(pk,
+    db_path, custom)`` and returns ``(pk, renditions,
+    error_msg_or_None)`` where ``renditions`` is ``(size,
+    webp_bytes)`` pairs. The pack has a single writer — the cover
+    thread — so the bytes come back to the parent instead of being
+    written here. On failure every size gets the empty
+    ``tried-and-failed`` sentinel.
+    """
+    pk, db_path, custom = args
+    failed = tuple((size, b"") for size in THUMBNAIL_SIZES)
+    try:
+        image_data = _read_cover_source(db_path, custom=custom)
+        if not image_data:
+            return pk, failed, "empty cover"
+        renditions = tuple(render_cover_sizes(image_data, tuple(THUMBNAIL_SIZES)))
+    except Exception as exc:
+        return pk, failed, repr(exc)
+    return pk, renditions, None
+
+
 class CoverCreateThread(QueuedThread, CoverPathMixin, ABC):
     """Create methods for covers."""
 
@@ -186,16 +256,27 @@ class CoverCreateThread(QueuedThread, CoverPathMixin, ABC):
 
     def _filter_pending_pks(self, pks: Collection[int], *, custom: bool) -> list[int]:
         """
-        Return only pks whose cover file isn't already on disk.
+        Return only pks missing a cover file for any size.
 
         Lifts the per-iteration ``cover_path.exists()`` stat into a
         single up-front pass so the work loop only runs against pks
         that genuinely need work — saves dispatch overhead on
         repeated CoverCreateAllTask runs and gives the multiprocessing
-        path a tight set of work items.
+        path a tight set of work items. In pack mode this is one
+        index query instead of a stat per size.
         """
+        if COVER_PACK:
+            complete = cover_pack.get_complete_pks(
+                pks, custom=custom, sizes=COVER_SIZES
+            )
+            return [pk for pk in pks if pk not in complete]
         return [
-            pk for pk in pks if not self.get_cover_path(pk, custom=custom).is_file()
+            pk
+            for pk in pks
+            if not all(
+                self.get_cover_path(pk, custom=custom, size=size).is_file()
+                for size in COVER_SIZES
+            )
         ]
 
     @staticmethod
@@ -220,21 +301,59 @@ class CoverCreateThread(QueuedThread, CoverPathMixin, ABC):
         db_paths: dict[int, str],
         *,
         custom: bool,
-    ) -> list[tuple[int, str, str, bool]]:
+    ) -> list[tuple]:
         """
-        Pair each pk with its db_path and target cover_path.
+        Pair each pk with its db_path and target cover paths, largest first.
 
+        Pack-mode items carry no paths; the parent writes the pack.
         Skips pks whose db_path went missing (importer race).
         """
-        work: list[tuple[int, str, str, bool]] = []
+        work: list[tuple] = []
         for pk in pks:
             db_path = db_paths.get(pk)
             if db_path is None:
                 continue
-            cover_path_str = str(self.get_cover_path(pk, custom=custom))
-            work.append((pk, db_path, cover_path_str, custom))
+            if COVER_PACK:
+                work.append((pk, db_path, custom))
+                continue
+            cover_paths = tuple(
+                (size, str(self.get_cover_path(pk, custom=custom, size=size)))
+                for size in THUMBNAIL_SIZES
+            )
+            work.append((pk, db_path, cover_paths, custom))
         return work
 
+    def _adopt_staged_covers(
+        self, db_paths: dict[int, str], status: CreateCoversStatus
+    ) -> int:
+        """
+        Store covers the importer rendered while it had the archive open.
+
+        Adopted pks are dropped from ``db_paths`` so they never reach
+        the render pool. Returns the number adopted.
+        """
+        adopted = 0
+        for pk, db_path in tuple(db_paths.items()):
+            if not (renditions := pop_staged_cover(db_path)):
+                continue
+            if COVER_PACK:
+                cover_pack.put_many(
+                    ((pk, size, data) for size, data in renditions.items()),
+                    custom=False,
+                )
+            else:
+                for size, data in renditions.items():
+                    cover_path = self.get_cover_path(pk, custom=False, size=size)
+                    _save_cover_to_cache(str(cover_path), data)
+            del db_paths[pk]
+            adopted += 1
+        if adopted:
+            self.log.debug(f"Adopted {adopted} comic covers rendered during import.")
+            status.total = (status.total or 0) + adopted
+            status.increment_complete(adopted)
+            self.status_controller.update(status)
+        return adopted
+
     def _render_covers_into_status(
         self,
         pks: Collection[int],
@@ -256,7 +375,9 @@ class CoverCreateThread(QueuedThread, CoverPathMixin, ABC):
         each target to a ``ProcessPoolExecutor`` and consume the
         completion stream via ``as_completed``. Workers own the
         full pipeline including the disk write — no bytes
-        round-trip through the executor's pickle channel.
+        round-trip through the executor's pickle channel — except in
+        pack mode, where this thread is the pack's single writer and
+        stores each cover's sizes as its future completes.
 
         Returns the number of covers rendered (skipped pks aren't
         counted).
@@ -265,9 +386,10 @@ class CoverCreateThread(QueuedThread, CoverPathMixin, ABC):
         if not pending_pks:
             return 0
         db_paths = self._resolve_db_paths(pending_pks, custom=custom)
+        adopted = 0 if custom else self._adopt_staged_covers(db_paths, status)
         work_items = self._build_cover_work_items(pending_pks, db_paths, custom=custom)
         if not work_items:
-            return 0
+            return adopted
         # ``status.total`` accumulates across burst batches so the UI
         # sees a growing total as new tasks drain in alongside the
         # already-running render.
@@ -276,11 +398,12 @@ class CoverCreateThread(QueuedThread, CoverPathMixin, ABC):
         desc = "custom" if custom else "comic"
         self.log.debug(f"Creating {len(work_items)} {desc} covers...")
         pool = self._get_cover_pool()
-        futures = [pool.submit(_render_cover_thumb, w) for w in work_items]
+        render = _render_cover_pack if COVER_PACK else _render_cover_thumb
+        futures = [pool.submit(render, w) for w in work_items]
         rendered = 0
         for future in as_completed(futures):
             try:
-                pk, _cover_path_str, err = future.result()
+                pk, renditions, err = future.result()
             except (CancelledError, BrokenExecutor):
                 # ``stop()`` cancels pending futures and SIGTERMs in-flight
                 # workers before ``SHUTDOWN_MSG`` lands — pending futures
@@ -288,12 +411,16 @@ class CoverCreateThread(QueuedThread, CoverPathMixin, ABC):
                 # Drop both; the burst handler's ``finally`` still finishes
                 # the status cleanly.
                 break
+            if COVER_PACK:
+                cover_pack.put_many(
+                    ((pk, size, data) for size, data in renditions), custom=custom
+                )
             if err:
                 self.log.warning(f"Could not create cover thumbnail for pk={pk}: {err}")
             status.increment_complete()
             self.status_controller.update(status)
             rendered += 1
-        return rendered
+        return adopted + rendered
 
     def _bulk_create_comic_covers(self, pks, *, custom: bool) -> int:
         """
@@ -0,0 +1,403 @@
+"""
+Packed cover store.
+
+Optional replacement for one WEBP file per cover size under the hex
+directory tree (``librarian.cover_pack``). Thumbnails are appended to a
+few large shard files and located through a small SQLite index keyed on
+``(custom, pk, size)``. A 600k comic library becomes a handful of files
+instead of millions of inodes, so backups and rsyncs of the cache dir
+stay fast, and purging or orphan cleanup become ``DELETE`` statements
+instead of ``unlink`` storms.
+
+The cover thread is the only writer. It appends rendered bytes to the
+newest shard, then records their offsets in one transaction, so a
+reader never sees an index row pointing at unwritten bytes. Deleting
+covers only drops index rows; :meth:`CoverPack.compact` (queued nightly
+by the janitor) copies the live covers out of mostly-dead shards and
+unlinks them.
+
+Readers — the web server's request threads — look rows up through
+thread-local read connections (SQLite WAL handles the cross-process
+concurrency, as in :mod:`codex.user_data.store`) and slice the bytes
+out of shared read-only mmaps of the shards. Compaction never reuses a
+shard id; a whole-store purge does, but it also replaces the index
+file, which readers notice by its inode and drop their maps.
+"""
+
+from __future__ import annotations
+
+import mmap
+import shutil
+import sqlite3
+import threading
+from contextlib import contextmanager, suppress
+from time import time_ns
+from typing import TYPE_CHECKING, Final, NamedTuple
+
+from codex.settings import ROOT_CACHE_PATH
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+    from pathlib import Path
+
+COVER_PACK_ROOT: Final = ROOT_CACHE_PATH / "cover-packs"
+_INDEX_NAME: Final = "index.sqlite3"
+_SHARD_SUFFIX: Final = ".pack"
+_SHARD_MAX_BYTES: Final = 256 * 1024 * 1024
+# Compact shards whose live covers fill less than this share of the file.
+_COMPACT_LIVE_FRACTION: Final = 0.5
+# Mapped shards kept open per process before the maps are recycled.
+_MAX_MAPS: Final = 64
+# Marks a zero-length "tried and failed" cover, as the empty file does
+# in the loose cover tree.
+_NO_SHARD: Final = -1
+_DELETE_BATCH_SIZE: Final = 900
+
+_PRAGMAS: Final = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+)
+_SCHEMA: Final = """\
+CREATE TABLE IF NOT EXISTS covers (
+    custom INTEGER NOT NULL,
+    pk INTEGER NOT NULL,
+    size TEXT NOT NULL,
+    shard INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    PRIMARY KEY (custom, pk, size)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS covers_shard ON covers (shard);
+"""
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection) -> Generator[None]:
+    """Run a block in one write transaction on an autocommit connection."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+class CoverPackEntry(NamedTuple):
+    """Location of one packed cover."""
+
+    shard: int
+    offset: int
+    length: int
+    mtime_ns: int
+
+    @property
+    def etag(self) -> str:
+        """Strong ETag; a rewritten cover gets a new offset and mtime."""
+        return f'"p{self.shard:x}-{self.offset:x}-{self.length:x}-{self.mtime_ns:x}"'
+
+
+class CoverPack:
+    """Append-only cover shards plus a SQLite offset index."""
+
+    def __init__(self, root: Path = COVER_PACK_ROOT) -> None:
+        """Bind to a pack directory. Nothing is opened yet."""
+        self.root = root
+        self.index_path = root / _INDEX_NAME
+        self._local = threading.local()
+        self._map_lock = threading.Lock()
+        self._maps: dict[int, mmap.mmap] = {}
+        self._maps_ino: int | None = None
+
+    # ── Connections ───────────────────────────────────────────────────
+
+    def _connect(self) -> sqlite3.Connection | None:
+        """
+        Return this thread's index connection, reopening a replaced index.
+
+        Returns ``None`` while no index exists yet.
+        """
+        try:
+            ino = self.index_path.stat().st_ino
+        except FileNotFoundError:
+            self._close_local()
+            return None
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.ino == ino:
+            return conn
+        self._close_local()
+        with self._map_lock:
+            if self._maps_ino != ino:
+                # A purged and recreated pack reuses shard ids.
+                self._close_maps()
+                self._maps_ino = ino
+        conn = sqlite3.connect(self.index_path, isolation_level=None, timeout=5.0)
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+        self._local.conn = conn
+        self._local.ino = ino
+        return conn
+
+    def _connect_writer(self) -> sqlite3.Connection:
+        """Return the writer's connection, creating the index if needed."""
+        if (conn := self._connect()) is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            sqlite3.connect(self.index_path).close()
+            conn = self._connect()
+            if conn is None:
+                reason = f"Could not create cover pack index {self.index_path}"
+                raise OSError(reason)
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def _close_local(self) -> None:
+        """Close this thread's connection."""
+        if conn := getattr(self._local, "conn", None):
+            with suppress(sqlite3.Error):
+                conn.close()
+        self._local.conn = None
+        self._local.ino = None
+
+    # ── Shards ────────────────────────────────────────────────────────
+
+    def _shard_path(self, shard: int) -> Path:
+        return self.root / f"{shard:06}{_SHARD_SUFFIX}"
+
+    def _shard_ids(self) -> list[int]:
+        """Every shard on disk, oldest first."""
+        if not self.root.is_dir():
+            return []
+        shards = []
+        for path in self.root.glob(f"*{_SHARD_SUFFIX}"):
+            with suppress(ValueError):
+                shards.append(int(path.stem))
+        return sorted(shards)
+
+    def _close_maps(self) -> None:
+        """Close every shard map. Caller holds ``_map_lock``."""
+        for shard_map in self._maps.values():
+            shard_map.close()
+        self._maps.clear()
+
+    def _read_mapped(self, entry: CoverPackEntry) -> bytes | None:
+        """Copy a cover's bytes out of its shard's mmap."""
+        end = entry.offset + entry.length
+        with self._map_lock:
+            shard_map = self._maps.get(entry.shard)
+            if shard_map is None or len(shard_map) < end:
+                # Unmapped, or appended to since it was mapped.
+                if shard_map is not None:
+                    shard_map.close()
+                if len(self._maps) >= _MAX_MAPS:
+                    self._close_maps()
+                try:
+                    with self._shard_path(entry.shard).open("rb") as shard_file:
+                        shard_map = mmap.mmap(
+                            shard_file.fileno(), 0, access=mmap.ACCESS_READ
+                        )
+                except (FileNotFoundError, ValueError):
+                    # Compacted away, or still empty.
+                    self._maps.pop(entry.shard, None)
+                    return None
+                self._maps[entry.shard] = shard_map
+            if len(shard_map) < end:
+                return None
+            return shard_map[entry.offset : end]
+
+    # ── Read API ──────────────────────────────────────────────────────
+
+    def lookup(self, pk: int, *, custom: bool, size: str) -> CoverPackEntry | None:
+        """Return a cover's index entry without reading its bytes."""
+        if (conn := self._connect()) is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT shard, offset, length, mtime_ns FROM covers "
+                "WHERE custom = ? AND pk = ? AND size = ?",
+                (int(custom), pk, size),
+            ).fetchone()
+        except sqlite3.OperationalError:
+            # Index exists but the writer hasn't created the table yet.
+            return None
+        return CoverPackEntry(*row) if row else None
+
+    def get(
+        self, pk: int, *, custom: bool, size: str
+    ) -> tuple[bytes, CoverPackEntry] | None:
+        """
+        Return a cover's bytes and entry, or ``None`` if it isn't packed.
+
+        ``b""`` is the tried-and-failed marker. A lookup that races a
+        compaction is retried once against the updated index.
+        """
+        for _ in range(2):
+            if not (entry := self.lookup(pk, custom=custom, size=size)):
+                return None
+            if entry.shard == _NO_SHARD:
+                return b"", entry
+            if (data := self._read_mapped(entry)) is not None:
+                return data, entry
+        return None
+
+    def get_complete_pks(
+        self, pks: Iterable[int], *, custom: bool, sizes: tuple[str, ...]
+    ) -> frozenset[int]:
+        """Return the pks that have every one of ``sizes`` packed."""
+        if (conn := self._connect()) is None:
+            return frozenset()
+        pks = tuple(pks)
+        complete = set()
+        with suppress(sqlite3.OperationalError):
+            for start in range(0, len(pks), _DELETE_BATCH_SIZE):
+                batch = pks[start : start + _DELETE_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                size_placeholders = ",".join("?" * len(sizes))
+                rows = conn.execute(
+                    f"SELECT pk FROM covers WHERE custom = ? "  # noqa: S608
+                    f"AND pk IN ({placeholders}) AND size IN ({size_placeholders}) "
+                    "GROUP BY pk HAVING COUNT(*) = ?",
+                    (int(custom), *batch, *sizes, len(sizes)),
+                )
+                complete.update(row[0] for row in rows)
+        return frozenset(complete)
+
+    # ── Write API (cover thread only) ─────────────────────────────────
+
+    def _append(self, data: bytes) -> tuple[int, int]:
+        """Append bytes to the newest shard, rolling over when it's full."""
+        shard_ids = self._shard_ids()
+        shard = shard_ids[-1] if shard_ids else 0
+        shard_path = self._shard_path(shard)
+        with suppress(FileNotFoundError):
+            if shard_path.stat().st_size + len(data) > _SHARD_MAX_BYTES:
+                shard += 1
+                shard_path = self._shard_path(shard)
+        with shard_path.open("ab") as shard_file:
+            offset = shard_file.tell()
+            shard_file.write(data)
+        return shard, offset
+
+    def put_many(
+        self, covers: Iterable[tuple[int, str, bytes]], *, custom: bool
+    ) -> None:
+        """Pack ``(pk, size, data)`` covers, replacing older versions."""
+        conn = self._connect_writer()
+        mtime_ns = time_ns()
+        rows = []
+        for pk, size, data in covers:
+            if data:
+                shard, offset = self._append(data)
+            else:
+                shard, offset = _NO_SHARD, 0
+            rows.append((int(custom), pk, size, shard, offset, len(data), mtime_ns))
+        if not rows:
+            return
+        # Bytes first, index second: readers never see unwritten offsets.
+        with _transaction(conn):
+            conn.executemany(
+                "INSERT OR REPLACE INTO covers "
+                "(custom, pk, size, shard, offset, length, mtime_ns) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def delete(self, pks: Iterable[int], *, custom: bool) -> int:
+        """Drop every size of the given covers from the index."""
+        if (conn := self._connect()) is None:
+            return 0
+        pks = tuple(pks)
+        count = 0
+        with _transaction(conn):
+            for start in range(0, len(pks), _DELETE_BATCH_SIZE):
+                batch = pks[start : start + _DELETE_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                cursor = conn.execute(
+                    f"DELETE FROM covers WHERE custom = ? AND pk IN ({placeholders})",  # noqa: S608
+                    (int(custom), *batch),
+                )
+                count += cursor.rowcount
+        return count
+
+    def delete_orphans(self, live_pks: Iterable[int], *, custom: bool) -> int:
+        """Drop covers whose pk isn't in ``live_pks``."""
+        if (conn := self._connect()) is None:
+            return 0
+        with _transaction(conn):
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS live_pks (pk INTEGER)")
+            conn.execute("DELETE FROM live_pks")
+            conn.executemany(
+                "INSERT INTO live_pks (pk) VALUES (?)", ((pk,) for pk in live_pks)
+            )
+            cursor = conn.execute(
+                "DELETE FROM covers WHERE custom = ? "
+                "AND pk NOT IN (SELECT pk FROM live_pks)",
+                (int(custom),),
+            )
+            conn.execute("DROP TABLE live_pks")
+        return cursor.rowcount
+
+    def delete_all(self) -> None:
+        """Remove the whole pack."""
+        self._close_local()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _relocate_shard(self, conn: sqlite3.Connection, shard: int) -> None:
+        """Copy a shard's live covers to the newest shard and repoint them."""
+        rows = conn.execute(
+            "SELECT custom, pk, size, offset, length FROM covers WHERE shard = ?",
+            (shard,),
+        ).fetchall()
+        updates = []
+        with self._shard_path(shard).open("rb") as shard_file:
+            for custom, pk, size, offset, length in rows:
+                shard_file.seek(offset)
+                new_shard, new_offset = self._append(shard_file.read(length))
+                updates.append((new_shard, new_offset, custom, pk, size))
+        with _transaction(conn):
+            conn.executemany(
+                "UPDATE covers SET shard = ?, offset = ? "
+                "WHERE custom = ? AND pk = ? AND size = ?",
+                updates,
+            )
+
+    def compact(self) -> int:
+        """
+        Rewrite mostly-dead shards and return the bytes reclaimed.
+
+        The newest shard is still being appended to and is left alone.
+        Live covers are copied out before their old shard is unlinked;
+        readers that already mapped the old shard keep a valid map.
+        """
+        if (conn := self._connect()) is None:
+            return 0
+        shard_ids = self._shard_ids()
+        if len(shard_ids) < 2:  # noqa: PLR2004
+            return 0
+        live_bytes = dict(
+            conn.execute(
+                "SELECT shard, SUM(length) FROM covers WHERE shard >= 0 GROUP BY shard"
+            ).fetchall()
+        )
+        reclaimed = 0
+        for shard in shard_ids[:-1]:
+            shard_path = self._shard_path(shard)
+            total = shard_path.stat().st_size
+            live = live_bytes.get(shard, 0)
+            if total and live / total >= _COMPACT_LIVE_FRACTION:
+                continue
+            if live:
+                self._relocate_shard(conn, shard)
+            shard_path.unlink(missing_ok=True)
+            reclaimed += total - live
+        return reclaimed
+
+    def close(self) -> None:
+        """Close this thread's connection and every shard map."""
+        self._close_local()
+        with self._map_lock:
+            self._close_maps()
+
+
+cover_pack = CoverPack()
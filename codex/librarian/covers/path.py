@@ -4,6 +4,12 @@ from pathlib import Path
 
 from codex.settings import ROOT_CACHE_PATH
 
+#: Cover thumbnail sizes. The unnamed 1x size keeps the original path.
+COVER_SIZE_1X = ""
+COVER_SIZE_2X = "2x"
+COVER_SIZE_LARGE = "large"
+COVER_SIZES = (COVER_SIZE_1X, COVER_SIZE_2X, COVER_SIZE_LARGE)
+
 
 class CoverPathMixin:
     """Path methods for covers."""
@@ -25,17 +31,33 @@ class CoverPathMixin:
         return Path("/".join(parts))
 
     @classmethod
-    def get_cover_path(cls, pk: int, *, custom: bool):
+    def get_cover_path(cls, pk: int, *, custom: bool, size: str = COVER_SIZE_1X):
         """Get cover path for comic pk."""
         cover_path = cls._hex_path(pk)
+        if size:
+            cover_path = cover_path.with_name(f"{cover_path.name}@{size}")
         root = cls.CUSTOM_COVERS_ROOT if custom else cls.COVERS_ROOT
         return root / cover_path.with_suffix(".webp")
 
     @classmethod
     def get_cover_paths(cls, pks, *, custom: bool) -> set:
-        """Get cover paths for many comic pks."""
+        """Get every size's cover path for many comic pks."""
         cover_paths = set()
         for pk in pks:
-            cover_path = cls.get_cover_path(pk, custom=custom)
-            cover_paths.add(cover_path)
+            for size in COVER_SIZES:
+                cover_path = cls.get_cover_path(pk, custom=custom, size=size)
+                cover_paths.add(cover_path)
         return cover_paths
+
+
+class PageCachePathMixin(CoverPathMixin):
+    """Path methods for the reader's decoded page caches."""
+
+    PAGES_ROOT = ROOT_CACHE_PATH / "pages"
+    PAGE_DERIVATIVES_ROOT = ROOT_CACHE_PATH / "page-derivatives"
+    PAGE_CACHE_ROOTS = (PAGES_ROOT, PAGE_DERIVATIVES_ROOT)
+
+    @classmethod
+    def get_page_cache_dir(cls, pk: int, root: Path | None = None) -> Path:
+        """Get the directory holding every cached page for comic pk."""
+        return (root or cls.PAGES_ROOT) / cls._hex_path(pk)
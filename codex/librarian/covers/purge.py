@@ -4,14 +4,23 @@ import shutil
 from abc import ABC
 from pathlib import Path
 
+from humanize import naturalsize
+
 from codex.librarian.covers.create import CoverCreateThread
+from codex.librarian.covers.pack import cover_pack
+from codex.librarian.covers.path import PageCachePathMixin
+from codex.librarian.covers.staging import (
+    remove_all_staged_covers,
+    remove_stale_staged_covers,
+)
 from codex.librarian.covers.status import FindOrphanCoversStatus, RemoveCoversStatus
 from codex.librarian.notifier.tasks import COVERS_CHANGED_TASK
 from codex.models import Comic
 from codex.models.paths import CustomCover
+from codex.settings import COVER_PACK
 
 
-class CoverPurgeThread(CoverCreateThread, ABC):
+class CoverPurgeThread(CoverCreateThread, PageCachePathMixin, ABC):
     """Cover Purge methods."""
 
     _CLEANUP_STATUS_MAP = (FindOrphanCoversStatus, RemoveCoversStatus)
@@ -48,8 +57,30 @@ class CoverPurgeThread(CoverCreateThread, ABC):
             self.status_controller.finish(status)
         return status.complete or 0
 
+    def purge_page_caches(self, pks) -> None:
+        """
+        Purge the reader's decoded page cache for changed or deleted comics.
+
+        Page cache keys already carry the archive stat so stale pages are
+        never served; this reclaims the disk space immediately instead of
+        waiting for the reader's LRU eviction.
+        """
+        for root in self.PAGE_CACHE_ROOTS:
+            for pk in pks:
+                page_dir = self.get_page_cache_dir(pk, root)
+                if not page_dir.is_dir():
+                    continue
+                shutil.rmtree(page_dir, ignore_errors=True)
+                self._cleanup_cover_dirs(page_dir.parent, root)
+
     def purge_comic_covers(self, pks: frozenset[int], *, custom: bool) -> int:
         """Purge a set a cover paths."""
+        if not custom:
+            self.purge_page_caches(pks)
+        if COVER_PACK:
+            count = cover_pack.delete(pks, custom=custom)
+            self.log.debug(f"Removed {count} packed cover thumbnails.")
+            return count
         cover_paths = self.get_cover_paths(pks, custom=custom)
         cover_root = self.CUSTOM_COVERS_ROOT if custom else self.COVERS_ROOT
         return self.purge_cover_paths(cover_paths, cover_root)
@@ -64,6 +95,8 @@ class CoverPurgeThread(CoverCreateThread, ABC):
                 shutil.rmtree(self.COVERS_ROOT)
             if self.CUSTOM_COVERS_ROOT.exists():
                 shutil.rmtree(self.CUSTOM_COVERS_ROOT)
+            cover_pack.delete_all()
+            remove_all_staged_covers()
             self.log.success("Removed entire comic cover cache and custom cover cache.")
         except OSError as exc:
             self.log.warning(exc)
@@ -79,7 +112,8 @@ class CoverPurgeThread(CoverCreateThread, ABC):
             self.log.debug(f"Removing covers from missing {name}.")
             self.status_controller.start(status)
             pks = cover_class.objects.all().values_list("pk", flat=True)
-            db_cover_paths = self.get_cover_paths(pks, custom=False)
+            custom = cover_class is CustomCover
+            db_cover_paths = self.get_cover_paths(pks, custom=custom)
 
             orphan_cover_paths = set()
             for root, _, filenames in cover_root.walk():
@@ -106,10 +140,81 @@ class CoverPurgeThread(CoverCreateThread, ABC):
                 except OSError as exc:
                     self.log.warning(f"Could not remove stale {tmp_path}: {exc!r}")
 
+    def _cleanup_orphan_page_caches(self) -> None:
+        """Remove cached reader pages for comics no longer in the db."""
+        roots = tuple(root for root in self.PAGE_CACHE_ROOTS if root.is_dir())
+        if not roots:
+            return
+        pks = frozenset(Comic.objects.values_list("pk", flat=True))
+        orphan_pks = set()
+        for cache_root in roots:
+            for root, dirnames, _ in cache_root.walk():
+                if dirnames:
+                    continue
+                try:
+                    pk = int("".join(root.relative_to(cache_root).parts), 16)
+                except ValueError:
+                    continue
+                if pk not in pks:
+                    orphan_pks.add(pk)
+        if orphan_pks:
+            self.log.debug(
+                f"Removing cached pages for {len(orphan_pks)} missing comics."
+            )
+            self.purge_page_caches(orphan_pks)
+
+    def _cleanup_orphan_packed_covers(self) -> None:
+        """Drop packed covers for missing comics and custom covers."""
+        status = FindOrphanCoversStatus()
+        try:
+            self.log.debug("Removing packed covers from missing comics.")
+            self.status_controller.start(status)
+            count = 0
+            for cover_class in (Comic, CustomCover):
+                pks = cover_class.objects.values_list("pk", flat=True).iterator()
+                custom = cover_class is CustomCover
+                count += cover_pack.delete_orphans(pks, custom=custom)
+            if count:
+                self.log.info(f"Removed {count} orphan packed cover thumbnails.")
+        finally:
+            self.status_controller.finish(status)
+
+    def _cleanup_other_cover_store(self) -> None:
+        """Remove the cover store left over from the other ``cover_pack`` mode."""
+        if COVER_PACK:
+            for cover_root in (self.COVERS_ROOT, self.CUSTOM_COVERS_ROOT):
+                if cover_root.exists():
+                    self.log.info(f"Removing unpacked cover cache {cover_root}")
+                    shutil.rmtree(cover_root, ignore_errors=True)
+        elif cover_pack.root.exists():
+            self.log.info(f"Removing cover pack {cover_pack.root}")
+            cover_pack.delete_all()
+
+    def _cleanup_stale_staged_covers(self) -> None:
+        """Remove import-time covers the cover thread never adopted."""
+        if count := remove_stale_staged_covers():
+            self.log.debug(f"Removed {count} stale staged covers.")
+
     def cleanup_orphan_covers(self) -> None:
         """Cleanup both comic and custom covers."""
+        self._cleanup_other_cover_store()
+        self._cleanup_stale_staged_covers()
+        self._cleanup_orphan_page_caches()
+        if COVER_PACK:
+            self._cleanup_orphan_packed_covers()
+            return
         self._cleanup_tmp_covers()
         self._cleanup_orphan_covers(Comic, self.COVERS_ROOT, "comics")
         self._cleanup_orphan_covers(
             CustomCover, self.CUSTOM_COVERS_ROOT, "custom covers"
         )
+
+    def compact_cover_pack(self) -> None:
+        """Reclaim space from packed covers dropped since the last compaction."""
+        if not COVER_PACK:
+            return
+        reclaimed = cover_pack.compact()
+        level = "INFO" if reclaimed else "DEBUG"
+        self.log.log(
+            level, f"Compacted cover pack, reclaimed {naturalsize(reclaimed)}."
+        )
@@ -0,0 +1,103 @@
+"""
+Cover thumbnails captured by the importer.
+
+The importer's read workers already have each new or changed archive
+open, so they render the cover thumbnails there too and stage them
+here, keyed on the archive's path and stat. The cover thread adopts a
+staged cover instead of opening the archive a second time — for CBR
+that's a whole second unrar pass per comic. The stat in the key means
+an archive that changed after it was read never adopts a stale cover;
+the cover thread just renders it the usual way. Unadopted leftovers
+are swept by the nightly orphan cover cleanup.
+"""
+
+import os
+import shutil
+from hashlib import sha256
+from pathlib import Path
+from time import time
+from uuid import uuid4
+
+from codex.librarian.covers.path import COVER_SIZES
+from codex.settings import ROOT_CACHE_PATH
+
+COVER_STAGING_ROOT = ROOT_CACHE_PATH / "cover-staging"
+STALE_STAGED_COVER_SECONDS = 24 * 60 * 60
+_TMP_PREFIX = ".tmp-"
+
+
+def _staged_cover_name(size: str) -> str:
+    return f"cover@{size}.webp" if size else "cover.webp"
+
+
+def get_staged_cover_dir(path_str: str, st: os.stat_result) -> Path:
+    """Get the staging dir for one version of an archive."""
+    key = f"{path_str}\0{st.st_mtime_ns}\0{st.st_size}"
+    digest = sha256(key.encode(errors="surrogateescape")).hexdigest()
+    return COVER_STAGING_ROOT / digest[:2] / digest[2:]
+
+
+def stage_cover(
+    path_str: str, st: os.stat_result, renditions: dict[str, bytes]
+) -> None:
+    """
+    Stage every size of an archive's cover.
+
+    Written to a private tmp dir first and renamed into place, so the
+    cover thread sees all sizes or none.
+    """
+    staged_dir = get_staged_cover_dir(path_str, st)
+    COVER_STAGING_ROOT.mkdir(parents=True, exist_ok=True)
+    tmp_dir = COVER_STAGING_ROOT / f"{_TMP_PREFIX}{os.getpid()}-{uuid4().hex}"
+    tmp_dir.mkdir()
+    try:
+        for size, data in renditions.items():
+            (tmp_dir / _staged_cover_name(size)).write_bytes(data)
+        staged_dir.parent.mkdir(exist_ok=True)
+        shutil.rmtree(staged_dir, ignore_errors=True)
+        tmp_dir.rename(staged_dir)
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+
+def pop_staged_cover(path_str: str) -> dict[str, bytes] | None:
+    """Return and remove the staged cover for an archive's current version."""
+    try:
+        staged_dir = get_staged_cover_dir(path_str, Path(path_str).stat())
+        renditions = {
+            size: (staged_dir / _staged_cover_name(size)).read_bytes()
+            for size in COVER_SIZES
+        }
+    except OSError:
+        return None
+    shutil.rmtree(staged_dir, ignore_errors=True)
+    return renditions
+
+
+def remove_stale_staged_covers(max_age: float = STALE_STAGED_COVER_SECONDS) -> int:
+    """Remove staged covers nothing adopted. Returns the count removed."""
+    if not COVER_STAGING_ROOT.is_dir():
+        return 0
+    cutoff = time() - max_age
+    count = 0
+    for entry in COVER_STAGING_ROOT.iterdir():
+        # Aborted worker tmp dirs sit at the top level, staged covers
+        # one level down.
+        staged_dirs = (
+            (entry,) if entry.name.startswith(_TMP_PREFIX) else entry.iterdir()
+        )
+        for staged_dir in staged_dirs:
+            try:
+                if staged_dir.stat().st_mtime > cutoff:
+                    continue
+            except OSError:
+                continue
+            shutil.rmtree(staged_dir, ignore_errors=True)
+            count += 1
+    return count
+
+
+def remove_all_staged_covers() -> None:
+    """Remove every staged cover."""
+    shutil.rmtree(COVER_STAGING_ROOT, ignore_errors=True)
@@ -17,6 +17,10 @@ class CoverRemoveOrphansTask(CoverTask):
     """Clean up covers from missing comics."""
 
 
+class CoverCompactPackTask(CoverTask):
+    """Reclaim dead space in the cover pack."""
+
+
 @dataclass
 class CoverRemoveTask(CoverTask):
     """Purge a set of comic covers."""
@@ -26,6 +26,7 @@ from codex.librarian.onlinetag.onlinetagd import OnlineTagThread
 from codex.librarian.onlinetag.tasks import OnlineTagTask
 from codex.librarian.restarter.restarter import CodexRestarter
 from codex.librarian.restarter.tasks import CodexRestarterTask
+from codex.librarian.scribe.importer.journal import get_resume_tasks
 from codex.librarian.scribe.scribed import ScribeThread
 from codex.librarian.scribe.search.tasks import SearchIndexSyncTask
 from codex.librarian.scribe.tasks import ScribeTask
@@ -68,13 +69,14 @@ class LibrarianDaemon(Process):
         self.queue = queue
         self.broadcast_queue = broadcast_queue
         self.status_controller = StatusController(logger_, queue)
-        # Startup reconciles the search index against the DB after any
-        # changes made while Codex was offline. Structural folder repair
+        # Startup finishes any search index changes an interrupted import
+        # left in the search change log. The full reconciling scan runs
+        # nightly and on demand. Structural folder repair
         # (adopt-folders, folder-relations) is intentionally *not* here:
         # those only drift from botched imports, are idempotent no-ops
         # when consistent, and belong after a re-poll — they run nightly
         # and on demand instead.
-        startup_tasks = (SearchIndexSyncTask(),)
+        startup_tasks = (SearchIndexSyncTask(changes_only=True),)
 
         for task in startup_tasks:
             self.queue.put(task)
@@ -151,7 +153,16 @@ class LibrarianDaemon(Process):
         self.log.debug(f"Started {self.name}.")
         # Janitor created in init.
         self._create_threads()  # can't do this in init.
+        # Imports a restart or crash cut short resume from their journals.
+        # Collect them before the threads start writing new journals.
+        try:
+            resume_tasks = get_resume_tasks(self.log)
+        except Exception:
+            self.log.exception("Resuming unfinished imports")
+            resume_tasks = ()
         self._start_threads()
+        for task in resume_tasks:
+            self.queue.put(task)
         self.log.success(f"{self.name} ready for tasks.")
 
     def _stop_threads(self) -> None:
@@ -124,6 +124,9 @@ class CreateForeignKeysImporter(CreateForeignKeysCreateUpdateImporter):
         )
         self._update_pending_cover_create_total()
         self.counts.comic += comic_count
+        # The comics are written; log their search changes before an
+        # abort can skip the search index phase.
+        self.log_chunk_fts_changes()
 
         self.clear_fk_link_instance_maps()
         self._submit_coalesced_cover_task()
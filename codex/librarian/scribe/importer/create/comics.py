@@ -116,9 +116,16 @@ class CreateComicsImporter(CreateForeignKeyLinksImporter):
             # FTS_UPDATE accumulates across chunks; setdefault preserves
             # entries already populated by an earlier chunk's pass.
             self.metadata.setdefault(FTS_UPDATE, {})
-            # Get existing comics to update
-            comics = Comic.objects.filter(library=self.library, pk__in=pks).only(
-                PATH_FIELD_NAME, *BULK_UPDATE_COMIC_FIELDS
+            # Get existing comics to update, with the collections
+            # ``presave`` composes into the sort key.
+            comics = (
+                Comic.objects.filter(library=self.library, pk__in=pks)
+                .select_related(*COLLECTION_FIELD_NAMES)
+                .only(
+                    PATH_FIELD_NAME,
+                    *BULK_UPDATE_COMIC_FIELDS,
+                    *Comic.SORT_KEY_RELATED_FIELDS,
+                )
             )
 
             # set attributes for each comic
@@ -29,9 +29,15 @@ class DeletedImporter(DeletedFoldersImporter):
         for model, pks in self.moved_source_collections.items():
             if pks:
                 deleted_comic_collections.setdefault(model, set()).update(pks)
+        # A resumed import also updates collections its earlier attempts changed.
+        start_time = (
+            self.checkpointer.journal.started_at
+            if self.checkpointer
+            else self.start_time
+        )
         timestamp_updater = TimestampUpdater(
             self.log, self.librarian_queue, self.db_write_lock
         )
         timestamp_updater.update_library_collections(
-            self.library, self.start_time, deleted_comic_collections
+            self.library, start_time, deleted_comic_collections
         )
@@ -3,6 +3,7 @@
 from codex.librarian.scribe.importer.const import ALL_COMIC_COLLECTION_FIELD_NAMES
 from codex.librarian.scribe.importer.delete.covers import DeletedCoversImporter
 from codex.librarian.scribe.importer.statii.delete import ImporterRemoveComicsStatus
+from codex.librarian.scribe.search.changes import ALL_FTS_FIELDS
 from codex.models import Comic, Folder, StoryArc
 from codex.settings import (
     IMPORTER_DELETE_MAX_CHUNK_SIZE,
@@ -81,6 +82,7 @@ class DeletedComicsImporter(DeletedCoversImporter):
                 delete_qs.delete()
 
             count = len(delete_comic_pks)
+            self.log_fts_changes(dict.fromkeys(delete_comic_pks, ALL_FTS_FIELDS))
             self.remove_covers(delete_comic_pks, custom=False)
         finally:
             self.status_controller.finish(status)
@@ -0,0 +1,54 @@
+"""
+Fast, path-independent archive content fingerprints.
+
+Hashes the file size, the first and last 64 KiB and, for zip based
+archives, the whole central directory. That's a few reads no matter
+how big the archive is, and every member's name, size and CRC lives in
+the central directory, so two archives that differ anywhere in their
+member data almost surely differ here too. It is not a cryptographic
+identity — matching fingerprints only decide that a deleted comic and
+a created file are the same book that moved.
+"""
+
+import struct
+from hashlib import blake2b
+from pathlib import Path
+
+_EDGE_BYTES = 64 * 1024
+_DIGEST_BYTES = 16
+# End of central directory record: signature, then the central
+# directory's size and offset at fixed positions.
+_ZIP_EOCD_SIGNATURE = b"PK\x05\x06"
+_ZIP_EOCD = struct.Struct("<4s4xHHII")
+_MAX_CENTRAL_DIRECTORY_BYTES = 16 * 1024 * 1024
+
+
+def _zip_central_directory_range(tail: bytes, tail_offset: int) -> tuple[int, int]:
+    """Return the ``(offset, size)`` of the zip central directory or zeros."""
+    index = tail.rfind(_ZIP_EOCD_SIGNATURE)
+    if index < 0 or index + _ZIP_EOCD.size > len(tail):
+        return 0, 0
+    _sig, _disk_entries, _entries, size, offset = _ZIP_EOCD.unpack_from(tail, index)
+    if offset + size > tail_offset + index or size > _MAX_CENTRAL_DIRECTORY_BYTES:
+        # Zip64 or garbage; the tail bytes are still hashed.
+        return 0, 0
+    return offset, size
+
+
+def get_fingerprint(path: str | Path) -> str:
+    """Return the fingerprint of a comic archive."""
+    with Path(path).open("rb") as archive:
+        size = archive.seek(0, 2)
+        digest = blake2b(digest_size=_DIGEST_BYTES)
+        archive.seek(0)
+        digest.update(archive.read(_EDGE_BYTES))
+        tail_offset = max(size - _EDGE_BYTES, 0)
+        archive.seek(tail_offset)
+        tail = archive.read(_EDGE_BYTES)
+        digest.update(tail)
+        cd_offset, cd_size = _zip_central_directory_range(tail, tail_offset)
+        if cd_size and cd_offset < tail_offset:
+            # Large directories start before the tail; hash all of it.
+            archive.seek(cd_offset)
+            digest.update(archive.read(cd_size))
+    return f"{size:x}-{digest.hexdigest()}"
@@ -1,5 +1,6 @@
 """The main importer class."""
 
+from dataclasses import asdict
 from operator import itemgetter
 from time import time
 from types import MappingProxyType
@@ -17,6 +18,8 @@ from codex.librarian.scribe.importer.statii import IMPORTER_STATII
 from codex.librarian.scribe.search.status import SEARCH_INDEX_STATII
 from codex.librarian.scribe.status import SCRIBE_STATII
 from codex.models.comic import Comic
+from codex.settings import IMPORTER_INTERN_SHARED
+from codex.views.browser.page_cache import bump_browser_generation
 
 _REPORT_MAP = MappingProxyType(
     {
@@ -42,6 +45,7 @@ class FinishImporter(InitImporter):
 
     def _get_log_finish_changed_text(self, elapsed, elapsed_time) -> str:
         cache.clear()
+        bump_browser_generation((self.library.pk,))
         log_txt = f"Imported library {self.library.path} in {elapsed}"
         if self.counts.comic:
             cps = round(self.counts.comic / elapsed_time, 1)
@@ -104,14 +108,34 @@ class FinishImporter(InitImporter):
             metadata_imported_at__isnull=True,
         ).update(metadata_imported_at=Now())
 
+    def _save_telemetry(self, *, aborted: bool) -> None:
+        """Persist the run's telemetry for the admin panel."""
+        try:
+            self.telemetry.save(
+                self.library,
+                self.log,
+                phase_times=self.phase_times,
+                counts=asdict(self.counts),
+                elapsed=time() - self.start_time.timestamp(),
+                aborted=aborted,
+                initial_load=self.initial_load,
+            )
+        except Exception:
+            self.log.exception("Saving import telemetry")
+
     def finish(self) -> None:
         """Perform final tasks when the apply is done."""
-        if self.abort_event.is_set():
+        aborted = self.abort_event.is_set()
+        if aborted:
             self.log.info("Import task aborted early.")
         self.abort_event.clear()
         self._stamp_metadata_imported()
+        if IMPORTER_INTERN_SHARED:
+            # Later imports check the interned models haven't changed since.
+            self.key_pks.snapshot()
         self.library.end_update()
         self.status_controller.finish_many(_FINISH_STATII)
         self._log_finish()
+        self._save_telemetry(aborted=aborted)
         if self.counts.failed_imports:
             self.librarian_queue.put(FAILED_IMPORTS_CHANGED_TASK)
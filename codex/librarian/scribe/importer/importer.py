@@ -1,9 +1,20 @@
 """The main importer class."""
 
+from functools import partial
+
+from django.db import connection
+
 from codex.librarian.memory import get_mem_limit
+from codex.librarian.scribe.importer.const import FIS
+from codex.librarian.scribe.importer.journal import ImportCheckpointer
 from codex.librarian.scribe.importer.moved import MovedImporter
 from codex.librarian.scribe.importer.pragmas import importer_pragmas
-from codex.settings import IMPORTER_CHUNK_MEM_FRACTION
+from codex.models import Comic
+from codex.settings import (
+    IMPORTER_CHUNK_MEM_FRACTION,
+    IMPORTER_INITIAL_LOAD,
+    IMPORTER_PIPELINE,
+)
 
 # Per-comic working set per chunk-resident path: Comic instance +
 # LINK_FKS dict + LINK_M2MS sets + FTS payload + ORM cache overhead.
@@ -20,9 +31,13 @@ _CHUNK_FLOOR = 1000
 # typical runs while a misreported 1 PiB host can't compute a
 # stupendous chunk size that pessimizes recovery from abort.
 _CHUNK_CEILING = 500000
+# Smaller first imports aren't worth dropping and rebuilding indexes for.
+_INITIAL_LOAD_FLOOR = 1000
 
 _PRE_PHASES = ("init_apply", "move_and_modify_dirs")
-_PER_COMIC_PHASES = ("read", "query", "create_and_update", "link")
+_READ_PHASES = ("read",)
+_WRITE_PHASES = ("query", "create_and_update", "link")
+_PER_COMIC_PHASES = _READ_PHASES + _WRITE_PHASES
 _POST_PHASES = ("fail_imports", "delete", "full_text_search")
 
 
@@ -39,9 +54,29 @@ class ComicImporter(MovedImporter):
         RAM is much larger.
         """
         mem_budget = get_mem_limit("b") * IMPORTER_CHUNK_MEM_FRACTION
+        if IMPORTER_PIPELINE:
+            # The next chunk's read results wait in memory while the
+            # current chunk is written, so two chunks share the budget.
+            mem_budget /= 2
         raw = int(mem_budget // _PER_COMIC_BYTES)
         return max(_CHUNK_FLOOR, min(_CHUNK_CEILING, raw))
 
+    def _is_initial_load(self) -> bool:
+        """
+        Choose the initial load mode for a large import into an empty library.
+
+        Rebuilding the comic indexes touches every comic in the database,
+        so the import must also outnumber the comics already there.
+        """
+        if not IMPORTER_INITIAL_LOAD:
+            return False
+        num_created = len(self.task.files_created)
+        if num_created < _INITIAL_LOAD_FLOOR:
+            return False
+        if Comic.objects.filter(library_id=self.task.library_id).exists():
+            return False
+        return num_created >= Comic.objects.count()
+
     def _run_phases(self, names: tuple[str, ...]) -> bool:
         """Run named phases in order. Return False if aborted mid-run."""
         for name in names:
@@ -67,6 +102,16 @@ class ComicImporter(MovedImporter):
         and fed back through ``self.task`` per iteration. Created vs
         modified is preserved per-chunk by intersecting with the
         original sets.
+
+        With ``importer.pipeline`` on, chunk N+1's archive reads are
+        submitted to the read pool as soon as chunk N's read phase is
+        done, so extraction overlaps chunk N's database writes instead
+        of alternating with them. At most one chunk is read ahead.
+
+        Each chunk's paths are checkpointed in the import journal once
+        its write phases finish, so a restart resumes with the next
+        chunk. Paths that failed to read stay in the journal to be
+        retried and recorded as failed imports.
         """
         saved_created = self.task.files_created
         saved_modified = self.task.files_modified
@@ -83,32 +128,62 @@ class ComicImporter(MovedImporter):
             return self._run_phases(_PER_COMIC_PHASES)
 
         chunk_size = self._compute_chunk_size()
+        self.telemetry.chunk_size = chunk_size
         # Sort once for deterministic chunk boundaries — useful for
-        # log-diff debugging and for any future resume-from-watermark
-        # work.
+        # log-diff debugging and resuming from the journal.
         path_list = sorted(all_paths)
-        for start in range(0, len(path_list), chunk_size):
-            if self.abort_event.is_set():
-                return False
-            chunk = frozenset(path_list[start : start + chunk_size])
-            self.task.files_created = chunk & saved_created
-            self.task.files_modified = chunk & saved_modified
-            if not self._run_phases(_PER_COMIC_PHASES):
-                return False
+        chunks = [
+            frozenset(path_list[start : start + chunk_size])
+            for start in range(0, len(path_list), chunk_size)
+        ]
+        try:
+            for index, chunk in enumerate(chunks):
+                if self.abort_event.is_set():
+                    return False
+                self.task.files_created = chunk & saved_created
+                self.task.files_modified = chunk & saved_modified
+                if not self._run_phases(_READ_PHASES):
+                    return False
+                if IMPORTER_PIPELINE and index + 1 < len(chunks):
+                    prefetch = partial(self.prefetch_extract, chunks[index + 1])
+                    self.timed_step("read.prefetch", prefetch)
+                if not self._run_phases(_WRITE_PHASES):
+                    return False
+                if self.checkpointer:
+                    finished_paths = chunk - self.metadata.get(FIS, {}).keys()
+                    self.checkpointer.checkpoint_chunk(
+                        finished_paths, _WRITE_PHASES[-1]
+                    )
+        finally:
+            self.close_prefetched_extract()
         return True
 
     def apply(self) -> None:
         """Bulk import comics."""
+        pragma_stats: dict[str, int] = {}
         try:
             self.abort_event.clear()
+            checkpointer = ImportCheckpointer(self.task, self.start_time)
+            self.checkpointer = checkpointer
+            self.initial_load = self._is_initial_load()
+            if self.initial_load:
+                self.log.info(
+                    f"Initial load of {self.library.path}: deferring indexes."
+                )
             # ``importer_pragmas`` bumps the page cache and defers
             # WAL checkpoints for the duration of the run, then
             # force-checkpoints + ``PRAGMA optimize`` on exit.
-            with importer_pragmas():
+            with (
+                connection.execute_wrapper(self.telemetry.count_query),
+                importer_pragmas(initial_load=self.initial_load) as pragma_stats,
+            ):
                 if not self._run_phases(_PRE_PHASES):
                     return
+                checkpointer.checkpoint_pre_phases(self.task, _PRE_PHASES[-1])
                 if not self._run_per_comic_phases_chunked():
                     return
-                self._run_phases(_POST_PHASES)
+                if self._run_phases(_POST_PHASES):
+                    checkpointer.finish()
         finally:
+            self.telemetry.pages_written = pragma_stats.get("wal_frames", 0)
             self.finish()
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Any
 from django.utils.timezone import now
 
 from codex.librarian.covers.status import CreateCoversStatus
+from codex.librarian.scribe.importer.intern import get_intern_cache
 from codex.librarian.scribe.importer.statii.create import (
     ImporterCreateComicsStatus,
     ImporterCreateCoversStatus,
@@ -48,6 +49,7 @@ from codex.librarian.scribe.importer.statii.search import (
     ImporterFTSUpdateStatus,
 )
 from codex.librarian.scribe.importer.tasks import ImportTask
+from codex.librarian.scribe.importer.telemetry import ImportTelemetry
 from codex.librarian.scribe.search.status import SearchIndexCleanStatus
 from codex.librarian.scribe.status import UpdateCollectionTimestampsStatus
 from codex.librarian.worker import WorkerStatusBase
@@ -55,6 +57,7 @@ from codex.models import Library
 from codex.settings import LOGLEVEL
 
 if TYPE_CHECKING:
+    from codex.librarian.scribe.importer.journal import ImportCheckpointer
     from codex.models.base import BaseModel
     from codex.models.collections import BrowserCollectionModel, Folder
 
@@ -122,6 +125,10 @@ class InitImporter(WorkerStatusBase):
         self.fk_link_instance_maps: dict[str, dict[tuple, BaseModel]] = {}
         self.protagonist_instance_maps: dict[str, dict[str, BaseModel]] = {}
         self.parent_folder_map: dict[str, Folder] = {}
+        # Reference data key tuples resolved to pks by earlier chunks (or
+        # earlier imports with ``importer.intern_shared``), so the link
+        # phase only queries keys it hasn't seen.
+        self.key_pks = get_intern_cache()
         # Per-import accumulator of collections a comic moved OUT of when its
         # publisher/imprint/series/volume FK changed during an update. The
         # delete phase folds these into ``TimestampUpdater``'s force-update map
@@ -136,6 +143,17 @@ class InitImporter(WorkerStatusBase):
         # import pass processed (including the SKIPPED no-metadata comics that
         # never reach the per-comic write path).
         self.metadata_import_paths: frozenset[str] = frozenset()
+        # Comics and search columns this import recorded in the search
+        # change log, and the logged comics an earlier unfinished import
+        # left there. The first are cleared from the log once the
+        # search index phase writes them; the second are left for the
+        # search sync.
+        self.fts_logged_changes: dict[int, frozenset[str]] = {}
+        self.fts_carried_over_pks: set[int] = set()
+        # Large first import into an empty library. Runs without the
+        # secondary comic indexes and builds the search index from the
+        # database at the end instead of staging entries per chunk.
+        self.initial_load = False
         self.library = Library.objects.only("path").get(pk=self.task.library_id)
         self.abort_event = event
         self.start_time = now()
@@ -146,16 +164,22 @@ class InitImporter(WorkerStatusBase):
         # parent's). Logged as a share table at finish and read
         # directly by bin/benchmark-import.py.
         self.phase_times: dict[str, float] = {}
+        # Per-phase queries and rows, saved with the times at finish.
+        self.telemetry = ImportTelemetry()
+        # Progress journal for resuming after a restart, opened by apply.
+        self.checkpointer: ImportCheckpointer | None = None
         self._is_log_debug_task = (
             self.log.level(LOGLEVEL).no <= self.log.level("DEBUG").no
         )
 
     def timed_step(self, name: str, method: Callable[[], Any]) -> Any:
         """Run a method, accumulating its wall time into phase_times."""
+        counters = self.telemetry.start_phase()
         start = perf_counter()
         result = method()
         elapsed = perf_counter() - start
         self.phase_times[name] = self.phase_times.get(name, 0.0) + elapsed
+        self.telemetry.end_phase(name, counters)
         return result
 
     def _wait_for_filesystem_ops_to_finish(self) -> bool:
@@ -0,0 +1,136 @@
+"""
+Intern reference data keys across import chunks.
+
+Every chunk resolves the publisher, series, credit and tag keys its
+comics link to, and most are the same few thousand rows each time.
+Resolved pks are kept so later chunks only query keys they haven't seen.
+An import never deletes reference rows and their keys don't change, so
+the pks stay valid for the whole import. Folders are the exception,
+moves change their paths, so they aren't interned.
+
+With ``importer.intern_shared`` on, the cache outlives the import and
+serves later imports. The janitor's orphan cleanup clears it, and each
+interned model's row count and top pk are checked at the start of every
+import, so rows deleted elsewhere don't leave stale pks behind.
+"""
+
+from collections.abc import Callable, Iterable
+from functools import cache
+
+from django.db.models import Count, Max
+
+from codex.librarian.memory import get_mem_limit
+from codex.models import Folder
+from codex.models.base import BaseModel
+from codex.settings import IMPORTER_INTERN_MEM_FRACTION, IMPORTER_INTERN_SHARED
+
+# An interned key tuple, its pk and their share of the dict.
+_ENTRY_BYTES = 256
+_UNINTERNED_MODELS = frozenset({Folder})
+
+
+class KeyInternCache:
+    """Map reference data key tuples to pks within a memory budget."""
+
+    def __init__(self) -> None:
+        """Size the cache for the memory budget."""
+        self._max_entries = int(
+            get_mem_limit("b") * IMPORTER_INTERN_MEM_FRACTION // _ENTRY_BYTES
+        )
+        # (model, key rels) -> key tuple -> pk
+        self._maps: dict[tuple[type[BaseModel], tuple[str, ...]], dict] = {}
+        self._num_entries = 0
+        # model -> (row count, top pk) when last validated
+        self._snapshots: dict[type[BaseModel], tuple[int, int | None]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of interned keys."""
+        return self._num_entries
+
+    def _evict(self, num: int) -> None:
+        """Drop the oldest keys."""
+        for pk_map in self._maps.values():
+            while pk_map and num > 0:
+                del pk_map[next(iter(pk_map))]
+                self._num_entries -= 1
+                num -= 1
+            if num <= 0:
+                return
+
+    def _add(self, pk_map: dict[tuple, int], found: dict[tuple, int]) -> None:
+        if len(found) > self._max_entries:
+            return
+        if (overflow := self._num_entries + len(found) - self._max_entries) > 0:
+            self._evict(overflow)
+        pk_map.update(found)
+        self._num_entries += len(found)
+
+    def resolve(
+        self,
+        model: type[BaseModel],
+        rels: tuple[str, ...],
+        key_tuples: Iterable[tuple],
+        query: Callable[[set[tuple]], dict[tuple, int]],
+    ) -> dict[tuple, int]:
+        """Resolve key tuples to pks, querying only the uninterned ones."""
+        if model in _UNINTERNED_MODELS:
+            return query(set(key_tuples))
+        pk_map = self._maps.setdefault((model, rels), {})
+        result = {}
+        missing = set()
+        for key in key_tuples:
+            if (pk := pk_map.get(key)) is None:
+                missing.add(key)
+            else:
+                result[key] = pk
+        if missing:
+            found = query(missing)
+            result.update(found)
+            self._add(pk_map, found)
+        return result
+
+    def _drop_model(self, model: type[BaseModel]) -> None:
+        for map_key in tuple(self._maps):
+            if map_key[0] is model:
+                self._num_entries -= len(self._maps.pop(map_key))
+
+    def validate(self) -> None:
+        """Drop models whose rows changed since the last import."""
+        for model in {map_key[0] for map_key in self._maps}:
+            aggregate = model.objects.aggregate(count=Count("pk"), max_pk=Max("pk"))
+            snapshot = (aggregate["count"], aggregate["max_pk"])
+            if self._snapshots.get(model) != snapshot:
+                self._drop_model(model)
+
+    def snapshot(self) -> None:
+        """Record the interned models' rows after an import."""
+        self._snapshots = {}
+        for model in {map_key[0] for map_key in self._maps}:
+            aggregate = model.objects.aggregate(count=Count("pk"), max_pk=Max("pk"))
+            self._snapshots[model] = (aggregate["count"], aggregate["max_pk"])
+
+    def clear(self) -> None:
+        """Drop every interned key."""
+        self._maps = {}
+        self._num_entries = 0
+        self._snapshots = {}
+
+
+@cache
+def _get_shared_cache() -> KeyInternCache:
+    return KeyInternCache()
+
+
+def get_intern_cache() -> KeyInternCache:
+    """Return the shared cache if configured, or a new one for one import."""
+    if not IMPORTER_INTERN_SHARED:
+        return KeyInternCache()
+    shared_cache = _get_shared_cache()
+    shared_cache.validate()
+    return shared_cache
+
+
+def clear_shared_intern_cache() -> None:
+    """Clear the shared cache after reference rows are deleted."""
+    if _get_shared_cache.cache_info().currsize:
+        _get_shared_cache().clear()
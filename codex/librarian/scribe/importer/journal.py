@@ -0,0 +1,124 @@
+"""
+Journal unfinished imports so they resume after a restart.
+
+An import records its task in an :class:`~codex.models.library.ImportJournal`
+row before it starts, then checkpoints it after the pre phases and after
+each chunk's write phases, dropping the work every phase has finished.
+A finished import deletes its journal. An import cut short by a restart,
+an OOM kill or an ``ImportAbortTask`` leaves it behind, and the
+librarian queues the remaining work on startup instead of waiting for
+the next poll to diff the whole library again.
+"""
+
+from collections.abc import Mapping
+from dataclasses import fields
+from datetime import datetime
+
+from codex.librarian.scribe.importer.tasks import ImportTask
+from codex.models import ImportJournal
+
+# An import that dies on every attempt is given up on after this many.
+_MAX_ATTEMPTS = 3
+# Finished by the pre phases.
+_PRE_PHASE_FIELDS = ("dirs_moved", "dirs_modified", "files_moved", "covers_moved")
+# Finished by the first chunk's query phase.
+_COVER_FIELDS = ("covers_created", "covers_modified")
+_CHUNK_FIELDS = ("files_created", "files_modified")
+_NOT_JOURNALED = frozenset({"library_id", "journal_id"})
+
+
+def dump_task(task: ImportTask) -> dict:
+    """Serialize an import task's work to JSON types."""
+    data = {}
+    for task_field in fields(task):
+        name = task_field.name
+        if name in _NOT_JOURNALED:
+            continue
+        value = getattr(task, name)
+        if isinstance(value, Mapping):
+            value = dict(value)
+        elif isinstance(value, frozenset):
+            value = sorted(value)
+        data[name] = value
+    return data
+
+
+def load_task(journal: ImportJournal) -> ImportTask:
+    """Rebuild the remaining import task from its journal."""
+    names = frozenset(task_field.name for task_field in fields(ImportTask))
+    kwargs = {
+        name: frozenset(value) if isinstance(value, list) else value
+        for name, value in journal.task.items()
+        if name in names - _NOT_JOURNALED
+    }
+    return ImportTask(library_id=journal.library_id, journal_id=journal.pk, **kwargs)
+
+
+def get_resume_tasks(log) -> tuple[ImportTask, ...]:
+    """Return import tasks for the journals unfinished imports left behind."""
+    tasks = []
+    for journal in ImportJournal.objects.order_by("created_at"):
+        if journal.attempts >= _MAX_ATTEMPTS:
+            log.warning(
+                f"Not resuming import of library {journal.library_id} again"
+                f" after {journal.attempts} attempts. The next poll will"
+                " pick up its changes."
+            )
+            journal.delete()
+            continue
+        journal.attempts += 1
+        journal.save(update_fields=("attempts", "updated_at"))
+        task = load_task(journal)
+        log.info(
+            f"Resuming unfinished import of library {journal.library_id}"
+            f" after {journal.phase or 'start'} with {task.total()} changes left."
+        )
+        tasks.append(task)
+    return tuple(tasks)
+
+
+class ImportCheckpointer:
+    """Checkpoint one import's progress in its journal."""
+
+    def __init__(self, task: ImportTask, start_time: datetime) -> None:
+        """Open the task's journal or start one."""
+        journal = None
+        if task.journal_id:
+            journal = ImportJournal.objects.filter(pk=task.journal_id).first()
+        if not journal:
+            journal = ImportJournal.objects.create(
+                library_id=task.library_id,
+                started_at=start_time,
+                task=dump_task(task),
+            )
+        self.journal = journal
+        self._chunk_paths: dict[str, set[str]] = {}
+
+    def checkpoint_pre_phases(self, task: ImportTask, phase: str) -> None:
+        """Record the moves and folder updates done."""
+        # Moves detected by fingerprint change the created and deleted sets.
+        data = dump_task(task)
+        for name in _PRE_PHASE_FIELDS:
+            data[name] = type(data[name])()
+        self.journal.task = data
+        self._chunk_paths = {name: set(data[name]) for name in _CHUNK_FIELDS}
+        self._save(phase)
+
+    def checkpoint_chunk(self, finished_paths: frozenset[str], phase: str) -> None:
+        """Record a chunk's paths finished."""
+        data = self.journal.task
+        for name, paths in self._chunk_paths.items():
+            paths.difference_update(finished_paths)
+            data[name] = sorted(paths)
+        for name in _COVER_FIELDS:
+            data[name] = []
+        self.journal.chunks_done += 1
+        self._save(phase)
+
+    def _save(self, phase: str) -> None:
+        self.journal.phase = phase
+        self.journal.save(update_fields=("task", "phase", "chunks_done", "updated_at"))
+
+    def finish(self) -> None:
+        """Delete the finished import's journal."""
+        self.journal.delete()
@@ -0,0 +1,54 @@
+"""
+Match import keys against the database through a TEMP table.
+
+Filtering thousands of keys with ``IN (...)`` lists or ``OR`` chains
+costs a statement per batch, because SQLite caps bound variables and
+expression depth. Loading the keys into a connection-local TEMP table
+with one ``executemany`` lets a single statement per model match them
+all with an indexed join.
+"""
+
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+
+from django.db import connection
+from django.db.models.expressions import RawSQL
+
+_TABLE_NAME_PREFIX = "codex_import_keys"
+
+
+@contextmanager
+def temp_key_table(rows: Iterable[tuple], num_columns: int = 1) -> Iterator[str]:
+    """
+    Load key rows into a TEMP table and yield its name.
+
+    Columns are named ``c0``, ``c1``… and untyped, so values keep the
+    type they were bound with. Rows are deduplicated and must not
+    contain None.
+    """
+    name = f"{_TABLE_NAME_PREFIX}_{num_columns}"
+    table = f"temp.{name}"
+    columns = ", ".join(f"c{index}" for index in range(num_columns))
+    placeholders = ", ".join(("%s",) * num_columns)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {name}"
+            f" ({columns}, PRIMARY KEY ({columns})) WITHOUT ROWID"
+        )
+        cursor.execute(f"DELETE FROM {table}")  # noqa: S608
+        cursor.executemany(
+            f"INSERT OR IGNORE INTO {table} VALUES ({placeholders})",  # noqa: S608
+            rows,
+        )
+    try:
+        yield table
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {table}")  # noqa: S608
+
+
+def select_keys(table: str) -> RawSQL:
+    """Subquery selecting a single column key table for an ``__in`` lookup."""
+    # The table name is generated here, never from input; the key values
+    # are bound when the table is loaded.
+    return RawSQL(f"SELECT c0 FROM {table}", ())  # noqa: S608, S611
@@ -31,6 +31,10 @@ class LinkComicsImporter(LinkManyToManyImporter):
         readers immediately.
         """
         self.counts.link += self.link_comic_m2m_fields()
+        # Extend the logged search changes with the linked tag columns.
+        self.log_chunk_fts_changes()
+        if self.initial_load:
+            self.discard_fts_entries()
         if self.abort_event.is_set():
             return
         if count := self.link_custom_covers():
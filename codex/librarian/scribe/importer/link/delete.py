@@ -1,8 +1,8 @@
 """Delete stale m2ms."""
 
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
-from django.db.models import ManyToManyField, Q
+from django.db.models.expressions import RawSQL
 
 from codex.librarian.scribe.importer.const import (
     DELETE_M2MS,
@@ -10,31 +10,37 @@ from codex.librarian.scribe.importer.const import (
     FTS_UPDATE,
     get_through_model,
 )
+from codex.librarian.scribe.importer.key_table import temp_key_table
 from codex.librarian.scribe.importer.link.prepare import LinkComicsImporterPrepare
 from codex.models import Comic
 from codex.models.base import BaseModel
-from codex.settings import IMPORTER_FILTER_BATCH_SIZE
+
+if TYPE_CHECKING:
+    from django.db.models import ManyToManyField
 
 
 class LinkImporterDelete(LinkComicsImporterPrepare):
     """Delete stale m2ms."""
 
-    def _delete_m2m_field_batch(
-        self,
+    @staticmethod
+    def _delete_m2m_field_rows(
         column_name: str,
         through_model: type[BaseModel],
-        batch_rows: tuple,
-        comic_ids: set[int],
-    ):
-        del_filter = Q()
-        for row in batch_rows:
-            comic_id, model_id = row
-            del_filter_dict = {"comic_id": comic_id, column_name: model_id}
-            del_filter |= Q(**del_filter_dict)
-            comic_ids.add(comic_id)
-
-        qs = through_model.objects.filter(del_filter)
-        count, _ = qs.delete()
+        rows: tuple,
+    ) -> int:
+        """Delete (comic_id, model_id) relations matched through a key table."""
+        through_table = through_model._meta.db_table
+        pk_column = through_model._meta.pk.column
+        with temp_key_table(rows, num_columns=2) as table:
+            sql = (
+                f"SELECT through.{pk_column} FROM {through_table} AS through"  # noqa: S608
+                f" JOIN {table} AS keys ON through.comic_id = keys.c0"
+                f" AND through.{column_name} = keys.c1"
+            )
+            # Only model metadata and the key table name are interpolated;
+            # the key values are bound when the table is loaded.
+            pks = RawSQL(sql, ())  # noqa: S611
+            count, _ = through_model.objects.filter(pk__in=pks).delete()
         return count
 
     def _delete_m2m_fts_entries(self, field_name: str, comic_ids: set[int]) -> None:
@@ -49,11 +55,10 @@ class LinkImporterDelete(LinkComicsImporterPrepare):
 
     def delete_m2m_field(self, field_name: str, delete_m2ms: dict, status) -> int:
         """Delete one comic field's m2m relations."""
-        total_field_count = 0
         rows = tuple(delete_m2ms.pop(field_name, ()))
         num_rows = len(rows)
         if not num_rows:
-            return total_field_count
+            return 0
         status.subtitle = f"Delete stale {field_name} links"
         self.status_controller.update(status)
         # ``Comic._meta.get_field`` returns the broad ``Field |
@@ -64,28 +69,19 @@ class LinkImporterDelete(LinkComicsImporterPrepare):
         table_name = related_model._meta.db_table
         column_name = table_name.removeprefix("codex_") + "_id"
         through_model = get_through_model(field)
-        comic_ids = set()
+        comic_ids = {row[0] for row in rows}
 
-        start = 0
-        while start < num_rows:
-            end = start + IMPORTER_FILTER_BATCH_SIZE
-            batch_rows = rows[start:end]
-            count = self._delete_m2m_field_batch(
-                column_name, through_model, batch_rows, comic_ids
+        count = self._delete_m2m_field_rows(column_name, through_model, rows)
+        status.complete += count
+        if count:
+            self.log.info(
+                f"Deleted {count}/{num_rows} stale {field_name} relations for altered comics.",
             )
-            status.complete += count
-            total_field_count += count
-            if count:
-                self.log.info(
-                    f"Deleted {total_field_count}/{num_rows} stale {field_name} relations for altered comics.",
-                )
-
-            self.status_controller.update(status)
-            start += IMPORTER_FILTER_BATCH_SIZE
+        self.status_controller.update(status)
 
         self._delete_m2m_fts_entries(field_name, comic_ids)
 
-        return total_field_count
+        return count
 
     def delete_m2ms(self, status) -> int:
         """Delete old missing m2ms."""
@@ -1,6 +1,7 @@
 """Prepare links with database objects."""
 
 from collections.abc import Iterable, Mapping
+from functools import partial
 from typing import TYPE_CHECKING
 
 from django.db.models.query_utils import Q
@@ -13,12 +14,12 @@ from codex.librarian.scribe.importer.const import (
     MODEL_SELECTOR_REL_MAP,
     NON_FTS_FIELDS,
 )
+from codex.librarian.scribe.importer.key_table import select_keys, temp_key_table
 from codex.librarian.scribe.importer.link.const import COMPLEX_MODEL_FIELD_NAMES
 from codex.librarian.scribe.importer.link.covers import (
     LinkCoversImporter,
 )
 from codex.models import Comic
-from codex.settings import IMPORTER_LINK_FK_BATCH_SIZE
 
 if TYPE_CHECKING:
     from codex.models.base import BaseModel
@@ -88,16 +89,11 @@ class LinkComicsImporterPrepare(LinkCoversImporter):
     def _build_pk_map_single_key(
         model: type["BaseModel"], rel: str, key_tuples: set[tuple]
     ) -> dict[tuple, int]:
-        """Resolve key tuples for a single-column model via batched IN."""
-        pk_map: dict[tuple, int] = {}
-        # IN clause batched against SQLite's 32766-variable cap.
-        values = sorted({tup[0] for tup in key_tuples if tup})
-        for start in range(0, len(values), IMPORTER_LINK_FK_BATCH_SIZE):
-            batch = values[start : start + IMPORTER_LINK_FK_BATCH_SIZE]
-            rows = model.objects.filter(**{f"{rel}__in": batch}).values_list("pk", rel)
-            for pk, key in rows:
-                pk_map[(key,)] = pk
-        return pk_map
+        """Resolve key tuples for a single-column model through a key table."""
+        rows = ((tup[0],) for tup in key_tuples if tup and tup[0] is not None)
+        with temp_key_table(rows) as table:
+            qs = model.objects.filter(**{f"{rel}__in": select_keys(table)})
+            return {(key,): pk for pk, key in qs.values_list("pk", rel)}
 
     @staticmethod
     def _build_pk_map_rows(
@@ -114,26 +110,23 @@ class LinkComicsImporterPrepare(LinkCoversImporter):
         """
         Resolve key tuples for a multi-column model.
 
-        Narrowed by one indexed IN on the model's selector key rel —
-        exact matching happens through the returned map, so superset
-        rows (same selector value under a different parent) are
-        harmless extra entries. Keys with a None selector value
-        (selector columns are non-null, so normally none) fall back to
-        batched Q-OR chains.
+        Narrowed by one indexed IN on the model's selector key rel
+        against a key table — exact matching happens through the
+        returned map, so superset rows (same selector value under a
+        different parent) are harmless extra entries. Keys with a None
+        selector value (selector columns are non-null, so normally
+        none) fall back to batched Q-OR chains.
         """
         pk_map: dict[tuple, int] = {}
         residual_tuples = key_tuples
         selector_rel = MODEL_SELECTOR_REL_MAP.get(model)
         if selector_rel and selector_rel in rels:
             index = rels.index(selector_rel)
-            selector_values = sorted(
-                {tup[index] for tup in key_tuples if tup[index] is not None}
-            )
+            rows = ((tup[index],) for tup in key_tuples if tup[index] is not None)
             residual_tuples = {tup for tup in key_tuples if tup[index] is None}
-            for start in range(0, len(selector_values), IMPORTER_LINK_FK_BATCH_SIZE):
-                batch = selector_values[start : start + IMPORTER_LINK_FK_BATCH_SIZE]
-                or_q = Q(**{f"{selector_rel}__in": batch})
-                pk_map.update(cls._build_pk_map_rows(model, rels, or_q))
+            with temp_key_table(rows) as table:
+                selector_q = Q(**{f"{selector_rel}__in": select_keys(table)})
+                pk_map.update(cls._build_pk_map_rows(model, rels, selector_q))
         # Q-OR chain batched at a planner-friendly cap.
         tuples = sorted(residual_tuples, key=_none_safe_key)
         for start in range(0, len(tuples), _M2M_OR_CHAIN_CAP):
@@ -148,12 +141,14 @@ class LinkComicsImporterPrepare(LinkCoversImporter):
         self, field_name: str, key_tuples: set[tuple]
     ) -> dict[tuple, int]:
         """
-        Issue batched query/queries for one M2M field.
+        Resolve one field's key tuples to pks.
 
         Returns ``{key_tuple: pk}`` covering every key the import touches
-        for ``field_name``. One round-trip per ``IMPORTER_LINK_FK_BATCH_SIZE``
-        chunk for single-column models, one per ``_M2M_OR_CHAIN_CAP``
-        chunk for multi-column complex models.
+        for ``field_name``. Keys interned by earlier chunks aren't
+        queried again. The rest are matched through a TEMP key table, so
+        one round-trip resolves them all, plus one per
+        ``_M2M_OR_CHAIN_CAP`` chunk of residual keys without a selector
+        value.
         """
         if not key_tuples:
             return {}
@@ -161,8 +156,10 @@ class LinkComicsImporterPrepare(LinkCoversImporter):
         model: type[BaseModel] = field.related_model  # pyright: ignore[reportAssignmentType], # ty: ignore[invalid-assignment]
         rels = FIELD_NAME_KEYS_REL_MAP[field_name]
         if len(rels) == 1:
-            return self._build_pk_map_single_key(model, rels[0], key_tuples)
-        return self._build_pk_map_multi_key(model, rels, key_tuples)
+            query = partial(self._build_pk_map_single_key, model, rels[0])
+        else:
+            query = partial(self._build_pk_map_multi_key, model, rels)
+        return self.key_pks.resolve(model, rels, key_tuples, query)
 
     def _build_m2m_pk_maps(
         self, per_field: Mapping[str, set[tuple]]
@@ -224,7 +221,9 @@ class LinkComicsImporterPrepare(LinkCoversImporter):
 
         # Phase 3: per-comic stitch — pure dict lookups, no SQL.
         comic_paths = tuple(link_m2ms.keys())
-        comics = Comic.objects.filter(path__in=comic_paths).values_list("pk", "path")
+        comics = Comic.objects.filter(
+            library=self.library, path__in=comic_paths
+        ).values_list("pk", "path")
         for comic_pk, comic_path in comics:
             md = link_m2ms.get(comic_path, {})
             for field_name, value_tuples in md.items():
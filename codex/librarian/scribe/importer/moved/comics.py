@@ -12,16 +12,97 @@ from codex.librarian.scribe.importer.const import (
     PARENT_FOLDER_FIELD_NAME,
     PATH_FIELD_NAME,
 )
+from codex.librarian.scribe.importer.fingerprint import get_fingerprint
 from codex.librarian.scribe.importer.read import ReadMetadataImporter
 from codex.librarian.scribe.importer.statii.create import ImporterCreateTagsStatus
 from codex.librarian.scribe.importer.statii.moved import ImporterMoveComicsStatus
 from codex.librarian.scribe.importer.statii.query import ImporterQueryMissingTagsStatus
 from codex.models import Comic, CustomCover, Folder
+from codex.settings import IMPORTER_FINGERPRINT
 
 
 class MovedComicsImporter(ReadMetadataImporter):
     """Methods for moving comics and folders."""
 
+    # Destinations of moves paired by content fingerprint this import.
+    fingerprint_moved_paths: frozenset[str] = frozenset()
+
+    def _get_deleted_comic_fingerprints(self) -> tuple[dict[str, list[str]], set]:
+        """Map fingerprints of deleted comics to their paths, and collect sizes."""
+        src_paths_by_fingerprint: dict[str, list[str]] = {}
+        sizes = set()
+        deleted_comics = (
+            Comic.objects.filter(library=self.library, path__in=self.task.files_deleted)
+            .exclude(fingerprint="")
+            .values_list(PATH_FIELD_NAME, "size", "fingerprint")
+        )
+        for path, size, fingerprint in deleted_comics:
+            src_paths_by_fingerprint.setdefault(fingerprint, []).append(path)
+            sizes.add(size)
+        return src_paths_by_fingerprint, sizes
+
+    def _get_created_file_fingerprints(
+        self, src_paths_by_fingerprint: Mapping[str, list[str]], sizes: set
+    ) -> dict[str, list[str]]:
+        """Fingerprint only created files the size of some deleted comic."""
+        dest_paths_by_fingerprint: dict[str, list[str]] = {}
+        for path_str in sorted(self.task.files_created):
+            try:
+                if Path(path_str).stat().st_size not in sizes:
+                    continue
+                fingerprint = get_fingerprint(path_str)
+            except OSError as exc:
+                self.log.debug(f"Could not fingerprint {path_str}: {exc}")
+                continue
+            if fingerprint in src_paths_by_fingerprint:
+                dest_paths_by_fingerprint.setdefault(fingerprint, []).append(path_str)
+        return dest_paths_by_fingerprint
+
+    def _pair_moved_comics_by_fingerprint(self) -> None:
+        """
+        Turn deletes paired with identical creates into moves.
+
+        The poller and the watcher only infer moves from inode matches,
+        so a move across filesystems, a copy-then-delete, or a sync tool
+        that rewrites files arrives as a delete and a create. The comic
+        would be deleted and reimported from scratch, losing its pk and
+        with it bookmarks, favorites and covers. Pair them instead when
+        exactly one deleted comic and exactly one created file share a
+        content fingerprint. Ambiguous matches, such as duplicate files,
+        stay a delete and a create.
+        """
+        if not (
+            IMPORTER_FINGERPRINT and self.task.files_deleted and self.task.files_created
+        ):
+            return
+        src_paths_by_fingerprint, sizes = self._get_deleted_comic_fingerprints()
+        if not src_paths_by_fingerprint:
+            return
+        dest_paths_by_fingerprint = self._get_created_file_fingerprints(
+            src_paths_by_fingerprint, sizes
+        )
+        moves: dict[str, str] = {}
+        ambiguous_paths: list[str] = []
+        for fingerprint, dest_paths in dest_paths_by_fingerprint.items():
+            src_paths = src_paths_by_fingerprint[fingerprint]
+            if len(src_paths) == 1 and len(dest_paths) == 1:
+                moves[src_paths[0]] = dest_paths[0]
+            else:
+                ambiguous_paths.extend(dest_paths)
+        if ambiguous_paths:
+            self.log.debug(
+                f"Not pairing ambiguous fingerprint moves to: {ambiguous_paths}"
+            )
+        if not moves:
+            return
+        self.task.files_moved = {**self.task.files_moved, **moves}
+        self.task.files_deleted = self.task.files_deleted - moves.keys()
+        self.task.files_created = self.task.files_created - frozenset(moves.values())
+        self.fingerprint_moved_paths = frozenset(moves.values())
+        count = len(moves)
+        plural = "s" if count != 1 else ""
+        self.log.info(f"Detected {count} moved comic{plural} by content fingerprint.")
+
     def _remove_file_move_collisions(
         self,
         model: type[Comic] | type[CustomCover],
@@ -127,6 +208,7 @@ class MovedComicsImporter(ReadMetadataImporter):
         """Prepare one comic for bulk update."""
         try:
             new_path_str = self.task.files_moved[comic.path]
+            old_stat = comic.stat
             old_folder_pks = frozenset(folder.pk for folder in comic.folders.all())
             comic.path = new_path_str
             new_path = Path(new_path_str)
@@ -140,6 +222,10 @@ class MovedComicsImporter(ReadMetadataImporter):
             comic.parent_folder_id = folder_pk_by_path[str(new_path.parent)]
             comic.updated_at = Now()
             comic.presave()
+            if new_path_str not in self.fingerprint_moved_paths:
+                # Only contents proven unchanged keep the new stat. An inode
+                # move keeps the old one so the poller still re-reads it.
+                comic.stat = old_stat
             # Missing ancestors silently absent from the set, matching
             # the prior ``filter(path__in=...)`` behavior.
             new_folder_pks = frozenset(
@@ -170,7 +256,7 @@ class MovedComicsImporter(ReadMetadataImporter):
         comics = (
             Comic.objects.prefetch_related(FOLDERS_FIELD_NAME)
             .filter(library=self.library, path__in=self.task.files_moved.keys())
-            .only(PATH_FIELD_NAME, PARENT_FOLDER_FIELD_NAME, FOLDERS_FIELD_NAME)
+            .only(PATH_FIELD_NAME, PARENT_FOLDER_FIELD_NAME, FOLDERS_FIELD_NAME, "stat")
         )
 
         folder_m2m_links: dict = {}
@@ -194,6 +280,7 @@ class MovedComicsImporter(ReadMetadataImporter):
     def bulk_comics_moved(self) -> int:
         """Move comics."""
         count = 0
+        self._pair_moved_comics_by_fingerprint()
         num_files_moved = len(self.task.files_moved)
         status = ImporterMoveComicsStatus(0, num_files_moved)
         try:
@@ -215,7 +302,12 @@ class MovedComicsImporter(ReadMetadataImporter):
 
             # Update comics
             # Potentially could just add these to the right structures and do it later during create and link.
-            Comic.objects.bulk_update(updated_comics, MOVED_BULK_COMIC_UPDATE_FIELDS)
+            update_fields = MOVED_BULK_COMIC_UPDATE_FIELDS
+            if self.fingerprint_moved_paths:
+                # Fingerprint moves keep their new stat, which stops the
+                # poller re-emitting the file as modified.
+                update_fields = (*update_fields, "stat")
+            Comic.objects.bulk_update(updated_comics, update_fields)
             if del_rows_map:
                 self.delete_m2m_field(FOLDERS_FIELD_NAME, del_rows_map, status)
             if folder_m2m_links:
@@ -24,17 +24,29 @@ On exit, the steady-state values are restored, the WAL is
 force-checkpointed (otherwise it would carry the import's worth of
 deferred frames forever), and ``PRAGMA optimize`` is fired so the
 query planner uses fresh statistics post-import.
+
+An initial load (a large first import into an empty library) also
+drops the secondary indexes on the comic table and its many to many
+link tables, so the bulk inserts skip B-tree maintenance, and builds
+them again in one pass on exit followed by a full ``ANALYZE``. Unique
+indexes stay: the importer's upserts and link queries need them. The
+dropped index SQL is saved next to the database first so a killed
+import gets its indexes back at the next startup.
 """
 
 from __future__ import annotations
 
+import json
+import re
 from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 from django.db import connection
 from django.db.backends.signals import connection_created
+from loguru import logger
 
-from codex.settings import IMPORTER_SQLITE_CACHE_KB
+from codex.models import Comic
+from codex.settings import CONFIG_PATH, IMPORTER_SQLITE_CACHE_KB
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -45,6 +57,13 @@ if TYPE_CHECKING:
 _STEADY_STATE_CACHE_KB = 64000
 # Default ``wal_autocheckpoint`` per SQLite's docs.
 _STEADY_STATE_WAL_AUTOCHECKPOINT = 1000
+DEFERRED_INDEXES_PATH = CONFIG_PATH / "deferred_indexes.json"
+_DEFERRED_INDEXES_SQL = (
+    "SELECT name, sql FROM sqlite_master WHERE type = 'index' "
+    "AND tbl_name IN ({}) AND sql IS NOT NULL "
+    "AND sql NOT LIKE 'CREATE UNIQUE %'"
+)
+_CREATE_INDEX_RE = re.compile(r"^CREATE INDEX ", re.IGNORECASE)
 
 
 def _importer_pragmas() -> tuple[str, ...]:
@@ -88,27 +107,95 @@ def _on_connection_created(
     _apply_pragmas(connection, _importer_pragmas())
 
 
+def _get_deferrable_tables() -> tuple[str, ...]:
+    """Return the comic table and its auto created many to many link tables."""
+    tables = [Comic._meta.db_table]
+    for field in Comic._meta.many_to_many:
+        through_meta = field.remote_field.through._meta  # pyright: ignore[reportAttributeAccessIssue], # ty: ignore[unresolved-attribute]
+        if through_meta.auto_created:
+            tables.append(through_meta.db_table)
+    return tuple(tables)
+
+
+def _create_indexes(sqls: list[str]) -> None:
+    """Create indexes, skipping any that already exist."""
+    with connection.cursor() as cursor:
+        for sql in sqls:
+            cursor.execute(_CREATE_INDEX_RE.sub("CREATE INDEX IF NOT EXISTS ", sql))
+
+
+def _defer_indexes() -> list[str]:
+    """Drop the deferrable secondary indexes. Returns their SQL."""
+    tables = _get_deferrable_tables()
+    placeholders = ", ".join(("%s",) * len(tables))
+    with connection.cursor() as cursor:
+        cursor.execute(_DEFERRED_INDEXES_SQL.format(placeholders), tables)
+        indexes = cursor.fetchall()
+    sqls = [sql for _, sql in indexes]
+    if not sqls:
+        return sqls
+    # Saved before dropping so a killed import can't lose them.
+    tmp_path = DEFERRED_INDEXES_PATH.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(sqls))
+    tmp_path.replace(DEFERRED_INDEXES_PATH)
+    with connection.cursor() as cursor:
+        for name, _ in indexes:
+            cursor.execute(f'DROP INDEX IF EXISTS "{name}"')
+    logger.debug(f"Deferred {len(sqls)} indexes for the initial load.")
+    return sqls
+
+
+def _rebuild_deferred_indexes(sqls: list[str]) -> None:
+    """Build the deferred indexes again and forget them."""
+    _create_indexes(sqls)
+    DEFERRED_INDEXES_PATH.unlink(missing_ok=True)
+    logger.debug(f"Rebuilt {len(sqls)} indexes deferred by the initial load.")
+
+
+def restore_deferred_indexes() -> None:
+    """Rebuild indexes an interrupted initial load left dropped."""
+    if not DEFERRED_INDEXES_PATH.exists():
+        return
+    sqls = json.loads(DEFERRED_INDEXES_PATH.read_text())
+    logger.warning("Rebuilding indexes left dropped by an interrupted import...")
+    _rebuild_deferred_indexes(sqls)
+
+
 @contextmanager
-def importer_pragmas() -> Generator[None]:
+def importer_pragmas(*, initial_load: bool = False) -> Generator[dict[str, int]]:
     """
     Apply importer PRAGMAs for the duration of an import.
 
     Yields with the override in place. On exit, restores steady-state
     values, force-checkpoints the WAL, and runs ``PRAGMA optimize``.
+    With ``initial_load`` the secondary comic indexes are dropped for
+    the run and rebuilt on exit, followed by ``ANALYZE``. The yielded
+    dict gets ``wal_frames`` on exit: the pages the run wrote to the
+    WAL, as no checkpoint cleared it in between.
     """
+    stats: dict[str, int] = {}
     connection_created.connect(_on_connection_created)
     _apply_pragmas(connection, _importer_pragmas())
+    deferred_indexes = _defer_indexes() if initial_load else []
     try:
-        yield
+        yield stats
     finally:
         connection_created.disconnect(_on_connection_created)
         _apply_pragmas(connection, _RESTORE_PRAGMAS)
+        if deferred_indexes:
+            _rebuild_deferred_indexes(deferred_indexes)
         with connection.cursor() as cursor:
+            if initial_load:
+                # Every statistic about the comic tables changed.
+                cursor.execute("ANALYZE")
             # TRUNCATE checkpoints the WAL and resets the file to a
             # single frame. Without this, the deferred-checkpoint
             # mode above leaves the WAL holding the import's worth
             # of frames until a reader transaction crosses them.
             cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            if row := cursor.fetchone():
+                # -1 outside WAL mode.
+                stats["wal_frames"] = max(row[1], 0)
             # Refresh planner statistics. SQLite's planner relies on
             # sqlite_stat1 etc., which are stale until ANALYZE
             # (or PRAGMA optimize) runs. Without this, the next few
@@ -1,30 +1,23 @@
 """Query the missing foreign keys methods."""
 
+from collections.abc import Generator
+
 from django.db.models.query_utils import Q
 
 from codex.librarian.scribe.importer.const import (
     MODEL_SELECTOR_REL_MAP,
     DictModelType,
 )
+from codex.librarian.scribe.importer.key_table import select_keys, temp_key_table
 from codex.librarian.scribe.importer.query.covers import QueryCustomCoversImporter
 from codex.models.base import BaseModel
 from codex.models.collections import BrowserCollectionModel
+from codex.settings import IMPORTER_FILTER_BATCH_SIZE
 
 
 class QueryForeignKeysFilterImporter(QueryCustomCoversImporter):
     """Query the missing foreign keys methods."""
 
-    @staticmethod
-    def _get_query_missing_simple_filter(
-        key_rels: tuple[str, ...],
-        key_values: tuple[str, ...],
-    ) -> Q:
-        filter_args = {}
-        rel = key_rels[0]
-        values = frozenset(key[0] for key in key_values if key[0])
-        filter_args[f"{rel}__in"] = values
-        return Q(**filter_args)
-
     @staticmethod
     def _query_missing_key_or_chain(
         key_rels: tuple[str, ...],
@@ -46,28 +39,29 @@ class QueryForeignKeysFilterImporter(QueryCustomCoversImporter):
             query_filter |= Q(**filter_dict)
         return query_filter
 
-    @classmethod
-    def _query_missing_complex_model_filter(
-        cls,
+    @staticmethod
+    def _split_selector_keys(
         model: type[BaseModel],
         key_rels: tuple[str, ...],
         key_values: tuple[tuple[str | None, ...], ...],
-    ) -> Q:
+    ) -> tuple[str | None, set, tuple]:
         """
-        Narrow with one indexed IN on the model's selector key rel.
+        Split keys into the model's selector key values and residual keys.
 
         ``query_existing_mds`` matches exact key tuples in Python from
-        the fetched values, so this filter only bounds the fetch — a
-        superset row (same selector value under a different parent) is
-        harmless. The per-key AND/OR chain this replaces cost one
-        Django filter-resolution per leaf and a giant OR parse in
-        SQLite per batch. Keys whose selector value is None (selector
-        columns are non-null, so normally none) fall back to the
-        chain.
+        the fetched values, so selecting on one indexed selector key rel
+        only bounds the fetch — a superset row (same selector value
+        under a different parent) is harmless. Keys whose selector value
+        is None (selector columns are non-null, so normally none) are
+        residual and need the exact chain.
         """
+        if not issubclass(model, DictModelType | BrowserCollectionModel):
+            # Simple named models, keyed on their name alone.
+            values = {keys[0] for keys in key_values if keys[0]}
+            return key_rels[0], values, ()
         selector_rel = MODEL_SELECTOR_REL_MAP.get(model)
         if not selector_rel or selector_rel not in key_rels:
-            return cls._query_missing_key_or_chain(key_rels, key_values)
+            return None, set(), key_values
         index = key_rels.index(selector_rel)
         selector_values = set()
         residual_keys = []
@@ -79,28 +73,30 @@ class QueryForeignKeysFilterImporter(QueryCustomCoversImporter):
                 residual_keys.append(keys)
             else:
                 selector_values.add(val)
-        query_filter = (
-            Q(**{f"{selector_rel}__in": selector_values}) if selector_values else Q()
-        )
-        if residual_keys:
-            query_filter |= cls._query_missing_key_or_chain(
-                key_rels, tuple(residual_keys)
-            )
-        return query_filter
+        return selector_rel, selector_values, tuple(residual_keys)
 
-    def query_missing_model_filter(
+    def query_missing_model_filters(
         self,
         model: type[BaseModel],
         key_rels: tuple[str, ...],
         key_value_tuples: tuple,
-    ) -> Q:
-        """Get filters for the model."""
-        if issubclass(model, DictModelType | BrowserCollectionModel):
-            fk_filter = self._query_missing_complex_model_filter(
-                model, key_rels, key_value_tuples
-            )
-        else:
-            fk_filter = self._get_query_missing_simple_filter(
-                key_rels, key_value_tuples
-            )
-        return fk_filter
+    ) -> Generator[Q]:
+        """
+        Yield filters that together select every existing key row.
+
+        Selector values are loaded into a TEMP table so one statement
+        matches them all, however many there are. Evaluate each
+        filter's queryset before taking the next; the TEMP table only
+        lives until then. Residual keys are chained in batches to stay
+        under SQLite's expression depth limit.
+        """
+        selector_rel, selector_values, residual_keys = self._split_selector_keys(
+            model, key_rels, key_value_tuples
+        )
+        if selector_values:
+            rows = ((value,) for value in selector_values)
+            with temp_key_table(rows) as table:
+                yield Q(**{f"{selector_rel}__in": select_keys(table)})
+        for start in range(0, len(residual_keys), IMPORTER_FILTER_BATCH_SIZE):
+            batch = residual_keys[start : start + IMPORTER_FILTER_BATCH_SIZE]
+            yield self._query_missing_key_or_chain(key_rels, batch)
@@ -19,7 +19,6 @@ from codex.librarian.scribe.importer.statii.query import ImporterQueryMissingTag
 from codex.librarian.status import Status
 from codex.models.base import BaseModel
 from codex.models.named import Universe
-from codex.settings import IMPORTER_FILTER_BATCH_SIZE
 from codex.util import flatten
 
 
@@ -27,52 +26,44 @@ class QueryForeignKeysQueryImporter(QueryIsUpdateImporter):
     """Query the missing foreign keys methods."""
 
     def query_existing_mds(
-        self, model: type[BaseModel], batch_proposed_key_tuples
+        self, model: type[BaseModel], proposed_key_tuples: tuple
     ) -> dict:
         """Query existing metadata tables."""
         key_rels: tuple[str, ...] = MODEL_REL_MAP[model][0]
-        fk_filter = self.query_missing_model_filter(
-            model,
-            key_rels,
-            batch_proposed_key_tuples,
-        )
         rels = MODEL_REL_MAP[model]
         select_related = MODEL_SELECT_RELATED.get(model, ())
         fields = tuple(filter(bool, flatten(rels)))
-        qs = model.objects
-        qs = qs.select_related(*select_related)
-        qs = qs.filter(fk_filter).distinct().values_list(*fields)
         extra_index = get_key_index(model)
         has_id = bool(rels[1])
         existing_mds = {}
-        for existing_values in qs:
-            key = existing_values[:extra_index]
-            value = existing_values[extra_index:]
-            if has_id:
-                identifier = value[:3] if any(value[:3]) else None
-                value = (identifier, *value[3:])
-            existing_mds[key] = value
+        for fk_filter in self.query_missing_model_filters(
+            model, key_rels, proposed_key_tuples
+        ):
+            qs = model.objects
+            qs = qs.select_related(*select_related)
+            qs = qs.filter(fk_filter).distinct().values_list(*fields)
+            for existing_values in qs:
+                key = existing_values[:extra_index]
+                value = existing_values[extra_index:]
+                if has_id:
+                    identifier = value[:3] if any(value[:3]) else None
+                    value = (identifier, *value[3:])
+                existing_mds[key] = value
         return existing_mds
 
-    def _query_missing_models_batch(
+    def _query_missing_models_sort(
         self,
         model: type[BaseModel],
-        start: int,
-        all_proposed_key_values: tuple,
         proposed_values_map: dict[tuple, set[tuple]],
         create_values: set[tuple],
         update_values: set[tuple],
         fts_values: dict[tuple, tuple],
-        status: Status,
     ) -> None:
-        # Do this in batches so as not to exceed the 1k sqlite query depth limit
-        end = start + IMPORTER_FILTER_BATCH_SIZE
-        batch_proposed_key_tuples = all_proposed_key_values[start:end]
-        num_in_batch = len(batch_proposed_key_tuples)
-
-        existing_values_map = self.query_existing_mds(model, batch_proposed_key_tuples)
+        """Sort proposed keys into creates and updates."""
+        proposed_key_values = tuple(proposed_values_map.keys())
+        existing_values_map = self.query_existing_mds(model, proposed_key_values)
 
-        for key_values in batch_proposed_key_tuples:
+        for key_values in proposed_key_values:
             proposed_extra_values_set = proposed_values_map.pop(key_values)
             exists = key_values in existing_values_map
             existing_extra_values = existing_values_map.pop(key_values, None)
@@ -89,9 +80,6 @@ class QueryForeignKeysQueryImporter(QueryIsUpdateImporter):
             if model is Universe:
                 fts_values[key_values] = best_extra_values
 
-        status.increment_complete(num_in_batch)
-        self.status_controller.update(status)
-
     def _finish_query_missing(
         self,
         model: type[BaseModel],
@@ -133,8 +121,6 @@ class QueryForeignKeysQueryImporter(QueryIsUpdateImporter):
         if not proposed_values_map:
             return 0
         num_all_proposed_values = len(proposed_values_map)
-        proposed_key_values = tuple(proposed_values_map.keys())
-        start = 0
 
         vnp = model._meta.verbose_name_plural
         title = vnp.title() if vnp else ""
@@ -144,18 +130,11 @@ class QueryForeignKeysQueryImporter(QueryIsUpdateImporter):
         update_values = set()
         fts_values = {}
 
-        while start < num_all_proposed_values:
-            self._query_missing_models_batch(
-                model,
-                start,
-                proposed_key_values,
-                proposed_values_map,
-                create_values,
-                update_values,
-                fts_values,
-                status,
-            )
-            start += IMPORTER_FILTER_BATCH_SIZE
+        self._query_missing_models_sort(
+            model, proposed_values_map, create_values, update_values, fts_values
+        )
+        status.increment_complete(num_all_proposed_values)
+        self.status_controller.update(status)
 
         self._finish_query_missing(model, create_values, CREATE_FKS, title)
         self._finish_query_missing(model, update_values, UPDATE_FKS, title)
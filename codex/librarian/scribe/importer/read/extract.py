@@ -1,13 +1,13 @@
 """Extract metadata from comic archive."""
 
+import sqlite3
 from collections.abc import Iterable, MutableMapping
 from datetime import UTC, datetime
 from pathlib import Path
 from types import MappingProxyType
-from typing import Any
+from typing import Any, NamedTuple
 
 from comicbox.formats.comicbox.schema import PAGE_COUNT_KEY
-from comicbox.process import ReadResult, iter_process_files
 
 from codex.choices.admin import AdminFlagChoices
 from codex.librarian.scribe.importer.const import (
@@ -19,20 +19,40 @@ from codex.librarian.scribe.importer.const import (
 from codex.librarian.scribe.importer.read.aggregate_path import (
     AggregateMetadataImporter,
 )
+from codex.librarian.scribe.importer.read.metadata_cache import (
+    CachedMetadata,
+    MetadataCache,
+    get_cache_key,
+)
+from codex.librarian.scribe.importer.read.reader import ComicReader, ComicReadResult
 from codex.librarian.scribe.importer.statii.read import ImporterReadComicsStatus
 from codex.models.admin import AdminFlag
 from codex.models.comic import Comic
-from codex.settings import COMICBOX_CONFIG, LOGLEVEL
-from codex.startup.loguru import CODEX_LOG_FORMAT
+from codex.settings import (
+    IMPORTER_CAPTURE_COVERS,
+    IMPORTER_FINGERPRINT,
+    IMPORTER_METADATA_CACHE,
+)
 
 # Indices into the WatchedPath.set_stat JSON list.
 _STAT_SIZE_INDEX = 6
 _STAT_MTIME_INDEX = 8
 
 
+class ExtractPlan(NamedTuple):
+    """One chunk's old comic values and in-flight archive reads."""
+
+    paths: frozenset[str]
+    old_comic_values: MappingProxyType[str, dict[str, Any]]
+    prefilter_skipped: frozenset[str]
+    reader: ComicReader
+
+
 class ExtractMetadataImporter(AggregateMetadataImporter):
     """Aggregate metadata from comics to prepare for importing."""
 
+    prefetched_extract: ExtractPlan | None = None
+
     @staticmethod
     def _filesystem_mtime_prefilter(
         all_paths: Iterable[str],
@@ -129,8 +149,17 @@ class ExtractMetadataImporter(AggregateMetadataImporter):
         all_paths: frozenset[str],
     ) -> tuple[MappingProxyType[str, datetime], MappingProxyType[str, dict[str, Any]]]:
         """Get some old comic values."""
-        values = ("path", "page_count", "file_type", "metadata_mtime", "stat")
-        old_comics = Comic.objects.filter(path__in=all_paths).values(*values)
+        values = (
+            "path",
+            "page_count",
+            "file_type",
+            "fingerprint",
+            "metadata_mtime",
+            "stat",
+        )
+        old_comics = Comic.objects.filter(
+            library=self.library, path__in=all_paths
+        ).values(*values)
         old_comic_values = {}
         old_comic_mtimes = {}
         for old_comic in old_comics:
@@ -164,7 +193,7 @@ class ExtractMetadataImporter(AggregateMetadataImporter):
 
     @staticmethod
     def _envelope_deltas(
-        result: ReadResult, old_comic: dict[str, Any]
+        result: ComicReadResult, old_comic: dict[str, Any]
     ) -> dict[str, Any]:
         """Build the subset of envelope fields that actually changed vs DB."""
         delta: dict[str, Any] = {}
@@ -180,12 +209,15 @@ class ExtractMetadataImporter(AggregateMetadataImporter):
         new_file_type = result.get("file_type")
         if new_file_type is not None and old_comic.get("file_type") != new_file_type:
             delta["file_type"] = new_file_type
+        fingerprint = result.get("fingerprint")
+        if fingerprint and old_comic.get("fingerprint") != fingerprint:
+            delta["fingerprint"] = fingerprint
         return delta
 
     def _extract_post_process_comic(
         self,
         path: Path,
-        value: tuple[ReadResult, BaseException | None],
+        value: tuple[ComicReadResult, BaseException | None],
         all_old_comic_values: MappingProxyType[str, dict[str, str | int]],
         status: ImporterReadComicsStatus,
     ):
@@ -243,61 +275,137 @@ class ExtractMetadataImporter(AggregateMetadataImporter):
         self.status_controller.update(status)
         return status
 
-    def _apply_filesystem_prefilter(
-        self,
-        all_paths: frozenset[str],
-        all_old_comic_mtimes: MappingProxyType[str, datetime],
-        all_old_comic_values: MappingProxyType[str, dict[str, Any]],
-        status: ImporterReadComicsStatus,
-    ) -> frozenset[str]:
+    def _plan_extract(self, all_paths: frozenset[str]) -> ExtractPlan:
         """
-        Skip archive-open cost via filesystem stat pre-filter.
+        Query the old comic values, pre-filter and submit the archive reads.
 
-        Worker still rechecks the embedded mtime for paths that pass
-        through, so a touch-without-content-change still short-circuits
-        inside the worker.
+        Only reads the database, so a pipelined import can plan the next
+        chunk while the current one is still being written.
         """
-        if not all_old_comic_mtimes:
-            return all_paths
-        paths_to_extract, prefilter_skipped = self._filesystem_mtime_prefilter(
-            all_paths, all_old_comic_mtimes, all_old_comic_values
+        import_metadata = self._get_import_metadata_flag()
+        all_old_comic_mtimes, all_old_comic_values = self._get_all_old_comic_values(
+            all_paths
         )
-        if prefilter_skipped:
-            self.metadata[SKIPPED].update(prefilter_skipped)
-            skipped_n = len(prefilter_skipped)
-            self.log.debug(
-                f"Skipped archive open for {skipped_n} comics via filesystem mtime pre-filter."
+        paths_to_extract = all_paths
+        prefilter_skipped: frozenset[str] = frozenset()
+        if all_old_comic_mtimes:
+            # Skip archive-open cost via filesystem stat pre-filter. The
+            # worker still rechecks the embedded mtime for paths that
+            # pass through, so a touch-without-content-change still
+            # short-circuits inside the worker.
+            paths_to_extract, prefilter_skipped = self._filesystem_mtime_prefilter(
+                all_paths, all_old_comic_mtimes, all_old_comic_values
             )
-            status.increment_complete(skipped_n)
-            self.status_controller.update(status)
-        return paths_to_extract
+        reader = ComicReader(
+            paths_to_extract,
+            all_old_comic_mtimes,
+            full_metadata=import_metadata,
+            capture_cover=IMPORTER_CAPTURE_COVERS,
+        )
+        return ExtractPlan(all_paths, all_old_comic_values, prefilter_skipped, reader)
+
+    def prefetch_extract(self, all_paths: frozenset[str]) -> None:
+        """Start reading a later chunk's archives in the background."""
+        self.close_prefetched_extract()
+        if all_paths:
+            self.prefetched_extract = self._plan_extract(all_paths)
+
+    def close_prefetched_extract(self) -> None:
+        """Cancel archive reads nothing will consume."""
+        if self.prefetched_extract:
+            self.prefetched_extract.reader.close()
+            self.prefetched_extract = None
+
+    def _get_extract_plan(self, all_paths: frozenset[str]) -> ExtractPlan:
+        """Use the prefetched plan for these paths or make one."""
+        plan = self.prefetched_extract
+        self.prefetched_extract = None
+        if plan and plan.paths == all_paths:
+            return plan
+        if plan:
+            plan.reader.close()
+        return self._plan_extract(all_paths)
+
+    def _apply_prefilter_skips(
+        self, prefilter_skipped: frozenset[str], status: ImporterReadComicsStatus
+    ) -> None:
+        """Account for the paths the filesystem pre-filter skipped."""
+        if not prefilter_skipped:
+            return
+        self.metadata[SKIPPED].update(prefilter_skipped)
+        skipped_n = len(prefilter_skipped)
+        self.log.debug(
+            f"Skipped archive open for {skipped_n} comics via filesystem mtime pre-filter."
+        )
+        status.increment_complete(skipped_n)
+        self.status_controller.update(status)
 
     def _run_extract_loop(
         self,
-        paths_to_extract: frozenset[str],
-        all_old_comic_mtimes: MappingProxyType[str, datetime],
+        reader: ComicReader,
         all_old_comic_values: MappingProxyType[str, dict[str, str | int]],
         status: ImporterReadComicsStatus,
-        *,
-        import_metadata: bool,
     ) -> None:
-        """Stream the comicbox extraction results into the metadata dict."""
-        for path, value in iter_process_files(
-            paths_to_extract,
-            config=COMICBOX_CONFIG,
-            logger=self.log,
-            worker_log_config={
-                "level": LOGLEVEL,
-                "format": CODEX_LOG_FORMAT,
-                "sink": "stdout",  # comicbox only accepts one sink
-            },
-            old_mtime_map=all_old_comic_mtimes,
-            full_metadata=import_metadata,
-        ):
+        """Stream the archive read results into the metadata dict."""
+        cache_puts: dict[str, CachedMetadata] = {}
+        cache_hits: set[str] = set()
+        for path, value in reader:
             if self._extract_post_process_comic(
                 path, value, all_old_comic_values, status
             ):
                 break
+            self._collect_metadata_cache_entry(path, value, cache_puts, cache_hits)
+        self._update_metadata_cache(cache_puts, cache_hits)
+
+    @staticmethod
+    def _collect_metadata_cache_entry(
+        path: Path,
+        value: tuple[ComicReadResult, BaseException | None],
+        cache_puts: dict[str, CachedMetadata],
+        cache_hits: set[str],
+    ) -> None:
+        """Note fully parsed archives to cache and cached ones to keep."""
+        result, exc = value
+        fingerprint = result.get("fingerprint")
+        if exc or not fingerprint:
+            return
+        key = get_cache_key(fingerprint, path)
+        if result.get("metadata_cached"):
+            cache_hits.add(key)
+            return
+        tags = result.get("tags")
+        if tags is None:
+            return
+        cache_puts[key] = CachedMetadata(
+            metadata_mtime=result.get("metadata_mtime"),
+            page_count=result.get("page_count"),
+            file_type=result.get("file_type"),
+            tags=tags,
+        )
+
+    def _update_metadata_cache(
+        self, cache_puts: dict[str, CachedMetadata], cache_hits: set[str]
+    ) -> None:
+        """Write newly parsed metadata to the cache and prune stale entries."""
+        if not (IMPORTER_FINGERPRINT and IMPORTER_METADATA_CACHE) or not (
+            cache_puts or cache_hits
+        ):
+            return
+        try:
+            metadata_cache = MetadataCache()
+            try:
+                metadata_cache.touch(cache_hits)
+                stored = metadata_cache.put_many(cache_puts.items())
+                pruned = metadata_cache.prune()
+            finally:
+                metadata_cache.close()
+        except sqlite3.Error:
+            # The cache only saves work; never fail an import over it.
+            self.log.exception("Updating the metadata cache")
+            return
+        self.log.debug(
+            f"Metadata cache: {len(cache_hits)} hits, {stored} stored, {pruned} pruned."
+        )
 
     def extract_metadata(self, status=None) -> int:
         """Extract comic metadata into memory."""
@@ -327,20 +435,9 @@ class ExtractMetadataImporter(AggregateMetadataImporter):
             )
             self.status_controller.start(status, notify=True)
 
-            import_metadata = self._get_import_metadata_flag()
-            all_old_comic_mtimes, all_old_comic_values = self._get_all_old_comic_values(
-                all_paths
-            )
-            paths_to_extract = self._apply_filesystem_prefilter(
-                all_paths, all_old_comic_mtimes, all_old_comic_values, status
-            )
-            self._run_extract_loop(
-                paths_to_extract,
-                all_old_comic_mtimes,
-                all_old_comic_values,
-                status,
-                import_metadata=import_metadata,
-            )
+            plan = self._get_extract_plan(all_paths)
+            self._apply_prefilter_skips(plan.prefilter_skipped, status)
+            self._run_extract_loop(plan.reader, plan.old_comic_values, status)
 
             skipped_count = len(self.metadata[SKIPPED])
             count = total_paths - skipped_count
@@ -0,0 +1,75 @@
+"""
+Size and throttle the importer's archive read pool.
+
+``importer.read_workers`` caps the pool, and so does the memory budget
+from :func:`codex.librarian.memory.get_mem_limit`, so each worker gets
+a share of it and a small NAS doesn't thrash. While reads run,
+:class:`MemoryGovernor` watches the memory of the librarian and its
+worker processes and tells the reader to hold back new reads while
+they're close to the budget.
+"""
+
+from threading import Lock
+from time import monotonic
+
+from loguru import logger
+from psutil import Error, Process
+
+from codex.librarian.memory import get_mem_limit
+from codex.settings import IMPORTER_READ_WORKERS
+
+# A read worker's working set: comicbox, an open archive, parsed tags
+# and a cover being rendered.
+_PER_WORKER_BYTES = 192 * 1024**2
+# Share of the memory budget read workers may claim when sizing the pool.
+_WORKERS_MEM_FRACTION = 0.5
+# Hold back new reads above this share of the memory budget.
+_HIGH_WATER_FRACTION = 0.8
+# Seconds between memory samples.
+_CHECK_INTERVAL = 0.5
+
+
+def get_read_workers() -> int:
+    """Return the read pool size for the configured cap and memory budget."""
+    by_memory = int(get_mem_limit("b") * _WORKERS_MEM_FRACTION // _PER_WORKER_BYTES)
+    return max(1, min(IMPORTER_READ_WORKERS, by_memory))
+
+
+class MemoryGovernor:
+    """Report when the librarian's process tree is near the memory budget."""
+
+    def __init__(self) -> None:
+        """Read the memory budget."""
+        self._high_water = get_mem_limit("b") * _HIGH_WATER_FRACTION
+        self._process = Process()
+        self._lock = Lock()
+        self._checked_at = 0.0
+        self._low = False
+
+    def _get_tree_memory(self) -> int:
+        """
+        Sum the librarian's resident memory and its children's.
+
+        Children are forked, so only their unshared pages count.
+        """
+        total = self._process.memory_info().rss
+        for child in self._process.children(recursive=True):
+            try:
+                info = child.memory_info()
+            except Error:
+                # Exited since listed.
+                continue
+            total += info.rss - getattr(info, "shared", 0)
+        return total
+
+    def is_memory_low(self) -> bool:
+        """Return whether memory is near the budget, sampling at most every interval."""
+        with self._lock:
+            now = monotonic()
+            if now - self._checked_at >= _CHECK_INTERVAL:
+                self._checked_at = now
+                low = self._get_tree_memory() > self._high_water
+                if low and not self._low:
+                    logger.debug("Memory near the limit, holding back archive reads.")
+                self._low = low
+            return self._low
@@ -0,0 +1,130 @@
+"""
+Persistent cache of extracted archive metadata.
+
+Keyed on the archive fingerprint (see
+:mod:`codex.librarian.scribe.importer.fingerprint`) and file name, since
+comicbox parses tags from the file name too, and versioned on the
+comicbox version and the comicbox settings that shape a read. Cached
+tags survive moves between directories, re-imports and a library being
+removed and added again, while a comicbox upgrade or a settings change
+that may parse differently starts afresh. Read
+workers only look entries up; the importer writes them, from one
+process, after each chunk is read. Entries nothing has read for
+:data:`METADATA_CACHE_MAX_AGE` are pruned as new ones are written.
+"""
+
+import pickle
+import sqlite3
+from collections.abc import Iterable
+from datetime import datetime
+from hashlib import blake2b
+from importlib.metadata import version
+from pathlib import Path
+from time import time
+from typing import Any, TypedDict
+
+from codex.settings import COMICBOX_CONFIG, ROOT_CACHE_PATH
+
+METADATA_CACHE_PATH = ROOT_CACHE_PATH / "metadata-cache.sqlite3"
+METADATA_CACHE_MAX_AGE = 90 * 24 * 60 * 60
+# Bump when the shape of the cached value changes.
+_FORMAT_VERSION = 2
+_CREATE_SQL = (
+    (
+        "CREATE TABLE IF NOT EXISTS metadata ("
+        "key TEXT NOT NULL, "
+        "schema TEXT NOT NULL, "
+        "accessed REAL NOT NULL, "
+        "value BLOB NOT NULL, "
+        "PRIMARY KEY (key, schema)"
+        ") WITHOUT ROWID"
+    ),
+    "CREATE INDEX IF NOT EXISTS metadata_accessed ON metadata (accessed)",
+)
+_GET_SQL = "SELECT value FROM metadata WHERE key = ? AND schema = ?"
+_PUT_SQL = (
+    "INSERT OR REPLACE INTO metadata (key, schema, accessed, value) VALUES (?, ?, ?, ?)"
+)
+_TOUCH_SQL = "UPDATE metadata SET accessed = ? WHERE key = ? AND schema = ?"
+_PRUNE_SQL = "DELETE FROM metadata WHERE accessed < ?"
+
+
+def _get_config_digest() -> str:
+    """Digest the comicbox settings that change what a read returns."""
+    read = COMICBOX_CONFIG.read
+    parts = (
+        sorted(fmt.name for fmt in read.formats),
+        sorted(fmt.name for fmt in read.except_formats or ()),
+        [fmt.name for fmt in read.merge_order or ()],
+        sorted(COMICBOX_CONFIG.general.delete_keys or ()),
+    )
+    return blake2b(repr(parts).encode(), digest_size=8).hexdigest()
+
+
+SCHEMA_VERSION = (
+    f"{_FORMAT_VERSION}-comicbox-{version('comicbox')}-{_get_config_digest()}"
+)
+
+
+def get_cache_key(fingerprint: str, path: str | Path) -> str:
+    """Key an archive on its contents and its file name."""
+    return f"{fingerprint}/{Path(path).name}"
+
+
+class CachedMetadata(TypedDict):
+    """A fully parsed archive's metadata envelope and tags."""
+
+    metadata_mtime: datetime | None
+    page_count: int | None
+    file_type: str | None
+    tags: dict[str, Any]
+
+
+class MetadataCache:
+    """SQLite store of parsed metadata."""
+
+    def __init__(self, path: Path = METADATA_CACHE_PATH, *, readonly: bool = False):
+        """Open the cache, creating it unless read only."""
+        if readonly:
+            self._conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(path)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            for sql in _CREATE_SQL:
+                self._conn.execute(sql)
+            self._conn.commit()
+
+    def get(self, key: str) -> CachedMetadata | None:
+        """Return the cached metadata for an archive's cache key."""
+        row = self._conn.execute(_GET_SQL, (key, SCHEMA_VERSION)).fetchone()
+        # Codex writes every value in its own cache dir.
+        return pickle.loads(row[0]) if row else None  # noqa: S301
+
+    def put_many(self, entries: Iterable[tuple[str, CachedMetadata]]) -> int:
+        """Store metadata by cache key. Returns the count stored."""
+        accessed = time()
+        rows = tuple(
+            (key, SCHEMA_VERSION, accessed, pickle.dumps(value))
+            for key, value in entries
+        )
+        with self._conn:
+            self._conn.executemany(_PUT_SQL, rows)
+        return len(rows)
+
+    def touch(self, keys: Iterable[str]) -> None:
+        """Mark entries as recently used so pruning keeps them."""
+        accessed = time()
+        rows = tuple((accessed, key, SCHEMA_VERSION) for key in keys)
+        with self._conn:
+            self._conn.executemany(_TOUCH_SQL, rows)
+
+    def prune(self, max_age: float = METADATA_CACHE_MAX_AGE) -> int:
+        """Remove entries unused for max_age seconds. Returns the count removed."""
+        with self._conn:
+            cursor = self._conn.execute(_PRUNE_SQL, (time() - max_age,))
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._conn.close()
@@ -0,0 +1,345 @@
+"""
+Importer-owned archive read pool.
+
+Mirrors comicbox's :func:`comicbox.process.iter_process_files` — same
+``(path, (ReadResult, exception_or_None))`` stream, same per-path
+failure contract — but runs codex's own worker so the importer can do
+more with each archive while it's open, and size the pool with
+``importer.read_workers`` and the memory governor (see
+:mod:`codex.librarian.scribe.importer.read.governor`). With
+``importer.capture_covers`` on, the worker renders the cover
+thumbnails of new or re-tagged comics and stages them for the cover
+thread (see :mod:`codex.librarian.covers.staging`). With
+``importer.metadata_cache`` on, archives found in the metadata cache
+aren't opened at all.
+"""
+
+import os
+import signal
+from collections.abc import Generator, Iterable, Mapping
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor
+from datetime import datetime
+from functools import cache, partial
+from pathlib import Path
+from queue import SimpleQueue
+from tarfile import TarError
+from threading import Event, Lock, Semaphore, Thread
+from typing import Any
+from zipfile import BadZipFile, LargeZipFile
+
+from comicbox.box import Comicbox
+from comicbox.box.archive.filenames import EPOCH_START
+from comicbox.exceptions import UnsupportedArchiveTypeError
+from comicbox.formats import MetadataFormats
+from comicbox.logger import init_logging
+from comicbox.process import ReadResult
+from loguru import logger
+
+from codex.librarian.covers.create import THUMBNAIL_SIZES, render_cover_sizes
+from codex.librarian.covers.staging import stage_cover
+from codex.librarian.scribe.importer.fingerprint import get_fingerprint
+from codex.librarian.scribe.importer.read.governor import (
+    MemoryGovernor,
+    get_read_workers,
+)
+from codex.librarian.scribe.importer.read.metadata_cache import (
+    CachedMetadata,
+    MetadataCache,
+    get_cache_key,
+)
+from codex.settings import (
+    COMICBOX_CONFIG,
+    IMPORTER_FINGERPRINT,
+    IMPORTER_METADATA_CACHE,
+    LOGLEVEL,
+)
+from codex.startup.loguru import CODEX_LOG_FORMAT
+
+
+class ComicReadResult(ReadResult, total=False):
+    """comicbox's read result plus codex-side extras."""
+
+    fingerprint: str
+    metadata_cached: bool
+
+
+ReadItem = tuple[Path, tuple[ComicReadResult, BaseException | None]]
+# Reads queued per worker so none idles waiting for the next path.
+_READS_PER_WORKER = 2
+# How often the feeder rechecks memory while holding back.
+_MEMORY_WAIT_SECONDS = 0.5
+
+
+def _init_read_worker() -> None:
+    """Match the parent's log format and leave SIGINT to the librarian."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # comicbox only accepts one sink
+    init_logging(loglevel=LOGLEVEL, log_format=CODEX_LOG_FORMAT, sink="stdout")
+
+
+@cache
+def _archive_errors() -> tuple[type[BaseException], ...]:
+    """Return the expected archive read errors, like comicbox does."""
+    from py7zr.exceptions import ArchiveError as Py7zError
+    from rarfile import Error as RarError
+
+    return (
+        UnsupportedArchiveTypeError,
+        BadZipFile,
+        LargeZipFile,
+        RarError,
+        Py7zError,
+        TarError,
+        OSError,
+    )
+
+
+def _empty_read_result() -> ComicReadResult:
+    """Return the result for an archive that failed to read."""
+    return ComicReadResult(
+        metadata_mtime=None, page_count=None, file_type=None, tags=None
+    )
+
+
+def _get_read_result(done: Future | BaseException) -> ComicReadResult:
+    """Return a finished read's result or raise its submit failure."""
+    if isinstance(done, BaseException):
+        raise done
+    return done.result()
+
+
+def _capture_cover(cb: Comicbox, path_str: str, st: os.stat_result) -> None:
+    """Render and stage the cover thumbnails from the open archive."""
+    try:
+        image_data = cb.get_cover_page(pdf_format="pixmap", skip_metadata=True)
+        if not image_data:
+            return
+        renditions = dict(render_cover_sizes(image_data, tuple(THUMBNAIL_SIZES)))
+        stage_cover(path_str, st, renditions)
+    except Exception as exc:
+        # The cover thread renders it the usual way and records failures.
+        logger.debug(f"Could not capture cover from {path_str}: {exc!r}")
+
+
+@cache
+def _get_worker_metadata_cache() -> MetadataCache:
+    """Open the metadata cache once per worker."""
+    return MetadataCache(readonly=True)
+
+
+def _get_cached_metadata(fingerprint: str, path_str: str) -> CachedMetadata | None:
+    """Look an archive up in the metadata cache."""
+    try:
+        return _get_worker_metadata_cache().get(get_cache_key(fingerprint, path_str))
+    except Exception as exc:
+        # Missing until the importer first writes it, or unreadable. Either
+        # way the archive is just read.
+        logger.debug(f"Metadata cache lookup failed: {exc!r}")
+        return None
+
+
+def _cached_read_result(
+    cached: CachedMetadata, fingerprint: str, old_mtime: datetime
+) -> ComicReadResult:
+    """Build a read result from the cache, skipping tags like a real read."""
+    metadata_mtime = cached["metadata_mtime"]
+    tags = (
+        cached["tags"]
+        if not old_mtime or not metadata_mtime or metadata_mtime > old_mtime
+        else None
+    )
+    return ComicReadResult(
+        metadata_mtime=metadata_mtime,
+        page_count=cached["page_count"],
+        file_type=cached["file_type"],
+        tags=tags,
+        fingerprint=fingerprint,
+        metadata_cached=True,
+    )
+
+
+def _read_comic(
+    path_str: str,
+    old_mtime: datetime,
+    *,
+    full_metadata: bool,
+    capture_cover: bool,
+) -> ComicReadResult:
+    """
+    Read one archive's metadata envelope and tags in a worker process.
+
+    Tags are only parsed when the embedded metadata is newer than
+    ``old_mtime``, which is ``EPOCH_START`` for archives with no
+    recorded metadata mtime, as in comicbox. The archive stat is taken
+    before opening so a cover captured from a file that changes
+    mid-read is keyed to the old version and never adopted. Archives
+    found in the metadata cache are never opened and have no cover
+    captured.
+    """
+    fingerprint = get_fingerprint(path_str) if IMPORTER_FINGERPRINT else ""
+    if fingerprint and full_metadata and IMPORTER_METADATA_CACHE:
+        cached = _get_cached_metadata(fingerprint, path_str)
+        if cached:
+            return _cached_read_result(cached, fingerprint, old_mtime)
+    st = Path(path_str).stat() if capture_cover else None
+    tags: dict[str, Any] | None = None
+    metadata_mtime: datetime | None = None
+    with Comicbox(
+        path_str, config=COMICBOX_CONFIG, fmt=MetadataFormats.COMICBOX_YAML
+    ) as cb:
+        if full_metadata:
+            metadata_mtime = cb.get_metadata_mtime()
+            if not old_mtime or not metadata_mtime or metadata_mtime > old_mtime:
+                tags = cb.to_dict().get("comicbox", {})
+                if tags:
+                    # The envelope fields travel out of band.
+                    tags.pop("metadata_mtime", None)
+                    tags.pop("page_count", None)
+                    tags.pop("file_type", None)
+        page_count = cb.get_page_count()
+        file_type = cb.get_file_type()
+        # New comics and re-tagged comics get their covers regenerated.
+        if st and (tags is not None or old_mtime == EPOCH_START):
+            _capture_cover(cb, path_str, st)
+    result = ComicReadResult(
+        metadata_mtime=metadata_mtime,
+        page_count=page_count,
+        file_type=file_type,
+        tags=tags,
+    )
+    if fingerprint:
+        result["fingerprint"] = fingerprint
+    return result
+
+
+class ComicReader:
+    """
+    Read archives on a worker pool, streaming results as they complete.
+
+    A feeder thread submits the reads as soon as the reader is built, so
+    the workers start immediately; the importer builds the next chunk's
+    reader before writing the current chunk and consumes it afterwards.
+    Only a few reads per worker are in flight at once, and while the
+    memory governor reports memory near the limit the feeder holds back
+    until just one is.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[str],
+        old_mtime_map: Mapping[str, datetime],
+        *,
+        full_metadata: bool,
+        capture_cover: bool,
+    ) -> None:
+        """Start the pool and the feeder."""
+        paths = tuple(paths)
+        self._total = len(paths)
+        self._done: SimpleQueue[tuple[str, Future | BaseException]] = SimpleQueue()
+        max_workers = get_read_workers()
+        self._slots = Semaphore(max_workers * _READS_PER_WORKER)
+        self._in_flight = 0
+        self._in_flight_lock = Lock()
+        self._closed = Event()
+        self._governor = MemoryGovernor()
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_read_worker
+        )
+        self._feeder = Thread(
+            target=self._feed,
+            args=(paths, old_mtime_map),
+            kwargs={"full_metadata": full_metadata, "capture_cover": capture_cover},
+            name="comic-reader-feeder",
+            daemon=True,
+        )
+        try:
+            self._feeder.start()
+        except Exception:
+            self.close()
+            raise
+
+    def _wait_for_memory(self) -> None:
+        """Hold back while memory is low, unless nothing is in flight."""
+        while self._in_flight and self._governor.is_memory_low():
+            if self._closed.wait(_MEMORY_WAIT_SECONDS):
+                return
+
+    def _feed(
+        self,
+        paths: tuple[str, ...],
+        old_mtime_map: Mapping[str, datetime],
+        *,
+        full_metadata: bool,
+        capture_cover: bool,
+    ) -> None:
+        """Submit reads as in flight slots free up."""
+        for index, path_str in enumerate(paths):
+            self._slots.acquire()
+            self._wait_for_memory()
+            if self._closed.is_set():
+                return
+            with self._in_flight_lock:
+                self._in_flight += 1
+            try:
+                future = self._executor.submit(
+                    _read_comic,
+                    path_str,
+                    old_mtime_map.get(path_str, EPOCH_START),
+                    full_metadata=full_metadata,
+                    capture_cover=capture_cover,
+                )
+            except Exception as exc:
+                # Broken or shut down pool. Fail this read and the rest.
+                for failed_path_str in paths[index:]:
+                    self._done.put((failed_path_str, exc))
+                return
+            future.add_done_callback(partial(self._on_done, path_str))
+
+    def _on_done(self, path_str: str, future: Future) -> None:
+        """Free the read's slot and queue its result."""
+        with self._in_flight_lock:
+            self._in_flight -= 1
+        self._slots.release()
+        if not future.cancelled():
+            self._done.put((path_str, future))
+
+    def __iter__(self) -> Generator[ReadItem]:
+        """
+        Yield ``(path, (ReadResult, exception_or_None))`` as each read completes.
+
+        Failures are delivered, not raised, so one bad archive can't abort
+        the import; the extract phase records them as failed imports. Once
+        the pool breaks every remaining path fails with
+        ``BrokenExecutor``. Closing the generator cancels pending reads.
+        """
+        try:
+            pool_broken = False
+            for _ in range(self._total):
+                path_str, done = self._done.get()
+                path = Path(path_str)
+                if pool_broken:
+                    exc = BrokenExecutor("Worker pool broken")
+                    yield path, (_empty_read_result(), exc)
+                    continue
+                try:
+                    value = (_get_read_result(done), None)
+                except _archive_errors() as exc:
+                    logger.warning(f"Failed to import {path}: {exc}")
+                    value = (_empty_read_result(), exc)
+                except BrokenExecutor as exc:
+                    logger.exception(f"Worker pool broken while reading {path}")
+                    pool_broken = True
+                    value = (_empty_read_result(), exc)
+                except Exception as exc:
+                    logger.exception(f"Failed to import: {path}")
+                    value = (_empty_read_result(), exc)
+                yield path, value
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop the feeder, cancel pending reads and release the pool."""
+        self._closed.set()
+        # Wake a feeder waiting for a slot so it sees the close.
+        self._slots.release()
+        self._executor.shutdown(wait=False, cancel_futures=True)
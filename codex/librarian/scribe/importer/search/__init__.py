@@ -1,5 +1,14 @@
 """Sync the fts index with the imported database."""
 
+from collections.abc import Mapping
+
+from codex.librarian.scribe.importer.const import (
+    FTS_CREATE,
+    FTS_CREATED_M2MS,
+    FTS_EXISTING_M2MS,
+    FTS_UPDATE,
+    FTS_UPDATED_M2MS,
+)
 from codex.librarian.scribe.importer.search.prepare import (
     SearchIndexPrepareImporter,
 )
@@ -7,28 +16,134 @@ from codex.librarian.scribe.importer.statii.search import (
     ImporterFTSCreateStatus,
     ImporterFTSUpdateStatus,
 )
+from codex.librarian.scribe.search.changes import (
+    ALL_FTS_FIELDS,
+    clear_fts_changes,
+    log_fts_changes,
+    merge_fts_fields,
+)
+from codex.librarian.scribe.search.const import COMICFTS_FIELDS
 from codex.librarian.scribe.search.handler import SearchIndexer
-from codex.librarian.scribe.search.status import SearchIndexCleanStatus
+from codex.librarian.scribe.search.status import (
+    SearchIndexCleanStatus,
+    SearchIndexOptimizeStatus,
+    SearchIndexSyncCreateStatus,
+)
+from codex.models import Comic
 
 _STATII = (SearchIndexCleanStatus, ImporterFTSCreateStatus, ImporterFTSUpdateStatus)
+_INITIAL_LOAD_STATII = (
+    SearchIndexCleanStatus,
+    SearchIndexSyncCreateStatus,
+    SearchIndexOptimizeStatus,
+)
+_FTS_ENTRY_KEYS = (
+    FTS_CREATE,
+    FTS_UPDATE,
+    FTS_EXISTING_M2MS,
+    FTS_CREATED_M2MS,
+    FTS_UPDATED_M2MS,
+)
 
 
 class SearchIndexImporter(SearchIndexPrepareImporter):
     """Sync the fts index with the imported database."""
 
-    def clean_fts(self) -> int:
-        """Clean search index of any deleted comics."""
-        indexer = SearchIndexer(
+    def log_fts_changes(self, changes: Mapping[int, frozenset[str]]) -> None:
+        """Record changed comics and columns in the search change log."""
+        new_changes = {}
+        for pk, fields in changes.items():
+            logged_fields = self.fts_logged_changes.get(pk)
+            if logged_fields is None or (
+                logged_fields and (not fields or fields - logged_fields)
+            ):
+                new_changes[pk] = fields
+        if not new_changes:
+            return
+        carried_over_pks = log_fts_changes(new_changes)
+        self.fts_carried_over_pks.update(
+            carried_over_pks - self.fts_logged_changes.keys()
+        )
+        for pk, fields in new_changes.items():
+            logged_fields = self.fts_logged_changes.get(pk)
+            self.fts_logged_changes[pk] = (
+                fields
+                if logged_fields is None
+                else merge_fts_fields(fields, logged_fields)
+            )
+
+    def _get_updated_m2m_fts_changes(self) -> dict[int, frozenset[str]]:
+        """Comics linked to tags whose search values changed."""
+        changes: dict[int, frozenset[str]] = {}
+        for field_name, model_pks in self.metadata.get(FTS_UPDATED_M2MS, {}).items():
+            comic_pks = Comic.objects.filter(
+                **{f"{field_name}__in": model_pks}
+            ).values_list("pk", flat=True)
+            for pk in comic_pks:
+                changes[pk] = changes.get(pk, frozenset()) | {field_name}
+        return changes
+
+    def log_chunk_fts_changes(self) -> None:
+        """Record this chunk's search index changes before they're written."""
+        changes = self._get_updated_m2m_fts_changes()
+        existing_m2ms = self.metadata.get(FTS_EXISTING_M2MS, {})
+        for pk, entry in self.metadata.get(FTS_UPDATE, {}).items():
+            fields = (entry.keys() | existing_m2ms.get(pk, {}).keys()) & COMICFTS_FIELDS
+            if fields:
+                changes[pk] = changes.get(pk, frozenset()) | fields
+        for pk in self.metadata.get(FTS_CREATE, {}):
+            # Comics that failed to create are still keyed by path.
+            if isinstance(pk, int):
+                changes[pk] = ALL_FTS_FIELDS
+        self.log_fts_changes(changes)
+
+    def discard_fts_entries(self) -> None:
+        """Drop the chunk's staged search entries; the initial load builds them."""
+        for key in _FTS_ENTRY_KEYS:
+            self.metadata.pop(key, None)
+
+    def _get_search_indexer(self) -> SearchIndexer:
+        return SearchIndexer(
             self.log, self.librarian_queue, self.db_write_lock, event=self.abort_event
         )
-        return indexer.remove_stale_records(log_success=False)
+
+    def clean_fts(self) -> int:
+        """Clean the search index of the comics this import deleted."""
+        # The delete phase logs deleted comics, so only logged pks can
+        # have stale entries.
+        return self._get_search_indexer().remove_deleted_records(
+            self.fts_logged_changes.keys()
+        )
+
+    def _initial_load_search_index(self) -> None:
+        """Build the missing search entries from the database in one pass."""
+        statii = tuple(status_class() for status_class in _INITIAL_LOAD_STATII)
+        self.status_controller.start_many(statii)
+        try:
+            self.clean_fts()
+            indexer = self._get_search_indexer()
+            indexer.create_missing_search_entries()
+            if self.abort_event.is_set():
+                return
+            clear_fts_changes(
+                self.fts_logged_changes.keys() - self.fts_carried_over_pks
+            )
+            indexer.optimize()
+        finally:
+            self.status_controller.finish_many(statii)
 
     def full_text_search(self) -> None:
         """Sync the fts index with the imported database."""
+        if self.initial_load:
+            self._initial_load_search_index()
+            return
         statii = (status_class() for status_class in _STATII)
         self.status_controller.start_many(statii)
         try:
             count = self.clean_fts()
-            self.import_search_index(count)
+            if self.import_search_index(count):
+                clear_fts_changes(
+                    self.fts_logged_changes.keys() - self.fts_carried_over_pks
+                )
         finally:
             self.status_controller.finish_many(statii)
@@ -212,11 +212,13 @@ class SearchIndexCreateUpdateImporter(SearchIndexSyncManyToManyImporter):
         log_txt += f" in {elapsed}."
         self.log.log(level, log_txt)
 
-    def import_search_index(self, cleaned_count: int) -> None:
-        """Update or Rebuild the search index."""
+    def import_search_index(self, cleaned_count: int) -> bool:
+        """Update or Rebuild the search index. Returns whether it finished."""
         self.abort_event.clear()
+        finished = False
         try:
             self._update_search_index(cleaned_count)
+            finished = not self.abort_event.is_set()
         except Exception:
             self.log.exception("Update search index")
         finally:
@@ -228,3 +230,4 @@ class SearchIndexCreateUpdateImporter(SearchIndexSyncManyToManyImporter):
             self.status_controller.finish_many(
                 (ImporterFTSCreateStatus, ImporterFTSUpdateStatus)
             )
+        return finished
@@ -31,6 +31,8 @@ class ImportTask(ScribeTask):
 
     force_import_metadata: bool = False
     check_metadata_mtime: bool = True
+    # Set when resuming an unfinished import from its journal.
+    journal_id: int | None = None
 
     def total(self) -> int:
         """Total number of operations."""
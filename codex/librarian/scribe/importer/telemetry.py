@@ -0,0 +1,137 @@
+"""
+Per-run importer telemetry.
+
+Every import saves an :class:`~codex.models.library.ImportRun` row for
+the admin panel: wall time, queries issued and rows written per phase,
+the chunk size, WAL pages written, database growth in pages and the
+librarian's peak RSS. SQLite exposes no per-connection page read
+counter through PRAGMAs, so reads aren't recorded. An import that ran
+several times slower than the library's recent imports logs a warning.
+"""
+
+from statistics import median
+
+from django.db import connection
+from psutil import Process
+
+from codex.models import ImportRun, Library
+
+# Oldest runs beyond this many are pruned as new ones are saved.
+_MAX_RUNS = 500
+_BASELINE_RUNS = 10
+# Too few comics to compare throughput against.
+_MIN_COMICS = 100
+_REGRESSION_FACTOR = 3.0
+
+
+def _get_page_count() -> int:
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA page_count")
+        return cursor.fetchone()[0]
+
+
+class ImportTelemetry:
+    """Collect one import run's counters."""
+
+    def __init__(self) -> None:
+        """Start counting."""
+        self.queries = 0
+        self.rows = 0
+        # phase name -> [queries, rows]
+        self.phases: dict[str, list[int]] = {}
+        self.chunk_size = 0
+        self.pages_written = 0
+        self._process = Process()
+        self.peak_rss = self._process.memory_info().rss
+        self._start_page_count = _get_page_count()
+
+    def count_query(self, execute, sql, params, many, context):
+        """Count queries and written rows as a ``connection.execute_wrapper``."""
+        result = execute(sql, params, many, context)
+        self.queries += 1
+        # -1 for reads.
+        if (rowcount := context["cursor"].rowcount) > 0:
+            self.rows += rowcount
+        return result
+
+    def start_phase(self) -> tuple[int, int]:
+        """Snapshot the counters before a phase."""
+        return self.queries, self.rows
+
+    def end_phase(self, name: str, start: tuple[int, int]) -> None:
+        """Accumulate a phase's counters and sample memory."""
+        counters = self.phases.setdefault(name, [0, 0])
+        counters[0] += self.queries - start[0]
+        counters[1] += self.rows - start[1]
+        self.peak_rss = max(self.peak_rss, self._process.memory_info().rss)
+
+    @staticmethod
+    def _get_comics_per_second(run: ImportRun) -> float:
+        return run.comics / run.elapsed if run.elapsed else 0.0
+
+    def _check_regression(self, run: ImportRun, log) -> None:
+        """Warn if this run imported comics much slower than recent runs."""
+        if run.aborted or run.comics < _MIN_COMICS:
+            return
+        recent_runs = (
+            ImportRun.objects.filter(
+                library=run.library, aborted=False, comics__gte=_MIN_COMICS
+            )
+            .exclude(pk=run.pk)
+            .order_by("-created_at")[:_BASELINE_RUNS]
+        )
+        baseline = [self._get_comics_per_second(recent) for recent in recent_runs]
+        if not baseline:
+            return
+        baseline_cps = median(baseline)
+        cps = self._get_comics_per_second(run)
+        if cps and baseline_cps / cps >= _REGRESSION_FACTOR:
+            log.warning(
+                f"Import of {run.library.path} ran at {cps:.1f} comics per second, "
+                f"{baseline_cps / cps:.1f}x slower than its recent median of "
+                f"{baseline_cps:.1f}."
+            )
+
+    def save(
+        self,
+        library: Library,
+        log,
+        *,
+        phase_times: dict[str, float],
+        counts: dict[str, int],
+        elapsed: float,
+        aborted: bool,
+        initial_load: bool,
+    ) -> ImportRun:
+        """Save the run, prune old runs and check for a slowdown."""
+        phases = {
+            name: {
+                "seconds": round(seconds, 3),
+                "queries": self.phases.get(name, (0, 0))[0],
+                "rows": self.phases.get(name, (0, 0))[1],
+            }
+            for name, seconds in phase_times.items()
+        }
+        run = ImportRun.objects.create(
+            library=library,
+            elapsed=elapsed,
+            aborted=aborted,
+            initial_load=initial_load,
+            chunk_size=self.chunk_size,
+            comics=counts.get("comic", 0),
+            counts=counts,
+            phases=phases,
+            queries=self.queries,
+            rows=self.rows,
+            pages_written=self.pages_written,
+            pages_added=_get_page_count() - self._start_page_count,
+            peak_rss=self.peak_rss,
+        )
+        if old_pks := tuple(
+            ImportRun.objects.order_by("-created_at").values_list("pk", flat=True)[
+                _MAX_RUNS:
+            ]
+        ):
+            ImportRun.objects.filter(pk__in=old_pks).delete()
+        self._check_regression(run, log)
+        return run
@@ -13,6 +13,7 @@ from codex.librarian.scribe.janitor.status import JanitorAdoptOrphanFoldersStatu
 from codex.librarian.scribe.search.tasks import SearchIndexSyncTask
 from codex.librarian.worker import WorkerStatusAbortableBase
 from codex.models import Folder, Library
+from codex.views.browser.page_cache import bump_browser_generation
 
 # Iteration cap on the per-library orphan-adopt loop. Real orphan-
 # folder graphs converge in 1-2 passes (each pass moves orphans to
@@ -88,6 +89,7 @@ class OrphanFolderAdopter(WorkerStatusAbortableBase):
     def _finalize_adopt_orphan_folders(self, total_count: int) -> None:
         """Queue downstream notifications and log abort state."""
         if total_count:
+            bump_browser_generation()
             # Cross-library fan-out — leave ``scope`` empty (any library
             # could have had folders adopted) and mark the broadcast
             # with the post-adoption ``now`` so probes resolve.
@@ -24,6 +24,7 @@ from codex.librarian.onlinetag.session_snapshot import (
     set_resolved_outcomes,
     set_resume_state,
 )
+from codex.librarian.scribe.importer.intern import clear_shared_intern_cache
 from codex.librarian.scribe.janitor.failed_imports import JanitorUpdateFailedImports
 from codex.librarian.scribe.janitor.status import (
     JanitorCleanupBookmarksStatus,
@@ -232,6 +233,7 @@ class JanitorCleanup(JanitorUpdateFailedImports):
             self.status_controller.start(status)
             self.log.debug("Cleaning up orphan tags...")
             converged = self._converge_cleanup_fks(status)
+            clear_shared_intern_cache()
             if not converged and not self.abort_event.is_set():
                 cap = _FK_CLEANUP_MAX_PASSES
                 reason = (
@@ -1,11 +1,11 @@
 """Force update events for failed imports."""
 
 from codex.librarian.scribe.importer.tasks import ImportTask
-from codex.librarian.scribe.janitor.vacuum import JanitorVacuum
+from codex.librarian.scribe.janitor.fingerprints import JanitorBackfillFingerprints
 from codex.models import FailedImport, Library
 
 
-class JanitorUpdateFailedImports(JanitorVacuum):
+class JanitorUpdateFailedImports(JanitorBackfillFingerprints):
     """Methods for updating failed imports."""
 
     def _force_update_failed_imports(self, library_id) -> int:
@@ -0,0 +1,67 @@
+"""Backfill content fingerprints for comics imported before they existed."""
+
+from codex.librarian.scribe.importer.fingerprint import get_fingerprint
+from codex.librarian.scribe.janitor.status import JanitorBackfillFingerprintsStatus
+from codex.librarian.scribe.janitor.vacuum import JanitorVacuum
+from codex.models.comic import Comic
+from codex.settings import IMPORTER_FINGERPRINT
+
+_BATCH_SIZE = 500
+
+
+class JanitorBackfillFingerprints(JanitorVacuum):
+    """Fingerprint comics that have none."""
+
+    def _save_fingerprints(
+        self, comics: list[Comic], status: JanitorBackfillFingerprintsStatus
+    ) -> None:
+        """Write a batch of fingerprints."""
+        if not comics:
+            return
+        with self.db_write_lock:
+            Comic.objects.bulk_update(comics, ("fingerprint",))
+        status.increment_complete(len(comics))
+        self.status_controller.update(status)
+
+    def backfill_fingerprints(self) -> None:
+        """
+        Fingerprint comics imported before fingerprints were stored.
+
+        Reads store a fingerprint on every comic they import, but comics
+        that haven't been re-read since the fingerprint column arrived
+        have none, and a deleted comic without one can never be paired
+        with its moved copy. Unreadable files are left for the importer.
+        """
+        if not IMPORTER_FINGERPRINT:
+            return
+        status = JanitorBackfillFingerprintsStatus()
+        try:
+            rows = tuple(
+                Comic.objects.filter(fingerprint="")
+                .order_by()
+                .values_list("pk", "path")
+            )
+            if not rows:
+                return
+            status.total = len(rows)
+            self.status_controller.start(status)
+            comics: list[Comic] = []
+            for pk, path in rows:
+                if self.abort_event.is_set():
+                    break
+                try:
+                    fingerprint = get_fingerprint(path)
+                except OSError as exc:
+                    self.log.debug(f"Could not fingerprint {path}: {exc}")
+                    continue
+                comics.append(Comic(pk=pk, fingerprint=fingerprint))
+                if len(comics) >= _BATCH_SIZE:
+                    self._save_fingerprints(comics, status)
+                    comics = []
+            self._save_fingerprints(comics, status)
+            level = "INFO" if status.complete else "DEBUG"
+            self.log.log(level, f"Fingerprinted {status.complete or 0} comics.")
+        except Exception:
+            self.log.exception("Backfilling comic fingerprints")
+        finally:
+            self.status_controller.finish(status)
@@ -5,10 +5,14 @@ from typing import Final
 
 from codex.librarian.bookmark.tasks import CodexLatestVersionTask
 from codex.librarian.covers.status import FindOrphanCoversStatus, RemoveCoversStatus
-from codex.librarian.covers.tasks import CoverRemoveOrphansTask
+from codex.librarian.covers.tasks import (
+    CoverCompactPackTask,
+    CoverRemoveOrphansTask,
+)
 from codex.librarian.scribe.importer.statii.moved import ImporterMoveFoldersStatus
 from codex.librarian.scribe.janitor.status import (
     JanitorAdoptOrphanFoldersStatus,
+    JanitorBackfillFingerprintsStatus,
     JanitorCleanupBookmarksStatus,
     JanitorCleanupCoversStatus,
     JanitorCleanupFavoritesStatus,
@@ -27,6 +31,7 @@ from codex.librarian.scribe.janitor.status import (
 )
 from codex.librarian.scribe.janitor.tasks import (
     JanitorAdoptOrphanFoldersTask,
+    JanitorBackfillFingerprintsTask,
     JanitorBackupTask,
     JanitorCleanCoversTask,
     JanitorCleanFKsTask,
@@ -59,6 +64,7 @@ from codex.librarian.scribe.search.tasks import (
 )
 from codex.librarian.tasks import LibrarianTask
 from codex.models import Timestamp
+from codex.views.browser.page_cache import bump_browser_generation
 
 _JANITOR_STATII: Final = (
     JanitorCodexLatestVersionStatus,
@@ -75,6 +81,7 @@ _JANITOR_STATII: Final = (
     JanitorCleanupSettingsStatus,
     JanitorCleanupFavoritesStatus,
     JanitorCleanupTaggingStateStatus,
+    JanitorBackfillFingerprintsStatus,
     SearchIndexCleanStatus,
     SearchIndexSyncUpdateStatus,
     SearchIndexSyncCreateStatus,
@@ -104,12 +111,14 @@ _NIGHTLY_TASKS: Final[tuple[LibrarianTask, ...]] = (
     JanitorCleanupSettingsTask(),
     JanitorCleanupFavoritesTask(),
     JanitorCleanupTaggingStateTask(),
+    JanitorBackfillFingerprintsTask(),
     SearchIndexSyncTask(),
     SearchIndexOptimizeTask(),
     JanitorVacuumTask(),
     JanitorBackupTask(),
     JanitorDumpUserDataTask(),
     CoverRemoveOrphansTask(),
+    CoverCompactPackTask(),
 )
 _JANITOR_METHOD_MAP: Final[MappingProxyType[type, str]] = MappingProxyType(
     {
@@ -121,6 +130,7 @@ _JANITOR_METHOD_MAP: Final[MappingProxyType[type, str]] = MappingProxyType(
         JanitorCleanupFavoritesTask: "cleanup_orphan_favorites",
         JanitorCleanupSettingsTask: "cleanup_orphan_settings",
         JanitorCleanupTaggingStateTask: "cleanup_tagging_state",
+        JanitorBackfillFingerprintsTask: "backfill_fingerprints",
         JanitorImportForceAllFailedTask: "force_update_all_failed_imports",
         JanitorForeignKeyCheckTask: "foreign_key_check",
         JanitorFolderRelationsCheckTask: "folder_relations_check",
@@ -130,6 +140,17 @@ _JANITOR_METHOD_MAP: Final[MappingProxyType[type, str]] = MappingProxyType(
         JanitorDumpUserDataTask: "dump_user_data_sidecar",
     }
 )
+# Tasks that can change what the browser shows.
+_BROWSER_CHANGED_TASKS: Final = frozenset(
+    {
+        JanitorCleanFKsTask,
+        JanitorCleanCoversTask,
+        JanitorCleanupFavoritesTask,
+        JanitorForeignKeyCheckTask,
+        JanitorFolderRelationsCheckTask,
+        JanitorFTSRebuildTask,
+    }
+)
 
 
 class Janitor(JanitorCodexUpdate):
@@ -164,6 +185,8 @@ class Janitor(JanitorCodexUpdate):
             if method_name := _JANITOR_METHOD_MAP.get(type(task)):
                 method = getattr(self, method_name)
                 method()
+                if type(task) in _BROWSER_CHANGED_TASKS:
+                    bump_browser_generation()
                 return
 
             # Tasks with special parameters
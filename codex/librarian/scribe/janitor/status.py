@@ -132,6 +132,15 @@ class JanitorCleanupTaggingStateStatus(JanitorStatus):
     SINGLE = True
 
 
+class JanitorBackfillFingerprintsStatus(JanitorStatus):
+    """Janitor Backfill Comic Fingerprints Status."""
+
+    CODE = "JFP"
+    VERB = "Fingerprint"
+    _verbed = "Fingerprinted"
+    ITEM_NAME = "comics"
+
+
 class JanitorDBFKIntegrityStatus(JanitorStatus):
     """Janitor Check DB FK Integrity Status."""
 
@@ -196,6 +205,7 @@ JANITOR_STATII = (
     JanitorCleanupSettingsStatus,
     JanitorCleanupFavoritesStatus,
     JanitorCleanupTaggingStateStatus,
+    JanitorBackfillFingerprintsStatus,
     JanitorDBFKIntegrityStatus,
     JanitorDBIntegrityStatus,
     JanitorDBFTSIntegrityStatus,
@@ -68,6 +68,10 @@ class JanitorFolderRelationsCheckTask(JanitorTask):
     """Check and repair drifted comic↔folder relations."""
 
 
+class JanitorBackfillFingerprintsTask(JanitorTask):
+    """Fingerprint comics that have none."""
+
+
 class JanitorImportForceAllFailedTask(JanitorTask):
     """Force update for failed imports in every library."""
 
@@ -7,6 +7,7 @@ from codex.librarian.scribe.importer.tasks import (
 )
 from codex.librarian.scribe.janitor.tasks import (
     JanitorAdoptOrphanFoldersTask,
+    JanitorBackfillFingerprintsTask,
     JanitorBackupTask,
     JanitorCleanCoversTask,
     JanitorCleanFKsTask,
@@ -68,6 +69,7 @@ _SCRIBE_TASK_PRIORITY = (
     JanitorCleanupSettingsTask,
     JanitorCleanupFavoritesTask,
     JanitorCleanupTaggingStateTask,
+    JanitorBackfillFingerprintsTask,
     SearchIndexClearTask,
     SearchIndexCleanStaleTask,
     SearchIndexSyncTask,
@@ -0,0 +1,52 @@
+"""Recompute collection rollups from their comics."""
+
+from collections.abc import Sequence
+
+from django.db.models import Count, Max, Min, Sum
+
+from codex.models import StoryArc
+from codex.models.collections import BrowserCollectionModel
+from codex.models.library import Library
+from codex.models.rollup import ROLLUP_MODELS
+from codex.settings import IMPORTER_LINK_FK_BATCH_SIZE
+
+
+def _get_rollup_aggregates(
+    model: type[BrowserCollectionModel],
+) -> tuple[dict, str]:
+    """Return the rollup field aggregates and the relation to comics."""
+    rel = "storyarcnumber__comic__" if model is StoryArc else "comic__"
+    return {
+        "child_count": Count(rel + "pk", distinct=True),
+        "size": Sum(rel + "size"),
+        "page_count": Sum(rel + "page_count"),
+        "date_min": Min(rel + "date"),
+        "date_max": Max(rel + "date"),
+    }, rel
+
+
+def update_rollups(
+    model: type[BrowserCollectionModel], library: Library, pks: Sequence[int]
+) -> None:
+    """Replace the library's rollups of the collections with fresh aggregates."""
+    rollup_model = ROLLUP_MODELS.get(model)
+    if not rollup_model:
+        return
+    aggregates, rel = _get_rollup_aggregates(model)
+    library_filter = {rel + "library": library}
+    for start in range(0, len(pks), IMPORTER_LINK_FK_BATCH_SIZE):
+        batch = pks[start : start + IMPORTER_LINK_FK_BATCH_SIZE]
+        # Filtering comics by library before aggregating scopes every
+        # aggregate to this library's comics. Collections left without
+        # comics here get no row.
+        rows = (
+            model.objects.filter(pk__in=batch, **library_filter)
+            .values("pk")
+            .annotate(**aggregates)
+        )
+        rollups = [
+            rollup_model(collection_id=row.pop("pk"), library=library, **row)
+            for row in rows
+        ]
+        rollup_model.objects.filter(collection_id__in=batch, library=library).delete()
+        rollup_model.objects.bulk_create(rollups)
@@ -0,0 +1,82 @@
+"""
+Search index change log.
+
+The importer records which comics and which search columns it changed
+in ``ComicFTSChange`` during its link and delete phases, and clears
+those rows once its own search index phase has written them. Rows left
+behind by an aborted or failed import are picked up by the next search
+sync, which then rewrites only those rows and columns instead of
+scanning every comic for staleness.
+"""
+
+from collections.abc import Collection, Iterable, Mapping
+
+from codex.models.comic import ComicFTSChange
+from codex.settings import IMPORTER_LINK_FK_BATCH_SIZE
+
+# An empty column set means rewrite the whole row.
+ALL_FTS_FIELDS: frozenset[str] = frozenset()
+_FIELDS_SEPARATOR = ","
+_UPDATE_FIELDS = ("fields", "updated_at")
+
+
+def parse_fts_fields(fields: str) -> frozenset[str]:
+    """Parse a stored column list."""
+    return frozenset(filter(None, fields.split(_FIELDS_SEPARATOR)))
+
+
+def merge_fts_fields(
+    fields_a: frozenset[str], fields_b: frozenset[str]
+) -> frozenset[str]:
+    """Union two column sets where an empty set means every column."""
+    if not fields_a or not fields_b:
+        return ALL_FTS_FIELDS
+    return fields_a | fields_b
+
+
+def _iter_batches(pks: Collection[int]) -> Iterable[tuple[int, ...]]:
+    pks = tuple(pks)
+    for start in range(0, len(pks), IMPORTER_LINK_FK_BATCH_SIZE):
+        yield pks[start : start + IMPORTER_LINK_FK_BATCH_SIZE]
+
+
+def log_fts_changes(changes: Mapping[int, frozenset[str]]) -> frozenset[int]:
+    """
+    Merge changed comics and columns into the log.
+
+    Returns the comics that were logged already, by an earlier import
+    that never finished its search index phase. Their merged columns
+    may include ones the current import won't write, so only the sync
+    may clear them.
+    """
+    carried_over: set[int] = set()
+    for batch_pks in _iter_batches(changes.keys()):
+        logged = dict(
+            ComicFTSChange.objects.filter(comic_id__in=batch_pks).values_list(
+                "comic_id", "fields"
+            )
+        )
+        objs = []
+        for pk in batch_pks:
+            fields = changes[pk]
+            if (old_fields := logged.get(pk)) is not None:
+                fields = merge_fts_fields(fields, parse_fts_fields(old_fields))
+                carried_over.add(pk)
+            objs.append(
+                ComicFTSChange(
+                    comic_id=pk, fields=_FIELDS_SEPARATOR.join(sorted(fields))
+                )
+            )
+        ComicFTSChange.objects.bulk_create(
+            objs,
+            update_conflicts=True,
+            update_fields=_UPDATE_FIELDS,
+            unique_fields=("comic_id",),
+        )
+    return frozenset(carried_over)
+
+
+def clear_fts_changes(pks: Collection[int]) -> None:
+    """Remove handled comics from the log."""
+    for batch_pks in _iter_batches(pks):
+        ComicFTSChange.objects.filter(comic_id__in=batch_pks).delete()
@@ -38,3 +38,6 @@ COMICFTS_UPDATE_FIELDS = (
     *_COMICFTS_FKS,
     *_COMICFTS_M2MS,
 )
+# Every column the search sync can rewrite.
+COMICFTS_FIELDS = frozenset(COMICFTS_UPDATE_FIELDS) - {"updated_at"}
+COMICFTS_M2M_FIELDS = frozenset(_COMICFTS_M2MS)
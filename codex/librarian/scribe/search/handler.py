@@ -8,6 +8,7 @@ from codex.librarian.scribe.search.tasks import (
     SearchIndexOptimizeTask,
     SearchIndexSyncTask,
 )
+from codex.views.browser.page_cache import bump_browser_generation
 
 
 class SearchIndexer(SearchIndexerSync):
@@ -15,14 +16,21 @@ class SearchIndexer(SearchIndexerSync):
 
     def handle_task(self, task: SearchIndexerTask) -> None:
         """Handle search indexer tasks."""
+        # Search results are cached with the browser pages; optimizing
+        # doesn't change them.
         match task:
             case SearchIndexSyncTask():
-                self.update_search_index(rebuild=task.rebuild)
+                self.update_search_index(
+                    rebuild=task.rebuild, changes_only=task.changes_only
+                )
             case SearchIndexCleanStaleTask():
                 self.remove_stale_records()
             case SearchIndexOptimizeTask():
                 self.optimize()
+                return
             case SearchIndexClearTask():
                 self.clear_search_index()
             case _:
                 self.log.warning(f"Bad task sent to scribe {task}")
+                return
+        bump_browser_generation()
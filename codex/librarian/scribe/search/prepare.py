@@ -155,7 +155,8 @@ class SearchEntryPrepare:
         if sources := cls._get_sources_fts_field(entry):
             entry["sources"] = sources
         cls._create_comicfts_entry_fks(entry)
-        entry["universes"] = entry["universes"].strip(",")
+        # Absent when a partial sync didn't ask for it.
+        entry["universes"] = entry.get("universes", "").strip(",")
         cls._create_comicfts_entry_attributes(entry, create=create)
         entry["comic_id"] = comic["id"]
 
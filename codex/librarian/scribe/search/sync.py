@@ -1,6 +1,8 @@
 """Search Index update."""
 
+from collections.abc import Iterable
 from datetime import datetime
+from functools import reduce
 from math import floor
 from time import monotonic
 from types import MappingProxyType
@@ -15,7 +17,16 @@ from django.db.models.query import QuerySet
 from humanize import intcomma, naturaldelta
 
 from codex.librarian.memory import get_mem_limit
-from codex.librarian.scribe.search.const import COMICFTS_UPDATE_FIELDS
+from codex.librarian.scribe.search.changes import (
+    ALL_FTS_FIELDS,
+    clear_fts_changes,
+    merge_fts_fields,
+    parse_fts_fields,
+)
+from codex.librarian.scribe.search.const import (
+    COMICFTS_FIELDS,
+    COMICFTS_UPDATE_FIELDS,
+)
 from codex.librarian.scribe.search.prepare import SearchEntryPrepare
 from codex.librarian.scribe.search.remove import SearchIndexerRemove
 from codex.librarian.scribe.search.status import (
@@ -26,7 +37,7 @@ from codex.librarian.scribe.search.status import (
     SearchIndexSyncUpdateStatus,
 )
 from codex.models import Comic
-from codex.models.comic import ComicFTS
+from codex.models.comic import ComicFTS, ComicFTSChange
 from codex.models.functions import GroupConcat
 from codex.settings import IMPORTER_SEARCH_SYNC_BATCH_MEMORY_RATIO
 
@@ -87,9 +98,12 @@ _M2M_FTS_REL_MAP = MappingProxyType(
 class SearchIndexerSync(SearchIndexerRemove):
     """Search Index update methods."""
 
-    def _init_statuses(self, rebuild) -> None:
+    def _init_statuses(self, *, rebuild: bool, changes_only: bool) -> None:
         """Initialize all statuses order before starting."""
         statii: list[Status] = []
+        if changes_only:
+            self.status_controller.start_many((SearchIndexSyncUpdateStatus(),))
+            return
         if rebuild:
             statii.append(
                 SearchIndexClearStatus(),
@@ -230,13 +244,16 @@ class SearchIndexerSync(SearchIndexerRemove):
         batch_pks: list[int],
         *,
         create: bool,
+        fields: frozenset[str] = ALL_FTS_FIELDS,
     ) -> list[ComicFTS]:
         """
         Build one batch of ``ComicFTS`` rows for create-or-update.
 
         Returns an empty list when every row was filtered out by
         ``prepare_sync_fts_entry`` — caller decides whether iteration
-        is exhausted via its pk watermark.
+        is exhausted via its pk watermark. A non-empty ``fields`` skips
+        the M2M queries for every other column; those columns come back
+        empty and must not be written.
         """
         if not batch_pks:
             return []
@@ -250,8 +267,13 @@ class SearchIndexerSync(SearchIndexerRemove):
         m2m_dicts = {
             f"fts_{alias}": self._build_m2m_fts_dict(batch_pks, target)
             for alias, target in _M2M_FTS_REL_MAP.items()
+            if not fields or alias in fields
         }
-        universes_dict = self._build_universes_fts_dict(batch_pks)
+        universes_dict = (
+            self._build_universes_fts_dict(batch_pks)
+            if not fields or "universes" in fields
+            else {}
+        )
 
         obj_list: list[ComicFTS] = []
         for comic in fk_rows:
@@ -262,14 +284,16 @@ class SearchIndexerSync(SearchIndexerRemove):
             SearchEntryPrepare.prepare_sync_fts_entry(comic, obj_list, create=create)
         return obj_list
 
+    @staticmethod
+    def _get_search_index_batch_size() -> int:
+        # Smaller systems may run out of virtual memory unless this is auto governed.
+        mem_limit_gb = get_mem_limit("g")
+        return floor((mem_limit_gb / IMPORTER_SEARCH_SYNC_BATCH_MEMORY_RATIO) * 1000)
+
     def _update_search_index_operate(
         self, comics_filtered_qs: QuerySet, *, create: bool
     ):
-        # Smaller systems may run out of virtual memory unless this is auto governed.
-        mem_limit_gb = get_mem_limit("g")
-        search_index_batch_size = floor(
-            (mem_limit_gb / IMPORTER_SEARCH_SYNC_BATCH_MEMORY_RATIO) * 1000
-        )
+        search_index_batch_size = self._get_search_index_batch_size()
         chunk_human_size = intcomma(search_index_batch_size)
 
         # Walk ``comics_filtered_qs`` in pk order via a watermark so
@@ -351,6 +375,111 @@ class SearchIndexerSync(SearchIndexerRemove):
         self.log.debug(f"Found {count} comics missing from the search index.")
         return self._update_search_index_operate(missing_comics, create=True)
 
+    def create_missing_search_entries(self) -> int:
+        """Create search entries for every comic without one, in pk order."""
+        return self._update_search_index_create()
+
+    @staticmethod
+    def _delete_deleted_comic_entries(
+        pks: tuple[int, ...],
+    ) -> tuple[frozenset[int], int]:
+        """Delete the entries of comics that are gone; return the extant pks."""
+        comic_pks = frozenset(
+            Comic.objects.filter(pk__in=pks).values_list("pk", flat=True)
+        )
+        count = 0
+        if deleted_pks := tuple(pk for pk in pks if pk not in comic_pks):
+            count, _ = ComicFTS.objects.filter(pk__in=deleted_pks).delete()
+        return comic_pks, count
+
+    def remove_deleted_records(self, pks: Iterable[int]) -> int:
+        """
+        Remove the entries of logged comics that no longer exist.
+
+        Looks up only the logged pks instead of scanning the whole index
+        for stale entries like :meth:`remove_stale_records`.
+        """
+        pks = tuple(sorted(pks))
+        count = 0
+        status = SearchIndexCleanStatus(log_success=False)
+        try:
+            self.status_controller.start(status)
+            batch_size = self._get_search_index_batch_size()
+            for start in range(0, len(pks), batch_size):
+                _, batch_count = self._delete_deleted_comic_entries(
+                    pks[start : start + batch_size]
+                )
+                count += batch_count
+            status.complete = count
+        except Exception:
+            self.log.exception("Removing deleted records:")
+        finally:
+            self.status_controller.finish(status)
+        return count
+
+    def _sync_fts_changes_batch(self, changes: dict[int, str]) -> int:
+        """Delete, create or rewrite one batch of logged search entries."""
+        pks = tuple(changes)
+        comic_pks, _ = self._delete_deleted_comic_entries(pks)
+        indexed_pks = frozenset(
+            ComicFTS.objects.filter(pk__in=comic_pks).values_list("pk", flat=True)
+        )
+        if create_pks := sorted(comic_pks - indexed_pks):
+            obj_list = self._build_search_index_batch_obj_list(create_pks, create=True)
+            ComicFTS.objects.bulk_create(obj_list)
+        if update_pks := sorted(indexed_pks):
+            # Rewrite the union of the batch's logged columns.
+            fields = reduce(
+                merge_fts_fields,
+                (parse_fts_fields(changes[pk]) for pk in update_pks),
+            )
+            obj_list = self._build_search_index_batch_obj_list(
+                update_pks, create=False, fields=fields
+            )
+            update_fields = (*sorted(fields or COMICFTS_FIELDS), "updated_at")
+            ComicFTS.objects.bulk_update(obj_list, update_fields)
+        return len(pks)
+
+    def _sync_fts_changes(self) -> int:
+        """Sync only the comics and columns in the search change log."""
+        total = ComicFTSChange.objects.count()
+        status = SearchIndexSyncUpdateStatus(total=total, subtitle="Change log")
+        count = 0
+        try:
+            if not total:
+                self.log.debug("No logged search index changes to sync.")
+                return count
+            self.status_controller.start(status, notify=True)
+            self.log.debug(f"Syncing {total} logged search index changes...")
+            batch_size = self._get_search_index_batch_size()
+            last_pk = 0
+            while not self.abort_event.is_set():
+                changes = dict(
+                    ComicFTSChange.objects.filter(comic_id__gt=last_pk)
+                    .order_by("comic_id")
+                    .values_list("comic_id", "fields")[:batch_size]
+                )
+                if not changes:
+                    break
+                batch_count = self._sync_fts_changes_batch(changes)
+                clear_fts_changes(tuple(changes))
+                count += batch_count
+                status.increment_complete(batch_count)
+                self.status_controller.update(status, notify=True)
+                last_pk = max(changes)
+        finally:
+            self.status_controller.finish(status)
+        return count
+
+    def _update_search_index_changes(self) -> None:
+        """Sync only logged changes."""
+        start_time = monotonic()
+        self._init_statuses(rebuild=False, changes_only=True)
+        count = self._sync_fts_changes()
+        elapsed = naturaldelta(monotonic() - start_time)
+        summary = f"synced {count} logged changes" if count else "already synced"
+        self.log.success(f"Search index {summary} in {elapsed}.")
+
     def _update_search_index(self, *, rebuild: bool) -> None:
         """Update or Rebuild the search index."""
         self.log.debug("In update search index before init statii.")
@@ -359,17 +488,25 @@ class SearchIndexerSync(SearchIndexerRemove):
         # would skew ``time() - start_time``. Mirrors the same fix
         # applied to other librarian threads in PR #623 / #624.
         start_time = monotonic()
-        self._init_statuses(rebuild)
+        self._init_statuses(rebuild=rebuild, changes_only=False)
 
         if self.abort_event.is_set():
             return
         cleaned_count = self._update_search_index_clean(rebuild)
+        if rebuild:
+            # Everything logged is about to be rewritten.
+            ComicFTSChange.objects.all().delete()
         if self.abort_event.is_set():
             return
         updated_count = self._update_search_index_update()
         if self.abort_event.is_set():
             return
         created_count = self._update_search_index_create()
+        if self.abort_event.is_set():
+            return
+        # After the scans so their updated_at watermark isn't moved past
+        # comics that changed without being logged.
+        updated_count += self._sync_fts_changes()
 
         elapsed_time = monotonic() - start_time
         elapsed = naturaldelta(elapsed_time)
@@ -387,11 +524,20 @@ class SearchIndexerSync(SearchIndexerRemove):
             summary = "found to be already synced"
         self.log.success(f"Search index {summary} in {elapsed}.")
 
-    def update_search_index(self, *, rebuild: bool) -> None:
-        """Update or Rebuild the search index."""
+    def update_search_index(self, *, rebuild: bool, changes_only: bool = False) -> None:
+        """
+        Update or Rebuild the search index.
+
+        ``changes_only`` syncs just the search change log unless the
+        index is empty, instead of also scanning every comic for stale,
+        out of date and missing entries.
+        """
         self.abort_event.clear()
         try:
-            self._update_search_index(rebuild=rebuild)
+            if changes_only and not rebuild and ComicFTS.objects.exists():
+                self._update_search_index_changes()
+            else:
+                self._update_search_index(rebuild=rebuild)
         except Exception:
             self.log.exception("Update search index")
         finally:
@@ -14,6 +14,7 @@ class SearchIndexSyncTask(SearchIndexerTask):
     """Update the search index."""
 
     rebuild: bool = False
+    changes_only: bool = False
 
 
 class SearchIndexOptimizeTask(SearchIndexerTask):
@@ -1,4 +1,4 @@
-"""Update Collections timestamp for cover cache busting."""
+"""Update Collections timestamp for cover cache busting and their rollups."""
 
 from collections.abc import Mapping
 from datetime import datetime
@@ -8,12 +8,14 @@ from django.db.models.query_utils import Q
 from django.utils import timezone
 
 from codex.librarian.notifier.tasks import LIBRARY_CHANGED_TASK
+from codex.librarian.scribe.rollup import update_rollups
 from codex.librarian.scribe.status import UpdateCollectionTimestampsStatus
 from codex.librarian.worker import WorkerStatusBase
 from codex.models import StoryArc, Volume
 from codex.models.collections import BrowserCollectionModel
 from codex.models.library import Library
 from codex.settings import IMPORTER_LINK_FK_BATCH_SIZE
+from codex.views.browser.page_cache import bump_browser_generation
 from codex.views.const import COLLECTION_MODELS
 
 
@@ -94,6 +96,9 @@ class TimestampUpdater(WorkerStatusBase):
             for start in range(0, count, IMPORTER_LINK_FK_BATCH_SIZE):
                 batch = pks[start : start + IMPORTER_LINK_FK_BATCH_SIZE]
                 model.objects.filter(pk__in=batch).update(updated_at=Now())
+            # The same collections changed children, so their rollups
+            # change with them.
+            update_rollups(model, library, pks)
             log_list.append(f"{count} {model.__name__}s")
         return count
 
@@ -141,4 +146,5 @@ class TimestampUpdater(WorkerStatusBase):
         level = "INFO" if count else "DEBUG"
         self.log.log(level, f"Updated timestamps for {count} collections.")
         # All-libraries fan-out: clients re-probe their viewed collection.
+        bump_browser_generation()
         self.librarian_queue.put(LIBRARY_CHANGED_TASK)
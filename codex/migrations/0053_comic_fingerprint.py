@@ -0,0 +1,19 @@
+"""Generated by Django 6.0.7 on 2026-10-18 12:00."""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Add a content fingerprint to comics for move detection."""
+
+    dependencies = [
+        ("codex", "0052_comicboxtaggingdefaults_comicvine_url"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="comic",
+            name="fingerprint",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+    ]
@@ -0,0 +1,30 @@
+"""Generated by Django 6.0.7 on 2026-10-18 12:00."""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Add the search index change log."""
+
+    dependencies = [
+        ("codex", "0053_comic_fingerprint"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ComicFTSChange",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "comic_id",
+                    models.PositiveIntegerField(primary_key=True, serialize=False),
+                ),
+                ("fields", models.TextField(blank=True, default="")),
+            ],
+            options={
+                "abstract": False,
+                "get_latest_by": "updated_at",
+            },
+        ),
+    ]
@@ -0,0 +1,54 @@
+"""Generated by Django 6.0.7 on 2026-10-18 12:00."""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Add importer telemetry."""
+
+    dependencies = [
+        ("codex", "0054_comicftschange"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ImportRun",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("elapsed", models.FloatField(default=0.0)),
+                ("aborted", models.BooleanField(default=False)),
+                ("initial_load", models.BooleanField(default=False)),
+                ("chunk_size", models.PositiveIntegerField(default=0)),
+                ("comics", models.PositiveIntegerField(default=0)),
+                ("counts", models.JSONField(default=dict)),
+                ("phases", models.JSONField(default=dict)),
+                ("queries", models.PositiveIntegerField(default=0)),
+                ("rows", models.PositiveBigIntegerField(default=0)),
+                ("pages_written", models.PositiveBigIntegerField(default=0)),
+                ("pages_added", models.BigIntegerField(default=0)),
+                ("peak_rss", models.PositiveBigIntegerField(default=0)),
+                (
+                    "library",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="codex.library",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+                "get_latest_by": "updated_at",
+            },
+        ),
+    ]
@@ -0,0 +1,47 @@
+"""Generated by Django 6.0.7 on 2026-10-18 12:00."""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Add the resumable import journal."""
+
+    dependencies = [
+        ("codex", "0055_importrun"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ImportJournal",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("started_at", models.DateTimeField()),
+                ("task", models.JSONField(default=dict)),
+                ("phase", models.CharField(default="", max_length=32)),
+                ("chunks_done", models.PositiveIntegerField(default=0)),
+                ("attempts", models.PositiveIntegerField(default=1)),
+                (
+                    "library",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="codex.library",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+                "get_latest_by": "updated_at",
+            },
+        ),
+    ]
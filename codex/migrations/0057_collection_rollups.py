@@ -0,0 +1,305 @@
+"""Generated by Django 6.0.7 on 2026-10-18 12:00."""
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Max, Min, Sum
+
+_ROLLUP_MODEL_NAMES = (
+    ("publisher", "publisherrollup"),
+    ("imprint", "imprintrollup"),
+    ("series", "seriesrollup"),
+    ("volume", "volumerollup"),
+    ("folder", "folderrollup"),
+    ("storyarc", "storyarcrollup"),
+)
+_BATCH_SIZE = 1000
+
+
+def _build_rollups(apps, _schema_editor):
+    """Build every collection's rollups from the existing comics."""
+    for model_name, rollup_model_name in _ROLLUP_MODEL_NAMES:
+        model = apps.get_model("codex", model_name)
+        rollup_model = apps.get_model("codex", rollup_model_name)
+        rel = "storyarcnumber__comic__" if model_name == "storyarc" else "comic__"
+        library_rel = rel + "library"
+        rows = (
+            model.objects.filter(**{f"{library_rel}__isnull": False})
+            .values("pk", library_rel)
+            .annotate(
+                child_count=Count(rel + "pk", distinct=True),
+                size=Sum(rel + "size"),
+                page_count=Sum(rel + "page_count"),
+                date_min=Min(rel + "date"),
+                date_max=Max(rel + "date"),
+            )
+            .order_by()
+        )
+        rollups = []
+        for row in rows.iterator():
+            collection_id = row.pop("pk")
+            library_id = row.pop(library_rel)
+            rollups.append(
+                rollup_model(collection_id=collection_id, library_id=library_id, **row)
+            )
+            if len(rollups) >= _BATCH_SIZE:
+                rollup_model.objects.bulk_create(rollups)
+                rollups = []
+        rollup_model.objects.bulk_create(rollups)
+
+
+class Migration(migrations.Migration):
+    """Add collection rollups and build them."""
+
+    dependencies = [
+        ("codex", "0056_importjournal"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PublisherRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("child_count", models.PositiveIntegerField(default=0)),
+                ("size", models.PositiveBigIntegerField(default=0)),
+                ("page_count", models.PositiveBigIntegerField(default=0)),
+                ("date_min", models.DateField(null=True)),
+                ("date_max", models.DateField(null=True)),
+                (
+                    "library",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="codex.library",
+                    ),
+                ),
+                (
+                    "collection",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rollups",
+                        to="codex.publisher",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+                "get_latest_by": "updated_at",
+                "unique_together": {("collection", "library")},
+            },
+        ),
+        migrations.CreateModel(
+            name="ImprintRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("child_count", models.PositiveIntegerField(default=0)),
+                ("size", models.PositiveBigIntegerField(default=0)),
+                ("page_count", models.PositiveBigIntegerField(default=0)),
+                ("date_min", models.DateField(null=True)),
+                ("date_max", models.DateField(null=True)),
+                (
+                    "library",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="codex.library",
+                    ),
+                ),
+                (
+                    "collection",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rollups",
+                        to="codex.imprint",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+                "get_latest_by": "updated_at",
+                "unique_together": {("collection", "library")},
+            },
+        ),
+        migrations.CreateModel(
+            name="SeriesRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("child_count", models.PositiveIntegerField(default=0)),
+                ("size", models.PositiveBigIntegerField(default=0)),
+                ("page_count", models.PositiveBigIntegerField(default=0)),
+                ("date_min", models.DateField(null=True)),
+                ("date_max", models.DateField(null=True)),
+                (
+                    "library",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="codex.library",
+                    ),
+                ),
+                (
+                    "collection",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rollups",
+                        to="codex.series",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+                "get_latest_by": "updated_at",
+                "unique_together": {("collection", "library")},
+            },
+        ),
+        migrations.CreateModel(
+            name="VolumeRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("child_count", models.PositiveIntegerField(default=0)),
+                ("size", models.PositiveBigIntegerField(default=0)),
+                ("page_count", models.PositiveBigIntegerField(default=0)),
+                ("date_min", models.DateField(null=True)),
+                ("date_max", models.DateField(null=True)),
+                (
+                    "library",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="codex.library",
+                    ),
+                ),
+                (
+                    "collection",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rollups",
+                        to="codex.volume",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+                "get_latest_by": "updated_at",
+                "unique_together": {("collection", "library")},
+            },
+        ),
+        migrations.CreateModel(
+            name="FolderRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("child_count", models.PositiveIntegerField(default=0)),
+                ("size", models.PositiveBigIntegerField(default=0)),
+                ("page_count", models.PositiveBigIntegerField(default=0)),
+                ("date_min", models.DateField(null=True)),
+                ("date_max", models.DateField(null=True)),
+                (
+                    "library",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="codex.library",
+                    ),
+                ),
+                (
+                    "collection",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rollups",
+                        to="codex.folder",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+                "get_latest_by": "updated_at",
+                "unique_together": {("collection", "library")},
+            },
+        ),
+        migrations.CreateModel(
+            name="StoryArcRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("child_count", models.PositiveIntegerField(default=0)),
+                ("size", models.PositiveBigIntegerField(default=0)),
+                ("page_count", models.PositiveBigIntegerField(default=0)),
+                ("date_min", models.DateField(null=True)),
+                ("date_max", models.DateField(null=True)),
+                (
+                    "library",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="codex.library",
+                    ),
+                ),
+                (
+                    "collection",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rollups",
+                        to="codex.storyarc",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+                "get_latest_by": "updated_at",
+                "unique_together": {("collection", "library")},
+            },
+        ),
+        migrations.RunPython(_build_rollups, migrations.RunPython.noop),
+    ]
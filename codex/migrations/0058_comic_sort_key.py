@@ -0,0 +1,53 @@
+"""Generated by Django 6.0.7 on 2026-10-18 12:00."""
+
+from django.db import migrations, models
+
+from codex.models.util import get_sort_key
+
+_SORT_KEY_FIELDS = (
+    "publisher__sort_name",
+    "imprint__sort_name",
+    "series__sort_name",
+    "volume__name",
+    "issue_number",
+    "issue_suffix",
+    "collection_title",
+    "sort_name",
+)
+_BATCH_SIZE = 1000
+
+
+def _set_sort_keys(apps, _schema_editor):
+    """Compose the sort key of every existing comic."""
+    comic_model = apps.get_model("codex", "comic")
+    rows = comic_model.objects.values_list("pk", *_SORT_KEY_FIELDS).order_by()
+    comics = []
+    for pk, *parts in rows.iterator():
+        comics.append(comic_model(pk=pk, sort_key=get_sort_key(*parts)))
+        if len(comics) >= _BATCH_SIZE:
+            comic_model.objects.bulk_update(comics, ("sort_key",))
+            comics = []
+    comic_model.objects.bulk_update(comics, ("sort_key",))
+
+
+class Migration(migrations.Migration):
+    """Add the comic sort key and compose it."""
+
+    dependencies = [
+        ("codex", "0057_collection_rollups"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="comic",
+            name="sort_key",
+            field=models.TextField(db_index=True, default=""),
+        ),
+        migrations.AddIndex(
+            model_name="comic",
+            index=models.Index(
+                fields=["series", "sort_key"], name="codex_comic_series_sk_idx"
+            ),
+        ),
+        migrations.RunPython(_set_sort_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,86 @@
+"""Generated by Django 6.0.7 on 2026-10-18 12:00."""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Add the fingerprint backfill status type."""
+
+    dependencies = [
+        ("codex", "0058_comic_sort_key"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="librarianstatus",
+            name="status_type",
+            field=models.CharField(
+                choices=[
+                    ("CCC", "Create Covers"),
+                    ("CFO", "Find Orphan Covers"),
+                    ("CRC", "Remove Covers"),
+                    ("IAT", "Aggregate Tags From Comics"),
+                    ("ICC", "Create Comics"),
+                    ("ICT", "Create Tags"),
+                    ("ICV", "Create Custom Covers"),
+                    ("IFC", "Mark Failed Failed Imports"),
+                    ("IFD", "Clean Up Failed Imports"),
+                    ("IFQ", "Query Failed Imports"),
+                    ("IFU", "Update Failed Imports"),
+                    ("IGU", "Update Timestamps For Browser Collections"),
+                    ("ILT", "Link Tags"),
+                    ("ILV", "Link Custom Covers"),
+                    ("IMC", "Move Comics"),
+                    ("IMF", "Move Folders"),
+                    ("IMV", "Move Custom Covers"),
+                    ("IQC", "Query Comics"),
+                    ("IQL", "Query Tag Links"),
+                    ("IQT", "Query Missing Tags"),
+                    ("IQV", "Query Missing Custom Covers"),
+                    ("IRC", "Remove Comics"),
+                    ("IRF", "Remove Folders"),
+                    ("IRT", "Read Tags From Comics"),
+                    ("IRV", "Remove Custom Covers"),
+                    ("ISC", "Create Search Index Entries"),
+                    ("ISU", "Update Search Index Entries"),
+                    ("IUC", "Update Comics"),
+                    ("IUF", "Update Folders"),
+                    ("IUT", "Update Tags"),
+                    ("IUV", "Update Custom Covers"),
+                    ("JAF", "Adopt Orphan Folders"),
+                    ("JAS", "Cleanup Orphan Settings"),
+                    ("JCT", "Cleanup Orphan Tags"),
+                    ("JCU", "Update Codex Server Software"),
+                    ("JDB", "Backup Database"),
+                    ("JDO", "Optimize Database"),
+                    ("JDU", "Snapshot User Data Sidecar"),
+                    ("JFP", "Fingerprint Comics"),
+                    ("JFR", "Repair Comic Folder Relations"),
+                    ("JID", "Check Integrity Of Entire Database"),
+                    ("JIF", "Check Integrity Of Database Foreign Keys"),
+                    ("JIS", "Check Integrity Of Full Text Virtual Table"),
+                    ("JLV", "Check Codex Latest Version"),
+                    ("JRB", "Cleanup Orphan Bookmarks"),
+                    ("JRF", "Cleanup Orphan Favorites"),
+                    ("JRS", "Cleanup Old Sessions"),
+                    ("JRV", "Cleanup Orphan Covers"),
+                    ("JSR", "Rebuild Full Text Search Virtual Table"),
+                    ("JTG", "Cleanup Stale Online Tagging State"),
+                    ("OTG", "Look Up Online Tags"),
+                    ("OTP", "Await Prompts Pending"),
+                    ("RCR", "Restart Codex Server"),
+                    ("RCS", "Stop Codex Server"),
+                    ("SIO", "Optimize Search Virtual Table"),
+                    ("SIR", "Clean Orphan Search Entries"),
+                    ("SIX", "Clear Full Text Search Table"),
+                    ("SSC", "Sync New Search Entries"),
+                    ("SSU", "Sync Old Search Entries"),
+                    ("TWR", "Write Comic Tags"),
+                    ("WPO", "Poll Library"),
+                    ("WRS", "Restart File Watcher"),
+                ],
+                db_index=True,
+                max_length=3,
+            ),
+        ),
+    ]
@@ -11,4 +11,5 @@ from codex.models.identifier import *
 from codex.models.library import *
 from codex.models.named import *
 from codex.models.paths import *
+from codex.models.rollup import *
 from codex.models.settings import *
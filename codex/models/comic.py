@@ -69,6 +69,7 @@ from codex.models.named import (
     Team,
     Universe,
 )
+from codex.models.util import get_sort_key
 
 __all__ = ("Comic",)
 
@@ -82,6 +83,13 @@ class Comic(WatchedPathBrowserCollection):
         "sort_name",
     )
     _RE_COMBINE_WHITESPACE = re.compile(r"\s+")
+    # Collection columns ``sort_key`` reads, for querysets that load them.
+    SORT_KEY_RELATED_FIELDS = (
+        "publisher__sort_name",
+        "imprint__sort_name",
+        "series__sort_name",
+        "volume__name",
+    )
 
     # From BaseModel, but Comics are sorted by these so index them
     created_at = DateTimeField(auto_now_add=True, db_index=True)
@@ -108,6 +116,11 @@ class Comic(WatchedPathBrowserCollection):
         default="",
         db_collation="nocase",
     )
+    # The default ``sort_name`` order (collection sort names, issue,
+    # collection title, sort name) composed into one column so browses
+    # and reader navigation read it in index order. Maintained by
+    # :meth:`presave`.
+    sort_key = TextField(db_index=True, default="")
     # An alternate numbering for the same physical issue (e.g. a
     # continuity-wide number). Display-only: unindexed, no name column —
     # comicbox recomputes ``alternative_issue.name`` from the parts.
@@ -246,6 +259,9 @@ class Comic(WatchedPathBrowserCollection):
         db_collation="nocase",
     )
     metadata_mtime = DateTimeField(null=True)
+    # Path-independent content fingerprint for move detection across
+    # mounts where inodes don't survive. See importer/fingerprint.py.
+    fingerprint = CharField(max_length=64, blank=True, default="")
     # Stamped when a forced/lazy metadata import pass completes for this
     # comic, regardless of whether any embedded metadata existed. Distinct
     # from ``metadata_mtime`` (comicbox's embedded-metadata mtime, which
@@ -273,6 +289,12 @@ class Comic(WatchedPathBrowserCollection):
                 fields=("library", "age_rating_metron_index"),
                 name="codex_comic_lib_ari_idx",
             ),
+            # Series browses and reader navigation filter on the series
+            # and read comics in ``sort_key`` order.
+            Index(
+                fields=("series", "sort_key"),
+                name="codex_comic_series_sk_idx",
+            ),
         )
 
     def _set_date(self) -> None:
@@ -320,6 +342,29 @@ class Comic(WatchedPathBrowserCollection):
                 metron_id = getattr(ar, "metron_id", None)
         self.age_rating_metron_index = get_metron_index(metron_id)
 
+    def _set_sort_key(self) -> None:
+        """
+        Compose the default order into ``sort_key``.
+
+        Only set when the collection relations are loaded, so callers
+        that don't load them, like moving a comic, never lazy load four
+        rows per comic. They can't change the key anyway.
+        """
+        for rel in ("publisher", "imprint", "series", "volume"):
+            field = self._meta.get_field(rel)
+            if not field.is_cached(self):  # pyright: ignore[reportAttributeAccessIssue], # ty: ignore[unresolved-attribute]
+                return
+        self.sort_key = get_sort_key(
+            self.publisher.sort_name,
+            self.imprint.sort_name,
+            self.series.sort_name,
+            self.volume.name,
+            self.issue_number,
+            self.issue_suffix,
+            self.collection_title,
+            self.sort_name,
+        )
+
     @override
     def presave(self) -> None:
         """Set computed values."""
@@ -328,6 +373,7 @@ class Comic(WatchedPathBrowserCollection):
         self._set_decade()
         self.size = Path(self.path).stat().st_size
         self._set_age_rating_metron_index()
+        self._set_sort_key()
 
     @property
     def max_page(self):
@@ -439,3 +485,15 @@ class ComicFTS(BaseModel):
 
     class Meta(BaseModel.Meta):
         managed = False
+
+
+class ComicFTSChange(BaseModel):
+    """
+    Write-ahead log of search entries that need rewriting.
+
+    Not a foreign key so a deleted comic's entry survives to tell the
+    search sync to remove its row. Empty ``fields`` means the whole row.
+    """
+
+    comic_id = PositiveIntegerField(primary_key=True)
+    fields = TextField(blank=True, default="")
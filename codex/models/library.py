@@ -7,17 +7,24 @@ from typing import override
 from django.contrib.auth.models import Group
 from django.core.exceptions import ValidationError
 from django.db.models import (
+    CASCADE,
+    BigIntegerField,
     BooleanField,
     CharField,
     DateTimeField,
     DurationField,
+    FloatField,
+    ForeignKey,
+    JSONField,
     ManyToManyField,
+    PositiveBigIntegerField,
+    PositiveIntegerField,
 )
 from django.utils.translation import gettext_lazy as _
 
 from codex.models.base import MAX_PATH_LEN, BaseModel
 
-__all__ = ("Library", "validate_dir_exists")
+__all__ = ("ImportJournal", "ImportRun", "Library", "validate_dir_exists")
 
 
 def validate_dir_exists(path) -> None:
@@ -66,3 +73,38 @@ class Library(BaseModel):
     def end_update(self) -> None:
         """Finish a library update."""
         self._save_update_in_progress(value=False)
+
+
+class ImportRun(BaseModel):
+    """Telemetry from one import run. Displayed in Admin Panel."""
+
+    library = ForeignKey(Library, on_delete=CASCADE, db_index=True)
+    elapsed = FloatField(default=0.0)
+    aborted = BooleanField(default=False)
+    initial_load = BooleanField(default=False)
+    chunk_size = PositiveIntegerField(default=0)
+    comics = PositiveIntegerField(default=0)
+    counts = JSONField(default=dict)
+    # Seconds, queries and rows by phase name.
+    phases = JSONField(default=dict)
+    queries = PositiveIntegerField(default=0)
+    rows = PositiveBigIntegerField(default=0)
+    pages_written = PositiveBigIntegerField(default=0)
+    # Negative when the import freed more pages than it used.
+    pages_added = BigIntegerField(default=0)
+    peak_rss = PositiveBigIntegerField(default=0)
+
+
+class ImportJournal(BaseModel):
+    """Checkpoint of an unfinished import, resumed on startup."""
+
+    library = ForeignKey(Library, on_delete=CASCADE, db_index=True)
+    # The start of the first attempt, so the resumed run updates the
+    # timestamps of every collection the import touched.
+    started_at = DateTimeField()
+    # The ImportTask fields still to do, as JSON lists and objects.
+    task = JSONField(default=dict)
+    # The last phase that finished for every path in the task.
+    phase = CharField(max_length=32, default="")
+    chunks_done = PositiveIntegerField(default=0)
+    attempts = PositiveIntegerField(default=1)
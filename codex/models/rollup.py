@@ -0,0 +1,100 @@
+"""Collection rollup models."""
+
+from types import MappingProxyType
+from typing import Final
+
+from django.db.models import (
+    CASCADE,
+    DateField,
+    ForeignKey,
+    PositiveBigIntegerField,
+    PositiveIntegerField,
+)
+
+from codex.models.base import BaseModel
+from codex.models.collections import Folder, Imprint, Publisher, Series, Volume
+from codex.models.library import Library
+from codex.models.named import StoryArc
+
+__all__ = (
+    "ROLLUP_MODELS",
+    "FolderRollup",
+    "ImprintRollup",
+    "PublisherRollup",
+    "SeriesRollup",
+    "StoryArcRollup",
+    "VolumeRollup",
+)
+
+
+class CollectionRollup(BaseModel):
+    """
+    Aggregates of one collection's comics in one library.
+
+    Kept by ``TimestampUpdater`` for every collection an import touches,
+    so unfiltered browser cards read them instead of aggregating comics.
+    Collections without comics in a library have no row.
+    """
+
+    library = ForeignKey(Library, on_delete=CASCADE, db_index=True)
+    child_count = PositiveIntegerField(default=0)
+    size = PositiveBigIntegerField(default=0)
+    page_count = PositiveBigIntegerField(default=0)
+    date_min = DateField(null=True)
+    date_max = DateField(null=True)
+
+    class Meta(BaseModel.Meta):
+        """Abstract with constraints."""
+
+        abstract = True
+        unique_together = ("collection", "library")
+
+
+class PublisherRollup(CollectionRollup):
+    """Publisher rollup."""
+
+    collection = ForeignKey(Publisher, on_delete=CASCADE, related_name="rollups")
+
+
+class ImprintRollup(CollectionRollup):
+    """Imprint rollup."""
+
+    collection = ForeignKey(Imprint, on_delete=CASCADE, related_name="rollups")
+
+
+class SeriesRollup(CollectionRollup):
+    """Series rollup."""
+
+    collection = ForeignKey(Series, on_delete=CASCADE, related_name="rollups")
+
+
+class VolumeRollup(CollectionRollup):
+    """Volume rollup."""
+
+    collection = ForeignKey(Volume, on_delete=CASCADE, related_name="rollups")
+
+
+class FolderRollup(CollectionRollup):
+    """Folder rollup, over the comics in every descendant folder."""
+
+    collection = ForeignKey(Folder, on_delete=CASCADE, related_name="rollups")
+
+
+class StoryArcRollup(CollectionRollup):
+    """Story arc rollup."""
+
+    collection = ForeignKey(StoryArc, on_delete=CASCADE, related_name="rollups")
+
+
+ROLLUP_MODELS: Final[MappingProxyType[type[BaseModel], type[CollectionRollup]]] = (
+    MappingProxyType(
+        {
+            Publisher: PublisherRollup,
+            Imprint: ImprintRollup,
+            Series: SeriesRollup,
+            Volume: VolumeRollup,
+            Folder: FolderRollup,
+            StoryArc: StoryArcRollup,
+        }
+    )
+)
@@ -11,7 +11,7 @@ from rest_framework.serializers import (
     ValidationError,
 )
 
-from codex.models import FailedImport, Library
+from codex.models import FailedImport, ImportRun, Library
 from codex.serializers.models.base import BaseModelSerializer
 
 
@@ -87,6 +87,38 @@ class FailedImportSerializer(BaseModelSerializer):
         resource_name = "failed-imports"
 
 
+class ImportRunSerializer(BaseModelSerializer):
+    """Import Run telemetry Serializer."""
+
+    class Meta(BaseModelSerializer.Meta):
+        """Specify Model."""
+
+        model = ImportRun
+        fields = (
+            "pk",
+            "library",
+            "created_at",
+            "elapsed",
+            "aborted",
+            "initial_load",
+            "chunk_size",
+            "comics",
+            "counts",
+            "phases",
+            "queries",
+            "rows",
+            "pages_written",
+            "pages_added",
+            "peak_rss",
+        )
+        read_only_fields = fields
+
+    class JSONAPIMeta:
+        """JSON:API resource_name for the v4 admin renderer."""
+
+        resource_name = "import-runs"
+
+
 class AdminFolderListSerializer(Serializer):
     """Get a list of dirs."""
 
@@ -278,6 +278,8 @@ class BrowserPageSerializer(Serializer):
     fts = BooleanField(read_only=True)
     search_error = CharField(read_only=True)
     mtime = TimestampField(read_only=True)
+    # Signed cursor for the next page when paginating by ``cursor``.
+    next_cursor = CharField(read_only=True, allow_null=True)
 
     def get_rows(self, obj) -> list:
         """Project collections + books through ``columns`` if requested."""
@@ -116,6 +116,7 @@ class OPDSSettingsSerializer(BrowserSettingsSerializerBase):
     limit = IntegerField(required=False)
     opds_metadata = BooleanField(required=False)
     query = CharField(allow_blank=True, required=False)  # OPDS 2.0
+    cursor = CharField(allow_blank=True, required=False)
 
 
 class BrowserSettingsSerializer(BrowserSettingsSerializerBase):
@@ -226,9 +227,13 @@ class BrowserPageInputSerializer(BrowserSettingsSerializer):
     keys from the table-view registry. The browser view consumes it
     when ``view_mode == "table"`` to project rows. Each key must be a
     valid registry entry; unknown keys cause a 400.
+
+    Also adds ``cursor``, which opts into keyset pagination: blank for
+    the first page, then the ``nextCursor`` of the previous response.
     """
 
     columns = CharField(required=False, allow_blank=True)
+    cursor = CharField(required=False, allow_blank=True)
 
     def validate_columns(self, value: str) -> tuple[str, ...]:
         """Split, trim, and validate column keys against the registry."""
@@ -178,6 +178,21 @@ AUTH_FAILED_LOGIN_LOG_TRUST_FORWARDED_FOR = get_bool(
 BROWSER_MAX_OBJ_PER_PAGE = get_int(
     CODEX_CONFIG, "browser.max_obj_per_page", default=100
 )
+# Read unfiltered collection card counts, sizes, page counts and dates from
+# the rollups the importer keeps instead of aggregating every comic. Only
+# for users the ACL hides nothing from. Off by default because comics
+# written outside the importer leave the rollups stale until the next
+# import or forced collection update.
+BROWSER_COLLECTION_ROLLUPS = get_bool(
+    CODEX_CONFIG, "browser.collection_rollups", default=False
+)
+# Seconds to keep serialized browser pages for signed-in users. Pages are
+# keyed on their params, ACL scope and the generations of the user's
+# bookmarks and visible libraries, so an import only retires pages that
+# can show its library. 0 disables the cache.
+BROWSER_PAGE_CACHE_TIMEOUT = get_int(
+    CODEX_CONFIG, "browser.page_cache_timeout", default=0
+)
 
 ##############################
 # Codex Config: Throttle     #
@@ -231,8 +246,9 @@ EMAIL_BACKEND = "codex.mail.DBEmailBackend"
 IMPORTER_DELETE_MAX_CHUNK_SIZE = get_int(
     CODEX_CONFIG, "importer.delete_max_chunk_size", default=2000
 )
-# OR-chain Q()s in link/delete.py and the residual-key fallbacks in
-# query/filters.py and link/prepare.py. The binding constraint is
+# OR-chain Q()s for the residual keys without a selector value in
+# query/filters.py. Keys with one are matched through a TEMP key table
+# (importer/key_table.py) in a single statement. The binding constraint is
 # SQLITE_LIMIT_EXPR_DEPTH (1000) — a flat OR parses as a deep tree —
 # not the 32766 variable cap, so 900 stays correct on modern SQLite.
 IMPORTER_FILTER_BATCH_SIZE = get_int(
@@ -282,6 +298,49 @@ IMPORTER_SQLITE_CACHE_KB = get_int(
 IMPORTER_CHUNK_MEM_FRACTION = get_float(
     CODEX_CONFIG, "importer.chunk_mem_fraction", default=0.25
 )
+# Fingerprint archives (size plus a hash of their edges and zip central
+# directory) so a comic deleted from one path and created at another is
+# moved instead of re-imported, even when the inode changed, as on
+# Docker bind mounts and network shares.
+IMPORTER_FINGERPRINT = get_bool(CODEX_CONFIG, "importer.fingerprint", default=True)
+# Keep parsed tags in a sqlite cache keyed on the archive fingerprint so
+# forced re-imports and re-added libraries skip parsing unchanged
+# archives. Needs importer.fingerprint.
+IMPORTER_METADATA_CACHE = get_bool(
+    CODEX_CONFIG, "importer.metadata_cache", default=True
+)
+# Read the next chunk's archives while the current chunk is written to
+# the database. Each chunk gets half the chunk memory budget so the
+# chunk being read ahead fits alongside the one being written.
+IMPORTER_PIPELINE = get_bool(CODEX_CONFIG, "importer.pipeline", default=True)
+# Render cover thumbnails in the importer's read workers while each new
+# or changed archive is already open, instead of having the cover
+# thread open it again. Turn off to keep imports as fast as possible
+# and generate covers later.
+IMPORTER_CAPTURE_COVERS = get_bool(
+    CODEX_CONFIG, "importer.capture_covers", default=True
+)
+# Import into an empty library without the secondary comic indexes and
+# build them, and the search index, once at the end. Only chosen when
+# the import is at least as large as every comic already in the
+# database, so rebuilding the indexes costs less than maintaining them.
+IMPORTER_INITIAL_LOAD = get_bool(CODEX_CONFIG, "importer.initial_load", default=True)
+# Most worker processes reading archive metadata at once. The importer
+# also caps the pool so each worker has ~192 MiB of half the memory
+# budget, and holds back reads while the librarian's processes are
+# near the memory limit.
+IMPORTER_READ_WORKERS = get_int(
+    CODEX_CONFIG, "importer.read_workers", default=cpu_count() or 1
+)
+# Fraction of the process memory budget for interned reference data
+# keys (publisher, series, tag… names to pks) that later import chunks
+# resolve without querying. ~256 bytes per key.
+IMPORTER_INTERN_MEM_FRACTION = get_float(
+    CODEX_CONFIG, "importer.intern_mem_fraction", default=0.02
+)
+# Keep interned reference data keys between imports. Checked against
+# each model's row count and top pk at the start of every import.
+IMPORTER_INTERN_SHARED = get_bool(CODEX_CONFIG, "importer.intern_shared", default=False)
 
 ##############################
 # Codex Config: Librarian    #
@@ -299,6 +358,10 @@ COVER_WORKERS = get_int(
     "librarian.cover_workers",
     default=min(cpu_count() or 1, 8),
 )
+# Store cover thumbnails in a few append-only shard files with a SQLite
+# offset index instead of one file per cover. Pays off on very large
+# libraries where millions of tiny files slow cache walks and backups.
+COVER_PACK = get_bool(CODEX_CONFIG, "librarian.cover_pack", default=False)
 
 ##############################
 # Codex Config: Debug        #
@@ -814,6 +877,8 @@ environ.setdefault("COMICBOX_ONLINE_CACHE_DIR", str(COMICBOX_CACHE_PATH))
 # cheap at cull time (FileBasedCache walks the dir — negligible at 10k).
 TAGGING_CACHE_PATH = ROOT_CACHE_PATH / "tagging"
 TAGGING_CACHE_PATH.mkdir(exist_ok=True, parents=True)
+BROWSER_CACHE_PATH = ROOT_CACHE_PATH / "browser"
+BROWSER_CACHE_PATH.mkdir(exist_ok=True, parents=True)
 
 CACHES = {
     "default": {
@@ -832,6 +897,15 @@ CACHES = {
         "LOCATION": str(TAGGING_CACHE_PATH),
         "OPTIONS": {"MAX_ENTRIES": 1000},
     },
+    # Serialized browser pages and their generation tokens. Kept apart
+    # from the default cache so the broad clears there don't drop pages
+    # of libraries an import never touched; generation bumps retire
+    # pages instead.
+    "browser": {
+        "BACKEND": "codex.cache.ResilientFileBasedCache",
+        "LOCATION": str(BROWSER_CACHE_PATH),
+        "OPTIONS": {"MAX_ENTRIES": 5000},
+    },
 }
 
 ##################
@@ -1095,10 +1169,11 @@ CUSTOM_COVERS_UPLOADS_DIR.mkdir(exist_ok=True, parents=True)
 # ``delete_keys`` config below tells comicbox to skip parse work for
 # everything else.
 #
-# Three entries (``file_type``, ``metadata_mtime``, ``path``) are
-# codex-side extras populated by ``comicbox/process.py``'s ``_read_one``
-# rather than from the parsed metadata; they are intentionally not in
-# the ``ComicboxYamlSubSchema`` field set.
+# Four entries (``file_type``, ``fingerprint``, ``metadata_mtime``,
+# ``path``) are codex-side extras populated by the importer's read
+# worker (``importer/read/reader.py``) rather than from the parsed
+# metadata; they are intentionally not in the ``ComicboxYamlSubSchema``
+# field set.
 USED_COMICBOX_FIELDS: frozenset[str] = frozenset(
     {
         "age_rating",
@@ -1111,6 +1186,7 @@ USED_COMICBOX_FIELDS: frozenset[str] = frozenset(
         "credits",
         "date",
         "file_type",  # codex-side extra
+        "fingerprint",  # codex-side extra
         "genres",
         "identifiers",
         "imprint",
@@ -1,6 +1,6 @@
 """Django signal actions."""
 
-from django.db.models.signals import post_delete, post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 
 
 def _on_library_changed(*_args, **_kwargs) -> None:
@@ -11,6 +11,20 @@ def _on_library_changed(*_args, **_kwargs) -> None:
     invalidate_libraries_exist_cache()
 
 
+def _on_admin_flag_changed(*_args, **_kwargs) -> None:
+    """Retire cached browser pages, which carry the admin flags."""
+    from codex.views.browser.page_cache import bump_browser_generation
+
+    bump_browser_generation()
+
+
+def _on_acl_changed(*_args, **_kwargs) -> None:
+    """Retire cached ACL scopes when an ACL input changes."""
+    from codex.views.auth import bump_acl_generation
+
+    bump_acl_generation()
+
+
 def _on_favorite_target_deleted(sender, instance, **_kwargs) -> None:
     """Drop favorites that pointed at a deleted browsable target."""
     # Lazy imports so the module is safe to load before ``django.setup()``.
@@ -50,14 +64,25 @@ def connect_signals() -> None:
     """Connect actions to signals."""
     # Imported lazily for the same reason as above.
     from django.contrib.auth import get_user_model
+    from django.contrib.auth.models import Group
 
-    from codex.models import Library
+    from codex.models import AdminFlag, GroupAuth, Library, UserAuth
     from codex.models.favorite import FAVORITE_MODEL_COLLECTIONS
     from codex.settings import AUTH_FAILED_LOGIN_LOG
 
+    user_model = get_user_model()
     post_save.connect(_on_library_changed, sender=Library)
     post_delete.connect(_on_library_changed, sender=Library)
-    post_save.connect(_ensure_user_auth, sender=get_user_model())
+    post_save.connect(_ensure_user_auth, sender=user_model)
+    post_save.connect(_on_admin_flag_changed, sender=AdminFlag)
+
+    # ACL scopes depend on libraries, group membership and exclusion,
+    # user rating ceilings and the rating admin flags.
+    for model in (Library, Group, GroupAuth, UserAuth, AdminFlag):
+        post_save.connect(_on_acl_changed, sender=model)
+        post_delete.connect(_on_acl_changed, sender=model)
+    for through in (Library.groups.through, user_model.groups.through):
+        m2m_changed.connect(_on_acl_changed, sender=through)
 
     # Cascade favorites when their target row is deleted. The handler
     # rereads the mapping at fire time so this loop only needs the
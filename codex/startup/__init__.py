@@ -7,6 +7,7 @@ from django.db.models.functions import Now
 from loguru import logger
 from rest_framework.authtoken.models import Token
 
+from codex.cache import browser_cache
 from codex.choices.admin import AdminFlagChoices
 from codex.librarian.status_controller import STATUS_DEFAULTS
 from codex.models import (
@@ -232,6 +233,7 @@ def codex_init() -> bool:
     ensure_db_rows()
     patch_registration_setting()
     cache.clear()
+    browser_cache.clear()
     if GRANIAN_URL_PATH_PREFIX:
         path_prefix_log = (
             f"Codex is being served from url path prefix: {GRANIAN_URL_PATH_PREFIX}"
@@ -10,6 +10,7 @@ from django.db.migrations.executor import MigrationExecutor
 from loguru import logger
 
 from codex.librarian.mp_queue import LIBRARIAN_QUEUE
+from codex.librarian.scribe.importer.pragmas import restore_deferred_indexes
 from codex.librarian.scribe.janitor.integrity import integrity_check
 from codex.librarian.scribe.janitor.integrity.foreign_keys import fix_foreign_keys
 from codex.librarian.scribe.janitor.janitor import Janitor
@@ -229,6 +230,8 @@ def ensure_db_schema() -> bool:
         logger.exception(msg)
         raise
     if "django_migrations" in table_names:
+        # Before migrations, which expect the full schema.
+        restore_deferred_indexes()
         # Cache the unapplied-migrations result so the backup,
         # repair, and post-migration paths all see the same answer
         # without each running its own SELECT against
@@ -13,7 +13,8 @@ from drf_spectacular.views import (
 )
 
 from codex.settings import FEATURES
-from codex.views.browser.cover import cover_dispatch_by_source
+from codex.urls.const import COVER_MAX_AGE
+from codex.views.browser.cover import CoverBatchView, cover_dispatch_by_source
 from codex.views.browser.mtime import MtimeView
 from codex.views.opds.urls import OPDSURLsView
 from codex.views.session import SessionView
@@ -46,5 +47,10 @@ urlpatterns += [
     path("version", VersionView.as_view(), name="version"),
     path("opds-urls", OPDSURLsView.as_view(), name="opds_urls"),
     path("schema", SpectacularAPIView.as_view(), name="schema"),
+    path(
+        "covers/batch",
+        CoverBatchView.as_view(CACHE_MAX_AGE=COVER_MAX_AGE),
+        name="covers_batch",
+    ),
     path("covers/<str:source>/<int:pk>", cover_dispatch_by_source, name="covers"),
 ]
@@ -22,6 +22,7 @@ from codex.views.admin.group import AdminGroupViewSet
 from codex.views.admin.library import (
     AdminFailedImportViewSet,
     AdminFolderListView,
+    AdminImportRunViewSet,
     AdminLibraryViewSet,
 )
 from codex.views.admin.oidc import AdminOIDCSettingsView, AdminOIDCTestView
@@ -132,6 +133,11 @@ urlpatterns = [
         AdminFailedImportsSeenView.as_view(),
         name="failed_imports_seen",
     ),
+    path(
+        "import-runs",
+        AdminImportRunViewSet.as_view({**READ}),
+        name="import_runs",
+    ),
     path(
         "age-ratings",
         AdminAgeRatingMetronViewSet.as_view({**READ}),
@@ -1,12 +1,16 @@
 """codex:api:v4:comics URL Configuration."""
 
 from django.urls import path
-from django.views.decorators.cache import cache_control, cache_page
+from django.views.decorators.cache import cache_page
 from django.views.decorators.vary import vary_on_cookie
 
 from codex.urls.const import COVER_MAX_AGE, PAGE_MAX_AGE
 from codex.views.browser.bookmark import ComicBookmarkView
-from codex.views.browser.cover import CoverView
+from codex.views.browser.cover import (
+    CoverView,
+    cover_cache_control,
+    cover_not_modified,
+)
 from codex.views.download import DownloadView
 from codex.views.reader.page import ReaderPageView
 from codex.views.reader.settings import ReaderSettingsView
@@ -31,9 +35,9 @@ urlpatterns = [
     ),
     path(
         "<int:pk>/cover",
-        cache_page(COVER_MAX_AGE)(
-            cache_control(max_age=COVER_MAX_AGE, public=True)(
-                vary_on_cookie(CoverView.as_view())
+        cover_not_modified(custom=False)(
+            cache_page(None)(
+                cover_cache_control(COVER_MAX_AGE)(vary_on_cookie(CoverView.as_view()))
             )
         ),
         name="cover",
@@ -5,6 +5,7 @@ from django.views.decorators.cache import cache_control, cache_page
 from django.views.decorators.vary import vary_on_headers
 
 from codex.urls.const import COVER_MAX_AGE, PAGE_MAX_AGE
+from codex.views.browser.cover import cover_cache_control, cover_not_modified
 from codex.views.opds.binary import (
     OPDSCoverView,
     OPDSCustomCoverView,
@@ -31,19 +32,23 @@ urlpatterns = [
         # Cookie and Authorization so cached responses don't leak across
         # auth types or users.  See codex.urls.api.reader "cover" route
         # for the full rationale on the cache_page composition.
-        cache_page(COVER_MAX_AGE)(
-            cache_control(max_age=COVER_MAX_AGE, public=True)(
-                vary_on_headers("Cookie", "Authorization")(OPDSCoverView.as_view())
+        cover_not_modified(custom=False)(
+            cache_page(None)(
+                cover_cache_control(COVER_MAX_AGE)(
+                    vary_on_headers("Cookie", "Authorization")(OPDSCoverView.as_view())
+                )
             )
         ),
         name="cover",
     ),
     path(
         "custom_cover/<int:pk>/cover.webp",
-        cache_page(COVER_MAX_AGE)(
-            cache_control(max_age=COVER_MAX_AGE, public=True)(
-                vary_on_headers("Cookie", "Authorization")(
-                    OPDSCustomCoverView.as_view()
+        cover_not_modified(custom=True)(
+            cache_page(None)(
+                cover_cache_control(COVER_MAX_AGE)(
+                    vary_on_headers("Cookie", "Authorization")(
+                        OPDSCustomCoverView.as_view()
+                    )
                 )
             )
         ),
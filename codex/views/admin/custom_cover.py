@@ -30,6 +30,7 @@ from codex.settings.db import (
 )
 from codex.views.admin.auth import AdminAPIView
 from codex.views.admin.json_api import AdminJsonApiMixin
+from codex.views.browser.page_cache import bump_browser_generation
 
 if TYPE_CHECKING:
     from django.db.models import Model
@@ -129,6 +130,7 @@ def _enqueue_thumb_create(pk: int) -> None:
 
 def _notify_covers_changed() -> None:
     """Broadcast a ``covers.changed`` event."""
+    bump_browser_generation()
     LIBRARIAN_QUEUE.put(COVERS_CHANGED_TASK)
 
 
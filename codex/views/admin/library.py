@@ -20,14 +20,20 @@ from codex.librarian.fs.poller.tasks import FSPollLibrariesTask
 from codex.librarian.fs.watcher.tasks import FSWatcherRestartTask
 from codex.librarian.mp_queue import LIBRARIAN_QUEUE
 from codex.librarian.notifier.tasks import LIBRARY_CHANGED_TASK
-from codex.models import Comic, FailedImport, Folder, Library
+from codex.models import Comic, FailedImport, Folder, ImportRun, Library
 from codex.serializers.admin.libraries import (
     AdminFolderListSerializer,
     AdminFolderSerializer,
     FailedImportSerializer,
+    ImportRunSerializer,
     LibrarySerializer,
 )
-from codex.views.admin.auth import AdminGenericAPIView, AdminModelViewSet
+from codex.views.admin.auth import (
+    AdminGenericAPIView,
+    AdminModelViewSet,
+    AdminReadOnlyModelViewSet,
+)
+from codex.views.browser.page_cache import bump_browser_generation
 
 # Per-Library count subqueries. Each is a correlated index-only count
 # against the related table's ``library_id`` index — no JOIN, no
@@ -77,6 +83,7 @@ class AdminLibraryViewSet(AdminModelViewSet):
     @staticmethod
     def _on_change() -> None:
         cache.clear()
+        bump_browser_generation()
         # Admin viewset doesn't pass the touched library down here;
         # broadcast with empty scope so any library view invalidates.
         LIBRARIAN_QUEUE.put(
@@ -138,6 +145,13 @@ class AdminFailedImportViewSet(AdminModelViewSet):
     serializer_class = FailedImportSerializer
 
 
+class AdminImportRunViewSet(AdminReadOnlyModelViewSet):
+    """Admin Import Run telemetry Viewset, newest first."""
+
+    queryset = ImportRun.objects.defer("updated_at").order_by("-created_at")
+    serializer_class = ImportRunSerializer
+
+
 class AdminFolderListView(AdminGenericAPIView):
     """List server directories."""
 
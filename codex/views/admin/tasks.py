@@ -34,6 +34,7 @@ from codex.librarian.notifier.tasks import (
 from codex.librarian.restarter.tasks import CodexRestartTask, CodexShutdownTask
 from codex.librarian.scribe.janitor.tasks import (
     JanitorAdoptOrphanFoldersTask,
+    JanitorBackfillFingerprintsTask,
     JanitorBackupTask,
     JanitorCleanCoversTask,
     JanitorCleanFKsTask,
@@ -116,6 +117,7 @@ _TASK_MAP = MappingProxyType(
         "cleanup_settings": JanitorCleanupSettingsTask(),
         "cleanup_favorites": JanitorCleanupFavoritesTask(),
         "cleanup_tagging_state": JanitorCleanupTaggingStateTask(),
+        "backfill_fingerprints": JanitorBackfillFingerprintsTask(),
         "cleanup_covers": CoverRemoveOrphansTask(),
         "librarian_clear_status": ClearLibrarianStatusTask(),
         "force_update_all_failed_imports": JanitorImportForceAllFailedTask(),
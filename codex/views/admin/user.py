@@ -25,6 +25,7 @@ from codex.models.auth import UserAuth
 from codex.serializers.admin.users import UserChangePasswordSerializer, UserSerializer
 from codex.settings.db import email_enabled
 from codex.views.admin.auth import AdminAPIView, AdminGenericAPIView, AdminModelViewSet
+from codex.views.auth import bump_acl_generation
 
 _BAD_CURRENT_USER_FALSE_KEYS = ("is_active", "is_staff", "is_superuser")
 
@@ -42,6 +43,9 @@ class AdminUserViewSet(AdminModelViewSet):
 
     @staticmethod
     def _on_change(uid: int) -> None:
+        # Rating ceilings are written with ``update()``, which sends no
+        # signal to retire cached ACL scopes.
+        bump_acl_generation()
         if uid:
             # User-targeted change: send to that user's private
             # channel plus the ADMIN channel so admin tables refresh.
@@ -23,6 +23,11 @@ index-friendly comparisons:
   composite index on ``(library_id, age_rating_metron_index)`` serves
   both halves of the ACL clause index-only.
 
+The scalars are bundled into an :class:`ACLScope` that is also cached
+across requests per user, keyed on an ACL generation token that
+writes to libraries, groups, user ceilings and the rating flags bump.
+A scope that hides nothing lets ``get_acl_filter`` drop both clauses.
+
 The classmethod forms (:meth:`AgeRatingACLMixin.get_age_rating_acl_filter`,
 :meth:`GroupACLFilterMixin.get_group_acl_filter`) remain as thin
 wrappers for tests and one-off callers that don't have a request in
@@ -30,12 +35,15 @@ hand; they recompute every scalar from scratch per call.
 """
 
 from collections.abc import Sequence
+from dataclasses import dataclass
+from secrets import token_hex
 from typing import TYPE_CHECKING, override
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser, Group
 from django.contrib.sessions.models import Session
+from django.core.cache import cache as _django_cache
 from django.db.models.query_utils import Q
 from django.middleware.csrf import get_token
 from django.utils.decorators import method_decorator
@@ -63,6 +71,34 @@ from codex.views.envelope import EnvelopeJSONRenderer as _EnvelopeJSONRenderer
 if TYPE_CHECKING:
     from rest_framework.request import Request
 
+_ACL_GENERATION_CACHE_KEY = "codex:acl_generation"
+_ACL_SCOPE_CACHE_KEY = "codex:acl_scope:{generation}:{user}"
+_ACL_SCOPE_TTL_SECONDS = 600
+
+
+def get_acl_generation() -> str:
+    """Return the ACL generation token, starting a fresh one if unset."""
+    # A fresh random token rather than a counter restarting at zero, so a
+    # culled or cleared generation can never match scopes cached under it.
+    return _django_cache.get_or_set(
+        _ACL_GENERATION_CACHE_KEY, lambda: token_hex(8), None
+    )
+
+
+def bump_acl_generation() -> None:
+    """Retire every cached ACL scope after an ACL input changes."""
+    _django_cache.set(_ACL_GENERATION_CACHE_KEY, token_hex(8), None)
+
+
+@dataclass(frozen=True, slots=True)
+class ACLScope:
+    """The resolved ACL inputs for one user."""
+
+    visible_library_pks: frozenset[int]
+    max_idx: int
+    default_fits: bool
+    admits_all: bool
+
 
 class IsAuthenticatedOrEnabledNonUsers(IsAuthenticated):
     """Custom DRF Authentication class."""
@@ -415,62 +451,95 @@ class GroupACLMixin(IsAdminMixin, GroupACLFilterMixin, AgeRatingACLMixin):
     """
     Merged ACL mixin: library-group visibility + age-rating restriction.
 
-    Adds a per-request cache over the scalar inputs to both sub-filters
-    so that a browser request that applies the ACL to 7+ models incurs
-    exactly three bookkeeping queries total instead of three-per-model.
+    Resolves the scalar inputs to both sub-filters into one
+    :class:`ACLScope` per user. The scope is cached across requests
+    under the current ACL generation and memoized on the view, so a
+    browser request that applies the ACL to 7+ models usually costs a
+    single cache read and at worst the handful of bookkeeping queries
+    once.
     """
 
-    # Class-level defaults double as the unmemoized sentinels.
-    # Lazily populated on first access via ``get_visible_library_pks``
-    # / ``get_max_idx`` / ``get_default_fits``. Each is populated at
-    # most once per request; subsequent ``get_acl_filter`` calls for
-    # other models reuse the cached value. ``init_group_acl`` resets
-    # them between requests.
-    _cached_visible_library_pks: frozenset[int] | None = None
-    _cached_max_idx: int | None = None
-    _cached_default_fits: bool | None = None
+    # Class-level default doubles as the unmemoized sentinel. Populated
+    # on first access via ``get_acl_scope``; ``init_group_acl`` resets
+    # it between requests.
+    _cached_acl_scope: ACLScope | None = None
 
     def init_group_acl(self) -> None:
-        """Initialize per-request cached scalars."""
+        """Initialize the per-request cached scope."""
         self.init_is_admin()
-        self._cached_visible_library_pks = None
-        self._cached_max_idx = None
-        self._cached_default_fits = None
+        self._cached_acl_scope = None
+
+    @classmethod
+    def compute_acl_scope(cls, user) -> ACLScope:
+        """Resolve every ACL input for ``user`` from the database."""
+        visible_library_pks = cls.compute_visible_library_pks(user)
+        max_idx = cls.compute_max_idx(user)
+        default_fits = cls.compute_default_fits(max_idx)
+        admits_all = (
+            max_idx == UNRESTRICTED_RATING_INDEX
+            and default_fits
+            and not Library.objects.exclude(pk__in=visible_library_pks).exists()
+        )
+        return ACLScope(visible_library_pks, max_idx, default_fits, admits_all)
+
+    def get_acl_scope(self, user) -> ACLScope:
+        """Return the user's ACL scope from the request or shared cache."""
+        if self._cached_acl_scope is None:
+            user_key = user.pk if user and user.is_authenticated else "anon"
+            key = _ACL_SCOPE_CACHE_KEY.format(
+                generation=get_acl_generation(), user=user_key
+            )
+            scope = _django_cache.get(key)
+            if scope is None:
+                scope = self.compute_acl_scope(user)
+                _django_cache.set(key, scope, _ACL_SCOPE_TTL_SECONDS)
+            self._cached_acl_scope = scope
+        return self._cached_acl_scope
 
     def get_visible_library_pks(self, user) -> frozenset[int]:
-        """Return the per-request cached visible library pk set."""
-        if self._cached_visible_library_pks is None:
-            self._cached_visible_library_pks = self.compute_visible_library_pks(user)
-        return self._cached_visible_library_pks
+        """Return the cached visible library pk set."""
+        return self.get_acl_scope(user).visible_library_pks
 
     def get_max_idx(self, user) -> int:
-        """Return the per-request cached integer rating ceiling."""
-        if self._cached_max_idx is None:
-            self._cached_max_idx = self.compute_max_idx(user)
-        return self._cached_max_idx
+        """Return the cached integer rating ceiling."""
+        return self.get_acl_scope(user).max_idx
 
     def get_default_fits(self, user) -> bool:
-        """Return the per-request cached default-rating-fits flag."""
-        if self._cached_default_fits is None:
-            self._cached_default_fits = self.compute_default_fits(
-                self.get_max_idx(user)
-            )
-        return self._cached_default_fits
+        """Return the cached default-rating-fits flag."""
+        return self.get_acl_scope(user).default_fits
+
+    def acl_admits_all(self, user) -> bool:
+        """
+        Return whether the ACL hides nothing from ``user``.
+
+        True when every library is visible and the age-rating clause
+        passes every comic: an unrestricted ceiling and null/unknown
+        ratings inheriting a default that fits under it.
+        """
+        return self.get_acl_scope(user).admits_all
 
     def get_acl_filter(self, model, user) -> Q:
         """
         Combine library-group and age-rating ACL filters.
 
-        Pulls all three scalar inputs out of the per-request cache,
-        then composes two dead-simple Qs against local columns:
+        Pulls the scalar inputs out of the cached scope, then composes
+        two dead-simple Qs against local columns:
         ``library_id__in=<pks>`` and either
         ``age_rating_metron_index__lte=<max_idx>`` or an OR'd
-        null/unknown clause gated by ``default_fits``.
+        null/unknown clause gated by ``default_fits``. When the scope
+        admits everything both clauses drop out; collections reached
+        through comics keep a bare comic join so they still need at
+        least one comic, as the library clause required.
         """
+        scope = self.get_acl_scope(user)
+        if scope.admits_all:
+            if model in (Comic, Folder):
+                return Q()
+            return Q(**{f"{self.get_rel_prefix(model)}pk__isnull": False})
         return self.get_group_acl_filter_for(
-            model, self.get_visible_library_pks(user)
+            model, scope.visible_library_pks
         ) & self.get_age_rating_acl_filter_for(
-            model, self.get_max_idx(user), default_fits=self.get_default_fits(user)
+            model, scope.max_idx, default_fits=scope.default_fits
         )
 
 
@@ -1,7 +1,5 @@
 """Base view for metadata annotations."""
 
-from types import MappingProxyType
-
 from django.db.models import (
     BooleanField,
     ExpressionWrapper,
@@ -13,28 +11,9 @@ from django.db.models import (
 from django.db.models.fields import CharField
 
 from codex.collection import Collection
-from codex.models.collections import (
-    BrowserCollectionModel,
-    Imprint,
-    Publisher,
-    Series,
-    Volume,
-)
 from codex.models.comic import Comic
-from codex.models.named import StoryArc
 from codex.views.browser.annotate.bookmark import BrowserAnnotateBookmarkView
-
-_COLLECTION_BY: MappingProxyType[type[BrowserCollectionModel], tuple[str, ...]] = (
-    MappingProxyType(
-        {
-            Publisher: ("sort_name",),
-            Imprint: ("sort_name",),
-            Series: ("sort_name",),
-            Volume: ("name", "number_to"),
-            StoryArc: ("sort_name",),
-        }
-    )
-)
+from codex.views.const import COLLECTION_GROUP_BY
 
 
 class BrowserAnnotateCardView(BrowserAnnotateBookmarkView):
@@ -43,7 +22,7 @@ class BrowserAnnotateCardView(BrowserAnnotateBookmarkView):
     def add_group_by(self, qs):
         """Get the group by for the model."""
         # this method is here because this is class is what metadata imports
-        if group_by := _COLLECTION_BY.get(qs.model):
+        if group_by := COLLECTION_GROUP_BY.get(qs.model):
             qs = qs.group_by(*group_by)
         return qs
 
@@ -4,8 +4,12 @@ from django.db.models import OuterRef, Q, Subquery
 
 from codex.models import Comic, Folder, Volume
 from codex.models.paths import CustomCover
-from codex.views.browser.annotate.card import _COLLECTION_BY, BrowserAnnotateCardView
-from codex.views.const import COLLECTION_RELATION, CUSTOM_COVER_COLLECTION_RELATION
+from codex.views.browser.annotate.card import BrowserAnnotateCardView
+from codex.views.const import (
+    COLLECTION_GROUP_BY,
+    COLLECTION_RELATION,
+    CUSTOM_COVER_COLLECTION_RELATION,
+)
 
 
 class BrowserAnnotateCoverView(BrowserAnnotateCardView):
@@ -38,7 +42,7 @@ class BrowserAnnotateCoverView(BrowserAnnotateCardView):
         # same columns used by add_group_by, so ``ids`` (the JsonGroupArray
         # of merged collection pks) and the cover subquery pick the exact same
         # comic set — without recomputing sort_names in Python.
-        collection_by_cols = _COLLECTION_BY.get(collection_model, ("sort_name",))
+        collection_by_cols = COLLECTION_GROUP_BY.get(collection_model, ("sort_name",))
         correlation: dict = {
             f"{collection_rel}__{col}": OuterRef(col) for col in collection_by_cols
         }
@@ -22,15 +22,13 @@ from codex.models import (
 )
 from codex.models.collections import Volume
 from codex.models.functions import ComicFTSRank, JsonGroupArray
+from codex.views.browser.annotate.rollup import BrowserAnnotateRollupView
 from codex.views.browser.columns import m2m_alias_for, m2m_columns
 from codex.views.browser.intersections import (
     m2m_intersection_sort_expr,
     scalar_intersection_sort_expr,
 )
-from codex.views.browser.order_by import (
-    BrowserOrderByView,
-    comic_order_path,
-)
+from codex.views.browser.order_by import comic_order_path
 from codex.views.const import (
     COMIC_COLLECTION,
     FOLDER_COLLECTION,
@@ -95,7 +93,7 @@ _ANNOTATED_ORDER_FIELDS = frozenset(
 )
 
 
-class BrowserAnnotateOrderView(BrowserOrderByView, SharedAnnotationsMixin):
+class BrowserAnnotateOrderView(BrowserAnnotateRollupView, SharedAnnotationsMixin):
     """Base class for views that need special metadata annotations."""
 
     CARD_TARGETS = frozenset({"browser", "metadata"})
@@ -156,6 +154,10 @@ class BrowserAnnotateOrderView(BrowserOrderByView, SharedAnnotationsMixin):
         collection = self.kwargs.get("collection")
         pks = self.kwargs.get("pks")
         show = MappingProxyType(self.params["show"])
+        if qs.model is Comic and self.sort_key_applies(collection, pks, show):
+            # Ordered by the precomputed ``sort_key`` instead.
+            self._comic_sort_key_applies = True
+            return qs
         sort_name_annotations = self.get_sort_name_annotations(
             qs.model, collection, pks, show
         )
@@ -235,8 +237,11 @@ class BrowserAnnotateOrderView(BrowserOrderByView, SharedAnnotationsMixin):
         ):
             return qs
 
-        rel = self.rel_prefix + "page_count"
-        page_count_sum = Sum(rel, distinct=True)
+        if self.rollup_mode:
+            page_count_sum = self.get_rollup_aggregate(qs.model, "page_count")
+        else:
+            rel = self.rel_prefix + "page_count"
+            page_count_sum = Sum(rel, distinct=True)
         if self.TARGET == "browser":
             qs = qs.alias(page_count=page_count_sum)
         else:
@@ -307,8 +312,11 @@ class BrowserAnnotateOrderView(BrowserOrderByView, SharedAnnotationsMixin):
         """Annotate child count."""
         if qs.model is Comic or self._child_count_annotated:
             return qs
-        rel = self.rel_prefix + "pk"
-        count_func = Count(rel, distinct=True)
+        if self.rollup_mode:
+            count_func = self.get_rollup_aggregate(qs.model, "child_count")
+        else:
+            rel = self.rel_prefix + "pk"
+            count_func = Count(rel, distinct=True)
         ann = {"child_count": count_func}
         qs = qs.alias(**ann) if self.TARGET == "opds2" else qs.annotate(**ann)
         self._child_count_annotated = True
@@ -379,6 +387,8 @@ class BrowserAnnotateOrderView(BrowserOrderByView, SharedAnnotationsMixin):
             isort_expr = scalar_intersection_sort_expr(qs.model, self.order_key)
             if isort_expr is not None:
                 return isort_expr
+        if self.rollup_mode and (value := self.get_rollup_order_value(qs.model)):
+            return value
         agg_func = _ORDER_AGGREGATE_FUNCS[self.order_key]
         agg_func = self.order_agg_func if agg_func == Min else agg_func
         field = self.rel_prefix + comic_order_path(self.order_key)
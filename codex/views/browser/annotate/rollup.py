@@ -0,0 +1,110 @@
+"""Read browser collection aggregates from the collection rollups."""
+
+from types import MappingProxyType
+from typing import override
+
+from django.db.models import Exists, OuterRef, Q, Subquery, Value
+from django.db.models.aggregates import Aggregate, Max, Min, Sum
+from django.db.models.functions import Coalesce
+
+from codex.models.rollup import ROLLUP_MODELS
+from codex.settings import BROWSER_COLLECTION_ROLLUPS
+from codex.views.browser.order_by import BrowserOrderByView
+from codex.views.const import COLLECTION_GROUP_BY, COLLECTION_RELATION
+
+# Order keys whose collection values the rollups hold. ``sort_name`` and
+# ``child_count`` need no other comic aggregate.
+_ROLLUP_ORDER_KEYS = frozenset(
+    {"child_count", "date", "page_count", "size", "sort_name"}
+)
+# order key -> (forward, reverse) rollup field and aggregate.
+_ROLLUP_ORDER_VALUES: MappingProxyType[str, tuple[tuple[str, type[Aggregate]], ...]] = (
+    MappingProxyType(
+        {
+            "date": (("date_min", Min), ("date_max", Max)),
+            "page_count": (("page_count", Sum), ("page_count", Sum)),
+            "size": (("size", Sum), ("size", Sum)),
+        }
+    )
+)
+# Stands in for NULL group columns so they correlate like the GROUP BY.
+_NULL_GROUP_VALUE = Value(-1)
+
+
+class BrowserAnnotateRollupView(BrowserOrderByView):
+    """
+    Read collection card aggregates from the collection rollups.
+
+    When no comic filters apply and the ACL hides nothing, a collection
+    browse needs only whole-collection aggregates, which the rollups
+    hold per library. The browse then filters on rollup existence and
+    reads counts and order values from correlated rollup sums instead
+    of joining and aggregating every comic.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the rollup mode."""
+        super().__init__(*args, **kwargs)
+        self.rollup_mode = False
+
+    def _rollup_mode_applies(self, model, *, page_mtime: bool) -> bool:
+        return (
+            BROWSER_COLLECTION_ROLLUPS
+            and self.TARGET == "browser"
+            and not page_mtime
+            and model is self.model
+            and model in ROLLUP_MODELS
+            and self.params.get("view_mode") != "table"
+            and self.order_key in _ROLLUP_ORDER_KEYS
+            and self.acl_admits_all(self.request.user)
+        )
+
+    @override
+    def get_rollup_acl_filter(self, model, *, page_mtime: bool) -> Q | None:
+        """Filter to collections with rollups when the rollups apply."""
+        if not self._rollup_mode_applies(model, page_mtime=page_mtime):
+            return None
+        self.rollup_mode = True
+        rollups = ROLLUP_MODELS[model].objects.filter(collection=OuterRef("pk"))
+        return Q(Exists(rollups))
+
+    def _get_rollup_group_qs(self, model):
+        """Rollups of every collection merged into the outer card."""
+        rollup_model = ROLLUP_MODELS[model]
+        collection_by_cols = COLLECTION_GROUP_BY.get(model)
+        if not collection_by_cols:
+            # Folders aren't merged.
+            qs = rollup_model.objects.filter(collection=OuterRef("pk"))
+            return qs, ("collection",)
+        # Correlate on the GROUP BY columns like the cover subquery, so the
+        # sums cover the same collections as ``ids``.
+        qs = rollup_model.objects.all()
+        group_by = tuple(f"collection__{col}" for col in collection_by_cols)
+        for col, rel in zip(collection_by_cols, group_by, strict=True):
+            if model._meta.get_field(col).null:
+                alias = f"rollup_{col}"
+                qs = qs.alias(**{alias: Coalesce(rel, _NULL_GROUP_VALUE)})
+                qs = qs.filter(**{alias: Coalesce(OuterRef(col), _NULL_GROUP_VALUE)})
+            else:
+                qs = qs.filter(**{rel: OuterRef(col)})
+        pks = self.kwargs.get("pks")
+        if pks and 0 not in pks:
+            parent_rel = COLLECTION_RELATION[self.kwargs["collection"]]
+            qs = qs.filter(**{f"collection__{parent_rel}__in": pks})
+        return qs, group_by
+
+    def get_rollup_aggregate(
+        self, model, field: str, agg_func: type[Aggregate] = Sum
+    ) -> Subquery:
+        """Aggregate a rollup field over the outer card's collections."""
+        qs, group_by = self._get_rollup_group_qs(model)
+        qs = qs.values(*group_by).annotate(value=agg_func(field)).values("value")
+        # One group per outer card. The slice lets lookups compare it.
+        return Subquery(qs[:1])
+
+    def get_rollup_order_value(self, model) -> Subquery | None:
+        """Return the rollup order value for the order key, if it has one."""
+        if not (fields := _ROLLUP_ORDER_VALUES.get(self.order_key)):
+            return None
+        field, agg_func = fields[bool(self.params.get("order_reverse"))]
+        return self.get_rollup_aggregate(model, field, agg_func)
@@ -24,6 +24,7 @@ from codex.serializers.browser.page import (
     BrowserPageSerializer,
 )
 from codex.serializers.browser.settings import BrowserPageInputSerializer
+from codex.settings import BROWSER_PAGE_CACHE_TIMEOUT
 from codex.settings.db import get_browser_max_obj_per_page
 from codex.views.browser.columns import (
     default_columns_filtered,
@@ -32,6 +33,11 @@ from codex.views.browser.columns import (
     m2m_annotations_for,
 )
 from codex.views.browser.intersections import compute_collection_intersections
+from codex.views.browser.page_cache import (
+    get_browser_page_cache_key,
+    get_cached_browser_page,
+    set_cached_browser_page,
+)
 from codex.views.browser.title import BrowserTitleView
 from codex.views.const import (
     COLLECTION_MODEL_MAP,
@@ -370,6 +376,7 @@ class BrowserView(BrowserTitleView):
         # self._debug_queries(page_collection_count, page_book_count, collection_qs, book_qs) # noqa: ERA001
 
         total_page_count = page_collection_count + page_book_count
+        self.set_next_cursor(collection_qs, book_qs, total_page_count)
         mtime = self._get_page_mtime()
         return (
             collection_qs,
@@ -411,6 +418,7 @@ class BrowserView(BrowserTitleView):
                 "mtime": mtime,
                 "search_error": self.search_error,
                 "fts": self.fts_mode,
+                "next_cursor": self.next_cursor,
             }
         )
 
@@ -439,9 +447,40 @@ class BrowserView(BrowserTitleView):
             return tuple(stored_for_collection)
         return default_columns_filtered(top_collection, self.params.get("show"))
 
+    def _get_page_cache_key(self) -> str:
+        """
+        Key the page in the browser page cache, or "" to skip the cache.
+
+        Only signed-in browser pages are cached; anonymous sessions and the
+        OPDS views that share this class don't reuse pages enough to pay
+        for it. Resolving ``params`` first also persists the settings and
+        last route exactly as an uncached request would.
+        """
+        user = self.request.user
+        if (
+            not BROWSER_PAGE_CACHE_TIMEOUT
+            or self.TARGET != "browser"
+            or not user.is_authenticated
+        ):
+            return ""
+        scope = self.get_acl_scope(user)
+        page = {
+            "kwargs": self.kwargs,
+            "params": dict(self.params),
+            "acl": (
+                sorted(scope.visible_library_pks),
+                scope.max_idx,
+                scope.default_fits,
+            ),
+        }
+        return get_browser_page_cache_key(user.pk, scope.visible_library_pks, page)
+
     @extend_schema(parameters=[BrowserTitleView.input_serializer_class])
     def get(self, *_args, **_kwargs) -> Response:
         """Return the page data — both cards and (in table mode) rows."""
+        cache_key = self._get_page_cache_key()
+        if cache_key and (cached := get_cached_browser_page(cache_key)) is not None:
+            return Response(cached)
         data = dict(self.get_object())
         if self.params.get("view_mode") == "table":
             # The unified serializer projects collections+books through
@@ -461,6 +500,10 @@ class BrowserView(BrowserTitleView):
                     collection_qs, columns
                 )
         serializer = self.get_serializer(data)
+        if cache_key:
+            set_cached_browser_page(
+                cache_key, serializer.data, BROWSER_PAGE_CACHE_TIMEOUT
+            )
         return Response(serializer.data)
 
 
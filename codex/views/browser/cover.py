@@ -14,23 +14,52 @@ the cover thread produces the real bytes. When a cover can't be produced
 (or doesn't exist) we respond 404 with an empty body — the web client
 falls back to its ``lazy-src`` SVG and OPDS clients use their own default
 rendering.
+
+Served covers carry an ETag and Last-Modified from the thumbnail file's
+stat. :func:`cover_not_modified` answers a matching ``If-None-Match``
+with 304 from a single ``stat()`` before the ACL query, the per-route
+``cache_page`` or DRF run. URLs that carry a version token (``ts``, as
+the browser and OPDS feeds emit) are cached as ``immutable``.
+
+With ``librarian.cover_pack`` the thumbnails live in the packed cover
+store instead of one file each; reads and validators come from its
+index entry rather than a file stat.
+
+``?size=2x`` and ``?size=large`` select the larger thumbnails the cover
+thread renders alongside the 1x one, for browser srcsets and OPDS image
+links.
+
+:class:`CoverBatchView` serves a whole browser page of covers in one
+response so a 72-card grid costs one round trip and one ACL query
+instead of 72 of each.
 """
 
+import json
+import os
+import struct
 from collections.abc import Sequence
-from typing import Any, Final, override
+from contextlib import suppress
+from functools import wraps
+from typing import Any, Final, NamedTuple, override
 
 from django.http import HttpResponse
+from django.http.response import HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema
 from loguru import logger
 from rest_framework import status
 from rest_framework.renderers import BaseRenderer
 
-from codex.librarian.covers.path import CoverPathMixin
+from codex.librarian.covers.pack import cover_pack
+from codex.librarian.covers.path import COVER_SIZE_1X, COVER_SIZES, CoverPathMixin
 from codex.librarian.covers.tasks import CoverCreateTask
 from codex.librarian.mp_queue import LIBRARIAN_QUEUE
 from codex.models import Comic
+from codex.settings import COVER_PACK
 from codex.views.auth import AuthFilterAPIView, GroupACLMixin
+from codex.views.ranges import stat_etag
 
 # source → queryset filter kwargs builder for representative-comic
 # resolution. Keys mirror the v4 ``collection`` vocabulary but use the
@@ -47,6 +76,133 @@ _COLLECTION_COMIC_FILTER: Final = {
 
 _RETRY_AFTER_SECONDS: Final = 2
 _WEBP_CONTENT_TYPE: Final = "image/webp"
+_PACK_CONTENT_TYPE: Final = "application/vnd.codex.cover-pack"
+# Big-endian uint32 byte length of the pack's JSON index.
+_PACK_INDEX_LENGTH: Final = struct.Struct(">I")
+MAX_BATCH_COVERS: Final = 256
+# Query params that pin a cover URL to one version of the cover.
+_VERSION_PARAMS: Final = ("ts", "cover_mtime")
+_IMMUTABLE_MAX_AGE: Final = 60 * 60 * 24 * 365
+
+
+class _CoverValidators(NamedTuple):
+    """ETag and modification time of one stored cover."""
+
+    etag: str
+    mtime: float
+
+    @classmethod
+    def from_stat(cls, st: os.stat_result) -> "_CoverValidators":
+        """Build validators from a cover file's stat."""
+        return cls(stat_etag(st), st.st_mtime)
+
+
+def _get_cover_size(request) -> str:
+    """Return the requested cover size, defaulting to 1x."""
+    size = request.GET.get("size", COVER_SIZE_1X)
+    return size if size in COVER_SIZES else COVER_SIZE_1X
+
+
+def _is_versioned(request) -> bool:
+    """Whether the URL pins one version of the cover."""
+    return any(param in request.GET for param in _VERSION_PARAMS)
+
+
+def _set_cover_validators(
+    request, response: HttpResponseBase, validators: _CoverValidators
+) -> None:
+    """Set validators and, for versioned URLs, immutable caching."""
+    response["ETag"] = validators.etag
+    response["Last-Modified"] = http_date(validators.mtime)
+    if _is_versioned(request):
+        patch_cache_control(
+            response, public=True, max_age=_IMMUTABLE_MAX_AGE, immutable=True
+        )
+
+
+def _get_cover_validators(
+    pk: int, *, custom: bool, size: str
+) -> _CoverValidators | None:
+    """Return a stored cover's validators without reading it."""
+    if COVER_PACK:
+        entry = cover_pack.lookup(pk, custom=custom, size=size)
+        if not entry or not entry.length:
+            # Missing, or the failed-cover marker; let the view answer.
+            return None
+        return _CoverValidators(entry.etag, entry.mtime_ns / 1e9)
+    try:
+        st = CoverPathMixin.get_cover_path(pk, custom=custom, size=size).stat()
+    except OSError:
+        return None
+    if not st.st_size:
+        # Failed-cover marker; let the view answer 404.
+        return None
+    return _CoverValidators.from_stat(st)
+
+
+def _cover_not_modified_response(
+    request, pk: int, *, custom: bool
+) -> HttpResponseBase | None:
+    """Return a 304 if the client's validator matches the stored cover."""
+    if "If-None-Match" not in request.headers:
+        return None
+    size = _get_cover_size(request)
+    if not (validators := _get_cover_validators(pk, custom=custom, size=size)):
+        return None
+    response = get_conditional_response(request, etag=validators.etag)
+    if response is None or response.status_code != status.HTTP_304_NOT_MODIFIED:
+        return None
+    _set_cover_validators(request, response, validators)
+    return response
+
+
+def cover_not_modified(*, custom: bool):
+    """
+    Answer a matching ``If-None-Match`` with 304 without running the view.
+
+    Wrap it outermost in the URLconf: the check is one ``stat()`` of the
+    thumbnail (or one cover pack index lookup), no ORM query, and a 304 returned outside ``cache_page``
+    is never stored as the route's cached response.
+    """
+
+    def _wrap(viewfunc):
+        @wraps(viewfunc)
+        def _wrapped(request, *args, **kwargs):
+            if response := _cover_not_modified_response(
+                request, kwargs["pk"], custom=custom
+            ):
+                return response
+            return viewfunc(request, *args, **kwargs)
+
+        return _wrapped
+
+    return _wrap
+
+
+def cover_cache_control(max_age: int):
+    """
+    Mark served covers publicly cacheable for ``max_age``.
+
+    Versioned covers already carry an immutable year-long
+    ``Cache-Control`` from the view; patching ``max_age`` over it would
+    clip it to the shorter age, so those responses are left alone.
+    Pair it with ``cache_page(None)``, which takes its timeout from this
+    ``max-age`` rather than clipping it too.
+    """
+
+    def _wrap(viewfunc):
+        @wraps(viewfunc)
+        def _wrapped(request, *args, **kwargs):
+            response = viewfunc(request, *args, **kwargs)
+            if response.status_code == status.HTTP_200_OK and not _is_versioned(
+                request
+            ):
+                patch_cache_control(response, public=True, max_age=max_age)
+            return response
+
+        return _wrapped
+
+    return _wrap
 
 
 class WEBPRenderer(BaseRenderer):
@@ -63,6 +219,13 @@ class WEBPRenderer(BaseRenderer):
         return data
 
 
+class CoverPackRenderer(WEBPRenderer):
+    """Render packed cover batches."""
+
+    media_type = _PACK_CONTENT_TYPE
+    format = "cover-pack"
+
+
 class _CoverBaseView(AuthFilterAPIView):
     """Shared cover-by-pk plumbing."""
 
@@ -90,33 +253,61 @@ class _CoverBaseView(AuthFilterAPIView):
         response["Cache-Control"] = "no-store"
         return response
 
-    @classmethod
-    def _get_cover_response(cls, pk: int, *, custom: bool) -> HttpResponse:
-        """Return a cached cover, enqueue one (202), or 404."""
-        cover_path = CoverPathMixin.get_cover_path(pk, custom=custom)
-        # Single read — no exists()/stat() race window. The cover thread
+    @staticmethod
+    def _read_cover(
+        pk: int, *, custom: bool, size: str = COVER_SIZE_1X
+    ) -> tuple[bytes | None, _CoverValidators | None]:
+        """Read a cached cover and the validators of what was read."""
+        if COVER_PACK:
+            if packed := cover_pack.get(pk, custom=custom, size=size):
+                data, entry = packed
+                return data, _CoverValidators(entry.etag, entry.mtime_ns / 1e9)
+            return None, None
+        cover_path = CoverPathMixin.get_cover_path(pk, custom=custom, size=size)
+        # Single open — no exists()/stat() race window. The cover thread
         # writes atomically via os.replace, so we only ever see the old state
-        # or the complete new file.
+        # or the complete new file, and fstat describes the bytes we read.
         try:
-            cover_bytes = cover_path.read_bytes()
+            with cover_path.open("rb") as cover_file:
+                st = os.fstat(cover_file.fileno())
+                return cover_file.read(), _CoverValidators.from_stat(st)
         except FileNotFoundError:
-            cover_bytes = None
+            return None, None
         except OSError as exc:
             logger.warning(f"Cover read error (pk={pk} custom={custom}): {exc!r}")
-            cover_bytes = None
+            return None, None
 
-        if cover_bytes:
-            return HttpResponse(cover_bytes, content_type=_WEBP_CONTENT_TYPE)
+    @classmethod
+    def _read_cover_bytes(
+        cls, pk: int, *, custom: bool, size: str = COVER_SIZE_1X
+    ) -> bytes | None:
+        """Read a cached cover; ``b""`` marks a failed cover, ``None`` a missing one."""
+        return cls._read_cover(pk, custom=custom, size=size)[0]
+
+    @staticmethod
+    def _enqueue_cover_create(pks: tuple[int, ...], *, custom: bool) -> None:
+        """Defer creation to the cover thread."""
+        try:
+            LIBRARIAN_QUEUE.put(CoverCreateTask(pks=pks, custom=custom))
+        except Exception as exc:
+            logger.warning(f"Cover enqueue failed (pks={pks} custom={custom}): {exc!r}")
+
+    @classmethod
+    def _get_cover_response(cls, request, pk: int, *, custom: bool) -> HttpResponse:
+        """Return a cached cover, enqueue one (202), or 404."""
+        size = _get_cover_size(request)
+        cover_bytes, validators = cls._read_cover(pk, custom=custom, size=size)
+        if cover_bytes and validators:
+            response = HttpResponse(cover_bytes, content_type=_WEBP_CONTENT_TYPE)
+            _set_cover_validators(request, response, validators)
+            return response
         if cover_bytes == b"":
             # Zero-byte marker = the cover thread already tried and failed.
             return cls._missing_cover_response()
 
         # Defer creation to the cover thread; respond 202 so the web client
         # polls until the real thumb is ready.
-        try:
-            LIBRARIAN_QUEUE.put(CoverCreateTask(pks=(pk,), custom=custom))
-        except Exception as exc:
-            logger.warning(f"Cover enqueue failed (pk={pk} custom={custom}): {exc!r}")
+        cls._enqueue_cover_create((pk,), custom=custom)
         response = cls._missing_cover_response(status.HTTP_202_ACCEPTED)
         response["Retry-After"] = str(_RETRY_AFTER_SECONDS)
         return response
@@ -134,7 +325,7 @@ class CoverView(_CoverBaseView):
             acl_q = self.get_acl_filter(Comic, self.request.user)
             if not Comic.objects.filter(acl_q, pk=pk).exists():
                 return self._missing_cover_response()
-            return self._get_cover_response(pk, custom=False)
+            return self._get_cover_response(self.request, pk, custom=False)
         except Exception:
             logger.exception(f"Get comic cover by pk {pk}")
             return self._missing_cover_response()
@@ -154,12 +345,127 @@ class CustomCoverView(_CoverBaseView):
     def get(self, *_args, pk: int, **_kwargs) -> HttpResponse:
         """Get the custom cover for a single CustomCover pk."""
         try:
-            return self._get_cover_response(pk, custom=True)
+            return self._get_cover_response(self.request, pk, custom=True)
         except Exception:
             logger.exception(f"Get custom cover by pk {pk}")
             return self._missing_cover_response()
 
 
+class CoverBatchView(_CoverBaseView):
+    """
+    Serve many covers in one packed response.
+
+    ``?comic=1,2,3&custom=4`` takes the ``cover_pk`` / ``cover_custom_pk``
+    values the browser response already annotated; ``size`` picks one
+    thumbnail size for the whole batch. Comic pks are ACL-checked in a
+    single query. The body is a uint32 big-endian index length, a JSON
+    index, then the concatenated WEBP bytes::
+
+        {"covers": [{"source": "comic", "pk": 1, "status": 200,
+                     "offset": 0, "length": 5120}, ...]}
+
+    Offsets are relative to the end of the index. ``status`` mirrors
+    what the single-cover view would have answered: 200, 202 (enqueued,
+    poll again) or 404. All missing covers go to the cover thread as one
+    task per source.
+    """
+
+    renderer_classes: Sequence[type[BaseRenderer]] = (CoverPackRenderer,)
+    content_type = _PACK_CONTENT_TYPE
+    TARGET: str = "cover"
+    CACHE_MAX_AGE: int = 0
+
+    def _parse_pks(self, key: str) -> tuple[int, ...]:
+        """Parse a comma separated pk list, dropping junk and duplicates."""
+        pks: dict[int, None] = {}
+        for part in self.request.GET.get(key, "").split(","):
+            with suppress(ValueError):
+                pks[int(part)] = None
+        return tuple(pks)[:MAX_BATCH_COVERS]
+
+    def _get_visible_comic_pks(self, pks: tuple[int, ...]) -> frozenset[int]:
+        """ACL-check every requested comic pk at once."""
+        if not pks:
+            return frozenset()
+        acl_q = self.get_acl_filter(Comic, self.request.user)
+        return frozenset(
+            Comic.objects.filter(acl_q, pk__in=pks).values_list("pk", flat=True)
+        )
+
+    def _pack_covers(
+        self, source_pks: dict[str, tuple[tuple[int, ...], frozenset[int] | None]]
+    ) -> tuple[bytes, bool]:
+        """Pack covers and report whether any are still pending."""
+        index = []
+        chunks = []
+        offset = 0
+        any_pending = False
+        size = _get_cover_size(self.request)
+        for source, (pks, visible) in source_pks.items():
+            custom = source == "custom"
+            pending = []
+            for pk in pks:
+                length = 0
+                if visible is not None and pk not in visible:
+                    cover_status = status.HTTP_404_NOT_FOUND
+                elif cover_bytes := self._read_cover_bytes(
+                    pk, custom=custom, size=size
+                ):
+                    cover_status = status.HTTP_200_OK
+                    length = len(cover_bytes)
+                    chunks.append(cover_bytes)
+                elif cover_bytes is None:
+                    cover_status = status.HTTP_202_ACCEPTED
+                    pending.append(pk)
+                else:
+                    cover_status = status.HTTP_404_NOT_FOUND
+                index.append(
+                    {
+                        "source": source,
+                        "pk": pk,
+                        "status": cover_status,
+                        "offset": offset,
+                        "length": length,
+                    }
+                )
+                offset += length
+            if pending:
+                any_pending = True
+                self._enqueue_cover_create(tuple(pending), custom=custom)
+
+        index_bytes = json.dumps({"covers": index}, separators=(",", ":")).encode()
+        body = b"".join(
+            (_PACK_INDEX_LENGTH.pack(len(index_bytes)), index_bytes, *chunks)
+        )
+        return body, any_pending
+
+    @extend_schema(responses={(200, _PACK_CONTENT_TYPE): OpenApiTypes.BINARY})
+    def get(self, *_args, **_kwargs) -> HttpResponse:
+        """Get a page of covers."""
+        comic_pks = self._parse_pks("comic")
+        custom_pks = self._parse_pks("custom")
+        try:
+            source_pks = {
+                "comic": (comic_pks, self._get_visible_comic_pks(comic_pks)),
+                # No ACL check for custom covers, as in CustomCoverView.
+                "custom": (custom_pks, None),
+            }
+            body, any_pending = self._pack_covers(source_pks)
+        except Exception:
+            logger.exception(f"Get cover batch comic={comic_pks} custom={custom_pks}")
+            return self._missing_cover_response()
+
+        response = HttpResponse(body, content_type=_PACK_CONTENT_TYPE)
+        if any_pending:
+            # The client re-requests once pending covers are written.
+            response["Cache-Control"] = "no-store"
+            response["Retry-After"] = str(_RETRY_AFTER_SECONDS)
+        else:
+            # Per-user ACLs make the batch private.
+            patch_cache_control(response, private=True, max_age=self.CACHE_MAX_AGE)
+        return response
+
+
 def _resolve_collection_comic_pk(source: str, pk: int, user) -> int | None:
     """Pick a representative comic pk for a collection source, ACL-aware."""
     field = _COLLECTION_COMIC_FILTER.get(source)
@@ -182,8 +488,12 @@ def _missing_cover_404() -> HttpResponse:
     return resp
 
 
-def cover_dispatch_by_source(request, source: str, pk: int) -> HttpResponse:
+def cover_dispatch_by_source(request, source: str, pk: int) -> HttpResponseBase:
     """Route ``/api/v4/covers/{source}/{id}`` by source kind."""
+    if source in ("comic", "custom") and (
+        response := _cover_not_modified_response(request, pk, custom=source == "custom")
+    ):
+        return response
     if source == "comic":
         return CoverView.as_view()(request, pk=pk)
     if source == "custom":
@@ -212,6 +212,20 @@ class BrowserFilterView(BrowserFilterBookmarkView):
             q |= Q(pk__in=subqueries[self_code])
         return q
 
+    def get_rollup_acl_filter(
+        self,
+        model,  # noqa: ARG002
+        *,
+        page_mtime: bool,  # noqa: ARG002
+    ) -> Q | None:
+        """
+        Return a filter that reads collection rollups in place of the ACL.
+
+        Only called when no comic filters apply. ``None`` keeps the ACL
+        filter and the comic aggregates.
+        """
+        return None
+
     def _get_query_filters(
         self,
         model,
@@ -221,20 +235,29 @@ class BrowserFilterView(BrowserFilterBookmarkView):
         pks=None,
     ) -> Q:
         """Return all the filters except the collection filter."""
+        comic_filter = Q()
+        comic_filter &= self.get_comic_field_filter(model)
+        if bookmark_filter:
+            comic_filter &= self.get_bookmark_filter(model)
+        comic_filter &= self.get_favorite_filter(model)
+        include_search_filter, exclude_search_filter, fts_q = self.get_search_filters(
+            model
+        )
+        comic_filter &= include_search_filter
+
+        acl_filter = None
+        if not (comic_filter or exclude_search_filter or fts_q):
+            acl_filter = self.get_rollup_acl_filter(model, page_mtime=page_mtime)
+        if acl_filter is None:
+            acl_filter = self.get_acl_filter(model, self.request.user)
+
         big_include_filter = Q()
         big_exclude_filter = Q()
-        big_include_filter &= self.get_acl_filter(model, self.request.user)
+        big_include_filter &= acl_filter
         big_include_filter &= self.get_collection_filter(
             collection, pks, page_mtime=page_mtime
         )
-        big_include_filter &= self.get_comic_field_filter(model)
-        if bookmark_filter:
-            big_include_filter &= self.get_bookmark_filter(model)
-        big_include_filter &= self.get_favorite_filter(model)
-        include_search_filter, exclude_search_filter, fts_q = self.get_search_filters(
-            model
-        )
-        big_include_filter &= include_search_filter
+        big_include_filter &= comic_filter
         big_exclude_filter &= exclude_search_filter
 
         return big_include_filter & ~big_exclude_filter & fts_q
@@ -47,6 +47,7 @@ class BrowserOrderByView(BrowserCollectionMtimeView):
         super().__init__(*args, **kwargs)
         self._order_key: str = ""
         self._comic_sort_names: tuple[str, ...] = ()
+        self._comic_sort_key_applies = False
 
     @property
     def order_key(self) -> str:
@@ -82,6 +83,9 @@ class BrowserOrderByView(BrowserCollectionMtimeView):
     def _comic_sort_name_head(self, comic_sort_names) -> list[str]:
         """Build the ORDER BY head used for the canonical ``sort_name`` sort."""
         if not comic_sort_names:
+            if self._comic_sort_key_applies:
+                # The same order composed into one indexed column.
+                return ["sort_key"]
             comic_sort_names = self._comic_sort_names
         return [
             *comic_sort_names,
@@ -0,0 +1,89 @@
+"""
+Serialized browser page cache.
+
+Pages are keyed on everything that shapes them: the route kwargs and
+resolved params, the user's ACL scope, and generation tokens for the
+whole site, the user's bookmarks and favorites, and each library the
+user can see. Writers bump the tokens they invalidate instead of
+clearing the cache, so an import of one library retires only the pages
+that can show it. Tokens are random rather than counted, so a culled or
+cleared token never matches a page cached under an earlier one.
+"""
+
+import hashlib
+import json
+from collections.abc import Iterable, Mapping
+from secrets import token_hex
+
+from codex.cache import browser_cache
+
+_GENERATION_KEY = "codex:browser_gen:{scope}"
+_SITE_SCOPE = "site"
+_PAGE_KEY = "codex:browser_page:{user}:{digest}"
+
+
+def _new_token() -> str:
+    return token_hex(8)
+
+
+def _library_key(pk: int) -> str:
+    return _GENERATION_KEY.format(scope=f"library:{pk}")
+
+
+def _user_key(pk: int) -> str:
+    return _GENERATION_KEY.format(scope=f"user:{pk}")
+
+
+def bump_browser_generation(library_pks: Iterable[int] | None = None) -> None:
+    """
+    Retire cached browser pages that can show the libraries.
+
+    ``None`` retires every page, for changes not tied to one library.
+    """
+    if library_pks is None:
+        keys = (_GENERATION_KEY.format(scope=_SITE_SCOPE),)
+    else:
+        keys = tuple(_library_key(pk) for pk in library_pks)
+    if keys:
+        browser_cache.set_many(dict.fromkeys(keys, _new_token()), None)
+
+
+def bump_browser_user_generation(user_pk: int) -> None:
+    """Retire the user's cached pages after their bookmarks or favorites change."""
+    browser_cache.set(_user_key(user_pk), _new_token(), None)
+
+
+def _get_generations(user_pk: int, library_pks: Iterable[int]) -> tuple[str, ...]:
+    """Return the current tokens for the page's scopes, starting missing ones."""
+    keys = (
+        _GENERATION_KEY.format(scope=_SITE_SCOPE),
+        _user_key(user_pk),
+        *(_library_key(pk) for pk in sorted(library_pks)),
+    )
+    tokens = browser_cache.get_many(keys)
+    if missing := {key: _new_token() for key in keys if key not in tokens}:
+        browser_cache.set_many(missing, None)
+        tokens.update(missing)
+    return tuple(tokens[key] for key in keys)
+
+
+def get_browser_page_cache_key(
+    user_pk: int, library_pks: Iterable[int], page: Mapping
+) -> str:
+    """Key a page on its shape and the current generations it depends on."""
+    generations = _get_generations(user_pk, library_pks)
+    page_str = json.dumps(
+        {"page": page, "generations": generations}, sort_keys=True, default=str
+    )
+    digest = hashlib.blake2s(page_str.encode(), digest_size=16).hexdigest()
+    return _PAGE_KEY.format(user=user_pk, digest=digest)
+
+
+def get_cached_browser_page(key: str):
+    """Return the cached serialized page or None."""
+    return browser_cache.get(key)
+
+
+def set_cached_browser_page(key: str, data, timeout: int) -> None:
+    """Cache the serialized page."""
+    browser_cache.set(key, data, timeout)
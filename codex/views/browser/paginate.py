@@ -1,19 +1,226 @@
-"""Browser pagination."""
+"""
+Browser pagination.
 
+Pages are numbered and sliced with OFFSET by default. A request that
+passes the ``cursor`` param (blank for the first page) opts into keyset
+pagination instead: each page seeks past the previous page's last sort
+tuple with a WHERE predicate and the response carries the signed cursor
+for the next page, so crawling a whole catalog costs O(n) rather than
+re-sorting and skipping every earlier page. OPDS feeds start a cursor
+chain on their first page so crawlers following next links seek too.
+
+Sorts on aggregate annotations, like most collection order values,
+would have to seek in a HAVING clause after grouping every row, so
+sections sorted by them fall back to numbered pages.
+"""
+
+from datetime import date
+from functools import reduce
 from math import ceil
+from operator import attrgetter, or_
 
+from django.core import signing
+from django.core.exceptions import ObjectDoesNotExist
 from django.core.paginator import EmptyPage, Paginator
+from django.db.models import F, Q
 from django.db.models.query import QuerySet
 from loguru import logger
+from rest_framework.exceptions import ValidationError
 
 from codex.settings.db import get_browser_max_obj_per_page
 from codex.views.browser.page_in_bounds import BrowserPageInBoundsView
-from codex.views.const import FOLDER_COLLECTION
+from codex.views.const import COLLECTION_GROUP_BY, FOLDER_COLLECTION
+
+_CURSOR_SALT = "codex.browser.cursor"
+_OPDS_TARGETS = frozenset({"opds1", "opds2"})
+_COLLECTION_SECTION = "c"
+_BOOK_SECTION = "b"
+
+
+def _cursor_value(value):
+    """Make a sort value JSON safe; the lookups parse strings back."""
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def _seek_after(name: str, value, *, reverse: bool) -> Q:
+    """Rows strictly after ``value`` on one column, with SQLite NULL order."""
+    # SQLite sorts NULLs first ascending and last descending.
+    if reverse:
+        if value is None:
+            return Q(pk__in=())
+        return Q(**{f"{name}__lt": value}) | Q(**{f"{name}__isnull": True})
+    if value is None:
+        return Q(**{f"{name}__isnull": False})
+    return Q(**{f"{name}__gt": value})
+
+
+def _seek_equal(name: str, value) -> Q:
+    if value is None:
+        return Q(**{f"{name}__isnull": True})
+    return Q(**{name: value})
 
 
 class BrowserPaginateView(BrowserPageInBoundsView):
     """Paginate Collections and Books."""
 
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the next page cursor."""
+        super().__init__(*args, **kwargs)
+        self.next_cursor: str | None = None
+        self._keyset_paginated = False
+
+    @property
+    def keyset_mode(self) -> bool:
+        """Whether the request paginates by cursor instead of page number."""
+        if self.params.get("cursor") is not None:
+            return True
+        return self.TARGET in _OPDS_TARGETS and self.kwargs.get("page", 1) == 1
+
+    @property
+    def keyset_paginated(self) -> bool:
+        """Whether the page was paginated by cursor."""
+        return self._keyset_paginated
+
+    def _get_cursor(self) -> tuple[str, list, list] | None:
+        """Decode the request cursor into its section, sort columns and values."""
+        if not (token := self.params.get("cursor")):
+            return None
+        try:
+            section, names, values = signing.loads(token, salt=_CURSOR_SALT)
+        except (signing.BadSignature, TypeError, ValueError) as exc:
+            reason = "Invalid cursor."
+            raise ValidationError(reason) from exc
+        return section, names, values
+
+    @staticmethod
+    def _get_keyset_qs(qs: QuerySet) -> QuerySet | None:
+        """
+        Order ``qs`` by a unique sort tuple, or None if it can't seek.
+
+        Merged collection rows have no single pk, so their group columns,
+        which are unique per card, break ties instead. Aggregate sort
+        columns can't seek before grouping.
+        """
+        order_by = qs.query.order_by
+        if qs.query.is_sliced or not all(isinstance(f, str) for f in order_by):
+            return None
+        annotations = qs.query.annotations
+        for field in order_by:
+            annotation = annotations.get(field.removeprefix("-"))
+            if annotation is not None and annotation.contains_aggregate:
+                return None
+        if group_by := COLLECTION_GROUP_BY.get(qs.model):
+            head = order_by[:-1]
+            prefix = "-" if order_by and order_by[-1].startswith("-") else ""
+            head_names = {field.removeprefix("-") for field in head}
+            tail = (prefix + col for col in group_by if col not in head_names)
+            qs = qs.order_by(*head, *tail)
+        # Promote aliased sort columns so the last row carries its values.
+        selected = qs.query.annotation_select
+        if aliases := {
+            name: F(name)
+            for name in (field.removeprefix("-") for field in qs.query.order_by)
+            if name in annotations and name not in selected
+        }:
+            qs = qs.annotate(**aliases)
+        return qs
+
+    @staticmethod
+    def _seek(qs: QuerySet, names: list, values: list) -> QuerySet:
+        """Filter ``qs`` to the rows after the sort tuple ``values``."""
+        if list(qs.query.order_by) != names:
+            reason = "Cursor does not match the current order."
+            raise ValidationError(reason)
+        terms = []
+        equal = Q()
+        for order_field, value in zip(names, values, strict=True):
+            name = order_field.removeprefix("-")
+            reverse = order_field.startswith("-")
+            terms.append(equal & _seek_after(name, value, reverse=reverse))
+            equal &= _seek_equal(name, value)
+        return qs.filter(reduce(or_, terms))
+
+    def _paginate_keyset_section(
+        self, qs: QuerySet, cursor, section: str, limit: int, total_count: int
+    ) -> tuple[QuerySet, int]:
+        """Take up to ``limit`` rows of a section, after the cursor if it's here."""
+        if not limit or not total_count:
+            return qs.model.objects.none(), 0
+        if cursor and cursor[0] == section:
+            qs = self._seek(qs, cursor[1], cursor[2])[:limit]
+            return qs, qs.count()
+        return qs[:limit], min(limit, total_count)
+
+    def _paginate_keyset(
+        self,
+        collection_qs: QuerySet,
+        book_qs: QuerySet,
+        collection_count: int,
+        book_count: int,
+    ) -> tuple[QuerySet, QuerySet, int, int] | None:
+        """Paginate by seeking past the cursor, or None to fall back to pages."""
+        cursor = self._get_cursor()
+        if cursor and cursor[0] == _BOOK_SECTION:
+            # Every collection came before the cursor's book.
+            collection_count = 0
+        # Empty sections never seek, so their order doesn't matter.
+        keyset_collection_qs = (
+            self._get_keyset_qs(collection_qs) if collection_count else collection_qs
+        )
+        keyset_book_qs = self._get_keyset_qs(book_qs) if book_count else book_qs
+        if keyset_collection_qs is None or keyset_book_qs is None:
+            return None
+        self._keyset_paginated = True
+        per_page = get_browser_max_obj_per_page()
+        page_collection_qs, page_collection_count = self._paginate_keyset_section(
+            keyset_collection_qs,
+            cursor,
+            _COLLECTION_SECTION,
+            per_page,
+            collection_count,
+        )
+        page_book_qs, page_book_count = self._paginate_keyset_section(
+            keyset_book_qs,
+            cursor,
+            _BOOK_SECTION,
+            per_page - page_collection_count,
+            book_count,
+        )
+        return page_collection_qs, page_book_qs, page_collection_count, page_book_count
+
+    def set_next_cursor(
+        self, collection_qs: QuerySet, book_qs: QuerySet, page_count: int
+    ) -> None:
+        """Encode the last row's sort tuple as the cursor for the next page."""
+        self.next_cursor = None
+        if not self._keyset_paginated or page_count < get_browser_max_obj_per_page():
+            return
+        # Evaluating the final page querysets primes the results the
+        # serializer reads.
+        if rows := list(book_qs):
+            section, qs = _BOOK_SECTION, book_qs
+        else:
+            rows = list(collection_qs)
+            section, qs = _COLLECTION_SECTION, collection_qs
+        if not rows:
+            return
+        names = list(qs.query.order_by)
+        values = []
+        for order_field in names:
+            path = order_field.removeprefix("-").replace("__", ".")
+            try:
+                value = attrgetter(path)(rows[-1])
+            except (AttributeError, ObjectDoesNotExist):
+                value = None
+            values.append(_cursor_value(value))
+        self.next_cursor = signing.dumps(
+            (section, names, values), salt=_CURSOR_SALT, compress=True
+        )
+
     def _paginate_section(
         self, qs: QuerySet, page: int, total_count: int
     ) -> tuple[QuerySet, int]:
@@ -105,6 +312,13 @@ class BrowserPaginateView(BrowserPageInBoundsView):
             self._opds_number_of_books = book_count
             self._opds_number_of_collections = collection_count
 
+        if self.keyset_mode and (
+            keyset := self._paginate_keyset(
+                collection_qs, book_qs, collection_count, book_count
+            )
+        ):
+            return keyset
+
         page_collection_qs, page_collection_count = self._paginate_collections(
             collection_qs, collection_count
         )
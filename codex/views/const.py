@@ -98,6 +98,18 @@ METADATA_COLLECTION_RELATION = MappingProxyType(
         STORY_ARC_COLLECTION: "comic__story_arc_numbers__story_arc",
     }
 )
+# Columns that group merged collection cards, one card per distinct value.
+COLLECTION_GROUP_BY: MappingProxyType[type[BrowserCollectionModel], tuple[str, ...]] = (
+    MappingProxyType(
+        {
+            Publisher: ("sort_name",),
+            Imprint: ("sort_name",),
+            Series: ("sort_name",),
+            Volume: ("name", "number_to"),
+            StoryArc: ("sort_name",),
+        }
+    )
+)
 CUSTOM_COVER_COLLECTION_RELATION: MappingProxyType[str, str] = MappingProxyType(
     {
         **COLLECTION_NAME_MAP,
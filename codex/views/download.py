@@ -2,23 +2,36 @@
 
 from pathlib import Path
 
-from django.http import FileResponse, Http404
+from django.http import Http404
+from django.http.response import HttpResponseBase
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema
 
 from codex.models.comic import Comic
 from codex.views.auth import AuthFilterAPIView
+from codex.views.ranges import FileRangeReader, ranged_response, stat_etag
 
 
 class DownloadView(AuthFilterAPIView):
-    """Return the comic archive file as an attachment."""
+    """
+    Return the comic archive file as an attachment.
+
+    Validators come from the archive's live stat (inode, mtime, size),
+    the same fields the importer records in ``Comic.stat``, so clients
+    revalidate with 304s and resume interrupted downloads with ranges.
+    """
 
     content_type = "application/vnd.comicbook+zip"
 
     AS_ATTACHMENT: bool = True
 
-    @extend_schema(responses={(200, content_type): OpenApiTypes.BINARY})
-    def get(self, *_args, **kwargs) -> FileResponse:
+    @extend_schema(
+        responses={
+            (200, content_type): OpenApiTypes.BINARY,
+            (206, content_type): OpenApiTypes.BINARY,
+        }
+    )
+    def get(self, *_args, **kwargs) -> HttpResponseBase:
         """Download a comic archive."""
         pk = kwargs.get("pk")
         try:
@@ -33,8 +46,13 @@ class DownloadView(AuthFilterAPIView):
             reason = f"Comic {pk} not not found."
             raise Http404(reason) from err
 
-        # FileResponse requires file handle not be closed in this method.
-        comic_file = Path(comic.path).open("rb")  # noqa: SIM115
+        path = Path(comic.path)
+        try:
+            st = path.stat()
+        except FileNotFoundError as err:
+            reason = f"Comic {pk} file not found."
+            raise Http404(reason) from err
+
         content_type = "application/"
         if comic.file_type == "PDF":
             content_type += "pdf"
@@ -43,12 +61,16 @@ class DownloadView(AuthFilterAPIView):
         else:
             content_type += "octet-stream"
 
-        filename = comic.get_filename()
-        return FileResponse(
-            comic_file,
-            as_attachment=self.AS_ATTACHMENT,
+        return ranged_response(
+            self.request,
+            etag=stat_etag(st),
+            last_modified=st.st_mtime,
+            size=st.st_size,
+            # FileResponse closes the reader once it's streamed.
+            open_content=lambda byte_range: FileRangeReader(path, byte_range),
             content_type=content_type,
-            filename=filename,
+            filename=comic.get_filename(),
+            as_attachment=self.AS_ATTACHMENT,
         )
 
 
@@ -7,6 +7,7 @@ from rest_framework.response import Response
 
 from codex.models.favorite import FAVORITE_COLLECTION_MODELS, Favorite
 from codex.views.auth import AuthFilterGenericAPIView
+from codex.views.browser.page_cache import bump_browser_user_generation
 
 if TYPE_CHECKING:
     from rest_framework.request import Request
@@ -88,6 +89,8 @@ class FavoriteDetailView(_FavoriteAuthMixin):
             collection=collection_code,
             target_id=target_id,
         )
+        if created:
+            bump_browser_user_generation(self.request.user.pk)
         return Response(status=201 if created else 200)
 
     def delete(self, *_args, **_kwargs) -> Response:
@@ -97,9 +100,11 @@ class FavoriteDetailView(_FavoriteAuthMixin):
             return resolved
         collection_code, target_id, _model = resolved
 
-        Favorite.objects.filter(
+        deleted, _ = Favorite.objects.filter(
             user=self.request.user,
             collection=collection_code,
             target_id=target_id,
         ).delete()
+        if deleted:
+            bump_browser_user_generation(self.request.user.pk)
         return Response(status=204)
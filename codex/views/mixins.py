@@ -58,6 +58,27 @@ class SharedAnnotationsMixin:  # (BrowserFilterView):
                 order_collections = _SHOW_COLLECTIONS
         return order_collections
 
+    @classmethod
+    def sort_key_applies(cls, parent_collection, pks, show) -> bool:
+        """
+        Whether ``Comic.sort_key`` orders like the sort name annotations.
+
+        The key leads with every collection's sort name, so it matches
+        when the collections the annotations leave out are pinned by a
+        single parent.
+        """
+        order_collections = cls._get_order_collections(parent_collection, pks, show)
+        num_omitted = len(_SHOW_COLLECTIONS) - len(order_collections)
+        if not num_omitted:
+            return True
+        return (
+            parent_collection in _SHOW_COLLECTIONS
+            and bool(pks)
+            and len(pks) == 1
+            and 0 not in pks
+            and num_omitted <= _SHOW_COLLECTIONS.index(parent_collection) + 1
+        )
+
     @classmethod
     def get_sort_name_annotations(cls, model, parent_collection, pks, show) -> dict:
         """Annotate sort names for browser subclasses and reader."""
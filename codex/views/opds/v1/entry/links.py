@@ -9,6 +9,7 @@ from comicbox.box import Comicbox
 from django.urls import reverse
 from loguru import logger
 
+from codex.librarian.covers.path import COVER_SIZE_1X, COVER_SIZE_LARGE
 from codex.settings import COMICBOX_CONFIG
 from codex.views.opds.const import MimeType, Rel
 from codex.views.opds.route import opds_feed_reverse
@@ -39,9 +40,11 @@ class OPDS1EntryLinksMixin:
         self._contributors_by_pk = data.contributors_by_pk
         self._category_groups_by_pk = data.category_groups_by_pk
 
-    def _cover_href(self, ts: int) -> str:
+    def _cover_href(self, ts: int, size: str) -> str:
         """Pick the thin cover URL for the entry."""
-        query_params = {"ts": ts}
+        query_params: dict = {"ts": ts}
+        if size:
+            query_params["size"] = size
         if custom_pk := getattr(self.obj, "cover_custom_pk", None):
             return reverse(
                 "opds:bin:custom_cover",
@@ -64,7 +67,10 @@ class OPDS1EntryLinksMixin:
             return None
         try:
             ts = floor(datetime.timestamp(self.obj.updated_at))
-            href = self._cover_href(ts)
+            # The full image rel gets the large thumbnail instead of a
+            # page extract.
+            size = COVER_SIZE_LARGE if rel == Rel.IMAGE else COVER_SIZE_1X
+            href = self._cover_href(ts, size)
             return OPDS1Link(rel, href, MimeType.WEBP)
         except Exception:
             logger.exception("create thumb")
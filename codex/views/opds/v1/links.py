@@ -56,6 +56,14 @@ class OPDS1LinksView(OPDS1FacetsView):
             and 0 not in pks
         ):
             links += [self._link(up_route, Rel.UP)]
+        if self.keyset_paginated:
+            # Cursors only seek forward.
+            if next_cursor := self.obj.get("next_cursor"):
+                query_params = self.request.GET.copy()
+                query_params["cursor"] = next_cursor
+                next_route = {**self.kwargs, "page": 1}
+                links += [self._link(next_route, Rel.NEXT, query_params)]
+            return links
         page = self.kwargs.get("page", 1)
         if page > 1:
             prev_route = {**self.kwargs, "page": page - 1}
@@ -99,6 +99,39 @@ class OPDS2FeedLinksView(OPDS2LinksView):
         link_data = LinkData(rel, href_data)
         return self.link(link_data)
 
+    def _link_cursor(self, rel, cursor: str):
+        """Links to a keyset page of results."""
+        kwargs = {**self.kwargs, "page": 1}
+        href_data = HrefData(
+            kwargs, query_params={"cursor": cursor}, inherit_query_params=True
+        )
+        link_data = LinkData(rel, href_data)
+        return self.link(link_data)
+
+    def _get_page_links(self, page) -> list:
+        """Links to the first, neighboring and last pages."""
+        if self.keyset_paginated:
+            # Cursors only seek forward and don't know the last page.
+            links = [self._link_cursor("first", "")]
+            if self.next_cursor:
+                links.append(self._link_cursor("next", self.next_cursor))
+            return links
+        links = []
+        if page != 1:
+            links += [
+                self._link_page("first", 1),
+            ]
+        if page > 1:
+            links += [
+                self._link_page("previous", page - 1),
+            ]
+        if page != self.num_pages:
+            links += [
+                self._link_page("next", page + 1),
+                self._link_page("last", self.num_pages),
+            ]
+        return links
+
     def get_links(self, up_route):
         """Get the top links section of the feed."""
         pks = self.kwargs.get("pks")
@@ -122,19 +155,7 @@ class OPDS2FeedLinksView(OPDS2LinksView):
                 self.link(up_link_data),
             ]
 
-        if page != 1:
-            links_data += [
-                self._link_page("first", 1),
-            ]
-        if page > 1:
-            links_data += [
-                self._link_page("previous", page - 1),
-            ]
-        if page != self.num_pages:
-            links_data += [
-                self._link_page("next", page + 1),
-                self._link_page("last", self.num_pages),
-            ]
+        links_data += self._get_page_links(page)
         link_dict = {}
         for link in links_data:
             self.link_aggregate(link_dict, link)
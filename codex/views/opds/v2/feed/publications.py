@@ -10,7 +10,13 @@ from urllib.parse import quote_plus
 from caseconverter import snakecase
 from django.db.models import CharField, F, Value
 
-from codex.librarian.covers.create import THUMBNAIL_HEIGHT, THUMBNAIL_WIDTH
+from codex.librarian.covers.create import (
+    LARGE_THUMBNAIL_HEIGHT,
+    LARGE_THUMBNAIL_WIDTH,
+    THUMBNAIL_HEIGHT,
+    THUMBNAIL_WIDTH,
+)
+from codex.librarian.covers.path import COVER_SIZE_LARGE
 from codex.models import Comic
 from codex.models.collections import BrowserCollectionModel, Folder
 from codex.models.identifier import Identifier
@@ -286,6 +292,23 @@ class OPDS2PublicationBaseView(OPDS2FeedLinksView):
 
         thumb_link = self.link(thumb_link_data)
         images.append(thumb_link)
+
+        # A larger rendition from the same cover pass, so clients that
+        # want a big cover don't fall back to a full page extract.
+        large_href_data = HrefData(
+            kwargs,
+            {**query_params, "size": COVER_SIZE_LARGE},
+            url_name="opds:bin:cover",
+        )
+        large_link_data = LinkData(
+            Rel.IMAGE,
+            large_href_data,
+            mime_type=MimeType.WEBP,
+            height=LARGE_THUMBNAIL_HEIGHT,
+            width=LARGE_THUMBNAIL_WIDTH,
+            authenticate=self.auth_link,
+        )
+        images.append(self.link(large_link_data))
         return images
 
 
@@ -545,12 +568,12 @@ class OPDS2PublicationsView(OPDS2PublicationBaseView):
         feed_view = OPDS2FeedLinksView()
         feed_view.request = self.request
         # Share request-scoped caches with the parent so each preview
-        # link_spec doesn't repeat the AdminFlag fetch + visible-library
-        # ACL lookup. ``_admin_flags`` and ``_cached_visible_library_pks``
-        # depend on (user, request) only, not on params/kwargs — safe to
-        # share across the 3 preview iterations (sub-plan 02 #2 / 04 #3).
+        # link_spec doesn't repeat the AdminFlag fetch + ACL scope
+        # lookup. ``_admin_flags`` and ``_cached_acl_scope`` depend on
+        # (user, request) only, not on params/kwargs — safe to share
+        # across the 3 preview iterations (sub-plan 02 #2 / 04 #3).
         feed_view._admin_flags = self.admin_flags  # noqa: SLF001
-        feed_view._cached_visible_library_pks = self._cached_visible_library_pks  # noqa: SLF001
+        feed_view._cached_acl_scope = self.get_acl_scope(self.request.user)  # noqa: SLF001
         feed_view.kwargs = {"collection": link_spec.group, "pks": [0], "page": 1}
         params = self.get_browser_default_params()
         if link_spec.query_params:
@@ -15,6 +15,10 @@ guard different costs:
    ``read`` calls; the cache structure itself is guarded by a separate
    short-held lock so unrelated archives proceed in parallel.
 
+   Each entry also memoizes the byte spans of STORED (uncompressed)
+   zip members so ``ReaderPageView`` can stream those pages straight
+   from the file without taking the per-archive lock at all.
+
 2. ``PageAclCache`` (``page_acl_cache``) — ``(auth_key, comic_pk) →
    (path, file_type)``. Skips the per-page ACL-filter SQL within a
    short TTL window during a single read-through (sub-plan 03 #2 /
@@ -40,16 +44,20 @@ from __future__ import annotations
 
 import atexit
 import os
+import struct
 import threading
 import time
+import zipfile
 from collections import OrderedDict
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 from comicbox.box import Comicbox
 from loguru import logger
 
 from codex.settings import COMICBOX_CONFIG, FALSY
+from codex.views.ranges import ByteRange, FileRangeReader
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -75,6 +83,93 @@ def _env_bool(name: str, *, default: bool) -> bool:
 _DEFAULT_SIZE = 4
 _DEFAULT_TTL = 30.0
 
+# Local file header layout from the zip spec (APPNOTE 4.3.7). ``zipfile``
+# keeps the same constants private, so mirror the two we need.
+_ZIP_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_ZIP_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+_ZIP_FILENAME_LENGTH_INDEX = 10
+_ZIP_EXTRA_LENGTH_INDEX = 11
+_ZIP_ENCRYPTED_FLAG = 0x1
+
+StoredSpan = tuple[int, int]
+# ``(st_mtime_ns, st_size)`` of the archive a span table was read from.
+ArchiveStat = tuple[int, int]
+
+
+def _read_stored_span(
+    zip_file: BinaryIO, info: zipfile.ZipInfo, file_size: int
+) -> StoredSpan | None:
+    """Return ``(offset, length)`` of a STORED member's data, else ``None``."""
+    if (
+        info.compress_type != zipfile.ZIP_STORED
+        or info.flag_bits & _ZIP_ENCRYPTED_FLAG
+        or info.compress_size != info.file_size
+    ):
+        return None
+    zip_file.seek(info.header_offset)
+    raw = zip_file.read(_ZIP_LOCAL_HEADER.size)
+    if len(raw) != _ZIP_LOCAL_HEADER.size:
+        return None
+    header = _ZIP_LOCAL_HEADER.unpack(raw)
+    if header[0] != _ZIP_LOCAL_HEADER_SIGNATURE:
+        return None
+    # The local extra field may differ from the central directory's
+    # copy, so the data offset must come from the local header.
+    offset = (
+        info.header_offset
+        + _ZIP_LOCAL_HEADER.size
+        + header[_ZIP_FILENAME_LENGTH_INDEX]
+        + header[_ZIP_EXTRA_LENGTH_INDEX]
+    )
+    if offset + info.file_size > file_size:
+        return None
+    return offset, info.file_size
+
+
+def _resolve_stored_spans(
+    comicbox: Comicbox,
+) -> tuple[ArchiveStat | None, tuple[StoredSpan | None, ...]]:
+    """
+    Map every page index to its STORED member span, if it has one.
+
+    Non-zip archives (and encrypted or compressed members) map to
+    ``None`` so the caller falls back to normal extraction. Runs once
+    per cached archive under the per-archive lock. Also returns the
+    archive stat the table is valid for.
+    """
+    # Private comicbox API, as in ``ReaderPageView._try_pdf_image_serve``.
+    archive = comicbox._get_archive()  # noqa: SLF001
+    if not isinstance(archive, zipfile.ZipFile) or not archive.filename:
+        return None, ()
+    spans: list[StoredSpan | None] = []
+    path = Path(archive.filename)
+    st = path.stat()
+    file_size = st.st_size
+    with path.open("rb") as zip_file:
+        for filename in comicbox.get_page_filenames():
+            try:
+                info = archive.getinfo(filename)
+            except KeyError:
+                spans.append(None)
+                continue
+            spans.append(_read_stored_span(zip_file, info, file_size))
+    return (st.st_mtime_ns, file_size), tuple(spans)
+
+
+class StoredMemberReader(FileRangeReader):
+    """
+    Length-bounded, read-only view of one STORED zip member.
+
+    Handed to ``FileResponse`` as its file-like. Uses its own file
+    handle so concurrent readers never share the cached archive's
+    handle or its lock. The caller sets Content-Length from ``length``.
+    """
+
+    def __init__(self, path: str, span: StoredSpan) -> None:
+        """Open ``path`` positioned at the member's data."""
+        offset, self.length = span
+        super().__init__(path, ByteRange(offset, offset + self.length))
+
 
 class _ArchiveEntry:
     """One cached Comicbox + its per-path lock + last-access timestamp."""
@@ -84,6 +179,8 @@ class _ArchiveEntry:
         "last_access",
         "lock",
         "path",
+        "stored_spans",
+        "stored_spans_stat",
         "verdicts",
     )
 
@@ -100,6 +197,11 @@ class _ArchiveEntry:
         # free. Typed loosely to keep ``pdffile`` out of this module's
         # import surface.
         self.verdicts: dict[int, Any] = {}
+        # Per-page STORED zip member spans, resolved on first use by
+        # ``ArchiveCache.get_stored_span``. ``None`` until resolved;
+        # immutable afterwards so readers may use it without the lock.
+        self.stored_spans: tuple[StoredSpan | None, ...] | None = None
+        self.stored_spans_stat: ArchiveStat | None = None
 
     def close(self) -> None:
         """Close the cached archive; tolerate already-closed state."""
@@ -211,6 +313,43 @@ class ArchiveCache:
         with entry.lock:
             yield entry
 
+    def get_stored_span(
+        self, path: str, page: int, archive_stat: ArchiveStat
+    ) -> StoredSpan | None:
+        """
+        Return the ``(offset, length)`` of a STORED page member, if any.
+
+        The span table is resolved once per cached archive under the
+        per-archive lock; every later call reads the memo lock-free, so
+        concurrent readers of the same CBZ stream in parallel instead of
+        queueing behind ``_ArchiveEntry.lock``. ``archive_stat`` is the
+        caller's fresh ``(st_mtime_ns, st_size)``; a table read from a
+        since-rewritten archive is never used. Returns ``None`` for
+        compressed members, non-zip archives and when the cache is
+        disabled.
+        """
+        if not self.enabled:
+            return None
+        entry = self._open_or_get(path)
+        spans = entry.stored_spans
+        if spans is None:
+            with entry.lock:
+                if entry.stored_spans is None:
+                    try:
+                        stat, spans = _resolve_stored_spans(entry.comicbox)
+                    except Exception as exc:
+                        logger.debug(f"resolving stored spans for {path}: {exc}")
+                        stat, spans = None, ()
+                    entry.stored_spans_stat = stat
+                    entry.stored_spans = spans
+                spans = entry.stored_spans
+        if entry.stored_spans_stat != archive_stat:
+            return None
+        page_index = int(page)
+        if 0 <= page_index < len(spans):
+            return spans[page_index]
+        return None
+
     def shutdown(self) -> None:
         """Close every cached archive. Wired to ``atexit`` at module load."""
         with self._struct_lock:
@@ -0,0 +1,179 @@
+"""
+Resized and transcoded reader page derivatives.
+
+``ReaderPageView`` serves original page bytes unless the client asks for
+a ``?width=``. Then the page is downscaled to the next rung of a fixed
+width ladder and transcoded to the best format the client's ``Accept``
+header allows (AVIF, then WEBP, then JPEG). Snapping widths to a ladder
+keeps the number of distinct derivatives per page small, so the resize
+runs once per popular page and every later client is a cache hit.
+
+Rendering mirrors the cover pipeline (``codex.librarian.covers.create``):
+a lazily built ``ProcessPoolExecutor`` running a picklable top-level
+function, so the PIL decode + LANCZOS resize + encode stays off the
+request threads' GIL. Results land in ``derivative_cache``, a second
+``PageCache`` with its own root and byte budget that the cover thread
+purges alongside the original-page cache.
+
+Configuration knobs (env vars):
+
+* ``CODEX_READER_DERIVATIVE_WORKERS`` — render processes (default 2).
+* ``CODEX_READER_DERIVATIVE_CACHE_DISK_MB`` — disk budget (default 1024).
+* ``CODEX_READER_DERIVATIVE_CACHE_MEM_MB`` — memory budget (default 0, off).
+* ``CODEX_READER_DERIVATIVE_DISABLE`` — ignore ``?width=`` (default off).
+"""
+
+from __future__ import annotations
+
+import atexit
+import signal
+import threading
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from os import cpu_count
+from typing import Final
+
+from PIL import Image, features
+
+from codex.librarian.covers.path import PageCachePathMixin
+from codex.views.reader._archive_cache import _env_bool, _env_int
+from codex.views.reader._page_cache import _MB, PageCache
+
+_DEFAULT_WORKERS = min(cpu_count() or 1, 2)
+_DEFAULT_DISK_MB = 1024
+_DEFAULT_MEM_MB = 0
+_RENDER_TIMEOUT: Final = 60.0
+
+#: Derivative widths. Requests snap up to the next rung; anything wider
+#: than the last rung gets the last rung.
+WIDTH_LADDER: Final = (320, 480, 640, 800, 1080, 1280, 1600, 2048)
+
+FORMAT_AVIF: Final = "avif"
+FORMAT_WEBP: Final = "webp"
+FORMAT_JPEG: Final = "jpeg"
+_FORMAT_PREFERENCE: Final = (FORMAT_AVIF, FORMAT_WEBP)
+_PIL_FORMATS: Final = {FORMAT_AVIF: "AVIF", FORMAT_WEBP: "WEBP", FORMAT_JPEG: "JPEG"}
+_SAVE_KWARGS: Final = {
+    FORMAT_AVIF: {"quality": 60, "speed": 6},
+    FORMAT_WEBP: {"quality": 80, "method": 4},
+    FORMAT_JPEG: {"quality": 85, "optimize": True},
+}
+_ALPHA_MODES: Final = frozenset({"RGBA", "LA", "PA"})
+
+
+def _init_derivative_worker() -> None:
+    """Ignore SIGINT in workers, as ``covers.create._init_cover_worker`` does."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def render_page_derivative(args: tuple[bytes, int, str]) -> bytes:
+    """
+    Downscale and transcode one page image.
+
+    Picklable; runs inside a worker subprocess. Never upscales: pages
+    narrower than ``width`` are only transcoded.
+    """
+    data, width, fmt = args
+    with BytesIO(data) as image_io, Image.open(image_io) as img:
+        if img.width > width:
+            height = max(1, round(img.height * width / img.width))
+            img.thumbnail((width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+        out = img
+        if fmt == FORMAT_JPEG or img.mode not in _ALPHA_MODES:
+            out = img.convert("RGB") if img.mode != "RGB" else img
+        buf = BytesIO()
+        out.save(buf, _PIL_FORMATS[fmt], **_SAVE_KWARGS[fmt])
+    return buf.getvalue()
+
+
+def snap_width(width: int) -> int:
+    """Snap a requested width up to the derivative width ladder."""
+    index = min(bisect_left(WIDTH_LADDER, width), len(WIDTH_LADDER) - 1)
+    return WIDTH_LADDER[index]
+
+
+def _parse_accept(accept: str) -> dict[str, float]:
+    """Map each media range in an Accept header to its q value."""
+    qualities: dict[str, float] = {}
+    for media_range in accept.lower().split(","):
+        media_type, *params = (part.strip() for part in media_range.split(";"))
+        if not media_type:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[media_type] = max(quality, qualities.get(media_type, 0.0))
+    return qualities
+
+
+def negotiate_format(accept: str) -> str:
+    """
+    Pick the encoding the client prefers that Pillow supports.
+
+    Only explicitly listed types with a nonzero q count; ties go to the
+    smaller encoding. Everything else gets JPEG.
+    """
+    qualities = _parse_accept(accept)
+    best_fmt, best_quality = FORMAT_JPEG, 0.0
+    for fmt in _FORMAT_PREFERENCE:
+        quality = qualities.get(f"image/{fmt}", 0.0)
+        if quality > best_quality and features.check(fmt):
+            best_fmt, best_quality = fmt, quality
+    return best_fmt
+
+
+class DerivativeRenderer:
+    """Lazily built process pool for page derivative rendering."""
+
+    def __init__(
+        self, workers: int = _DEFAULT_WORKERS, *, enabled: bool = True
+    ) -> None:
+        self.workers = workers
+        self.enabled = enabled and workers > 0
+        self._lock = threading.Lock()
+        self._pool: ProcessPoolExecutor | None = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Spawn on first use; the pool lives until process exit."""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers, initializer=_init_derivative_worker
+                )
+            return self._pool
+
+    def render(self, data: bytes, width: int, fmt: str) -> bytes:
+        """Render one derivative, blocking the request until it's done."""
+        future = self._get_pool().submit(render_page_derivative, (data, width, fmt))
+        return future.result(timeout=_RENDER_TIMEOUT)
+
+    def shutdown(self) -> None:
+        """Shut the pool down. Wired to ``atexit`` at module load."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+# ── Module-level singletons ───────────────────────────────────────────
+
+derivative_renderer = DerivativeRenderer(
+    workers=_env_int("CODEX_READER_DERIVATIVE_WORKERS", _DEFAULT_WORKERS),
+    enabled=not _env_bool("CODEX_READER_DERIVATIVE_DISABLE", default=False),
+)
+
+derivative_cache = PageCache(
+    disk_max_bytes=_env_int("CODEX_READER_DERIVATIVE_CACHE_DISK_MB", _DEFAULT_DISK_MB)
+    * _MB,
+    mem_max_bytes=_env_int("CODEX_READER_DERIVATIVE_CACHE_MEM_MB", _DEFAULT_MEM_MB)
+    * _MB,
+    root=PageCachePathMixin.PAGE_DERIVATIVES_ROOT,
+)
+
+atexit.register(derivative_renderer.shutdown)
@@ -0,0 +1,266 @@
+"""
+Decoded page cache for the reader page endpoint.
+
+A tier below ``archive_cache``: where that cache keeps archives *open*,
+this one keeps the *extracted* page bytes so a page that many readers
+hit is served without re-entering the archive (and without taking the
+per-archive extraction lock) at all.
+
+Entries are keyed on ``PageCacheKey`` — comic pk, the archive file's
+``st_mtime_ns`` + ``st_size``, the zero-based page index and the serve
+mode. Rewriting the archive changes the stat half of the key, so a
+stale page can never be served even before the importer notices the
+change. The importer additionally purges a comic's whole page directory
+(via the cover thread's ``CoverRemoveTask`` handling, which already
+fires for every updated or deleted comic) so stale bytes don't linger
+on disk until LRU eviction catches up.
+
+Two size-bounded LRU tiers, both evicting by bytes:
+
+1. Disk — ``ROOT_CACHE_PATH/pages/<hex pk path>/<stat>-<page>-<serve>.<type>``.
+   Hits are returned as a path so the view can stream them with a
+   ``FileResponse`` (sendfile where the server supports it) instead of
+   copying through Python. The LRU index is in-process and rebuilt
+   lazily from a directory walk on first use.
+2. Memory — optional, off by default. Worth enabling on hosts with
+   spare RAM and slow cache disks.
+
+Configuration knobs (env vars):
+
+* ``CODEX_READER_PAGE_CACHE_DISK_MB`` — disk tier budget (default 512).
+* ``CODEX_READER_PAGE_CACHE_MEM_MB`` — memory tier budget (default 0, off).
+* ``CODEX_READER_PAGE_CACHE_DISABLE`` — bypass entirely (default off).
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import NamedTuple
+
+from loguru import logger
+
+from codex.librarian.covers.path import PageCachePathMixin
+from codex.views.reader._archive_cache import _env_bool, _env_int
+
+_MB = 1024 * 1024
+_DEFAULT_DISK_MB = 512
+_DEFAULT_MEM_MB = 0
+_TMP_SUFFIX = ".tmp"
+_FILENAME_FIELDS = 4
+
+
+class PageCacheKey(NamedTuple):
+    """Identity of one decoded page."""
+
+    pk: int
+    mtime_ns: int
+    size: int
+    page: int
+    serve: str
+
+    @classmethod
+    def from_path(cls, pk: int, path: str, page: int, serve: str) -> PageCacheKey:
+        """Build a key from the archive's current stat. Raises FileNotFoundError."""
+        st = Path(path).stat()
+        return cls(int(pk), st.st_mtime_ns, st.st_size, int(page), serve)
+
+    def replace(self, **changes) -> PageCacheKey:
+        """Return a copy of the key with ``changes`` applied."""
+        return self._replace(**changes)
+
+
+class _DiskEntry(NamedTuple):
+    path: Path
+    nbytes: int
+    content_type: str
+
+
+def _content_type_to_suffix(content_type: str) -> str:
+    return content_type.replace("/", "_", 1)
+
+
+def _suffix_to_content_type(suffix: str) -> str:
+    return suffix.replace("_", "/", 1)
+
+
+class PageCache(PageCachePathMixin):
+    """Process-wide, byte-bounded LRU of decoded reader pages."""
+
+    def __init__(
+        self,
+        disk_max_bytes: int = _DEFAULT_DISK_MB * _MB,
+        mem_max_bytes: int = _DEFAULT_MEM_MB * _MB,
+        *,
+        enabled: bool = True,
+        root: Path | None = None,
+    ) -> None:
+        self.root = root or self.PAGES_ROOT
+        self.disk_max_bytes = disk_max_bytes
+        self.mem_max_bytes = mem_max_bytes
+        self.enabled = enabled and bool(disk_max_bytes or mem_max_bytes)
+        self._lock = threading.Lock()
+        self._disk: OrderedDict[PageCacheKey, _DiskEntry] = OrderedDict()
+        self._disk_bytes = 0
+        self._disk_loaded = False
+        self._mem: OrderedDict[PageCacheKey, tuple[bytes, str]] = OrderedDict()
+        self._mem_bytes = 0
+
+    # ── Internals ──────────────────────────────────────────────────────
+
+    def _get_entry_path(self, key: PageCacheKey, content_type: str) -> Path:
+        suffix = _content_type_to_suffix(content_type)
+        name = f"{key.mtime_ns}-{key.size}-{key.page}-{key.serve}.{suffix}"
+        return self.get_page_cache_dir(key.pk, self.root) / name
+
+    def _parse_entry_path(self, path: Path) -> tuple[PageCacheKey, str] | None:
+        """Reverse ``_get_entry_path``. Returns None for foreign files."""
+        try:
+            hex_str = "".join(path.parent.relative_to(self.root).parts)
+            pk = int(hex_str, 16)
+            stem, suffix = path.name.split(".", 1)
+            mtime_ns, size, page, serve = stem.split("-", _FILENAME_FIELDS - 1)
+            key = PageCacheKey(pk, int(mtime_ns), int(size), int(page), serve)
+        except ValueError:
+            return None
+        return key, _suffix_to_content_type(suffix)
+
+    def _load_disk_index(self) -> None:
+        """Rebuild the disk LRU from a directory walk. Caller holds ``_lock``."""
+        self._disk_loaded = True
+        if not self.root.is_dir():
+            return
+        found: list[tuple[float, PageCacheKey, _DiskEntry]] = []
+        for root, _, filenames in self.root.walk():
+            for fn in filenames:
+                path = root / fn
+                if fn.endswith(_TMP_SUFFIX):
+                    path.unlink(missing_ok=True)
+                    continue
+                parsed = self._parse_entry_path(path)
+                if parsed is None:
+                    continue
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                key, content_type = parsed
+                found.append(
+                    (st.st_atime, key, _DiskEntry(path, st.st_size, content_type))
+                )
+        # Oldest access first so LRU order survives restarts.
+        found.sort(key=lambda item: item[0])
+        for _, key, entry in found:
+            self._disk[key] = entry
+            self._disk_bytes += entry.nbytes
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """Drop LRU disk entries over budget. Caller holds ``_lock``."""
+        while self._disk and self._disk_bytes > self.disk_max_bytes:
+            _, entry = self._disk.popitem(last=False)
+            self._disk_bytes -= entry.nbytes
+            try:
+                entry.path.unlink(missing_ok=True)
+            except OSError as exc:
+                logger.warning(f"evicting cached page {entry.path}: {exc}")
+
+    def _evict_mem(self) -> None:
+        """Drop LRU memory entries over budget. Caller holds ``_lock``."""
+        while self._mem and self._mem_bytes > self.mem_max_bytes:
+            _, (data, _) = self._mem.popitem(last=False)
+            self._mem_bytes -= len(data)
+
+    def _put_mem(self, key: PageCacheKey, data: bytes, content_type: str) -> None:
+        """Insert into the memory tier. Caller holds ``_lock``."""
+        if not self.mem_max_bytes or len(data) > self.mem_max_bytes:
+            return
+        if old := self._mem.pop(key, None):
+            self._mem_bytes -= len(old[0])
+        self._mem[key] = (data, content_type)
+        self._mem_bytes += len(data)
+        self._evict_mem()
+
+    def _write_disk(self, key: PageCacheKey, data: bytes, content_type: str) -> None:
+        """Atomically write one entry and index it."""
+        path = self._get_entry_path(key, content_type)
+        path.parent.mkdir(exist_ok=True, parents=True)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}{_TMP_SUFFIX}")
+        try:
+            with tmp_path.open("wb") as page_file:
+                page_file.write(data)
+            tmp_path.replace(path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        with self._lock:
+            if old := self._disk.pop(key, None):
+                self._disk_bytes -= old.nbytes
+            self._disk[key] = _DiskEntry(path, len(data), content_type)
+            self._disk_bytes += len(data)
+            self._evict_disk()
+
+    # ── Public API ─────────────────────────────────────────────────────
+
+    def get(self, key: PageCacheKey) -> tuple[bytes | Path, str] | None:
+        """
+        Return ``(bytes_or_path, content_type)`` or ``None`` on a miss.
+
+        Memory hits return bytes; disk hits return the cached file's
+        path for the caller to stream. A disk entry whose file has been
+        purged out from under the index (importer invalidation runs in
+        the librarian process) is dropped and reported as a miss.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            if (mem_hit := self._mem.get(key)) is not None:
+                self._mem.move_to_end(key)
+                return mem_hit
+            if not self.disk_max_bytes:
+                return None
+            if not self._disk_loaded:
+                self._load_disk_index()
+            entry = self._disk.get(key)
+            if entry is None:
+                return None
+            if not entry.path.is_file():
+                self._disk.pop(key)
+                self._disk_bytes -= entry.nbytes
+                return None
+            self._disk.move_to_end(key)
+        return entry.path, entry.content_type
+
+    def put(self, key: PageCacheKey, data: bytes, content_type: str) -> None:
+        """Cache freshly extracted page bytes in every enabled tier."""
+        if not self.enabled or not data:
+            return
+        with self._lock:
+            self._put_mem(key, data, content_type)
+            if not self.disk_max_bytes or len(data) > self.disk_max_bytes:
+                return
+            if not self._disk_loaded:
+                self._load_disk_index()
+        try:
+            self._write_disk(key, data, content_type)
+        except OSError as exc:
+            logger.warning(f"caching page {key}: {exc}")
+
+    def clear(self) -> None:
+        """Forget every in-process entry. Useful for tests."""
+        with self._lock:
+            self._mem.clear()
+            self._mem_bytes = 0
+            self._disk.clear()
+            self._disk_bytes = 0
+            self._disk_loaded = False
+
+
+# ── Module-level singleton ────────────────────────────────────────────
+
+page_cache = PageCache(
+    disk_max_bytes=_env_int("CODEX_READER_PAGE_CACHE_DISK_MB", _DEFAULT_DISK_MB) * _MB,
+    mem_max_bytes=_env_int("CODEX_READER_PAGE_CACHE_MEM_MB", _DEFAULT_MEM_MB) * _MB,
+    enabled=not _env_bool("CODEX_READER_PAGE_CACHE_DISABLE", default=False),
+)
@@ -0,0 +1,200 @@
+"""
+Server-side read-ahead for the reader page endpoint.
+
+``ReaderPageView`` reports every page hit here. When a reader (keyed on
+the same ``(auth_key, comic_pk)`` as ``page_acl_cache``) turns pages
+forward, the next few pages are extracted speculatively on a small
+background thread pool and parked in ``page_cache``. By the time the
+next page turn arrives its bytes are usually a cache hit, so slow-disk
+CBR extraction happens between page turns instead of during them.
+
+Only archive pages that go through full extraction are prefetched —
+STORED zip members already stream zero-copy and PDFs depend on the
+serve mode. Prefetch is a no-op while ``page_cache`` is disabled, since
+there would be nowhere to put the bytes.
+
+In-flight work is bounded by a memory budget: a small fraction of
+``codex.librarian.memory.read_mem_limit`` divided by the running mean
+page size. A foreground request for a page that is being prefetched
+waits on that prefetch instead of extracting it a second time.
+
+Configuration knobs (env vars):
+
+* ``CODEX_READER_PREFETCH_PAGES`` — pages to read ahead (default 3).
+* ``CODEX_READER_PREFETCH_WORKERS`` — extraction threads (default 2).
+* ``CODEX_READER_PREFETCH_DISABLE`` — bypass entirely (default off).
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import suppress
+from typing import Final
+
+from loguru import logger
+
+from codex.librarian.memory import read_mem_limit
+from codex.views.reader._archive_cache import _env_bool, _env_int, archive_cache
+from codex.views.reader._page_cache import PageCacheKey, page_cache
+
+_DEFAULT_PAGES = 3
+_DEFAULT_WORKERS = 2
+# Readers tracked for sequential-access detection.
+_MAX_READERS = 256
+# A forward step of one page, or two in two-page spread mode.
+_MAX_SEQUENTIAL_STEP = 2
+# Share of the memory budget in-flight prefetched pages may hold.
+_MEM_BUDGET_FRACTION: Final = 0.02
+# Seed for the running mean page size until real pages are measured.
+_INITIAL_PAGE_BYTES: Final = 2 * 1024 * 1024
+_JOIN_TIMEOUT: Final = 10.0
+_JPEG_CONTENT_TYPE: Final = "image/jpeg"
+
+
+class ReadAhead:
+    """Detect sequential page turns and extract the next pages early."""
+
+    def __init__(
+        self,
+        pages: int = _DEFAULT_PAGES,
+        workers: int = _DEFAULT_WORKERS,
+        *,
+        enabled: bool = True,
+    ) -> None:
+        self.pages = pages
+        self.workers = workers
+        self.enabled = enabled and pages > 0 and workers > 0
+        self._lock = threading.Lock()
+        self._last_pages: OrderedDict[tuple, int] = OrderedDict()
+        self._inflight: dict[PageCacheKey, Future] = {}
+        self._mean_page_bytes = float(_INITIAL_PAGE_BYTES)
+        self._mem_budget: float | None = None
+        self._pool: ThreadPoolExecutor | None = None
+
+    # ── Internals ──────────────────────────────────────────────────────
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Lazy-build the pool so idle servers never spawn the threads."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="reader-prefetch"
+            )
+        return self._pool
+
+    def _max_inflight(self) -> int:
+        """Pages that fit the memory budget at the current mean size."""
+        if self._mem_budget is None:
+            self._mem_budget = read_mem_limit() * _MEM_BUDGET_FRACTION
+        return max(1, int(self._mem_budget // self._mean_page_bytes))
+
+    def _is_sequential(self, reader_key: tuple, page: int) -> bool:
+        """Record ``page`` and report whether it continued a forward read."""
+        last = self._last_pages.pop(reader_key, None)
+        self._last_pages[reader_key] = page
+        while len(self._last_pages) > _MAX_READERS:
+            self._last_pages.popitem(last=False)
+        return last is not None and 0 < page - last <= _MAX_SEQUENTIAL_STEP
+
+    def _extract(self, path: str, key: PageCacheKey) -> None:
+        """Worker body: extract one page into ``page_cache``."""
+        try:
+            with archive_cache.open(path) as cb:
+                if key.page >= cb.get_page_count():
+                    return
+                page_image = cb.get_page_by_index(key.page, pdf_format="")
+            if page_image:
+                with self._lock:
+                    # Exponential moving mean keeps the budget honest for
+                    # books with unusually large scans.
+                    self._mean_page_bytes = 0.8 * self._mean_page_bytes + 0.2 * len(
+                        page_image
+                    )
+                page_cache.put(key, page_image, _JPEG_CONTENT_TYPE)
+        except Exception as exc:
+            logger.debug(f"Reader prefetch {path} page {key.page}: {exc}")
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    @staticmethod
+    def _needs_extract(path: str, key: PageCacheKey, *, is_zip: bool) -> bool:
+        """Whether ``key`` is neither cached nor zero-copy streamable."""
+        if page_cache.get(key) is not None:
+            return False
+        if not is_zip:
+            return True
+        archive_stat = (key.mtime_ns, key.size)
+        return archive_cache.get_stored_span(path, key.page, archive_stat) is None
+
+    # ── Public API ─────────────────────────────────────────────────────
+
+    def note_access(
+        self, reader_key: tuple, path: str, key: PageCacheKey, *, is_zip: bool
+    ) -> None:
+        """
+        Record a foreground page hit and schedule read-ahead if sequential.
+
+        ``key`` is the page just served; the pages after it share its
+        comic pk, archive stat and serve mode. ``is_zip`` says whether
+        the archive can have zero-copy STORED members. The cache probes
+        run outside ``_lock`` because resolving stored spans may wait on
+        the per-archive lock.
+        """
+        if not self.enabled or not page_cache.enabled:
+            return
+        with self._lock:
+            if not self._is_sequential((reader_key, key.pk), key.page):
+                return
+            ahead_keys = [
+                ahead_key
+                for page in range(key.page + 1, key.page + 1 + self.pages)
+                if (ahead_key := key.replace(page=page)) not in self._inflight
+            ]
+        ahead_keys = [
+            k for k in ahead_keys if self._needs_extract(path, k, is_zip=is_zip)
+        ]
+        if not ahead_keys:
+            return
+        with self._lock:
+            max_inflight = self._max_inflight()
+            for ahead_key in ahead_keys:
+                if len(self._inflight) >= max_inflight:
+                    break
+                if ahead_key in self._inflight:
+                    continue
+                self._inflight[ahead_key] = self._get_pool().submit(
+                    self._extract, path, ahead_key
+                )
+
+    def join(self, key: PageCacheKey) -> None:
+        """Wait for an in-flight prefetch of ``key``, if there is one."""
+        with self._lock:
+            future = self._inflight.get(key)
+        if future is None:
+            return
+        with suppress(FutureTimeoutError):
+            future.result(timeout=_JOIN_TIMEOUT)
+
+    def shutdown(self) -> None:
+        """Drop queued prefetches. Wired to ``atexit`` at module load."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self._inflight.clear()
+            self._last_pages.clear()
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+# ── Module-level singleton ────────────────────────────────────────────
+
+read_ahead = ReadAhead(
+    pages=_env_int("CODEX_READER_PREFETCH_PAGES", _DEFAULT_PAGES),
+    workers=_env_int("CODEX_READER_PREFETCH_WORKERS", _DEFAULT_WORKERS),
+    enabled=not _env_bool("CODEX_READER_PREFETCH_DISABLE", default=False),
+)
+
+atexit.register(read_ahead.shutdown)
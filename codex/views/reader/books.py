@@ -113,6 +113,11 @@ class ReaderBooksView(ReaderArcsView, SharedAnnotationsMixin, BookmarkAuthMixin)
                 else Collection.SERIES
             )
             show = self.get_from_settings("show", browser=True)
+            if model is Comic and self.sort_key_applies(
+                parent_collection, self._selected_arc_ids, show
+            ):
+                # The browser's order, read from the (series, sort_key) index.
+                return sort_name_annotations, (*ordering, "sort_key", "pk")
             sort_name_annotations = self.get_sort_name_annotations(
                 model, parent_collection, self._selected_arc_ids, show
             )
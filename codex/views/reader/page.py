@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import time
-from typing import TYPE_CHECKING, Final
+from typing import TYPE_CHECKING, BinaryIO, Final
 
 from comicbox.exceptions import ComicboxError
-from django.http import HttpResponse
+from django.http import FileResponse, HttpResponse
+from django.utils.cache import patch_vary_headers
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from loguru import logger
@@ -19,9 +20,22 @@ from codex.models.choices import FileTypeChoices
 from codex.models.comic import Comic
 from codex.views.auth import AuthFilterAPIView
 from codex.views.bookmark import BookmarkAuthMixin
-from codex.views.reader._archive_cache import archive_cache, page_acl_cache
+from codex.views.reader._archive_cache import (
+    StoredMemberReader,
+    archive_cache,
+    page_acl_cache,
+)
+from codex.views.reader._derivative import (
+    derivative_cache,
+    derivative_renderer,
+    negotiate_format,
+    snap_width,
+)
+from codex.views.reader._page_cache import PageCache, PageCacheKey, page_cache
+from codex.views.reader._prefetch import read_ahead
 
 if TYPE_CHECKING:
+    from django.http.response import HttpResponseBase
     from pdffile import PageVerdict
 
     from codex.views.reader._archive_cache import _ArchiveEntry
@@ -43,6 +57,19 @@ _SERVE_PDF: Final[str] = "pdf"
 _SERVE_IMAGE: Final[str] = "image"
 _SERVE_HINTS: Final[frozenset[str]] = frozenset({_SERVE_AUTO, _SERVE_PDF, _SERVE_IMAGE})
 
+#: Query-parameter that opts into a resized, transcoded derivative.
+_WIDTH_PARAM: Final[str] = "width"
+
+
+def _read_page_bytes(page_image: bytes | BinaryIO | StoredMemberReader) -> bytes:
+    """Drain a streamable page into bytes."""
+    if isinstance(page_image, bytes):
+        return page_image
+    try:
+        return page_image.read()
+    finally:
+        page_image.close()
+
 
 class ReaderPageView(BookmarkAuthMixin, AuthFilterAPIView):
     """Display a comic page from the archive itself."""
@@ -67,6 +94,13 @@ class ReaderPageView(BookmarkAuthMixin, AuthFilterAPIView):
         task = BookmarkUpdateTask(auth_filter, comic_pks, updates)
         LIBRARIAN_QUEUE.put(task)
 
+    def _get_auth_key(self) -> tuple:
+        """Identify the reader for the per-reader caches."""
+        auth_filter = self.get_bookmark_auth_filter()
+        # ``auth_filter`` is one of ``{"user_id": pk}`` or
+        # ``{"session_id": key}``; flatten to a hashable tuple.
+        return next(iter(auth_filter.items()))
+
     def _resolve_path_and_type(self, pk) -> tuple[str, str | None]:
         """
         Resolve ``(path, file_type)`` for the requested comic, ACL-filtered.
@@ -79,11 +113,7 @@ class ReaderPageView(BookmarkAuthMixin, AuthFilterAPIView):
         making the explicit ``.distinct()`` on a single-row fetch
         redundant (sub-plan 03 #6).
         """
-        auth_filter = self.get_bookmark_auth_filter()
-        # ``auth_filter`` is one of ``{"user_id": pk}`` or
-        # ``{"session_id": key}``; flatten to a hashable tuple.
-        auth_key = next(iter(auth_filter.items()))
-        cache_key = (auth_key, pk)
+        cache_key = (self._get_auth_key(), pk)
         now = time.monotonic()
         cached = page_acl_cache.get(cache_key, now)
         if cached is not None:
@@ -100,6 +130,16 @@ class ReaderPageView(BookmarkAuthMixin, AuthFilterAPIView):
         raw = self.request.GET.get(_SERVE_PARAM, _SERVE_AUTO).lower()
         return raw if raw in _SERVE_HINTS else _SERVE_AUTO
 
+    def _derivative_width(self) -> int | None:
+        """Return the snapped ``?width=`` if a derivative was requested."""
+        if not derivative_renderer.enabled:
+            return None
+        try:
+            width = int(self.request.GET.get(_WIDTH_PARAM, 0))
+        except ValueError:
+            return None
+        return snap_width(width) if width > 0 else None
+
     @staticmethod
     def _classify_cached(entry: _ArchiveEntry, pdf: PDFFile, page: int) -> PageVerdict:
         """Memoize ``pdf.classify_page`` on the cache entry."""
@@ -150,16 +190,10 @@ class ReaderPageView(BookmarkAuthMixin, AuthFilterAPIView):
             blob, ext = served
             return blob, f"image/{ext}"
 
-    def _get_page_image(self) -> tuple[bytes, str]:
-        """Get the image data and content type."""
-        pk = self.kwargs.get("pk")
-        path, file_type = self._resolve_path_and_type(pk)
-
-        page = self.kwargs.get("page")
-        serve_hint = self._serve_hint()
-
-        is_pdf = file_type == FileTypeChoices.PDF.value  # pyright: ignore[reportAttributeAccessIssue]  # ty: ignore[unresolved-attribute]
-
+    def _extract_page_image(
+        self, path: str, page: int, serve_hint: str, *, is_pdf: bool
+    ) -> tuple[bytes, str]:
+        """Extract the image data and content type from the archive."""
         # Image-dominant fast path for PDFs (skipped when the caller
         # forces ``?serve=pdf``).
         if is_pdf and serve_hint != _SERVE_PDF:
@@ -182,6 +216,128 @@ class ReaderPageView(BookmarkAuthMixin, AuthFilterAPIView):
         content_type = _PDF_MIME_TYPE if is_pdf else self.content_type
         return page_image, content_type
 
+    @staticmethod
+    def _get_cached_page(
+        key: PageCacheKey, cache: PageCache = page_cache
+    ) -> tuple[bytes | BinaryIO, str] | None:
+        """Return cached page bytes or an open cached file, else ``None``."""
+        if not (cached := cache.get(key)):
+            return None
+        data, content_type = cached
+        if isinstance(data, bytes):
+            return data, content_type
+        # Disk hit: hand back an open file to stream. The librarian may
+        # have purged it since the index lookup; treat that as a miss.
+        try:
+            return data.open("rb"), content_type
+        except FileNotFoundError:
+            return None
+
+    def _load_page_image(
+        self, path: str, key: PageCacheKey, *, is_pdf: bool, is_zip: bool
+    ) -> tuple[bytes | BinaryIO | StoredMemberReader, str]:
+        """Fetch from cache, stream, or extract the page for ``key``."""
+        if cached := self._get_cached_page(key):
+            return cached
+        if is_zip:
+            # Only zips have STORED members; resolving the span opens
+            # the archive, so it waits for a cache miss.
+            archive_stat = (key.mtime_ns, key.size)
+            span = archive_cache.get_stored_span(path, key.page, archive_stat)
+            if span is not None:
+                return StoredMemberReader(path, span), self.content_type
+        if not is_pdf:
+            # A read-ahead worker may be extracting this very page; wait
+            # for it rather than extracting it twice.
+            read_ahead.join(key)
+            if cached := self._get_cached_page(key):
+                return cached
+
+        page_image, content_type = self._extract_page_image(
+            path, key.page, key.serve, is_pdf=is_pdf
+        )
+        page_cache.put(key, page_image, content_type)
+        return page_image, content_type
+
+    def _load_derivative(
+        self, path: str, key: PageCacheKey, width: int, *, is_pdf: bool, is_zip: bool
+    ) -> tuple[bytes | BinaryIO | StoredMemberReader, str]:
+        """
+        Serve a downscaled, transcoded derivative of the page for ``key``.
+
+        Rendered once per (page, width rung, format) in the derivative
+        process pool and cached. Pages that come back as PDFs, or fail
+        to render, are served as the original.
+        """
+        fmt = negotiate_format(self.request.headers.get("Accept", ""))
+        derivative_key = key.replace(serve=f"{key.serve}+w{width}+{fmt}")
+        if cached := self._get_cached_page(derivative_key, derivative_cache):
+            return cached
+
+        page_image, content_type = self._load_page_image(
+            path, key, is_pdf=is_pdf, is_zip=is_zip
+        )
+        if content_type == _PDF_MIME_TYPE:
+            return page_image, content_type
+        data = _read_page_bytes(page_image)
+        if not data:
+            return data, content_type
+        try:
+            rendered = derivative_renderer.render(data, width, fmt)
+        except Exception as exc:
+            logger.warning(
+                f"Rendering {width}px {fmt} page derivative for {path}: {exc}"
+            )
+            return data, content_type
+        derivative_content_type = f"image/{fmt}"
+        derivative_cache.put(derivative_key, rendered, derivative_content_type)
+        return rendered, derivative_content_type
+
+    def _get_page_image(self) -> tuple[bytes | BinaryIO | StoredMemberReader, str]:
+        """
+        Get the image data (or an open file-like to stream) and content type.
+
+        The decoded page cache is consulted first so popular pages skip
+        the archive and its per-archive lock entirely. The key carries
+        the archive's current mtime + size, so a rewritten archive
+        misses. On a miss, STORED zip members stream straight from the
+        archive file, lock free. A ``?width=`` request is served a
+        resized derivative instead. Forward page turns then schedule
+        server-side read-ahead of the following pages.
+        """
+        pk = self.kwargs.get("pk")
+        path, file_type = self._resolve_path_and_type(pk)
+
+        page = self.kwargs.get("page")
+        is_pdf = file_type == FileTypeChoices.PDF.value  # pyright: ignore[reportAttributeAccessIssue]  # ty: ignore[unresolved-attribute]
+        is_zip = file_type == FileTypeChoices.CBZ.value  # pyright: ignore[reportAttributeAccessIssue]  # ty: ignore[unresolved-attribute]
+        # The serve hint only changes the output for PDFs; collapse it
+        # for everything else so every ``?serve=`` shares one entry.
+        serve_hint = self._serve_hint() if is_pdf else _SERVE_AUTO
+
+        key = PageCacheKey.from_path(pk, path, page, serve_hint)
+        if (width := self._derivative_width()) is not None:
+            result = self._load_derivative(
+                path, key, width, is_pdf=is_pdf, is_zip=is_zip
+            )
+        else:
+            result = self._load_page_image(path, key, is_pdf=is_pdf, is_zip=is_zip)
+        if not is_pdf:
+            read_ahead.note_access(self._get_auth_key(), path, key, is_zip=is_zip)
+        return result
+
+    @staticmethod
+    def _page_response(
+        page_image: bytes | BinaryIO | StoredMemberReader, content_type: str
+    ) -> HttpResponseBase:
+        """Wrap page bytes, or stream a file-like without copying it."""
+        if isinstance(page_image, bytes):
+            return HttpResponse(page_image, content_type=content_type)
+        response = FileResponse(page_image, content_type=content_type)
+        if isinstance(page_image, StoredMemberReader):
+            response["Content-Length"] = str(page_image.length)
+        return response
+
     @extend_schema(
         parameters=[
             OpenApiParameter("bookmark", OpenApiTypes.BOOL, default=True),
@@ -196,15 +352,26 @@ class ReaderPageView(BookmarkAuthMixin, AuthFilterAPIView):
                     "'image' (always rasterize). Ignored for non-PDF archives."
                 ),
             ),
+            OpenApiParameter(
+                _WIDTH_PARAM,
+                OpenApiTypes.INT,
+                required=False,
+                description=(
+                    "Serve a downscaled derivative at least this wide, "
+                    "transcoded to the best format the Accept header allows "
+                    "(AVIF, WEBP, else JPEG). Omit for the original page."
+                ),
+            ),
         ],
         responses={
             (200, content_type): OpenApiTypes.BINARY,
             (200, "image/png"): OpenApiTypes.BINARY,
             (200, "image/webp"): OpenApiTypes.BINARY,
+            (200, "image/avif"): OpenApiTypes.BINARY,
             (200, _PDF_MIME_TYPE): OpenApiTypes.BINARY,
         },
     )
-    def get(self, *_args, **_kwargs) -> HttpResponse:
+    def get(self, *_args, **_kwargs) -> HttpResponseBase:
         """Get the comic page from the archive."""
         try:
             page_image, content_type = self._get_page_image()
@@ -221,4 +388,8 @@ class ReaderPageView(BookmarkAuthMixin, AuthFilterAPIView):
             logger.warning(exc)
             raise NotFound(detail="comic page not found") from exc
         else:
-            return HttpResponse(page_image, content_type=content_type)
+            response = self._page_response(page_image, content_type)
+            if self._derivative_width() is not None:
+                # The encoding was negotiated from Accept.
+                patch_vary_headers(response, ("Accept",))
+            return response
@@ -54,8 +54,16 @@ export const getBrowserHref = ({ collection, pks, query }) => {
   return `${APP_BASE}${hrefPath}/1?${queryString}`;
 };
 
-export const getCoverSrc = ({ coverPk, coverCustomPk }, ts) => {
-  const query = ts ? `?ts=${ts}` : "";
+export const getCoverSrc = ({ coverPk, coverCustomPk }, ts, size) => {
+  const params = new URLSearchParams();
+  if (ts) {
+    params.set("ts", ts);
+  }
+  if (size) {
+    params.set("size", size);
+  }
+  const queryString = params.toString();
+  const query = queryString ? `?${queryString}` : "";
   if (coverCustomPk) {
     return `${V4_BASE}covers/custom/${coverCustomPk}${query}`;
   }
@@ -65,6 +73,103 @@ export const getCoverSrc = ({ coverPk, coverCustomPk }, ts) => {
   return `${V4_BASE}covers/comic/${coverPk}${query}`;
 };
 
+/*
+ * Cover batching. Every card mounted in the same tick joins one
+ * ``covers/batch`` request instead of fetching its own cover. The pack
+ * is a uint32 big-endian index length, a JSON index, then the
+ * concatenated WEBP bytes the index points into.
+ */
+const MAX_BATCH_COVERS = 256;
+let _coverBatch = null;
+
+// Batched covers are fetched at the size the display needs.
+const _coverBatchSize = () => (globalThis.devicePixelRatio > 1 ? "2x" : "");
+
+const _coverBatchKey = (source, pk) => `${source}:${pk}`;
+
+const _unpackCovers = (buf) => {
+  const view = new DataView(buf);
+  const indexLength = view.getUint32(0);
+  const dataStart = 4 + indexLength;
+  const index = JSON.parse(
+    new TextDecoder().decode(new Uint8Array(buf, 4, indexLength)),
+  );
+  const covers = new Map();
+  for (const { source, pk, status, offset, length } of index.covers) {
+    const start = dataStart + offset;
+    const blob = length
+      ? new Blob([buf.slice(start, start + length)], { type: "image/webp" })
+      : null;
+    covers.set(_coverBatchKey(source, pk), { status, blob });
+  }
+  return covers;
+};
+
+const _flushCoverBatch = async (batch) => {
+  if (_coverBatch === batch) {
+    _coverBatch = null;
+  }
+  const params = new URLSearchParams();
+  for (const source of ["comic", "custom"]) {
+    if (batch.pks[source].size) {
+      params.set(source, [...batch.pks[source]].join(","));
+    }
+  }
+  if (batch.ts) {
+    params.set("ts", batch.ts);
+  }
+  const size = _coverBatchSize();
+  if (size) {
+    params.set("size", size);
+  }
+  let covers = new Map();
+  try {
+    const resp = await fetch(`${V4_BASE}covers/batch?${params}`, {
+      credentials: "same-origin",
+    });
+    if (resp.ok) {
+      covers = _unpackCovers(await resp.arrayBuffer());
+    }
+  } catch {
+    // Fall through: waiters fetch their covers individually.
+  }
+  for (const [key, resolvers] of batch.waiters) {
+    const cover = covers.get(key) ?? { status: 0, blob: null };
+    for (const resolve of resolvers) {
+      resolve(cover);
+    }
+  }
+};
+
+/*
+ * Resolve to ``{ status, blob }`` for one card's cover, where status is
+ * what the single cover route would have answered (200, 202, 404) or 0
+ * if the batch failed.
+ */
+export const getBatchedCover = ({ coverPk, coverCustomPk }, ts) => {
+  const source = coverCustomPk ? "custom" : "comic";
+  const pk = coverCustomPk || coverPk;
+  if (!_coverBatch || _coverBatch.size >= MAX_BATCH_COVERS) {
+    const newBatch = {
+      pks: { comic: new Set(), custom: new Set() },
+      waiters: new Map(),
+      size: 0,
+      ts: 0,
+    };
+    _coverBatch = newBatch;
+    setTimeout(() => _flushCoverBatch(newBatch), 0);
+  }
+  const batch = _coverBatch;
+  const key = _coverBatchKey(source, pk);
+  if (!batch.waiters.has(key)) {
+    batch.waiters.set(key, []);
+    batch.pks[source].add(pk);
+    batch.size += 1;
+  }
+  batch.ts = Math.max(batch.ts, ts || 0);
+  return new Promise((resolve) => batch.waiters.get(key).push(resolve));
+};
+
 const PLACEHOLDER_BY_GROUP = Object.freeze({
   publishers: "publisher",
   imprints: "imprint",
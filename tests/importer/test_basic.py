@@ -80,6 +80,7 @@ LIBRARY_PATH = TMP_DIR
 FILES_DIR = Path(__file__).parent.parent / "files"
 COMIC_PATH = FILES_DIR / "comicbox-2-example.cbz"
 PATH = str(LIBRARY_PATH / "test.cbz")
+FINGERPRINT = "4a932-87bdfd82d5dce3dc9303df0882217c73"
 PATH_PARENTS = {(str(Path(PATH).parent),)}
 PATH_PARENTS_QUERY = {(str(Path(PATH).parent),): set()}
 COMPLEX_FIELD_NAMES = frozenset(
@@ -196,6 +197,7 @@ AGGREGATED = MappingProxyType(
                 "day": 1,
                 # ext ignore
                 "file_type": "CBZ",
+                "fingerprint": FINGERPRINT,
                 "issue_number": Decimal("1.2"),
                 "issue_suffix": "S",
                 "metadata_mtime": datetime(2026, 7, 1, 12, 0, 0, tzinfo=UTC),
@@ -291,6 +293,7 @@ QUERIED = MappingProxyType(
                 "community_rating_count": 128,
                 "day": 1,
                 "file_type": "CBZ",
+                "fingerprint": FINGERPRINT,
                 "issue_number": Decimal("1.2"),
                 "issue_suffix": "S",
                 "metadata_mtime": datetime(2026, 7, 1, 12, 0, 0, tzinfo=UTC),
@@ -456,6 +459,7 @@ CREATED_FK = MappingProxyType(
                 "community_rating_count": 128,
                 "day": 1,
                 "file_type": "CBZ",
+                "fingerprint": FINGERPRINT,
                 "issue_number": Decimal("1.2"),
                 "issue_suffix": "S",
                 "metadata_mtime": datetime(2026, 7, 1, 12, 0, 0, tzinfo=UTC),
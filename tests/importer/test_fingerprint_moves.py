@@ -0,0 +1,105 @@
+"""A delete and a create of the same archive become a move."""
+
+import shutil
+from pathlib import Path
+from threading import Event, Lock
+from typing import override
+
+from loguru import logger
+
+from codex.librarian.mp_queue import LIBRARIAN_QUEUE
+from codex.librarian.scribe.importer.fingerprint import get_fingerprint
+from codex.librarian.scribe.importer.importer import ComicImporter
+from codex.librarian.scribe.importer.tasks import ImportTask
+from codex.librarian.scribe.janitor.janitor import Janitor
+from codex.models import (
+    Comic,
+    Folder,
+    Imprint,
+    Library,
+    Publisher,
+    Series,
+    Volume,
+)
+from tests.importer.test_basic import (
+    COMIC_PATH,
+    FINGERPRINT,
+    LIBRARY_PATH,
+    PATH,
+    BaseTestImporter,
+)
+
+_NEW_PATH = str(LIBRARY_PATH / "copied.cbz")
+_DUPE_PATH = str(LIBRARY_PATH / "copied-again.cbz")
+
+
+class TestImporterFingerprintMoves(BaseTestImporter):
+    """Deleted comics pair with created files that have the same contents."""
+
+    @override
+    def setUp(self) -> None:
+        super().setUp()
+        shutil.copy(COMIC_PATH, PATH)
+        library = Library.objects.get(pk=self.task.library_id)
+        folder = Folder.objects.create(
+            library=library, path=str(Path(PATH).parent), name=LIBRARY_PATH.name
+        )
+        pub = Publisher.objects.create(name="FP Pub")
+        imp = Imprint.objects.create(name="FP Imprint", publisher=pub)
+        ser = Series.objects.create(name="FP Series", imprint=imp, publisher=pub)
+        vol = Volume.objects.create(name="1", series=ser, imprint=imp, publisher=pub)
+        self.comic: Comic = Comic.objects.create(
+            library=library,
+            path=PATH,
+            parent_folder=folder,
+            issue_number=1,
+            name="before",
+            publisher=pub,
+            imprint=imp,
+            series=ser,
+            volume=vol,
+            size=1,
+            page_count=1,
+            fingerprint=FINGERPRINT,
+        )
+        # A copy, not a rename, so the inode differs.
+        shutil.copy(PATH, _NEW_PATH)
+        Path(PATH).unlink()
+
+    def _move(self, files_created: frozenset[str]) -> ComicImporter:
+        task = ImportTask(
+            library_id=self.task.library_id,
+            files_created=files_created,
+            files_deleted=frozenset({PATH}),
+        )
+        importer = ComicImporter(task, logger, LIBRARIAN_QUEUE, Lock(), Event())
+        importer.move_and_modify_dirs()
+        return importer
+
+    def test_fingerprint(self) -> None:
+        assert get_fingerprint(COMIC_PATH) == FINGERPRINT
+
+    def test_copy_delete_is_move(self) -> None:
+        importer = self._move(frozenset({_NEW_PATH}))
+
+        assert not importer.task.files_created
+        assert not importer.task.files_deleted
+        comic = Comic.objects.get(path=_NEW_PATH)
+        assert comic.pk == self.comic.pk
+        assert comic.stat[1] == Path(_NEW_PATH).stat().st_ino
+
+    def test_ambiguous_is_not_move(self) -> None:
+        shutil.copy(_NEW_PATH, _DUPE_PATH)
+        created = frozenset({_NEW_PATH, _DUPE_PATH})
+        importer = self._move(created)
+
+        assert importer.task.files_created == created
+        assert importer.task.files_deleted == frozenset({PATH})
+        assert Comic.objects.get(pk=self.comic.pk).path == PATH
+
+    def test_janitor_backfills_missing_fingerprints(self) -> None:
+        Comic.objects.filter(pk=self.comic.pk).update(path=_NEW_PATH, fingerprint="")
+        janitor = Janitor(logger, LIBRARIAN_QUEUE, Lock(), Event())
+        janitor.backfill_fingerprints()
+
+        assert Comic.objects.get(pk=self.comic.pk).fingerprint == FINGERPRINT
@@ -0,0 +1,48 @@
+"""Initial load imports defer indexes and build the search index at the end."""
+
+from django.db import connection
+
+from codex.librarian.scribe.importer.const import FTS_CREATE
+from codex.librarian.scribe.importer.pragmas import (
+    DEFERRED_INDEXES_PATH,
+    _defer_indexes,
+    restore_deferred_indexes,
+)
+from codex.models import Comic
+from codex.models.comic import ComicFTS, ComicFTSChange
+from tests.importer.test_basic import PATH, BaseTestImporter, run_full_import
+
+_INDEX_NAMES_SQL = (
+    "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = %s"
+)
+
+
+def _get_comic_index_names() -> frozenset[str]:
+    with connection.cursor() as cursor:
+        cursor.execute(_INDEX_NAMES_SQL, (Comic._meta.db_table,))
+        return frozenset(row[0] for row in cursor.fetchall())
+
+
+class TestInitialLoad(BaseTestImporter):
+    def test_defer_and_restore_indexes(self):
+        index_names = _get_comic_index_names()
+        try:
+            sqls = _defer_indexes()
+            assert sqls
+            assert DEFERRED_INDEXES_PATH.exists()
+            deferred_names = _get_comic_index_names()
+            assert deferred_names < index_names
+            # The upsert's unique index stays.
+            assert deferred_names
+        finally:
+            restore_deferred_indexes()
+        assert not DEFERRED_INDEXES_PATH.exists()
+        assert _get_comic_index_names() == index_names
+
+    def test_search_index_built_at_end(self):
+        self.importer.initial_load = True
+        run_full_import(self.importer)
+        comic = Comic.objects.get(path=PATH)
+        assert FTS_CREATE not in self.importer.metadata
+        assert ComicFTS.objects.filter(comic_id=comic.pk).exists()
+        assert not ComicFTSChange.objects.exists()
@@ -0,0 +1,48 @@
+"""Reference data keys interned across import chunks."""
+
+from typing import Final
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from codex.librarian.scribe.importer.intern import KeyInternCache
+from codex.models import Folder, Publisher
+
+_INTERN: Final = "codex.librarian.scribe.importer.intern"
+_RELS: Final = ("name",)
+# Four keys at the default memory fraction.
+_MEM_LIMIT: Final = 256 * 4 / 0.02
+
+
+class TestKeyInternCache(SimpleTestCase):
+    def setUp(self):
+        with patch(f"{_INTERN}.get_mem_limit", return_value=_MEM_LIMIT):
+            self.cache = KeyInternCache()
+        self.queried: list[set[tuple]] = []
+
+    def _query(self, keys: set[tuple]) -> dict[tuple, int]:
+        self.queried.append(keys)
+        return {key: ord(key[0][0]) for key in keys}
+
+    def test_query_only_new_keys(self):
+        first = self.cache.resolve(Publisher, _RELS, {("a",), ("b",)}, self._query)
+        second = self.cache.resolve(Publisher, _RELS, {("b",), ("c",)}, self._query)
+        assert first == {("a",): ord("a"), ("b",): ord("b")}
+        assert second == {("b",): ord("b"), ("c",): ord("c")}
+        assert self.queried[-1] == {("c",)}
+        assert len(self.cache) == 3  # noqa: PLR2004
+
+    def test_evict_over_budget(self):
+        keys = {(name,) for name in "abcdef"}
+        self.cache.resolve(Publisher, _RELS, {("a",), ("b",), ("c",)}, self._query)
+        self.cache.resolve(Publisher, _RELS, {("d",), ("e",)}, self._query)
+        assert len(self.cache) == 4  # noqa: PLR2004
+        # More keys than the budget are resolved but not interned.
+        assert len(self.cache.resolve(Publisher, _RELS, keys, self._query)) == len(keys)
+        assert len(self.cache) <= 4  # noqa: PLR2004
+
+    def test_folders_not_interned(self):
+        self.cache.resolve(Folder, ("path",), {("/a",)}, self._query)
+        self.cache.resolve(Folder, ("path",), {("/a",)}, self._query)
+        assert len(self.queried) == 2  # noqa: PLR2004
+        assert not len(self.cache)
@@ -0,0 +1,59 @@
+"""Unfinished imports resume from their journal."""
+
+from dataclasses import replace
+
+from django.utils.timezone import now
+from loguru import logger
+
+from codex.librarian.scribe.importer.journal import (
+    ImportCheckpointer,
+    get_resume_tasks,
+)
+from codex.models import ImportJournal
+from tests.importer.test_basic import PATH, TMP_DIR, BaseTestImporter
+
+_OTHER_PATH = str(TMP_DIR / "other.cbz")
+_DIR_PATH = str(TMP_DIR / "dir")
+
+
+class TestImportJournal(BaseTestImporter):
+    def test_resume_remaining_chunks(self):
+        task = replace(
+            self.task,
+            files_created=frozenset({_OTHER_PATH}),
+            dirs_modified=frozenset({_DIR_PATH}),
+        )
+        checkpointer = ImportCheckpointer(task, now())
+        checkpointer.checkpoint_pre_phases(task, "move_and_modify_dirs")
+        checkpointer.checkpoint_chunk(frozenset({PATH}), "link")
+
+        (resumed,) = get_resume_tasks(logger)
+        assert resumed.journal_id == checkpointer.journal.pk
+        assert resumed.files_created == frozenset({_OTHER_PATH})
+        assert not resumed.files_modified
+        assert not resumed.dirs_modified
+        journal = ImportJournal.objects.get()
+        assert journal.chunks_done == 1
+        assert journal.attempts == 2  # noqa: PLR2004
+
+        resumed_checkpointer = ImportCheckpointer(resumed, now())
+        assert resumed_checkpointer.journal.pk == journal.pk
+        assert resumed_checkpointer.journal.started_at == journal.started_at
+        resumed_checkpointer.finish()
+        assert not ImportJournal.objects.exists()
+
+    def test_checkpoint_chunks(self):
+        checkpointer = ImportCheckpointer(self.task, now())
+        checkpointer.checkpoint_pre_phases(self.task, "move_and_modify_dirs")
+        self.importer.checkpointer = checkpointer
+        assert self.importer._run_per_comic_phases_chunked()  # noqa: SLF001
+        journal = ImportJournal.objects.get()
+        assert journal.task["files_modified"] == []
+        assert journal.phase == "link"
+
+    def test_give_up_after_attempts(self):
+        checkpointer = ImportCheckpointer(self.task, now())
+        checkpointer.journal.attempts = 3
+        checkpointer.journal.save()
+        assert not get_resume_tasks(logger)
+        assert not ImportJournal.objects.exists()
@@ -0,0 +1,26 @@
+"""Import keys match the database through a TEMP key table."""
+
+from django.test import TestCase
+
+from codex.librarian.scribe.importer.key_table import select_keys, temp_key_table
+from codex.models import Publisher
+
+
+class TestKeyTable(TestCase):
+    def test_match_keys(self):
+        for name in ("Alpha", "Beta", "Gamma"):
+            Publisher.objects.create(name=name)
+        rows = (("Alpha",), ("Gamma",), ("Gamma",), ("Missing",))
+        with temp_key_table(rows) as table:
+            names = set(
+                Publisher.objects.filter(name__in=select_keys(table)).values_list(
+                    "name", flat=True
+                )
+            )
+        assert names == {"Alpha", "Gamma"}
+
+    def test_table_emptied(self):
+        with temp_key_table((("Alpha",),)) as table:
+            pass
+        with temp_key_table(()) as table:
+            assert not Publisher.objects.filter(name__in=select_keys(table)).exists()
@@ -0,0 +1,35 @@
+"""Pipelined imports read the next chunk's archives ahead of time."""
+
+from types import MappingProxyType
+from unittest.mock import patch
+
+from codex.librarian.scribe.importer.importer import ComicImporter
+from tests.importer.test_basic import (
+    AGGREGATED,
+    LIBRARY_PATH,
+    PATH,
+    BaseTestImporter,
+    diff_assert,
+)
+
+
+class TestPipelinedRead(BaseTestImporter):
+    """The read phase consumes a matching prefetched chunk."""
+
+    def test_read_consumes_prefetched_chunk(self) -> None:
+        self.importer.prefetch_extract(frozenset({PATH}))
+        assert self.importer.prefetched_extract
+        with patch.object(
+            ComicImporter, "_plan_extract", side_effect=AssertionError("replanned")
+        ):
+            self.importer.read()
+        assert self.importer.prefetched_extract is None
+        md = MappingProxyType(self.importer.metadata)
+        diff_assert(AGGREGATED, md, "AGGREGATED")
+
+    def test_read_replans_other_chunk(self) -> None:
+        self.importer.prefetch_extract(frozenset({str(LIBRARY_PATH / "other.cbz")}))
+        self.importer.read()
+        assert self.importer.prefetched_extract is None
+        md = MappingProxyType(self.importer.metadata)
+        diff_assert(AGGREGATED, md, "AGGREGATED")
@@ -0,0 +1,56 @@
+"""Import runs save telemetry for the admin panel."""
+
+from typing import Final
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client
+
+from codex.models import ImportRun
+from tests.importer.test_basic import BaseTestImporter
+
+_TEST_PASSWORD: Final = "test-pw-hush-S106"  # noqa: S105
+_HTTP_OK: Final = 200
+
+
+def _run_phases(importer) -> None:
+    """Run the phases through create_and_update, which counts the comics."""
+    importer.read()
+    importer.query()
+    importer.create_and_update()
+    importer.link()
+    importer.fail_imports()
+    importer.delete()
+    importer.full_text_search()
+
+
+class TestImportTelemetry(BaseTestImporter):
+    def _import(self) -> ImportRun:
+        telemetry = self.importer.telemetry
+        with connection.execute_wrapper(telemetry.count_query):
+            self.importer.timed_step("full", lambda: _run_phases(self.importer))
+        self.importer.finish()
+        return ImportRun.objects.get(library_id=self.task.library_id)
+
+    def test_saves_run(self):
+        run = self._import()
+        assert not run.aborted
+        assert run.comics == 1
+        assert run.queries
+        assert run.rows
+        assert run.peak_rss
+        assert run.phases["full"]["queries"] == run.queries
+
+    def test_admin_api(self):
+        run = self._import()
+        admin = User.objects.create_user(
+            username="telemetry_admin",
+            password=_TEST_PASSWORD,
+            is_staff=True,
+            is_superuser=True,
+        )
+        client = Client()
+        client.force_login(admin)
+        response = client.get("/api/v4/admin/import-runs")
+        assert response.status_code == _HTTP_OK
+        assert str(run.pk) in response.content.decode()
@@ -66,6 +66,8 @@ from tests.importer.test_basic import (
 )
 from tests.importer.test_update_none import UPDATE_PATH, BaseTestImporterUpdate
 
+UPDATE_FINGERPRINT = "4f4-ab938b950c5ea6e2144dfaab25822087"
+
 AGGREGATED_UPDATE_ALL = MappingProxyType(
     {
         CREATE_COMICS: {
@@ -76,6 +78,7 @@ AGGREGATED_UPDATE_ALL = MappingProxyType(
                 "community_rating": Decimal("3.5"),
                 "community_rating_count": 200,
                 "day": 20,
+                "fingerprint": UPDATE_FINGERPRINT,
                 "issue_number": Decimal("2.2"),
                 "issue_suffix": "XXX",
                 "metadata_mtime": datetime(2026, 7, 1, 12, 10, 0, tzinfo=UTC),
@@ -416,6 +419,7 @@ QUERIED_UPDATE_ALL = MappingProxyType(
                 "community_rating": Decimal("3.5"),
                 "community_rating_count": 200,
                 "day": 20,
+                "fingerprint": UPDATE_FINGERPRINT,
                 "issue_number": Decimal("2.2"),
                 "issue_suffix": "XXX",
                 "metadata_mtime": datetime(2026, 7, 1, 12, 10, 0, tzinfo=UTC),
@@ -529,6 +533,7 @@ CREATED_FK_UPDATE_ALL = MappingProxyType(
                 "community_rating": Decimal("3.5"),
                 "community_rating_count": 200,
                 "day": 20,
+                "fingerprint": UPDATE_FINGERPRINT,
                 "issue_number": Decimal("2.2"),
                 "issue_suffix": "XXX",
                 "metadata_mtime": datetime(2026, 7, 1, 12, 10, 0, tzinfo=UTC),
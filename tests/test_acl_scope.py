@@ -0,0 +1,65 @@
+"""ACL scopes cached across requests and retired by ACL writes."""
+
+from typing import override
+
+from comicbox.enums.metroninfo import MetronAgeRatingEnum
+from django.contrib.auth.models import Group, User
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Q
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from codex.models import AgeRatingMetron, Comic, Library, Publisher
+from codex.models.auth import GroupAuth, UserAuth
+from codex.startup import init_admin_flags
+from codex.views.auth import GroupACLMixin, bump_acl_generation
+
+TMP_DIR = "/tmp/codex.tests.acl_scope"  # noqa: S108
+_TEST_PASSWORD = "test-pw-hush-S106"  # noqa: S105
+
+
+class ACLScopeTestCase(TestCase):
+    @override
+    def setUp(self) -> None:
+        cache.clear()
+        init_admin_flags()
+        self.library = Library.objects.create(path=TMP_DIR)
+        self.user = User.objects.create_user(username="scope", password=_TEST_PASSWORD)
+
+    def _scope(self):
+        view = GroupACLMixin()
+        view.init_group_acl()
+        return view.get_acl_scope(self.user)
+
+    def test_scope_cached_across_requests(self) -> None:
+        first = self._scope()
+        with CaptureQueriesContext(connection) as ctx:
+            second = self._scope()
+        assert second == first
+        assert not ctx.captured_queries, ctx.captured_queries
+
+    def test_bump_retires_scope(self) -> None:
+        assert self._scope().admits_all
+        teen = AgeRatingMetron.objects.get(name=MetronAgeRatingEnum.TEEN.value)
+        UserAuth.objects.filter(user=self.user).update(age_rating_metron=teen)
+        assert self._scope().admits_all
+        bump_acl_generation()
+        scope = self._scope()
+        assert not scope.admits_all
+        assert scope.max_idx == teen.index
+
+    def test_group_write_retires_scope(self) -> None:
+        assert self.library.pk in self._scope().visible_library_pks
+        group = Group.objects.create(name="kids")
+        GroupAuth.objects.create(group=group, exclude=False)
+        self.library.groups.add(group)
+        scope = self._scope()
+        assert self.library.pk not in scope.visible_library_pks
+        assert not scope.admits_all
+
+    def test_admits_all_drops_acl(self) -> None:
+        view = GroupACLMixin()
+        view.init_group_acl()
+        assert view.get_acl_filter(Comic, self.user) == Q()
+        assert view.get_acl_filter(Publisher, self.user) == Q(comic__pk__isnull=False)
@@ -0,0 +1,110 @@
+"""Browser pages cached until a generation they depend on is bumped."""
+
+import shutil
+from pathlib import Path
+from typing import Final, override
+from unittest.mock import patch
+
+from django.contrib.auth.models import Group, User
+from django.core.cache import cache
+from django.test import Client, TestCase
+
+from codex.cache import browser_cache
+from codex.models import (
+    Comic,
+    GroupAuth,
+    Imprint,
+    Library,
+    Publisher,
+    Series,
+    Volume,
+)
+from codex.startup import init_admin_flags
+from codex.views.browser.page_cache import (
+    bump_browser_generation,
+    bump_browser_user_generation,
+)
+
+_TEST_PASSWORD: Final = "test-pw-hush-S106"  # noqa: S105
+_HTTP_OK: Final = 200
+_PAGE_CACHE_TIMEOUT: Final = 60
+TMP_DIR = Path("/tmp/codex.tests.browser_page_cache")  # noqa: S108
+
+
+class BrowserPageCacheTestCase(TestCase):
+    @override
+    def setUp(self) -> None:
+        cache.clear()
+        browser_cache.clear()
+        init_admin_flags()
+        TMP_DIR.mkdir(exist_ok=True, parents=True)
+        self.library = Library.objects.create(path=str(TMP_DIR / "a"))
+        self.other_library = Library.objects.create(path=str(TMP_DIR / "b"))
+        # An include group the user isn't in hides the other library.
+        group = Group.objects.create(name="page_cache_other")
+        GroupAuth.objects.create(group=group, exclude=False)
+        self.other_library.groups.add(group)
+        self.publisher = Publisher.objects.create(name="Cache Press")
+        imprint = Imprint.objects.create(name="Cache Imprint", publisher=self.publisher)
+        self.series = Series.objects.create(
+            name="Alpha", imprint=imprint, publisher=self.publisher
+        )
+        volume = Volume.objects.create(
+            name=2020, series=self.series, imprint=imprint, publisher=self.publisher
+        )
+        path = TMP_DIR / "alpha1.cbz"
+        path.touch()
+        Comic.objects.create(
+            library=self.library,
+            path=path,
+            issue_number=1,
+            name="Alpha 1",
+            publisher=self.publisher,
+            imprint=imprint,
+            series=self.series,
+            volume=volume,
+            size=100,
+        )
+        self.user = User.objects.create_user(
+            username="page_cache_test", password=_TEST_PASSWORD
+        )
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    @override
+    def tearDown(self) -> None:
+        shutil.rmtree(TMP_DIR, ignore_errors=True)
+        browser_cache.clear()
+
+    def _series_names(self) -> set[str]:
+        url = f"/api/v4/browse/publishers/{self.publisher.pk}?page=1"
+        with patch(
+            "codex.views.browser.browser.BROWSER_PAGE_CACHE_TIMEOUT",
+            new=_PAGE_CACHE_TIMEOUT,
+        ):
+            response = self.client.get(url)
+        assert response.status_code == _HTTP_OK, response.content
+        body = response.json()
+        return {card["name"] for card in body.get("data", body)["collections"]}
+
+    def _rename_series(self) -> None:
+        # ``update()`` sends no signals, standing in for a librarian write.
+        Series.objects.filter(pk=self.series.pk).update(name="Beta", sort_name="beta")
+
+    def test_library_bump_retires_page(self) -> None:
+        assert self._series_names() == {"Alpha"}
+        self._rename_series()
+        assert self._series_names() == {"Alpha"}
+        bump_browser_generation((self.other_library.pk,))
+        assert self._series_names() == {"Alpha"}
+        bump_browser_generation((self.library.pk,))
+        assert self._series_names() == {"Beta"}
+
+    def test_site_and_user_bumps_retire_page(self) -> None:
+        assert self._series_names() == {"Alpha"}
+        self._rename_series()
+        bump_browser_user_generation(self.user.pk)
+        assert self._series_names() == {"Beta"}
+        Series.objects.filter(pk=self.series.pk).update(name="Gamma")
+        bump_browser_generation()
+        assert self._series_names() == {"Gamma"}
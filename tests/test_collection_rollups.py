@@ -0,0 +1,119 @@
+"""Collection rollups kept from comics and read by the browser."""
+
+import shutil
+from pathlib import Path
+from typing import Final, override
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models import Max, Min, Sum
+from django.test import Client, TestCase
+
+from codex.librarian.scribe.rollup import update_rollups
+from codex.models import (
+    Comic,
+    Imprint,
+    Library,
+    Publisher,
+    PublisherRollup,
+    Series,
+    SeriesRollup,
+    Volume,
+)
+from codex.startup import init_admin_flags
+
+_TEST_PASSWORD: Final = "test-pw-hush-S106"  # noqa: S105
+_HTTP_OK: Final = 200
+_ROLLUP_CHILD_COUNT: Final = 99
+TMP_DIR = Path("/tmp/codex.tests.collection_rollups")  # noqa: S108
+
+
+class CollectionRollupTestCase(TestCase):
+    @override
+    def setUp(self) -> None:
+        cache.clear()
+        init_admin_flags()
+        TMP_DIR.mkdir(exist_ok=True, parents=True)
+        self.library = Library.objects.create(path=str(TMP_DIR))
+        self.publisher = Publisher.objects.create(name="Rollup Press")
+        imprint = Imprint.objects.create(
+            name="Rollup Imprint", publisher=self.publisher
+        )
+        self.series = []
+        for index, name in enumerate(("Alpha", "Beta")):
+            series = Series.objects.create(
+                name=name, imprint=imprint, publisher=self.publisher
+            )
+            volume = Volume.objects.create(
+                name=2020 + index,
+                series=series,
+                imprint=imprint,
+                publisher=self.publisher,
+            )
+            for issue in range(1, 3 + index):
+                path = TMP_DIR / f"{name}{issue}.cbz"
+                path.touch()
+                Comic.objects.create(
+                    library=self.library,
+                    path=path,
+                    issue_number=issue,
+                    name=f"{name} {issue}",
+                    publisher=self.publisher,
+                    imprint=imprint,
+                    series=series,
+                    volume=volume,
+                    size=100 + issue,
+                    year=2020 + issue,
+                    page_count=10 + issue,
+                )
+            self.series.append(series)
+
+    @override
+    def tearDown(self) -> None:
+        shutil.rmtree(TMP_DIR, ignore_errors=True)
+
+    def test_update_rollups(self) -> None:
+        update_rollups(Publisher, self.library, (self.publisher.pk,))
+        rollup = PublisherRollup.objects.get(collection=self.publisher)
+        expected = Comic.objects.aggregate(
+            size=Sum("size"),
+            page_count=Sum("page_count"),
+            date_min=Min("date"),
+            date_max=Max("date"),
+        )
+        assert rollup.library == self.library
+        assert rollup.child_count == Comic.objects.count()
+        assert rollup.size == expected["size"]
+        assert rollup.page_count == expected["page_count"]
+        assert rollup.date_min == expected["date_min"]
+        assert rollup.date_max == expected["date_max"]
+
+    def test_emptied_collection_loses_rollup(self) -> None:
+        pks = tuple(series.pk for series in self.series)
+        update_rollups(Series, self.library, pks)
+        assert SeriesRollup.objects.count() == len(pks)
+        Comic.objects.filter(series=self.series[0]).delete()
+        update_rollups(Series, self.library, pks)
+        assert tuple(SeriesRollup.objects.values_list("collection_id", flat=True)) == (
+            self.series[1].pk,
+        )
+
+    def test_browser_reads_rollups(self) -> None:
+        update_rollups(Series, self.library, tuple(series.pk for series in self.series))
+        SeriesRollup.objects.filter(collection=self.series[0]).update(
+            child_count=_ROLLUP_CHILD_COUNT
+        )
+        user = User.objects.create_user(username="rollup_test", password=_TEST_PASSWORD)
+        client = Client()
+        client.force_login(user)
+        url = f"/api/v4/browse/publishers/{self.publisher.pk}?page=1"
+        with patch(
+            "codex.views.browser.annotate.rollup.BROWSER_COLLECTION_ROLLUPS", new=True
+        ):
+            response = client.get(url)
+        assert response.status_code == _HTTP_OK, response.content
+        body = response.json()
+        cards = body.get("data", body)["collections"]
+        child_counts = {card["name"]: card["childCount"] for card in cards}
+        assert child_counts == {"Alpha": _ROLLUP_CHILD_COUNT, "Beta": 3}
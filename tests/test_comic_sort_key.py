@@ -0,0 +1,123 @@
+"""Comic sort keys order like the sort name columns they compose."""
+
+import shutil
+from decimal import Decimal
+from pathlib import Path
+from typing import Final, override
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import Client, TestCase
+
+from codex.collection import Collection
+from codex.models import Comic, Imprint, Library, Publisher, Series, Volume
+from codex.models.util import get_sort_key
+from codex.startup import init_admin_flags
+from codex.views.mixins import SharedAnnotationsMixin
+
+_TEST_PASSWORD: Final = "test-pw-hush-S106"  # noqa: S105
+_HTTP_OK: Final = 200
+_SETTINGS_URL: Final = "/api/v4/browse/series/settings"
+# Volume, then issue number, then suffix with blank first.
+_EXPECTED_NAMES: Final = ("Sort 2", "Sort 2b", "Sort 10", "Sort 1")
+_SHOW: Final = {"publishers": True, "imprints": False}
+TMP_DIR = Path("/tmp/codex.tests.comic_sort_key")  # noqa: S108
+
+
+def _column_order(row: tuple) -> tuple:
+    """Sort like SQLite: NULLs first, text under NOCASE."""
+    order = []
+    for value in row:
+        if value is None:
+            order.append((0,))
+        else:
+            order.append((1, value.lower() if isinstance(value, str) else value))
+    return tuple(order)
+
+
+def test_sort_key_orders_like_columns() -> None:
+    """Sorting by the key matches sorting by its columns."""
+    rows = [
+        ("b", None, Decimal(1), "", "x"),
+        ("B", 2020, Decimal(-1), "a", ""),
+        ("b", 2020, Decimal(10), "", ""),
+        ("b", 2020, Decimal("2.5"), "", ""),
+        ("b", 2020, Decimal("2.5"), "A", ""),
+        ("ba", None, None, "", ""),
+        ("b", 2019, Decimal(0), "", ""),
+    ]
+    by_key = sorted(rows, key=lambda row: get_sort_key(*row))
+    assert by_key == sorted(rows, key=_column_order)
+
+
+def test_sort_key_applies_when_parent_pins_collections() -> None:
+    """The key orders a browse only when its parents are pinned."""
+    applies = SharedAnnotationsMixin.sort_key_applies
+    assert applies(Collection.SERIES, (1,), _SHOW)
+    assert applies(Collection.VOLUME, (1,), _SHOW)
+    assert applies(Collection.FOLDER, (1,), _SHOW)
+    # Merged series may span publishers the annotations don't order by.
+    assert not applies(Collection.SERIES, (1, 2), _SHOW)
+
+
+class ComicSortKeyTestCase(TestCase):
+    @override
+    def setUp(self) -> None:
+        cache.clear()
+        init_admin_flags()
+        TMP_DIR.mkdir(exist_ok=True, parents=True)
+        library = Library.objects.create(path=str(TMP_DIR))
+        publisher = Publisher.objects.create(name="Sort Press")
+        imprint = Imprint.objects.create(name="Sort Imprint", publisher=publisher)
+        self.series = Series.objects.create(
+            name="Sort", imprint=imprint, publisher=publisher
+        )
+        issues = ((2021, "1", ""), (2020, "10", ""), (2020, "2", "b"), (2020, "2", ""))
+        for volume_name, issue_number, issue_suffix in issues:
+            volume, _ = Volume.objects.get_or_create(
+                name=volume_name,
+                series=self.series,
+                imprint=imprint,
+                publisher=publisher,
+            )
+            path = TMP_DIR / f"sort{volume_name}-{issue_number}{issue_suffix}.cbz"
+            path.touch()
+            Comic.objects.create(
+                library=library,
+                path=path,
+                issue_number=Decimal(issue_number),
+                issue_suffix=issue_suffix,
+                name=f"Sort {issue_number}{issue_suffix}",
+                publisher=publisher,
+                imprint=imprint,
+                series=self.series,
+                volume=volume,
+                size=100,
+            )
+        user = User.objects.create_user(username="sort_key", password=_TEST_PASSWORD)
+        self.client = Client()
+        self.client.force_login(user)
+
+    @override
+    def tearDown(self) -> None:
+        shutil.rmtree(TMP_DIR, ignore_errors=True)
+
+    def test_series_browse_reads_sort_key_order(self) -> None:
+        # Pin the order rather than relying on the settings defaults.
+        response = self.client.patch(
+            _SETTINGS_URL,
+            data='{"orderBy":"sort_name","orderReverse":false}',
+            content_type="application/json",
+        )
+        assert response.status_code == _HTTP_OK, response.content
+        url = f"/api/v4/browse/series/{self.series.pk}?page=1"
+        response = self.client.get(url)
+        assert response.status_code == _HTTP_OK, response.content
+        body = response.json()
+        pks = [book["pk"] for book in body.get("data", body)["books"]]
+        names = dict(Comic.objects.values_list("pk", "name"))
+        assert tuple(names[pk] for pk in pks) == _EXPECTED_NAMES
+        sort_key_pks = Comic.objects.order_by("sort_key", "pk").values_list(
+            "pk", flat=True
+        )
+        assert pks == list(sort_key_pks)
@@ -0,0 +1,108 @@
+"""Tests for the packed cover batch endpoint."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import struct
+import zipfile
+from http import HTTPStatus
+from pathlib import Path
+from typing import Final, override
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.test import Client, TestCase
+
+from codex.librarian.covers.path import CoverPathMixin
+from codex.models import Comic, Imprint, Library, Publisher, Series, Volume
+from codex.startup import init_admin_flags
+
+_TMP_DIR: Final = Path("/tmp/codex.tests.cover_batch")  # noqa: S108
+_TEST_PASSWORD: Final = "test-pw-hush-S106"  # noqa: S105
+_QUEUE_PATCH: Final = "codex.views.browser.cover.LIBRARIAN_QUEUE"
+_COVER_BYTES: Final = b"RIFF-not-really-webp"
+
+
+def _write_comic(path: Path) -> Path:
+    """Write a one-page comic archive; Comic.save() stats its path."""
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("page-001.jpg", b"jpg")
+    return path
+
+
+def _unpack(body: bytes) -> tuple[list[dict], bytes]:
+    (index_length,) = struct.unpack(">I", body[:4])
+    index = json.loads(body[4 : 4 + index_length])["covers"]
+    return index, body[4 + index_length :]
+
+
+class CoverBatchTestCase(TestCase):
+    """One request packs ready covers and reports pending or missing ones."""
+
+    @override
+    def setUp(self) -> None:
+        init_admin_flags()
+        shutil.rmtree(_TMP_DIR, ignore_errors=True)
+        _TMP_DIR.mkdir(parents=True)
+        library = Library.objects.create(path=str(_TMP_DIR))
+        publisher = Publisher.objects.create(name="Pub")
+        imprint = Imprint.objects.create(name="Imp", publisher=publisher)
+        series = Series.objects.create(name="Ser", imprint=imprint, publisher=publisher)
+        volume = Volume.objects.create(
+            name="2024", series=series, imprint=imprint, publisher=publisher
+        )
+        self.comics = [  # pyright: ignore[reportUninitializedInstanceVariable]
+            Comic.objects.create(
+                library=library,
+                path=_write_comic(_TMP_DIR / f"{index}.cbz"),
+                issue_number=index,
+                name=str(index),
+                publisher=publisher,
+                imprint=imprint,
+                series=series,
+                volume=volume,
+                size=1,
+            )
+            for index in range(2)
+        ]
+        User.objects.create_superuser(
+            username="admin-cb", email="cb@example.com", password=_TEST_PASSWORD
+        )
+        self.client = Client()
+        self.client.login(username="admin-cb", password=_TEST_PASSWORD)
+        self.root_patch = patch.object(  # pyright: ignore[reportUninitializedInstanceVariable]
+            CoverPathMixin, "COVERS_ROOT", _TMP_DIR / "covers"
+        )
+        self.root_patch.start()
+        cover_path = CoverPathMixin.get_cover_path(self.comics[0].pk, custom=False)
+        cover_path.parent.mkdir(parents=True)
+        cover_path.write_bytes(_COVER_BYTES)
+
+    @override
+    def tearDown(self) -> None:
+        self.root_patch.stop()
+        shutil.rmtree(_TMP_DIR, ignore_errors=True)
+
+    @patch(_QUEUE_PATCH)
+    def test_batch_packs_ready_and_enqueues_missing(self, mock_queue) -> None:
+        ready, pending = (comic.pk for comic in self.comics)
+        absent = pending + 1000
+        response = self.client.get(
+            f"/api/v4/covers/batch?comic={ready},{pending},{absent},junk"
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response["Cache-Control"] == "no-store"
+        index, data = _unpack(response.content)
+        statuses = {entry["pk"]: entry["status"] for entry in index}
+        assert statuses == {
+            ready: HTTPStatus.OK,
+            pending: HTTPStatus.ACCEPTED,
+            absent: HTTPStatus.NOT_FOUND,
+        }
+        entry = index[0]
+        assert data[entry["offset"] : entry["offset"] + entry["length"]] == (
+            _COVER_BYTES
+        )
+        (task,) = (call.args[0] for call in mock_queue.put.call_args_list)
+        assert task.pks == (pending,)
@@ -0,0 +1,77 @@
+"""Tests for the packed cover store."""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from typing import Final, override
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from codex.librarian.covers.pack import CoverPack
+from codex.librarian.covers.path import COVER_SIZE_1X, COVER_SIZE_2X
+
+_TMP_DIR: Final = Path("/tmp/codex.tests.cover_pack")  # noqa: S108
+_SIZES: Final = (COVER_SIZE_1X, COVER_SIZE_2X)
+
+
+class CoverPackTestCase(SimpleTestCase):
+    """Covers round-trip through shards and the index."""
+
+    @override
+    def setUp(self) -> None:
+        shutil.rmtree(_TMP_DIR, ignore_errors=True)
+        self.pack = CoverPack(_TMP_DIR)  # pyright: ignore[reportUninitializedInstanceVariable]
+
+    @override
+    def tearDown(self) -> None:
+        self.pack.close()
+        shutil.rmtree(_TMP_DIR, ignore_errors=True)
+
+    def _put(self, pk: int, *, custom: bool = False) -> None:
+        self.pack.put_many(
+            ((pk, size, f"{pk}{size}".encode()) for size in _SIZES), custom=custom
+        )
+
+    def test_missing_pack(self) -> None:
+        assert self.pack.get(1, custom=False, size=COVER_SIZE_1X) is None
+        assert not self.pack.get_complete_pks((1,), custom=False, sizes=_SIZES)
+
+    def test_put_and_get(self) -> None:
+        self._put(1)
+        self._put(1, custom=True)
+        self.pack.put_many(((2, COVER_SIZE_1X, b""),), custom=False)
+        data, entry = self.pack.get(1, custom=False, size=COVER_SIZE_2X)  # pyright: ignore[reportGeneralTypeIssues]
+        assert data == b"12x"
+        assert entry.etag != self.pack.get(1, custom=True, size=COVER_SIZE_2X)[1].etag  # pyright: ignore[reportOptionalSubscript]
+        assert self.pack.get(2, custom=False, size=COVER_SIZE_1X)[0] == b""  # pyright: ignore[reportOptionalSubscript]
+        complete = self.pack.get_complete_pks((1, 2, 3), custom=False, sizes=_SIZES)
+        assert complete == frozenset({1})
+
+    def test_delete_and_orphans(self) -> None:
+        for pk in range(1, 5):
+            self._put(pk)
+        self._put(1, custom=True)
+        assert self.pack.delete((1,), custom=False) == len(_SIZES)
+        assert self.pack.delete_orphans((2, 3), custom=False) == len(_SIZES)
+        assert self.pack.get(4, custom=False, size=COVER_SIZE_1X) is None
+        assert self.pack.get(1, custom=True, size=COVER_SIZE_1X) is not None
+
+    def test_compact_reclaims_dead_shards(self) -> None:
+        with patch("codex.librarian.covers.pack._SHARD_MAX_BYTES", 16):
+            for pk in range(1, 9):
+                self._put(pk)
+        self.pack.delete(range(1, 8), custom=False)
+        assert self.pack.compact()
+        for size in _SIZES:
+            data, _entry = self.pack.get(8, custom=False, size=size)  # pyright: ignore[reportGeneralTypeIssues]
+            assert data == f"8{size}".encode()
+        assert self.pack.get(1, custom=False, size=COVER_SIZE_1X) is None
+
+    def test_delete_all(self) -> None:
+        self._put(1)
+        self.pack.delete_all()
+        assert self.pack.get(1, custom=False, size=COVER_SIZE_1X) is None
+        self._put(2)
+        assert self.pack.get(2, custom=False, size=COVER_SIZE_1X) is not None
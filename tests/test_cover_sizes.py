@@ -0,0 +1,47 @@
+"""Tests for multi-resolution cover thumbnails."""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from typing import Final, override
+
+from django.test import SimpleTestCase
+from PIL import Image
+
+from codex.librarian.covers.create import THUMBNAIL_SIZES, _render_cover_thumb
+from codex.librarian.covers.path import COVER_SIZES, CoverPathMixin
+
+_TMP_DIR: Final = Path("/tmp/codex.tests.cover_sizes")  # noqa: S108
+_SOURCE_PATH: Final = _TMP_DIR / "source.png"
+
+
+class CoverSizesTestCase(SimpleTestCase):
+    """One render pass writes every cover size."""
+
+    @override
+    def setUp(self) -> None:
+        shutil.rmtree(_TMP_DIR, ignore_errors=True)
+        _TMP_DIR.mkdir(parents=True)
+        Image.new("RGB", (2000, 3000), "blue").save(_SOURCE_PATH)
+
+    @override
+    def tearDown(self) -> None:
+        shutil.rmtree(_TMP_DIR, ignore_errors=True)
+
+    def test_size_paths_are_distinct(self) -> None:
+        paths = {
+            CoverPathMixin.get_cover_path(1, custom=False, size=s) for s in COVER_SIZES
+        }
+        assert len(paths) == len(COVER_SIZES)
+        assert CoverPathMixin.get_cover_path(1, custom=False).name == "01.webp"
+
+    def test_render_writes_every_size(self) -> None:
+        cover_paths = tuple(
+            (size, str(_TMP_DIR / f"cover{size}.webp")) for size in THUMBNAIL_SIZES
+        )
+        _pk, _path, err = _render_cover_thumb((1, str(_SOURCE_PATH), cover_paths, True))
+        assert err is None
+        for size, path_str in cover_paths:
+            with Image.open(path_str) as img:
+                assert img.width == THUMBNAIL_SIZES[size][0]
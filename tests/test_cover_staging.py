@@ -0,0 +1,73 @@
+"""Tests for covers captured by the importer's read workers."""
+
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+from typing import Final, override
+from unittest.mock import patch
+
+from comicbox.box.archive.filenames import EPOCH_START
+from django.test import SimpleTestCase
+from PIL import Image
+
+from codex.librarian.covers.create import THUMBNAIL_SIZES
+from codex.librarian.covers.path import COVER_SIZES
+from codex.librarian.covers.staging import pop_staged_cover, stage_cover
+from codex.librarian.scribe.importer.read.reader import _read_comic
+
+_TMP_DIR: Final = Path("/tmp/codex.tests.cover_staging")  # noqa: S108
+_COMIC_PATH: Final = _TMP_DIR / "comic.cbz"
+_SOURCE_PATH: Final = Path(__file__).parent / "files" / "comicbox-2-example.cbz"
+
+
+class CoverStagingTestCase(SimpleTestCase):
+    """Staged covers are adopted only for the archive version they came from."""
+
+    @override
+    def setUp(self) -> None:
+        shutil.rmtree(_TMP_DIR, ignore_errors=True)
+        _TMP_DIR.mkdir(parents=True)
+        shutil.copy(_SOURCE_PATH, _COMIC_PATH)
+        self.root_patch = patch(  # pyright: ignore[reportUninitializedInstanceVariable]
+            "codex.librarian.covers.staging.COVER_STAGING_ROOT", _TMP_DIR / "staging"
+        )
+        self.root_patch.start()
+
+    @override
+    def tearDown(self) -> None:
+        self.root_patch.stop()
+        shutil.rmtree(_TMP_DIR, ignore_errors=True)
+
+    def test_stage_and_pop(self) -> None:
+        path_str = str(_COMIC_PATH)
+        renditions = {size: size.encode() for size in COVER_SIZES}
+        stage_cover(path_str, _COMIC_PATH.stat(), renditions)
+        assert pop_staged_cover(path_str) == renditions
+        assert pop_staged_cover(path_str) is None
+
+    def test_changed_archive_is_not_adopted(self) -> None:
+        path_str = str(_COMIC_PATH)
+        st = _COMIC_PATH.stat()
+        stage_cover(path_str, st, dict.fromkeys(COVER_SIZES, b"old"))
+        os.utime(_COMIC_PATH, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+        assert pop_staged_cover(path_str) is None
+
+    @patch(
+        "codex.librarian.scribe.importer.read.reader.IMPORTER_METADATA_CACHE", new=False
+    )
+    def test_read_captures_cover(self) -> None:
+        # A metadata cache hit from another import of the same file would
+        # skip opening the archive, and with it the capture.
+        path_str = str(_COMIC_PATH)
+        result = _read_comic(
+            path_str, EPOCH_START, full_metadata=True, capture_cover=True
+        )
+        assert result["tags"] is not None
+        renditions = pop_staged_cover(path_str)
+        assert renditions
+        for size, data in renditions.items():
+            (_TMP_DIR / "thumb.webp").write_bytes(data)
+            with Image.open(_TMP_DIR / "thumb.webp") as img:
+                assert img.width <= THUMBNAIL_SIZES[size][0]
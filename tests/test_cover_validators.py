@@ -0,0 +1,80 @@
+"""Tests for cover ETag revalidation and versioned immutable caching."""
+
+from __future__ import annotations
+
+import shutil
+from http import HTTPStatus
+from pathlib import Path
+from typing import Final, override
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from codex.librarian.covers.path import CoverPathMixin
+from codex.startup import init_admin_flags
+from codex.urls.const import COVER_MAX_AGE
+
+_TMP_DIR: Final = Path("/tmp/codex.tests.cover_validators")  # noqa: S108
+_COVER_PK: Final = 7
+_URL: Final = f"/api/v4/covers/custom/{_COVER_PK}"
+_OPDS_URL: Final = f"/opds/bin/custom_cover/{_COVER_PK}/cover.webp"
+_IMMUTABLE_MAX_AGE: Final = 60 * 60 * 24 * 365
+
+
+class CoverValidatorsTestCase(TestCase):
+    """Covers revalidate with 304 without running the view."""
+
+    @override
+    def setUp(self) -> None:
+        init_admin_flags()
+        shutil.rmtree(_TMP_DIR, ignore_errors=True)
+        self.root_patch = patch.object(  # pyright: ignore[reportUninitializedInstanceVariable]
+            CoverPathMixin, "CUSTOM_COVERS_ROOT", _TMP_DIR
+        )
+        self.root_patch.start()
+        cover_path = CoverPathMixin.get_cover_path(_COVER_PK, custom=True)
+        cover_path.parent.mkdir(parents=True)
+        cover_path.write_bytes(b"webp")
+
+    @override
+    def tearDown(self) -> None:
+        self.root_patch.stop()
+        shutil.rmtree(_TMP_DIR, ignore_errors=True)
+
+    def test_cover_has_validators(self) -> None:
+        response = self.client.get(_URL)
+        assert response.status_code == HTTPStatus.OK
+        assert response["ETag"]
+        assert response["Last-Modified"]
+        assert "immutable" not in response.get("Cache-Control", "")
+
+    def test_versioned_cover_is_immutable(self) -> None:
+        response = self.client.get(_URL, {"ts": 1234})
+        assert response.status_code == HTTPStatus.OK
+        assert "immutable" in response["Cache-Control"]
+
+    def test_cached_route_keeps_one_cache_control(self) -> None:
+        response = self.client.get(_OPDS_URL)
+        assert response.status_code == HTTPStatus.OK
+        cache_control = response["Cache-Control"]
+        assert f"max-age={COVER_MAX_AGE}" in cache_control
+        assert "immutable" not in cache_control
+
+        response = self.client.get(_OPDS_URL, {"ts": 1234})
+        assert response.status_code == HTTPStatus.OK
+        cache_control = response["Cache-Control"]
+        assert f"max-age={_IMMUTABLE_MAX_AGE}" in cache_control
+        assert "immutable" in cache_control
+        assert cache_control.count("max-age") == 1
+
+    def test_matching_etag_is_not_modified_without_queries(self) -> None:
+        etag = self.client.get(_URL)["ETag"]
+        with self.assertNumQueries(0):
+            response = self.client.get(_URL, headers={"If-None-Match": etag})
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        assert response["ETag"] == etag
+
+    def test_stale_etag_gets_the_cover(self) -> None:
+        response = self.client.get(_URL, headers={"If-None-Match": '"stale"'})
+        assert response.status_code == HTTPStatus.OK
+        assert response.content == b"webp"
@@ -0,0 +1,111 @@
+"""Tests for conditional GET and byte-range download responses."""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from typing import Final, override
+
+import pytest
+from django.test import RequestFactory, SimpleTestCase
+from django.utils.http import http_date
+
+from codex.views.ranges import (
+    ByteRange,
+    FileRangeReader,
+    RangeNotSatisfiableError,
+    iter_byte_range,
+    parse_range,
+    ranged_response,
+    stat_etag,
+)
+
+_TMP_DIR: Final = Path("/tmp/codex.tests.download_ranges")  # noqa: S108
+_FILE_PATH: Final = _TMP_DIR / "comic.cbz"
+_DATA: Final = bytes(range(256)) * 4
+_SIZE: Final = len(_DATA)
+
+
+class ParseRangeTestCase(SimpleTestCase):
+    """Range header parsing."""
+
+    def test_parse_range(self) -> None:
+        assert parse_range("bytes=0-99", _SIZE) == ByteRange(0, 100)
+        assert parse_range("bytes=1000-", _SIZE) == ByteRange(1000, _SIZE)
+        assert parse_range("bytes=-24", _SIZE) == ByteRange(1000, _SIZE)
+        assert parse_range("bytes=10-99999", _SIZE) == ByteRange(10, _SIZE)
+
+    def test_ignored_ranges(self) -> None:
+        assert parse_range("bytes=0-1,5-6", _SIZE) is None
+        assert parse_range("items=0-1", _SIZE) is None
+        assert parse_range("bytes=9-2", _SIZE) is None
+
+    def test_unsatisfiable_range(self) -> None:
+        with pytest.raises(RangeNotSatisfiableError):
+            parse_range(f"bytes={_SIZE}-", _SIZE)
+
+    def test_iter_byte_range(self) -> None:
+        chunks = [_DATA[i : i + 100] for i in range(0, _SIZE, 100)]
+        sliced = b"".join(iter_byte_range(chunks, ByteRange(150, 420)))
+        assert sliced == _DATA[150:420]
+
+
+class RangedResponseTestCase(SimpleTestCase):
+    """Conditional and partial responses for a file."""
+
+    @override
+    def setUp(self) -> None:
+        shutil.rmtree(_TMP_DIR, ignore_errors=True)
+        _TMP_DIR.mkdir(parents=True)
+        _FILE_PATH.write_bytes(_DATA)
+        self.st = _FILE_PATH.stat()  # pyright: ignore[reportUninitializedInstanceVariable]
+        self.factory = RequestFactory()  # pyright: ignore[reportUninitializedInstanceVariable]
+
+    @override
+    def tearDown(self) -> None:
+        shutil.rmtree(_TMP_DIR, ignore_errors=True)
+
+    def _get(self, **headers):
+        request = self.factory.get("/", headers=headers)
+        return ranged_response(
+            request,
+            etag=stat_etag(self.st),
+            last_modified=self.st.st_mtime,
+            size=_SIZE,
+            open_content=lambda byte_range: FileRangeReader(_FILE_PATH, byte_range),
+            content_type="application/vnd.comicbook+zip",
+            filename="comic.cbz",
+            as_attachment=True,
+        )
+
+    def test_full_response(self) -> None:
+        response = self._get()
+        assert response.status_code == 200  # noqa: PLR2004
+        assert b"".join(response.streaming_content) == _DATA  # pyright: ignore[reportAttributeAccessIssue]
+        assert response["Accept-Ranges"] == "bytes"
+        assert response["ETag"] == stat_etag(self.st)
+        assert response["Content-Length"] == str(_SIZE)
+
+    def test_if_none_match_not_modified(self) -> None:
+        response = self._get(if_none_match=stat_etag(self.st))
+        assert response.status_code == 304  # noqa: PLR2004
+
+    def test_if_modified_since_not_modified(self) -> None:
+        response = self._get(if_modified_since=http_date(self.st.st_mtime))
+        assert response.status_code == 304  # noqa: PLR2004
+
+    def test_partial_response(self) -> None:
+        response = self._get(range="bytes=100-199")
+        assert response.status_code == 206  # noqa: PLR2004
+        assert b"".join(response.streaming_content) == _DATA[100:200]  # pyright: ignore[reportAttributeAccessIssue]
+        assert response["Content-Range"] == f"bytes 100-199/{_SIZE}"
+        assert response["Content-Length"] == "100"
+
+    def test_stale_if_range_sends_whole_file(self) -> None:
+        response = self._get(range="bytes=100-199", if_range='"stale"')
+        assert response.status_code == 200  # noqa: PLR2004
+
+    def test_unsatisfiable_range(self) -> None:
+        response = self._get(range=f"bytes={_SIZE}-")
+        assert response.status_code == 416  # noqa: PLR2004
+        assert response["Content-Range"] == f"bytes */{_SIZE}"
@@ -0,0 +1,104 @@
+"""Tests for the fingerprint keyed metadata cache."""
+
+from __future__ import annotations
+
+import shutil
+import sqlite3
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Final, override
+from unittest.mock import patch
+
+import pytest
+from comicbox.box.archive.filenames import EPOCH_START
+from django.test import SimpleTestCase
+
+from codex.librarian.scribe.importer.fingerprint import get_fingerprint
+from codex.librarian.scribe.importer.read.metadata_cache import (
+    CachedMetadata,
+    MetadataCache,
+    get_cache_key,
+)
+from codex.librarian.scribe.importer.read.reader import _read_comic
+
+_TMP_DIR: Final = Path("/tmp/codex.tests.metadata_cache")  # noqa: S108
+_CACHE_PATH: Final = _TMP_DIR / "metadata-cache.sqlite3"
+_READER: Final = "codex.librarian.scribe.importer.read.reader"
+_COMIC_PATH: Final = Path(__file__).parent / "files" / "comicbox-2-example.cbz"
+_MTIME: Final = datetime(2026, 7, 1, 12, 0, 0, tzinfo=UTC)
+_CACHED: Final = CachedMetadata(
+    metadata_mtime=_MTIME,
+    page_count=3,
+    file_type="CBZ",
+    tags={"series": {"name": "Cached Series"}},
+)
+
+
+class MetadataCacheTestCase(SimpleTestCase):
+    """Cached metadata stands in for reading the archive."""
+
+    @override
+    def setUp(self) -> None:
+        shutil.rmtree(_TMP_DIR, ignore_errors=True)
+        self.cache: MetadataCache = MetadataCache(_CACHE_PATH)
+
+    @override
+    def tearDown(self) -> None:
+        self.cache.close()
+        shutil.rmtree(_TMP_DIR, ignore_errors=True)
+
+    def test_put_and_get(self) -> None:
+        assert self.cache.get("abc") is None
+        assert self.cache.put_many((("abc", _CACHED),)) == 1
+        assert self.cache.get("abc") == _CACHED
+
+    def test_prune(self) -> None:
+        self.cache.put_many((("abc", _CACHED),))
+        assert self.cache.prune(max_age=60) == 0
+        assert self.cache.prune(max_age=-60) == 1
+        assert self.cache.get("abc") is None
+
+    def test_readonly_missing(self) -> None:
+        with pytest.raises(sqlite3.OperationalError):
+            MetadataCache(_TMP_DIR / "missing.sqlite3", readonly=True)
+
+    def _read_cached(self, old_mtime: datetime, path: Path = _COMIC_PATH):
+        key = get_cache_key(get_fingerprint(_COMIC_PATH), _COMIC_PATH)
+        self.cache.put_many(((key, _CACHED),))
+        readonly_cache = MetadataCache(_CACHE_PATH, readonly=True)
+        try:
+            with (
+                patch(
+                    f"{_READER}._get_worker_metadata_cache",
+                    return_value=readonly_cache,
+                ),
+                patch(
+                    f"{_READER}.Comicbox", side_effect=AssertionError("archive opened")
+                ),
+            ):
+                return _read_comic(
+                    str(path),
+                    old_mtime,
+                    full_metadata=True,
+                    capture_cover=True,
+                )
+        finally:
+            readonly_cache.close()
+
+    def test_read_hit_skips_archive(self) -> None:
+        result = self._read_cached(EPOCH_START)
+        assert result["metadata_cached"]
+        assert result["tags"] == _CACHED["tags"]
+        assert result["page_count"] == _CACHED["page_count"]
+
+    def test_read_hit_unchanged_skips_tags(self) -> None:
+        result = self._read_cached(_MTIME)
+        assert result["metadata_cached"]
+        assert result["tags"] is None
+
+    def test_renamed_archive_misses(self) -> None:
+        # Comicbox parses tags from the file name too.
+        renamed_path = _TMP_DIR / "renamed.cbz"
+        shutil.copy(_COMIC_PATH, renamed_path)
+        with pytest.raises(AssertionError, match="archive opened"):
+            self._read_cached(EPOCH_START, renamed_path)
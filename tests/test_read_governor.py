@@ -0,0 +1,48 @@
+"""Tests for the importer's read pool sizing and memory governor."""
+
+from pathlib import Path
+from typing import Final
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from codex.librarian.scribe.importer.read.governor import (
+    MemoryGovernor,
+    get_read_workers,
+)
+from codex.librarian.scribe.importer.read.reader import ComicReader
+
+_GOVERNOR: Final = "codex.librarian.scribe.importer.read.governor"
+_COMIC_PATH: Final = Path(__file__).parent / "files" / "comicbox-2-example.cbz"
+_MISSING_PATH: Final = Path("/tmp/codex.tests.read_governor/missing.cbz")  # noqa: S108
+_GIB: Final = 1024**3
+
+
+class ReadGovernorTestCase(SimpleTestCase):
+    """The read pool fits the memory budget and reports failures."""
+
+    def test_workers_capped_by_memory(self) -> None:
+        with (
+            patch(f"{_GOVERNOR}.IMPORTER_READ_WORKERS", 16),
+            patch(f"{_GOVERNOR}.get_mem_limit", return_value=2 * _GIB),
+        ):
+            assert get_read_workers() == 5  # noqa: PLR2004
+        with (
+            patch(f"{_GOVERNOR}.IMPORTER_READ_WORKERS", 4),
+            patch(f"{_GOVERNOR}.get_mem_limit", return_value=64 * _GIB),
+        ):
+            assert get_read_workers() == 4  # noqa: PLR2004
+        with patch(f"{_GOVERNOR}.get_mem_limit", return_value=0):
+            assert get_read_workers() == 1
+
+    def test_reads_finish_while_memory_low(self) -> None:
+        paths = (str(_COMIC_PATH), str(_MISSING_PATH))
+        with patch.object(MemoryGovernor, "is_memory_low", return_value=True):
+            reader = ComicReader(paths, {}, full_metadata=True, capture_cover=False)
+            results = {str(path): value for path, value in reader}
+        assert results.keys() == set(paths)
+        result, exc = results[str(_COMIC_PATH)]
+        assert exc is None
+        assert result["tags"]
+        _, exc = results[str(_MISSING_PATH)]
+        assert exc is not None
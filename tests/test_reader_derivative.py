@@ -0,0 +1,55 @@
+"""Tests for resized reader page derivatives."""
+
+from __future__ import annotations
+
+from io import BytesIO
+
+from django.test import SimpleTestCase
+from PIL import Image
+
+from codex.views.reader._derivative import (
+    FORMAT_JPEG,
+    FORMAT_WEBP,
+    WIDTH_LADDER,
+    negotiate_format,
+    render_page_derivative,
+    snap_width,
+)
+
+
+def _png(width: int, height: int) -> bytes:
+    buf = BytesIO()
+    Image.new("RGB", (width, height), "red").save(buf, "PNG")
+    return buf.getvalue()
+
+
+class DerivativeTestCase(SimpleTestCase):
+    """Width snapping, format negotiation and rendering."""
+
+    def test_snap_width_rounds_up_to_ladder(self) -> None:
+        assert snap_width(1) == WIDTH_LADDER[0]
+        assert snap_width(700) == 800  # noqa: PLR2004
+        assert snap_width(800) == 800  # noqa: PLR2004
+        assert snap_width(100_000) == WIDTH_LADDER[-1]
+
+    def test_negotiate_format_falls_back_to_jpeg(self) -> None:
+        assert negotiate_format("*/*") == FORMAT_JPEG
+        assert negotiate_format("") == FORMAT_JPEG
+
+    def test_negotiate_format_honors_q_values(self) -> None:
+        assert negotiate_format("image/webp,*/*;q=0.8") == FORMAT_WEBP
+        assert negotiate_format("image/avif;q=0, image/webp") == FORMAT_WEBP
+        assert negotiate_format("image/avif;q=0,image/webp;q=0") == FORMAT_JPEG
+        assert negotiate_format("image/avif;q=0.5,image/webp;q=0.9") == FORMAT_WEBP
+
+    def test_render_downscales(self) -> None:
+        data = render_page_derivative((_png(1000, 1500), 320, FORMAT_JPEG))
+        with Image.open(BytesIO(data)) as img:
+            assert img.format == "JPEG"
+            assert img.size == (320, 480)
+
+    def test_render_never_upscales(self) -> None:
+        data = render_page_derivative((_png(200, 300), 640, FORMAT_WEBP))
+        with Image.open(BytesIO(data)) as img:
+            assert img.format == "WEBP"
+            assert img.size == (200, 300)
@@ -0,0 +1,76 @@
+"""Tests for the reader's decoded page cache."""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from typing import Final, override
+
+from django.test import SimpleTestCase
+
+from codex.views.reader._page_cache import PageCache, PageCacheKey
+
+_TMP_DIR: Final = Path("/tmp/codex.tests.page_cache")  # noqa: S108
+_JPEG: Final = "image/jpeg"
+
+
+def _key(page: int, mtime_ns: int = 1) -> PageCacheKey:
+    return PageCacheKey(7, mtime_ns, 100, page, "auto")
+
+
+class PageCacheTestCase(SimpleTestCase):
+    """Disk + memory tier round trips and eviction."""
+
+    @override
+    def setUp(self) -> None:
+        shutil.rmtree(_TMP_DIR, ignore_errors=True)
+
+    @override
+    def tearDown(self) -> None:
+        shutil.rmtree(_TMP_DIR, ignore_errors=True)
+
+    @staticmethod
+    def _cache(disk: int, mem: int = 0) -> PageCache:
+        return PageCache(disk_max_bytes=disk, mem_max_bytes=mem, root=_TMP_DIR)
+
+    def test_disk_hit_returns_path(self) -> None:
+        cache = self._cache(1000)
+        cache.put(_key(0), b"page0", _JPEG)
+        hit = cache.get(_key(0))
+        assert hit is not None
+        path, content_type = hit
+        assert isinstance(path, Path)
+        assert path.read_bytes() == b"page0"
+        assert content_type == _JPEG
+
+    def test_stat_change_misses(self) -> None:
+        cache = self._cache(1000)
+        cache.put(_key(0), b"page0", _JPEG)
+        assert cache.get(_key(0, mtime_ns=2)) is None
+
+    def test_disk_evicts_lru_by_bytes(self) -> None:
+        cache = self._cache(10)
+        cache.put(_key(0), b"aaaa", _JPEG)
+        cache.put(_key(1), b"bbbb", _JPEG)
+        cache.get(_key(0))
+        cache.put(_key(2), b"cccc", _JPEG)
+        assert cache.get(_key(1)) is None
+        assert cache.get(_key(0)) is not None
+        assert cache.get(_key(2)) is not None
+
+    def test_memory_tier_returns_bytes(self) -> None:
+        cache = self._cache(0, mem=1000)
+        cache.put(_key(0), b"page0", "image/png")
+        assert cache.get(_key(0)) == (b"page0", "image/png")
+
+    def test_index_rebuilt_from_disk(self) -> None:
+        self._cache(1000).put(_key(3), b"page3", "application/pdf")
+        hit = self._cache(1000).get(_key(3))
+        assert hit is not None
+        assert hit[1] == "application/pdf"
+
+    def test_purged_file_misses(self) -> None:
+        cache = self._cache(1000)
+        cache.put(_key(0), b"page0", _JPEG)
+        shutil.rmtree(_TMP_DIR)
+        assert cache.get(_key(0)) is None
@@ -0,0 +1,97 @@
+"""Tests for the reader's server-side read-ahead."""
+
+from __future__ import annotations
+
+import shutil
+import zipfile
+from pathlib import Path
+from typing import Final, override
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from codex.views.reader._archive_cache import ArchiveCache
+from codex.views.reader._page_cache import PageCache, PageCacheKey
+from codex.views.reader._prefetch import ReadAhead
+
+_TMP_DIR: Final = Path("/tmp/codex.tests.prefetch")  # noqa: S108
+_CBZ_PATH: Final = _TMP_DIR / "deflated.cbz"
+_NUM_PAGES: Final = 6
+_READER: Final = ("user_id", 1)
+
+
+class ReadAheadTestCase(SimpleTestCase):
+    """Forward page turns prefetch the following pages into the cache."""
+
+    @override
+    def setUp(self) -> None:
+        shutil.rmtree(_TMP_DIR, ignore_errors=True)
+        _TMP_DIR.mkdir(parents=True)
+        with zipfile.ZipFile(_CBZ_PATH, "w") as zf:
+            for index in range(_NUM_PAGES):
+                zf.writestr(
+                    f"{index:02}.jpg",
+                    bytes([index]) * 1000,
+                    compress_type=zipfile.ZIP_DEFLATED,
+                )
+        self.page_cache = PageCache(disk_max_bytes=0, mem_max_bytes=1_000_000)  # pyright: ignore[reportUninitializedInstanceVariable]
+        self.archive_cache = ArchiveCache()  # pyright: ignore[reportUninitializedInstanceVariable]
+        self.read_ahead = ReadAhead(pages=2, workers=1)  # pyright: ignore[reportUninitializedInstanceVariable]
+        self.patches = (  # pyright: ignore[reportUninitializedInstanceVariable]
+            patch("codex.views.reader._prefetch.page_cache", self.page_cache),
+            patch("codex.views.reader._prefetch.archive_cache", self.archive_cache),
+        )
+        for patcher in self.patches:
+            patcher.start()
+
+    @override
+    def tearDown(self) -> None:
+        for patcher in self.patches:
+            patcher.stop()
+        self.read_ahead.shutdown()
+        self.archive_cache.shutdown()
+        shutil.rmtree(_TMP_DIR, ignore_errors=True)
+
+    def _key(self, page: int) -> PageCacheKey:
+        return PageCacheKey.from_path(1, str(_CBZ_PATH), page, "auto")
+
+    def _access(self, page: int, *, is_zip: bool = True) -> None:
+        self.read_ahead.note_access(
+            _READER, str(_CBZ_PATH), self._key(page), is_zip=is_zip
+        )
+
+    def test_first_access_does_not_prefetch(self) -> None:
+        self._access(0)
+        self.read_ahead.join(self._key(1))
+        assert self.page_cache.get(self._key(1)) is None
+
+    def test_sequential_access_prefetches_ahead(self) -> None:
+        self._access(0)
+        self._access(1)
+        for page in (2, 3):
+            self.read_ahead.join(self._key(page))
+            assert self.page_cache.get(self._key(page)) == (
+                bytes([page]) * 1000,
+                "image/jpeg",
+            )
+        assert self.page_cache.get(self._key(4)) is None
+
+    def test_backward_access_does_not_prefetch(self) -> None:
+        self._access(3)
+        self._access(2)
+        self.read_ahead.join(self._key(3))
+        assert self.page_cache.get(self._key(3)) is None
+
+    def test_prefetch_stops_at_last_page(self) -> None:
+        self._access(_NUM_PAGES - 2)
+        self._access(_NUM_PAGES - 1)
+        self.read_ahead.join(self._key(_NUM_PAGES))
+        assert self.page_cache.get(self._key(_NUM_PAGES)) is None
+
+    def test_non_zip_never_resolves_stored_spans(self) -> None:
+        with patch.object(self.archive_cache, "get_stored_span") as get_span:
+            self._access(0, is_zip=False)
+            self._access(1, is_zip=False)
+            self.read_ahead.join(self._key(2))
+        get_span.assert_not_called()
+        assert self.page_cache.get(self._key(2)) is not None
@@ -0,0 +1,69 @@
+"""Tests for the reader's STORED zip member streaming fast path."""
+
+from __future__ import annotations
+
+import shutil
+import zipfile
+from pathlib import Path
+from typing import Final, override
+
+from comicbox.box import Comicbox
+from django.test import SimpleTestCase
+
+from codex.views.reader._archive_cache import ArchiveCache, StoredMemberReader
+
+_TMP_DIR: Final = Path("/tmp/codex.tests.stored_spans")  # noqa: S108
+_CBZ_PATH: Final = _TMP_DIR / "stored.cbz"
+_STORED_PAGE: Final = b"A" * 1000
+_DEFLATED_PAGE: Final = b"B" * 1000
+_EXTRA_PAGE: Final = b"C" * 500
+
+
+class StoredSpanTestCase(SimpleTestCase):
+    """Spans resolve for STORED members only and stream identical bytes."""
+
+    @override
+    def setUp(self) -> None:
+        shutil.rmtree(_TMP_DIR, ignore_errors=True)
+        _TMP_DIR.mkdir(parents=True)
+        with zipfile.ZipFile(_CBZ_PATH, "w") as zf:
+            zf.writestr("01.jpg", _STORED_PAGE, compress_type=zipfile.ZIP_STORED)
+            zf.writestr("02.jpg", _DEFLATED_PAGE, compress_type=zipfile.ZIP_DEFLATED)
+            # A local extra field shifts the data offset.
+            info = zipfile.ZipInfo("03.jpg")
+            info.extra = b"\x99\x99\x04\x00abcd"
+            zf.writestr(info, _EXTRA_PAGE, compress_type=zipfile.ZIP_STORED)
+        self.cache = ArchiveCache()  # pyright: ignore[reportUninitializedInstanceVariable]
+        st = _CBZ_PATH.stat()
+        self.stat = (st.st_mtime_ns, st.st_size)  # pyright: ignore[reportUninitializedInstanceVariable]
+
+    @override
+    def tearDown(self) -> None:
+        self.cache.shutdown()
+        shutil.rmtree(_TMP_DIR, ignore_errors=True)
+
+    def _stream(self, page: int) -> bytes | None:
+        span = self.cache.get_stored_span(str(_CBZ_PATH), page, self.stat)
+        if span is None:
+            return None
+        reader = StoredMemberReader(str(_CBZ_PATH), span)
+        try:
+            return b"".join(iter(lambda: reader.read(64), b""))
+        finally:
+            reader.close()
+
+    def test_stored_pages_stream_identical_bytes(self) -> None:
+        with Comicbox(_CBZ_PATH) as cb:
+            assert self._stream(0) == cb.get_page_by_index(0)
+            assert self._stream(2) == cb.get_page_by_index(2)
+
+    def test_deflated_page_has_no_span(self) -> None:
+        assert self._stream(1) is None
+
+    def test_out_of_range_page_has_no_span(self) -> None:
+        assert self._stream(99) is None
+
+    def test_stale_stat_has_no_span(self) -> None:
+        mtime_ns, size = self.stat
+        stale = (mtime_ns - 1, size)
+        assert self.cache.get_stored_span(str(_CBZ_PATH), 0, stale) is None
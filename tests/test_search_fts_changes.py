@@ -0,0 +1,80 @@
+"""The search change log drives incremental search index syncs."""
+
+from threading import Event, Lock
+from typing import override
+
+from loguru import logger
+
+from codex.librarian.mp_queue import LIBRARIAN_QUEUE
+from codex.librarian.scribe.search.changes import ALL_FTS_FIELDS, log_fts_changes
+from codex.librarian.scribe.search.sync import SearchIndexerSync
+from codex.models import Comic
+from codex.models.comic import ComicFTS, ComicFTSChange
+from tests.importer.test_basic import PATH, BaseTestImporter, run_full_import
+
+
+class SearchChangeLogTestCase(BaseTestImporter):
+    """Import the example fixture, then sync logged changes."""
+
+    @override
+    def setUp(self) -> None:
+        super().setUp()
+        run_full_import(self.importer)
+        self.comic: Comic = Comic.objects.get(path=PATH)
+
+    @staticmethod
+    def _get_indexer() -> SearchIndexerSync:
+        return SearchIndexerSync(logger, LIBRARIAN_QUEUE, Lock(), Event())
+
+    def _sync_changes(self) -> None:
+        self._get_indexer().update_search_index(rebuild=False, changes_only=True)
+
+    def _comicfts(self) -> ComicFTS:
+        return ComicFTS.objects.get(comic_id=self.comic.pk)
+
+    def test_import_clears_its_changes(self) -> None:
+        assert not ComicFTSChange.objects.exists()
+
+    def test_merge_fields(self) -> None:
+        log_fts_changes({self.comic.pk: frozenset({"tags"})})
+        carried_over = log_fts_changes({self.comic.pk: frozenset({"genres"})})
+        assert carried_over == {self.comic.pk}
+        assert ComicFTSChange.objects.get(comic_id=self.comic.pk).fields == (
+            "genres,tags"
+        )
+        log_fts_changes({self.comic.pk: ALL_FTS_FIELDS})
+        assert ComicFTSChange.objects.get(comic_id=self.comic.pk).fields == ""
+
+    def test_sync_only_logged_columns(self) -> None:
+        old_name = self._comicfts().name
+        self.comic.reprints.clear()
+        Comic.objects.filter(pk=self.comic.pk).update(name="Unlogged")
+        log_fts_changes({self.comic.pk: frozenset({"alternate_series"})})
+
+        self._sync_changes()
+
+        comicfts = self._comicfts()
+        assert comicfts.alternate_series == ""
+        assert comicfts.name == old_name
+        assert not ComicFTSChange.objects.exists()
+
+    def test_sync_logged_delete(self) -> None:
+        pk = self.comic.pk
+        log_fts_changes({pk: ALL_FTS_FIELDS})
+        Comic.objects.filter(pk=pk).delete()
+        # Put back the stale row an unfinished import would leave behind.
+        ComicFTS.objects.bulk_create((ComicFTS(comic_id=pk, name="stale"),))
+
+        self._sync_changes()
+
+        assert not ComicFTS.objects.filter(comic_id=pk).exists()
+        assert not ComicFTSChange.objects.exists()
+
+    def test_remove_deleted_records(self) -> None:
+        pk = self.comic.pk
+        Comic.objects.filter(pk=pk).delete()
+        ComicFTS.objects.bulk_create((ComicFTS(comic_id=pk, name="stale"),))
+
+        assert self._get_indexer().remove_deleted_records((pk, pk + 1)) == 1
+
+        assert not ComicFTS.objects.filter(comic_id=pk).exists()